@@ -0,0 +1,71 @@
+# The properties an argument parser is called with, read only.  Contexts are interned, so equal
+# properties always give the same context, and every context remembers the ones derived from
+# it.  Parsers pass contexts along and derive the ones they need instead of building or
+# changing dicts, so the properties in the command tree can't be changed by a parse
+class ArgumentContext(dict):
+	interned = {} # frozenset of the properties -> ArgumentContext
+
+	def __init__(self, properties):
+		dict.__init__(self, properties)
+		self.derived = {} # changes passed to derive -> ArgumentContext
+		self.escape_depths = {} # escape depth -> this context at that depth, see at_escape_depth
+
+	@classmethod
+	def of(cls, properties):
+		key = frozenset(properties.items())
+		context = cls.interned.get(key)
+		if context is None:
+			context = cls(properties)
+			cls.interned[key] = context
+		return context
+
+	# Returns the context with changes applied to it, changing a property to None removes it
+	def derive(self, **changes):
+		key = tuple(changes.items())
+		context = self.derived.get(key)
+		if context is None:
+			properties = dict(self)
+			for name, value in changes.items():
+				if value == None:
+					properties.pop(name, None)
+				else:
+					properties[name] = value
+			context = self.of(properties)
+			self.derived[key] = context
+		return context
+
+	# Returns the context with escape_depth set to escape_depth.  Nested strings, JSON and NBT
+	# ask for one of these for every value they parse, so they're kept by depth instead of
+	# building a key for derive each time.  Lines can be parsed on several threads at once, so
+	# a depth is only ever added in one step
+	def at_escape_depth(self, escape_depth):
+		context = self.escape_depths.get(escape_depth)
+		if context is None:
+			context = self.escape_depths.setdefault(escape_depth, self.derive(escape_depth=escape_depth))
+		return context
+
+	def read_only(self, *args, **kwargs):
+		raise TypeError("Argument contexts are read only, use derive instead")
+
+	__setitem__ = read_only
+	__delitem__ = read_only
+	clear = read_only
+	pop = read_only
+	popitem = read_only
+	setdefault = read_only
+	update = read_only
+
+	# Contexts are interned, so they're only ever equal to themselves and copies are the context
+	# itself
+	__hash__ = object.__hash__
+
+	def __copy__(self):
+		return self
+
+	def __deepcopy__(self, memo):
+		return self
+
+	def __reduce__(self):
+		return (ArgumentContext.of, (dict(self),))
+
+EMPTY_CONTEXT = ArgumentContext.of({})
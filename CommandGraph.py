@@ -0,0 +1,86 @@
+from types import MappingProxyType
+from .CommandTree import COMMAND_TREE
+from .ArgumentContext import ArgumentContext
+
+# A node of the command tree compiled for the parser.  Instead of scanning every child of a
+# node, literal children are found with a single lookup on the next token and only the
+# argument children are tried, in the order the tree lists them.
+#
+# Redirects are resolved once the whole graph is built, and the graph is read only after that
+# so a parse can never change the grammar the next one uses.  first_char_arguments is the only
+# thing filled in later, and it's a cache that gives the same answer whoever fills it in
+class CommandNode:
+	__slots__ = ("name", "path", "type", "parser", "properties", "executable", "redirect", "redirect_node", "has_children", "literals", "arguments", "first_char_arguments", "last_child_executable")
+	frozen = False
+
+	def __init__(self, name, node_data, path=()):
+		self.name = name
+		self.path = path # names of the nodes from the root down to this one
+		self.type = node_data["type"]
+		self.parser = node_data.get("parser")
+		self.properties = ArgumentContext.of(node_data.get("properties", {}))
+		self.executable = node_data.get("executable")
+		self.redirect = node_data.get("redirect")
+		self.redirect_node = None # the node redirect points to, set by resolve_redirects
+		self.has_children = "children" in node_data
+		self.literals = {}  # literal -> CommandNode
+		self.arguments = () # argument CommandNodes in tree order
+		self.first_char_arguments = {} # character -> the arguments whose parser can start on it, filled in by the parser
+
+		# Whether the last child in tree order is executable, the walker falls back on it when
+		# none of the children matched
+		self.last_child_executable = None
+
+		if self.has_children:
+			arguments = []
+			for child_name, child_data in node_data["children"].items():
+				child = CommandNode(child_name, child_data, path + (child_name,))
+				if child.type == "literal":
+					self.literals[child_name] = child
+				else:
+					arguments.append(child)
+				self.last_child_executable = child.executable
+			self.arguments = tuple(arguments)
+		self.literals = MappingProxyType(self.literals)
+
+	def __setattr__(self, name, value):
+		if CommandNode.frozen:
+			raise AttributeError("The command graph is read only")
+		object.__setattr__(self, name, value)
+
+	# Returns a node that is the same as this one apart from being executable or not, for a
+	# redirect that says whether its target is executable.  It shares this node's children
+	# and caches, so it parses the same way
+	def with_executable(self, executable, variants):
+		if executable == None or executable == self.executable:
+			return self
+
+		variant = variants.get((self, executable))
+		if variant == None:
+			variant = object.__new__(CommandNode)
+			for name in CommandNode.__slots__:
+				object.__setattr__(variant, name, getattr(self, name))
+			variant.executable = executable
+			variants[(self, executable)] = variant
+		return variant
+
+	# Points every redirect in the graph below root at the node it names, carrying whether
+	# the target is executable on the redirect instead of on the target
+	@staticmethod
+	def resolve_redirects(root):
+		variants = {} # (target, executable) -> the target with that executable
+		pending = [root]
+		while len(pending) > 0:
+			node = pending.pop()
+			if node.redirect != None:
+				target = root
+				if node.redirect[0] != "root":
+					for name in node.redirect:
+						target = target.literals[name]
+				node.redirect_node = target.with_executable(node.executable, variants)
+			pending.extend(node.literals.values())
+			pending.extend(node.arguments)
+
+COMMAND_GRAPH = CommandNode("root", COMMAND_TREE)
+CommandNode.resolve_redirects(COMMAND_GRAPH)
+CommandNode.frozen = True
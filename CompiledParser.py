@@ -0,0 +1,82 @@
+import json
+import hashlib
+from .Parser import Parser
+from .CommandTree import COMMAND_TREE
+
+# The parser with the command graph replaced by CompiledTree.py, which UpdateAll.py generates
+# from the same commands.json as CommandTree.py.  Every node there is a function that does
+# what Parser.highlight does on entering that node, with the node's literals, arguments and
+# executability written into it, so the walker no longer has to look any of them up.
+#
+# A node function takes the parser and the walker's stack and returns either the function of
+# the child to enter next or the outcome of the node, True or False.  Frames, the redirect
+# memo and the argument parsers are the same as the interpreter's, so both give the same tokens
+
+# An argument child in the generated tree.  name, parser and properties are what the
+# interpreter reads off argument nodes, enter is the child's node function
+class CompiledArgument:
+	__slots__ = ("name", "parser", "properties", "enter")
+
+	def __init__(self, name, parser, properties, enter):
+		self.name = name
+		self.parser = parser
+		self.properties = properties
+		self.enter = enter
+
+# What the walker needs of a node while it tries that node's argument children
+class CompiledChildren:
+	__slots__ = ("path", "arguments", "first_char_arguments", "last_child_executable")
+
+	def __init__(self, path, arguments, last_child_executable):
+		self.path = path # names of the nodes from the root down to this one
+		self.arguments = arguments # CompiledArguments in tree order
+		self.first_char_arguments = {} # character -> the arguments whose parser can start on it, filled in by the parser
+		self.last_child_executable = last_child_executable
+
+# Returns the pattern the first character of argument has to match, or None if its parser can
+# start on anything.  The same test as Parser.can_start, looked up once per argument
+def start_pattern(argument):
+	if argument.parser == "brigadier:string" and argument.properties["type"] == "greedy":
+		return None
+	return Parser.first_chars.get(argument.parser)
+
+class CompiledParser(Parser):
+	root = None # set to the root node function by load_compiled_parser
+
+	def highlight(self, enter, line_string, current, region_start=None):
+		if (region_start != None):
+			self.region_begin = region_start
+		self.string = line_string
+		self.current = current
+
+		stack = []
+		while True:
+			result = enter(self, stack)
+			if result is True or result is False:
+				result = self.hand_up(stack, result)
+				if result is True or result is False:
+					return result
+				enter = result.enter
+			else:
+				enter = result
+
+# The hash of a command tree, CompiledTree.py is only used with the tree it was generated from.
+# The keys are sorted so the hash doesn't depend on dict order, which Sublime's Python doesn't
+# keep
+def tree_hash(command_tree):
+	return hashlib.sha1(json.dumps(command_tree, sort_keys=True).encode("utf-8")).hexdigest()
+
+# Returns CompiledParser ready to use, or Parser when there is no CompiledTree.py or it was
+# generated from a different command tree than the one in CommandTree.py
+def load_compiled_parser():
+	try:
+		from . import CompiledTree
+	except ImportError:
+		return Parser
+
+	if CompiledTree.SOURCE_HASH != tree_hash(COMMAND_TREE):
+		print("MCC: CompiledTree.py is out of date, run UpdateAll.py again.  Using the interpreted command tree for now")
+		return Parser
+
+	CompiledParser.root = staticmethod(CompiledTree.ROOT)
+	return CompiledParser
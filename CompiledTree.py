@@ -0,0 +1,23484 @@
+# File automatically generated by UpdateAll.py
+from .Parser import Parser, CHILDREN_FRAME
+from .ArgumentContext import ArgumentContext
+from .CompiledParser import CompiledArgument, CompiledChildren, start_pattern
+
+SOURCE_HASH = "09ed6caefd173921625e59999d15c6896c0b1f66"
+TOKEN = Parser.regex["token"]
+
+# root
+def enter_0(parser, stack):
+	parser.check_budget()
+	if parser.current >= len(parser.string):
+		return parser.end_of_command(None)
+	return parser.enter_command(stack, COMMANDS_0)
+
+# advancement
+def enter_1(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'grant':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_72
+	elif token == 'revoke':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_73
+	return parser.no_child_matched(CHILDREN_1)
+
+# ban
+def enter_2(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_2, current, parser.mark(), None, -1]
+	if START_74 == None or START_74.match(string[current]) != None:
+		parser.current = PARSE_74(parser, ARGUMENT_74.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_74,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_74
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_2)
+
+# ban-ip
+def enter_3(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_3, current, parser.mark(), None, -1]
+	if START_75 == None or START_75.match(string[current]) != None:
+		parser.current = PARSE_75(parser, ARGUMENT_75.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_75,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_75
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_3)
+
+# banlist
+def enter_4(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_4, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'ips':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_76
+	elif token == 'players':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_77
+	return parser.no_child_matched(CHILDREN_4)
+
+# bossbar
+def enter_5(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_5, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_5.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_5)
+
+# clear
+def enter_6(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_6, current, parser.mark(), None, -1]
+	if START_83 == None or START_83.match(string[current]) != None:
+		parser.current = PARSE_83(parser, ARGUMENT_83.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_83,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_83
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_6)
+
+# clone
+def enter_7(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_7, current, parser.mark(), None, -1]
+	if START_84 == None or START_84.match(string[current]) != None:
+		parser.current = PARSE_84(parser, ARGUMENT_84.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_84,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_84
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_7)
+
+# data
+def enter_8(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_8, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'get':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_85
+	elif token == 'merge':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_86
+	elif token == 'modify':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_87
+	elif token == 'remove':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_88
+	return parser.no_child_matched(CHILDREN_8)
+
+# datapack
+def enter_9(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_9, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'disable':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_89
+	elif token == 'enable':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_90
+	elif token == 'list':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_91
+	return parser.no_child_matched(CHILDREN_9)
+
+# debug
+def enter_10(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_10, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'start':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_92
+	elif token == 'stop':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_93
+	return parser.no_child_matched(CHILDREN_10)
+
+# defaultgamemode
+def enter_11(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_11, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'adventure':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 9)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 9
+		stack.append(frame)
+		return enter_94
+	elif token == 'creative':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_95
+	elif token == 'spectator':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 9)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 9
+		stack.append(frame)
+		return enter_96
+	elif token == 'survival':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_97
+	return parser.no_child_matched(CHILDREN_11)
+
+# deop
+def enter_12(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_12, current, parser.mark(), None, -1]
+	if START_98 == None or START_98.match(string[current]) != None:
+		parser.current = PARSE_98(parser, ARGUMENT_98.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_98,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_98
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_12)
+
+# difficulty
+def enter_13(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_13, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'easy':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_99
+	elif token == 'hard':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_100
+	elif token == 'normal':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_101
+	elif token == 'peaceful':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_102
+	return parser.no_child_matched(CHILDREN_13)
+
+# effect
+def enter_14(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_14, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'clear':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_103
+	elif token == 'give':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_104
+	return parser.no_child_matched(CHILDREN_14)
+
+# enchant
+def enter_15(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_15, current, parser.mark(), None, -1]
+	if START_105 == None or START_105.match(string[current]) != None:
+		parser.current = PARSE_105(parser, ARGUMENT_105.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_105,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_105
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_15)
+
+# execute
+def enter_16(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_16, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_16.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_16)
+
+# experience
+def enter_17(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_17, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'add':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_118
+	elif token == 'query':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_119
+	elif token == 'set':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_120
+	return parser.no_child_matched(CHILDREN_17)
+
+# fill
+def enter_18(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_18, current, parser.mark(), None, -1]
+	if START_121 == None or START_121.match(string[current]) != None:
+		parser.current = PARSE_121(parser, ARGUMENT_121.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_121,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_121
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_18)
+
+# forceload
+def enter_19(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_19, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'add':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_122
+	elif token == 'query':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_123
+	elif token == 'remove':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_124
+	return parser.no_child_matched(CHILDREN_19)
+
+# function
+def enter_20(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_20, current, parser.mark(), None, -1]
+	if START_125 == None or START_125.match(string[current]) != None:
+		parser.current = PARSE_125(parser, ARGUMENT_125.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_125,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_125
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_20)
+
+# gamemode
+def enter_21(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_21, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'adventure':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 9)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 9
+		stack.append(frame)
+		return enter_126
+	elif token == 'creative':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_127
+	elif token == 'spectator':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 9)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 9
+		stack.append(frame)
+		return enter_128
+	elif token == 'survival':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_129
+	return parser.no_child_matched(CHILDREN_21)
+
+# gamerule
+def enter_22(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_22, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_22.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_22)
+
+# give
+def enter_23(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_23, current, parser.mark(), None, -1]
+	if START_153 == None or START_153.match(string[current]) != None:
+		parser.current = PARSE_153(parser, ARGUMENT_153.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_153,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_153
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_23)
+
+# help
+def enter_24(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_24, current, parser.mark(), None, -1]
+	if START_154 == None or START_154.match(string[current]) != None:
+		parser.current = PARSE_154(parser, ARGUMENT_154.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_154,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_154
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_24)
+
+# kick
+def enter_25(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_25, current, parser.mark(), None, -1]
+	if START_155 == None or START_155.match(string[current]) != None:
+		parser.current = PARSE_155(parser, ARGUMENT_155.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_155,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_155
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_25)
+
+# kill
+def enter_26(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_26, current, parser.mark(), None, -1]
+	if START_156 == None or START_156.match(string[current]) != None:
+		parser.current = PARSE_156(parser, ARGUMENT_156.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_156,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_156
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_26)
+
+# list
+def enter_27(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_27, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'uuids':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_157
+	return parser.no_child_matched(CHILDREN_27)
+
+# locate
+def enter_28(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_28, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_28.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_28)
+
+# loot
+def enter_29(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_29, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'give':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_173
+	elif token == 'insert':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_174
+	elif token == 'replace':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_175
+	elif token == 'spawn':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_176
+	return parser.no_child_matched(CHILDREN_29)
+
+# me
+def enter_30(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_30, current, parser.mark(), None, -1]
+	if START_177 == None or START_177.match(string[current]) != None:
+		parser.current = PARSE_177(parser, ARGUMENT_177.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_177,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_177
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_30)
+
+# msg
+def enter_31(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_31, current, parser.mark(), None, -1]
+	if START_178 == None or START_178.match(string[current]) != None:
+		parser.current = PARSE_178(parser, ARGUMENT_178.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_178,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_178
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_31)
+
+# op
+def enter_32(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_32, current, parser.mark(), None, -1]
+	if START_179 == None or START_179.match(string[current]) != None:
+		parser.current = PARSE_179(parser, ARGUMENT_179.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_179,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_179
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_32)
+
+# pardon
+def enter_33(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_33, current, parser.mark(), None, -1]
+	if START_180 == None or START_180.match(string[current]) != None:
+		parser.current = PARSE_180(parser, ARGUMENT_180.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_180,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_180
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_33)
+
+# pardon-ip
+def enter_34(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_34, current, parser.mark(), None, -1]
+	if START_181 == None or START_181.match(string[current]) != None:
+		parser.current = PARSE_181(parser, ARGUMENT_181.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_181,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_181
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_34)
+
+# particle
+def enter_35(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_35, current, parser.mark(), None, -1]
+	if START_182 == None or START_182.match(string[current]) != None:
+		parser.current = PARSE_182(parser, ARGUMENT_182.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_182,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_182
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_35)
+
+# playsound
+def enter_36(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_36, current, parser.mark(), None, -1]
+	if START_183 == None or START_183.match(string[current]) != None:
+		parser.current = PARSE_183(parser, ARGUMENT_183.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_183,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_183
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_36)
+
+# publish
+def enter_37(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_37, current, parser.mark(), None, -1]
+	if START_184 == None or START_184.match(string[current]) != None:
+		parser.current = PARSE_184(parser, ARGUMENT_184.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_184,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_184
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_37)
+
+# recipe
+def enter_38(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_38, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'give':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_185
+	elif token == 'take':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_186
+	return parser.no_child_matched(CHILDREN_38)
+
+# reload
+def enter_39(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# replaceitem
+def enter_40(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_40, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_187
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_188
+	return parser.no_child_matched(CHILDREN_40)
+
+# save-all
+def enter_41(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_41, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'flush':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_189
+	return parser.no_child_matched(CHILDREN_41)
+
+# save-off
+def enter_42(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# save-on
+def enter_43(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# say
+def enter_44(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_44, current, parser.mark(), None, -1]
+	if START_190 == None or START_190.match(string[current]) != None:
+		parser.current = PARSE_190(parser, ARGUMENT_190.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_190,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_190
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_44)
+
+# schedule
+def enter_45(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_45, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'function':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_191
+	return parser.no_child_matched(CHILDREN_45)
+
+# scoreboard
+def enter_46(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_46, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'objectives':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 10)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 10
+		stack.append(frame)
+		return enter_192
+	elif token == 'players':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_193
+	return parser.no_child_matched(CHILDREN_46)
+
+# seed
+def enter_47(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# setblock
+def enter_48(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_48, current, parser.mark(), None, -1]
+	if START_194 == None or START_194.match(string[current]) != None:
+		parser.current = PARSE_194(parser, ARGUMENT_194.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_194,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_194
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_48)
+
+# setidletimeout
+def enter_49(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_49, current, parser.mark(), None, -1]
+	if START_195 == None or START_195.match(string[current]) != None:
+		parser.current = PARSE_195(parser, ARGUMENT_195.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_195,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_195
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_49)
+
+# setworldspawn
+def enter_50(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_50, current, parser.mark(), None, -1]
+	if START_196 == None or START_196.match(string[current]) != None:
+		parser.current = PARSE_196(parser, ARGUMENT_196.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_196,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_196
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_50)
+
+# spawnpoint
+def enter_51(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_51, current, parser.mark(), None, -1]
+	if START_197 == None or START_197.match(string[current]) != None:
+		parser.current = PARSE_197(parser, ARGUMENT_197.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_197,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_197
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_51)
+
+# spreadplayers
+def enter_52(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_52, current, parser.mark(), None, -1]
+	if START_198 == None or START_198.match(string[current]) != None:
+		parser.current = PARSE_198(parser, ARGUMENT_198.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_198,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_198
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_52)
+
+# stop
+def enter_53(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound
+def enter_54(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_54, current, parser.mark(), None, -1]
+	if START_199 == None or START_199.match(string[current]) != None:
+		parser.current = PARSE_199(parser, ARGUMENT_199.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_199,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_199
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_54)
+
+# summon
+def enter_55(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_55, current, parser.mark(), None, -1]
+	if START_200 == None or START_200.match(string[current]) != None:
+		parser.current = PARSE_200(parser, ARGUMENT_200.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_200,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_200
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_55)
+
+# tag
+def enter_56(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_56, current, parser.mark(), None, -1]
+	if START_201 == None or START_201.match(string[current]) != None:
+		parser.current = PARSE_201(parser, ARGUMENT_201.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_201,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_201
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_56)
+
+# team
+def enter_57(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_57, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_57.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_57)
+
+# teammsg
+def enter_58(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_58, current, parser.mark(), None, -1]
+	if START_209 == None or START_209.match(string[current]) != None:
+		parser.current = PARSE_209(parser, ARGUMENT_209.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_209,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_209
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_58)
+
+# teleport
+def enter_59(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_59, current, parser.mark(), None, -1]
+	argument = parser.next_child(frame)
+	if argument != None:
+		stack.append(frame)
+		return argument.enter
+	return parser.no_child_matched(CHILDREN_59)
+
+# tell
+def enter_60(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_31)
+
+# tellraw
+def enter_61(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_61, current, parser.mark(), None, -1]
+	if START_213 == None or START_213.match(string[current]) != None:
+		parser.current = PARSE_213(parser, ARGUMENT_213.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_213,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_213
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_61)
+
+# time
+def enter_62(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_62, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'add':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_214
+	elif token == 'query':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_215
+	elif token == 'set':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_216
+	return parser.no_child_matched(CHILDREN_62)
+
+# title
+def enter_63(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_63, current, parser.mark(), None, -1]
+	if START_217 == None or START_217.match(string[current]) != None:
+		parser.current = PARSE_217(parser, ARGUMENT_217.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_217,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_217
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_63)
+
+# tm
+def enter_64(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_58)
+
+# tp
+def enter_65(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_59)
+
+# trigger
+def enter_66(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_66, current, parser.mark(), None, -1]
+	if START_218 == None or START_218.match(string[current]) != None:
+		parser.current = PARSE_218(parser, ARGUMENT_218.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_218,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_218
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_66)
+
+# w
+def enter_67(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_31)
+
+# weather
+def enter_68(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_68, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'clear':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_219
+	elif token == 'rain':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_220
+	elif token == 'thunder':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_221
+	return parser.no_child_matched(CHILDREN_68)
+
+# whitelist
+def enter_69(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_69, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_69.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_69)
+
+# worldborder
+def enter_70(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_70, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_70.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_70)
+
+# xp
+def enter_71(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_17)
+
+# advancement grant
+def enter_72(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_72, current, parser.mark(), None, -1]
+	if START_234 == None or START_234.match(string[current]) != None:
+		parser.current = PARSE_234(parser, ARGUMENT_234.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_234,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_234
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_72)
+
+# advancement revoke
+def enter_73(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_73, current, parser.mark(), None, -1]
+	if START_235 == None or START_235.match(string[current]) != None:
+		parser.current = PARSE_235(parser, ARGUMENT_235.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_235,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_235
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_73)
+
+# ban targets
+def enter_74(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_74, current, parser.mark(), None, -1]
+	if START_236 == None or START_236.match(string[current]) != None:
+		parser.current = PARSE_236(parser, ARGUMENT_236.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_236,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_236
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_74)
+
+# ban-ip target
+def enter_75(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_75, current, parser.mark(), None, -1]
+	if START_237 == None or START_237.match(string[current]) != None:
+		parser.current = PARSE_237(parser, ARGUMENT_237.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_237,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_237
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_75)
+
+# banlist ips
+def enter_76(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# banlist players
+def enter_77(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar add
+def enter_78(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_78, current, parser.mark(), None, -1]
+	if START_238 == None or START_238.match(string[current]) != None:
+		parser.current = PARSE_238(parser, ARGUMENT_238.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_238,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_238
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_78)
+
+# bossbar get
+def enter_79(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_79, current, parser.mark(), None, -1]
+	if START_239 == None or START_239.match(string[current]) != None:
+		parser.current = PARSE_239(parser, ARGUMENT_239.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_239,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_239
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_79)
+
+# bossbar list
+def enter_80(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar remove
+def enter_81(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_81, current, parser.mark(), None, -1]
+	if START_240 == None or START_240.match(string[current]) != None:
+		parser.current = PARSE_240(parser, ARGUMENT_240.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_240,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_240
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_81)
+
+# bossbar set
+def enter_82(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_82, current, parser.mark(), None, -1]
+	if START_241 == None or START_241.match(string[current]) != None:
+		parser.current = PARSE_241(parser, ARGUMENT_241.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_241,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_241
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_82)
+
+# clear targets
+def enter_83(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_83, current, parser.mark(), None, -1]
+	if START_242 == None or START_242.match(string[current]) != None:
+		parser.current = PARSE_242(parser, ARGUMENT_242.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_242,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_242
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_83)
+
+# clone begin
+def enter_84(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_84, current, parser.mark(), None, -1]
+	if START_243 == None or START_243.match(string[current]) != None:
+		parser.current = PARSE_243(parser, ARGUMENT_243.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_243,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_243
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_84)
+
+# data get
+def enter_85(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_85, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_244
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_245
+	return parser.no_child_matched(CHILDREN_85)
+
+# data merge
+def enter_86(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_86, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_246
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_247
+	return parser.no_child_matched(CHILDREN_86)
+
+# data modify
+def enter_87(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_87, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_248
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_249
+	return parser.no_child_matched(CHILDREN_87)
+
+# data remove
+def enter_88(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_88, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_250
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_251
+	return parser.no_child_matched(CHILDREN_88)
+
+# datapack disable
+def enter_89(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_89, current, parser.mark(), None, -1]
+	if START_252 == None or START_252.match(string[current]) != None:
+		parser.current = PARSE_252(parser, ARGUMENT_252.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_252,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_252
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_89)
+
+# datapack enable
+def enter_90(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_90, current, parser.mark(), None, -1]
+	if START_253 == None or START_253.match(string[current]) != None:
+		parser.current = PARSE_253(parser, ARGUMENT_253.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_253,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_253
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_90)
+
+# datapack list
+def enter_91(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_91, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'available':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 9)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 9
+		stack.append(frame)
+		return enter_254
+	elif token == 'enabled':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_255
+	return parser.no_child_matched(CHILDREN_91)
+
+# debug start
+def enter_92(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# debug stop
+def enter_93(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# defaultgamemode adventure
+def enter_94(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# defaultgamemode creative
+def enter_95(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# defaultgamemode spectator
+def enter_96(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# defaultgamemode survival
+def enter_97(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# deop targets
+def enter_98(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# difficulty easy
+def enter_99(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# difficulty hard
+def enter_100(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# difficulty normal
+def enter_101(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# difficulty peaceful
+def enter_102(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# effect clear
+def enter_103(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_103, current, parser.mark(), None, -1]
+	if START_256 == None or START_256.match(string[current]) != None:
+		parser.current = PARSE_256(parser, ARGUMENT_256.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_256,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_256
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_103)
+
+# effect give
+def enter_104(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_104, current, parser.mark(), None, -1]
+	if START_257 == None or START_257.match(string[current]) != None:
+		parser.current = PARSE_257(parser, ARGUMENT_257.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_257,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_257
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_104)
+
+# enchant targets
+def enter_105(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_105, current, parser.mark(), None, -1]
+	if START_258 == None or START_258.match(string[current]) != None:
+		parser.current = PARSE_258(parser, ARGUMENT_258.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_258,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_258
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_105)
+
+# execute align
+def enter_106(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_106, current, parser.mark(), None, -1]
+	if START_259 == None or START_259.match(string[current]) != None:
+		parser.current = PARSE_259(parser, ARGUMENT_259.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_259,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_259
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_106)
+
+# execute anchored
+def enter_107(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_107, current, parser.mark(), None, -1]
+	if START_260 == None or START_260.match(string[current]) != None:
+		parser.current = PARSE_260(parser, ARGUMENT_260.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_260,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_260
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_107)
+
+# execute as
+def enter_108(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_108, current, parser.mark(), None, -1]
+	if START_261 == None or START_261.match(string[current]) != None:
+		parser.current = PARSE_261(parser, ARGUMENT_261.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_261,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_261
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_108)
+
+# execute at
+def enter_109(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_109, current, parser.mark(), None, -1]
+	if START_262 == None or START_262.match(string[current]) != None:
+		parser.current = PARSE_262(parser, ARGUMENT_262.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_262,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_262
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_109)
+
+# execute facing
+def enter_110(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_110, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_263
+	if START_264 == None or START_264.match(string[current]) != None:
+		parser.current = PARSE_264(parser, ARGUMENT_264.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_264,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_264
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_110)
+
+# execute if
+def enter_111(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_111, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_111.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_111)
+
+# execute in
+def enter_112(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_112, current, parser.mark(), None, -1]
+	if START_270 == None or START_270.match(string[current]) != None:
+		parser.current = PARSE_270(parser, ARGUMENT_270.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_270,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_270
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_112)
+
+# execute positioned
+def enter_113(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_113, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'as':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 2)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 2
+		stack.append(frame)
+		return enter_271
+	if START_272 == None or START_272.match(string[current]) != None:
+		parser.current = PARSE_272(parser, ARGUMENT_272.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_272,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_272
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_113)
+
+# execute rotated
+def enter_114(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_114, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'as':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 2)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 2
+		stack.append(frame)
+		return enter_273
+	if START_274 == None or START_274.match(string[current]) != None:
+		parser.current = PARSE_274(parser, ARGUMENT_274.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_274,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_274
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_114)
+
+# execute run
+def enter_115(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_0)
+
+# execute store
+def enter_116(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_116, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'result':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_275
+	elif token == 'success':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_276
+	return parser.no_child_matched(CHILDREN_116)
+
+# execute unless
+def enter_117(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_117, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_117.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_117)
+
+# experience add
+def enter_118(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_118, current, parser.mark(), None, -1]
+	if START_282 == None or START_282.match(string[current]) != None:
+		parser.current = PARSE_282(parser, ARGUMENT_282.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_282,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_282
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_118)
+
+# experience query
+def enter_119(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_119, current, parser.mark(), None, -1]
+	if START_283 == None or START_283.match(string[current]) != None:
+		parser.current = PARSE_283(parser, ARGUMENT_283.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_283,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_283
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_119)
+
+# experience set
+def enter_120(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_120, current, parser.mark(), None, -1]
+	if START_284 == None or START_284.match(string[current]) != None:
+		parser.current = PARSE_284(parser, ARGUMENT_284.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_284,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_284
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_120)
+
+# fill from
+def enter_121(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_121, current, parser.mark(), None, -1]
+	if START_285 == None or START_285.match(string[current]) != None:
+		parser.current = PARSE_285(parser, ARGUMENT_285.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_285,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_285
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_121)
+
+# forceload add
+def enter_122(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_122, current, parser.mark(), None, -1]
+	if START_286 == None or START_286.match(string[current]) != None:
+		parser.current = PARSE_286(parser, ARGUMENT_286.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_286,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_286
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_122)
+
+# forceload query
+def enter_123(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_123, current, parser.mark(), None, -1]
+	if START_287 == None or START_287.match(string[current]) != None:
+		parser.current = PARSE_287(parser, ARGUMENT_287.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_287,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_287
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_123)
+
+# forceload remove
+def enter_124(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_124, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'all':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_288
+	if START_289 == None or START_289.match(string[current]) != None:
+		parser.current = PARSE_289(parser, ARGUMENT_289.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_289,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_289
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_124)
+
+# function name
+def enter_125(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamemode adventure
+def enter_126(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_126, current, parser.mark(), None, -1]
+	if START_290 == None or START_290.match(string[current]) != None:
+		parser.current = PARSE_290(parser, ARGUMENT_290.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_290,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_290
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_126)
+
+# gamemode creative
+def enter_127(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_127, current, parser.mark(), None, -1]
+	if START_291 == None or START_291.match(string[current]) != None:
+		parser.current = PARSE_291(parser, ARGUMENT_291.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_291,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_291
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_127)
+
+# gamemode spectator
+def enter_128(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_128, current, parser.mark(), None, -1]
+	if START_292 == None or START_292.match(string[current]) != None:
+		parser.current = PARSE_292(parser, ARGUMENT_292.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_292,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_292
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_128)
+
+# gamemode survival
+def enter_129(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_129, current, parser.mark(), None, -1]
+	if START_293 == None or START_293.match(string[current]) != None:
+		parser.current = PARSE_293(parser, ARGUMENT_293.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_293,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_293
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_129)
+
+# gamerule announceAdvancements
+def enter_130(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_130, current, parser.mark(), None, -1]
+	if START_294 == None or START_294.match(string[current]) != None:
+		parser.current = PARSE_294(parser, ARGUMENT_294.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_294,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_294
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_130)
+
+# gamerule commandBlockOutput
+def enter_131(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_131, current, parser.mark(), None, -1]
+	if START_295 == None or START_295.match(string[current]) != None:
+		parser.current = PARSE_295(parser, ARGUMENT_295.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_295,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_295
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_131)
+
+# gamerule disableElytraMovementCheck
+def enter_132(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_132, current, parser.mark(), None, -1]
+	if START_296 == None or START_296.match(string[current]) != None:
+		parser.current = PARSE_296(parser, ARGUMENT_296.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_296,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_296
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_132)
+
+# gamerule doDaylightCycle
+def enter_133(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_133, current, parser.mark(), None, -1]
+	if START_297 == None or START_297.match(string[current]) != None:
+		parser.current = PARSE_297(parser, ARGUMENT_297.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_297,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_297
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_133)
+
+# gamerule doEntityDrops
+def enter_134(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_134, current, parser.mark(), None, -1]
+	if START_298 == None or START_298.match(string[current]) != None:
+		parser.current = PARSE_298(parser, ARGUMENT_298.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_298,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_298
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_134)
+
+# gamerule doFireTick
+def enter_135(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_135, current, parser.mark(), None, -1]
+	if START_299 == None or START_299.match(string[current]) != None:
+		parser.current = PARSE_299(parser, ARGUMENT_299.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_299,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_299
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_135)
+
+# gamerule doLimitedCrafting
+def enter_136(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_136, current, parser.mark(), None, -1]
+	if START_300 == None or START_300.match(string[current]) != None:
+		parser.current = PARSE_300(parser, ARGUMENT_300.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_300,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_300
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_136)
+
+# gamerule doMobLoot
+def enter_137(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_137, current, parser.mark(), None, -1]
+	if START_301 == None or START_301.match(string[current]) != None:
+		parser.current = PARSE_301(parser, ARGUMENT_301.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_301,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_301
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_137)
+
+# gamerule doMobSpawning
+def enter_138(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_138, current, parser.mark(), None, -1]
+	if START_302 == None or START_302.match(string[current]) != None:
+		parser.current = PARSE_302(parser, ARGUMENT_302.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_302,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_302
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_138)
+
+# gamerule doTileDrops
+def enter_139(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_139, current, parser.mark(), None, -1]
+	if START_303 == None or START_303.match(string[current]) != None:
+		parser.current = PARSE_303(parser, ARGUMENT_303.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_303,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_303
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_139)
+
+# gamerule doWeatherCycle
+def enter_140(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_140, current, parser.mark(), None, -1]
+	if START_304 == None or START_304.match(string[current]) != None:
+		parser.current = PARSE_304(parser, ARGUMENT_304.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_304,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_304
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_140)
+
+# gamerule keepInventory
+def enter_141(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_141, current, parser.mark(), None, -1]
+	if START_305 == None or START_305.match(string[current]) != None:
+		parser.current = PARSE_305(parser, ARGUMENT_305.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_305,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_305
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_141)
+
+# gamerule logAdminCommands
+def enter_142(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_142, current, parser.mark(), None, -1]
+	if START_306 == None or START_306.match(string[current]) != None:
+		parser.current = PARSE_306(parser, ARGUMENT_306.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_306,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_306
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_142)
+
+# gamerule maxCommandChainLength
+def enter_143(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_143, current, parser.mark(), None, -1]
+	if START_307 == None or START_307.match(string[current]) != None:
+		parser.current = PARSE_307(parser, ARGUMENT_307.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_307,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_307
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_143)
+
+# gamerule maxEntityCramming
+def enter_144(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_144, current, parser.mark(), None, -1]
+	if START_308 == None or START_308.match(string[current]) != None:
+		parser.current = PARSE_308(parser, ARGUMENT_308.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_308,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_308
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_144)
+
+# gamerule mobGriefing
+def enter_145(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_145, current, parser.mark(), None, -1]
+	if START_309 == None or START_309.match(string[current]) != None:
+		parser.current = PARSE_309(parser, ARGUMENT_309.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_309,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_309
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_145)
+
+# gamerule naturalRegeneration
+def enter_146(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_146, current, parser.mark(), None, -1]
+	if START_310 == None or START_310.match(string[current]) != None:
+		parser.current = PARSE_310(parser, ARGUMENT_310.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_310,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_310
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_146)
+
+# gamerule randomTickSpeed
+def enter_147(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_147, current, parser.mark(), None, -1]
+	if START_311 == None or START_311.match(string[current]) != None:
+		parser.current = PARSE_311(parser, ARGUMENT_311.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_311,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_311
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_147)
+
+# gamerule reducedDebugInfo
+def enter_148(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_148, current, parser.mark(), None, -1]
+	if START_312 == None or START_312.match(string[current]) != None:
+		parser.current = PARSE_312(parser, ARGUMENT_312.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_312,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_312
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_148)
+
+# gamerule sendCommandFeedback
+def enter_149(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_149, current, parser.mark(), None, -1]
+	if START_313 == None or START_313.match(string[current]) != None:
+		parser.current = PARSE_313(parser, ARGUMENT_313.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_313,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_313
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_149)
+
+# gamerule showDeathMessages
+def enter_150(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_150, current, parser.mark(), None, -1]
+	if START_314 == None or START_314.match(string[current]) != None:
+		parser.current = PARSE_314(parser, ARGUMENT_314.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_314,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_314
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_150)
+
+# gamerule spawnRadius
+def enter_151(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_151, current, parser.mark(), None, -1]
+	if START_315 == None or START_315.match(string[current]) != None:
+		parser.current = PARSE_315(parser, ARGUMENT_315.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_315,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_315
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_151)
+
+# gamerule spectatorsGenerateChunks
+def enter_152(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_152, current, parser.mark(), None, -1]
+	if START_316 == None or START_316.match(string[current]) != None:
+		parser.current = PARSE_316(parser, ARGUMENT_316.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_316,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_316
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_152)
+
+# give targets
+def enter_153(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_153, current, parser.mark(), None, -1]
+	if START_317 == None or START_317.match(string[current]) != None:
+		parser.current = PARSE_317(parser, ARGUMENT_317.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_317,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_317
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_153)
+
+# help command
+def enter_154(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# kick targets
+def enter_155(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_155, current, parser.mark(), None, -1]
+	if START_318 == None or START_318.match(string[current]) != None:
+		parser.current = PARSE_318(parser, ARGUMENT_318.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_318,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_318
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_155)
+
+# kill targets
+def enter_156(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# list uuids
+def enter_157(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Buried_Treasure
+def enter_158(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Desert_Pyramid
+def enter_159(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate EndCity
+def enter_160(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Fortress
+def enter_161(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Igloo
+def enter_162(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Jungle_Pyramid
+def enter_163(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Mansion
+def enter_164(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Mineshaft
+def enter_165(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Monument
+def enter_166(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Ocean_Ruin
+def enter_167(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Pillager_Outpost
+def enter_168(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Shipwreck
+def enter_169(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Stronghold
+def enter_170(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Swamp_Hut
+def enter_171(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# locate Village
+def enter_172(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give
+def enter_173(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_173, current, parser.mark(), None, -1]
+	if START_319 == None or START_319.match(string[current]) != None:
+		parser.current = PARSE_319(parser, ARGUMENT_319.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_319,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_319
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_173)
+
+# loot insert
+def enter_174(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_174, current, parser.mark(), None, -1]
+	if START_320 == None or START_320.match(string[current]) != None:
+		parser.current = PARSE_320(parser, ARGUMENT_320.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_320,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_320
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_174)
+
+# loot replace
+def enter_175(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_175, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_321
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_322
+	return parser.no_child_matched(CHILDREN_175)
+
+# loot spawn
+def enter_176(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_176, current, parser.mark(), None, -1]
+	if START_323 == None or START_323.match(string[current]) != None:
+		parser.current = PARSE_323(parser, ARGUMENT_323.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_323,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_323
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_176)
+
+# me action
+def enter_177(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# msg targets
+def enter_178(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_178, current, parser.mark(), None, -1]
+	if START_324 == None or START_324.match(string[current]) != None:
+		parser.current = PARSE_324(parser, ARGUMENT_324.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_324,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_324
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_178)
+
+# op targets
+def enter_179(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# pardon targets
+def enter_180(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# pardon-ip target
+def enter_181(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# particle name
+def enter_182(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_182, current, parser.mark(), None, -1]
+	if START_325 == None or START_325.match(string[current]) != None:
+		parser.current = PARSE_325(parser, ARGUMENT_325.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_325,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_325
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_182)
+
+# playsound sound
+def enter_183(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_183, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_183.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_183)
+
+# publish port
+def enter_184(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# recipe give
+def enter_185(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_185, current, parser.mark(), None, -1]
+	if START_336 == None or START_336.match(string[current]) != None:
+		parser.current = PARSE_336(parser, ARGUMENT_336.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_336,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_336
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_185)
+
+# recipe take
+def enter_186(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_186, current, parser.mark(), None, -1]
+	if START_337 == None or START_337.match(string[current]) != None:
+		parser.current = PARSE_337(parser, ARGUMENT_337.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_337,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_337
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_186)
+
+# replaceitem block
+def enter_187(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_187, current, parser.mark(), None, -1]
+	if START_338 == None or START_338.match(string[current]) != None:
+		parser.current = PARSE_338(parser, ARGUMENT_338.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_338,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_338
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_187)
+
+# replaceitem entity
+def enter_188(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_188, current, parser.mark(), None, -1]
+	if START_339 == None or START_339.match(string[current]) != None:
+		parser.current = PARSE_339(parser, ARGUMENT_339.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_339,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_339
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_188)
+
+# save-all flush
+def enter_189(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# say message
+def enter_190(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# schedule function
+def enter_191(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_191, current, parser.mark(), None, -1]
+	if START_340 == None or START_340.match(string[current]) != None:
+		parser.current = PARSE_340(parser, ARGUMENT_340.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_340,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_340
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_191)
+
+# scoreboard objectives
+def enter_192(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_192, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_192.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_192)
+
+# scoreboard players
+def enter_193(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_193, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_193.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_193)
+
+# setblock pos
+def enter_194(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_194, current, parser.mark(), None, -1]
+	if START_354 == None or START_354.match(string[current]) != None:
+		parser.current = PARSE_354(parser, ARGUMENT_354.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_354,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_354
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_194)
+
+# setidletimeout minutes
+def enter_195(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# setworldspawn pos
+def enter_196(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# spawnpoint targets
+def enter_197(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_197, current, parser.mark(), None, -1]
+	if START_355 == None or START_355.match(string[current]) != None:
+		parser.current = PARSE_355(parser, ARGUMENT_355.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_355,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_355
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_197)
+
+# spreadplayers center
+def enter_198(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_198, current, parser.mark(), None, -1]
+	if START_356 == None or START_356.match(string[current]) != None:
+		parser.current = PARSE_356(parser, ARGUMENT_356.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_356,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_356
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_198)
+
+# stopsound targets
+def enter_199(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_199, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_199.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_199)
+
+# summon entity
+def enter_200(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_200, current, parser.mark(), None, -1]
+	if START_368 == None or START_368.match(string[current]) != None:
+		parser.current = PARSE_368(parser, ARGUMENT_368.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_368,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_368
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_200)
+
+# tag targets
+def enter_201(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_201, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'add':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_369
+	elif token == 'list':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_370
+	elif token == 'remove':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_371
+	return parser.no_child_matched(CHILDREN_201)
+
+# team add
+def enter_202(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_202, current, parser.mark(), None, -1]
+	if START_372 == None or START_372.match(string[current]) != None:
+		parser.current = PARSE_372(parser, ARGUMENT_372.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_372,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_372
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_202)
+
+# team empty
+def enter_203(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_203, current, parser.mark(), None, -1]
+	if START_373 == None or START_373.match(string[current]) != None:
+		parser.current = PARSE_373(parser, ARGUMENT_373.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_373,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_373
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_203)
+
+# team join
+def enter_204(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_204, current, parser.mark(), None, -1]
+	if START_374 == None or START_374.match(string[current]) != None:
+		parser.current = PARSE_374(parser, ARGUMENT_374.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_374,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_374
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_204)
+
+# team leave
+def enter_205(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_205, current, parser.mark(), None, -1]
+	if START_375 == None or START_375.match(string[current]) != None:
+		parser.current = PARSE_375(parser, ARGUMENT_375.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_375,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_375
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_205)
+
+# team list
+def enter_206(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_206, current, parser.mark(), None, -1]
+	if START_376 == None or START_376.match(string[current]) != None:
+		parser.current = PARSE_376(parser, ARGUMENT_376.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_376,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_376
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_206)
+
+# team modify
+def enter_207(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_207, current, parser.mark(), None, -1]
+	if START_377 == None or START_377.match(string[current]) != None:
+		parser.current = PARSE_377(parser, ARGUMENT_377.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_377,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_377
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_207)
+
+# team remove
+def enter_208(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_208, current, parser.mark(), None, -1]
+	if START_378 == None or START_378.match(string[current]) != None:
+		parser.current = PARSE_378(parser, ARGUMENT_378.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_378,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_378
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_208)
+
+# teammsg message
+def enter_209(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# teleport destination
+def enter_210(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# teleport location
+def enter_211(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# teleport targets
+def enter_212(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_212, current, parser.mark(), None, -1]
+	argument = parser.next_child(frame)
+	if argument != None:
+		stack.append(frame)
+		return argument.enter
+	return parser.no_child_matched(CHILDREN_212)
+
+# tellraw targets
+def enter_213(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_213, current, parser.mark(), None, -1]
+	if START_381 == None or START_381.match(string[current]) != None:
+		parser.current = PARSE_381(parser, ARGUMENT_381.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_381,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_381
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_213)
+
+# time add
+def enter_214(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_214, current, parser.mark(), None, -1]
+	if START_382 == None or START_382.match(string[current]) != None:
+		parser.current = PARSE_382(parser, ARGUMENT_382.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_382,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_382
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_214)
+
+# time query
+def enter_215(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_215, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'day':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_383
+	elif token == 'daytime':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_384
+	elif token == 'gametime':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_385
+	return parser.no_child_matched(CHILDREN_215)
+
+# time set
+def enter_216(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_216, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'day':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_386
+	elif token == 'midnight':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_387
+	elif token == 'night':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_388
+	elif token == 'noon':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_389
+	if START_390 == None or START_390.match(string[current]) != None:
+		parser.current = PARSE_390(parser, ARGUMENT_390.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_390,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_390
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_216)
+
+# title targets
+def enter_217(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_217, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_217.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_217)
+
+# trigger objective
+def enter_218(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_218, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'add':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_397
+	elif token == 'set':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_398
+	return parser.no_child_matched(CHILDREN_218)
+
+# weather clear
+def enter_219(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_219, current, parser.mark(), None, -1]
+	if START_399 == None or START_399.match(string[current]) != None:
+		parser.current = PARSE_399(parser, ARGUMENT_399.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_399,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_399
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_219)
+
+# weather rain
+def enter_220(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_220, current, parser.mark(), None, -1]
+	if START_400 == None or START_400.match(string[current]) != None:
+		parser.current = PARSE_400(parser, ARGUMENT_400.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_400,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_400
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_220)
+
+# weather thunder
+def enter_221(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_221, current, parser.mark(), None, -1]
+	if START_401 == None or START_401.match(string[current]) != None:
+		parser.current = PARSE_401(parser, ARGUMENT_401.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_401,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_401
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_221)
+
+# whitelist add
+def enter_222(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_222, current, parser.mark(), None, -1]
+	if START_402 == None or START_402.match(string[current]) != None:
+		parser.current = PARSE_402(parser, ARGUMENT_402.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_402,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_402
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_222)
+
+# whitelist list
+def enter_223(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# whitelist off
+def enter_224(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# whitelist on
+def enter_225(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# whitelist reload
+def enter_226(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# whitelist remove
+def enter_227(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_227, current, parser.mark(), None, -1]
+	if START_403 == None or START_403.match(string[current]) != None:
+		parser.current = PARSE_403(parser, ARGUMENT_403.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_403,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_403
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_227)
+
+# worldborder add
+def enter_228(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_228, current, parser.mark(), None, -1]
+	if START_404 == None or START_404.match(string[current]) != None:
+		parser.current = PARSE_404(parser, ARGUMENT_404.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_404,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_404
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_228)
+
+# worldborder center
+def enter_229(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_229, current, parser.mark(), None, -1]
+	if START_405 == None or START_405.match(string[current]) != None:
+		parser.current = PARSE_405(parser, ARGUMENT_405.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_405,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_405
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_229)
+
+# worldborder damage
+def enter_230(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_230, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'amount':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_406
+	elif token == 'buffer':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_407
+	return parser.no_child_matched(CHILDREN_230)
+
+# worldborder get
+def enter_231(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# worldborder set
+def enter_232(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_232, current, parser.mark(), None, -1]
+	if START_408 == None or START_408.match(string[current]) != None:
+		parser.current = PARSE_408(parser, ARGUMENT_408.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_408,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_408
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_232)
+
+# worldborder warning
+def enter_233(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_233, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'distance':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_409
+	elif token == 'time':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_410
+	return parser.no_child_matched(CHILDREN_233)
+
+# advancement grant targets
+def enter_234(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_234, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_234.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_234)
+
+# advancement revoke targets
+def enter_235(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_235, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_235.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_235)
+
+# ban targets reason
+def enter_236(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# ban-ip target reason
+def enter_237(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar add id
+def enter_238(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_238, current, parser.mark(), None, -1]
+	if START_421 == None or START_421.match(string[current]) != None:
+		parser.current = PARSE_421(parser, ARGUMENT_421.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_421,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_421
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_238)
+
+# bossbar get id
+def enter_239(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_239, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'max':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_422
+	elif token == 'players':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_423
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_424
+	elif token == 'visible':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_425
+	return parser.no_child_matched(CHILDREN_239)
+
+# bossbar remove id
+def enter_240(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id
+def enter_241(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_241, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_241.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_241)
+
+# clear targets item
+def enter_242(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_242, current, parser.mark(), None, -1]
+	if START_433 == None or START_433.match(string[current]) != None:
+		parser.current = PARSE_433(parser, ARGUMENT_433.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_433,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_433
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_242)
+
+# clone begin end
+def enter_243(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_243, current, parser.mark(), None, -1]
+	if START_434 == None or START_434.match(string[current]) != None:
+		parser.current = PARSE_434(parser, ARGUMENT_434.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_434,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_434
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_243)
+
+# data get block
+def enter_244(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_244, current, parser.mark(), None, -1]
+	if START_435 == None or START_435.match(string[current]) != None:
+		parser.current = PARSE_435(parser, ARGUMENT_435.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_435,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_435
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_244)
+
+# data get entity
+def enter_245(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_245, current, parser.mark(), None, -1]
+	if START_436 == None or START_436.match(string[current]) != None:
+		parser.current = PARSE_436(parser, ARGUMENT_436.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_436,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_436
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_245)
+
+# data merge block
+def enter_246(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_246, current, parser.mark(), None, -1]
+	if START_437 == None or START_437.match(string[current]) != None:
+		parser.current = PARSE_437(parser, ARGUMENT_437.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_437,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_437
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_246)
+
+# data merge entity
+def enter_247(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_247, current, parser.mark(), None, -1]
+	if START_438 == None or START_438.match(string[current]) != None:
+		parser.current = PARSE_438(parser, ARGUMENT_438.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_438,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_438
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_247)
+
+# data modify block
+def enter_248(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_248, current, parser.mark(), None, -1]
+	if START_439 == None or START_439.match(string[current]) != None:
+		parser.current = PARSE_439(parser, ARGUMENT_439.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_439,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_439
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_248)
+
+# data modify entity
+def enter_249(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_249, current, parser.mark(), None, -1]
+	if START_440 == None or START_440.match(string[current]) != None:
+		parser.current = PARSE_440(parser, ARGUMENT_440.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_440,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_440
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_249)
+
+# data remove block
+def enter_250(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_250, current, parser.mark(), None, -1]
+	if START_441 == None or START_441.match(string[current]) != None:
+		parser.current = PARSE_441(parser, ARGUMENT_441.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_441,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_441
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_250)
+
+# data remove entity
+def enter_251(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_251, current, parser.mark(), None, -1]
+	if START_442 == None or START_442.match(string[current]) != None:
+		parser.current = PARSE_442(parser, ARGUMENT_442.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_442,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_442
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_251)
+
+# datapack disable name
+def enter_252(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# datapack enable name
+def enter_253(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_253, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'after':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_443
+	elif token == 'before':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_444
+	elif token == 'first':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_445
+	elif token == 'last':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_446
+	return parser.no_child_matched(CHILDREN_253)
+
+# datapack list available
+def enter_254(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# datapack list enabled
+def enter_255(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# effect clear targets
+def enter_256(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_256, current, parser.mark(), None, -1]
+	if START_447 == None or START_447.match(string[current]) != None:
+		parser.current = PARSE_447(parser, ARGUMENT_447.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_447,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_447
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_256)
+
+# effect give targets
+def enter_257(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_257, current, parser.mark(), None, -1]
+	if START_448 == None or START_448.match(string[current]) != None:
+		parser.current = PARSE_448(parser, ARGUMENT_448.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_448,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_448
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_257)
+
+# enchant targets enchantment
+def enter_258(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_258, current, parser.mark(), None, -1]
+	if START_449 == None or START_449.match(string[current]) != None:
+		parser.current = PARSE_449(parser, ARGUMENT_449.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_449,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_449
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_258)
+
+# execute align axes
+def enter_259(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute anchored anchor
+def enter_260(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute as targets
+def enter_261(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute at targets
+def enter_262(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute facing entity
+def enter_263(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_263, current, parser.mark(), None, -1]
+	if START_450 == None or START_450.match(string[current]) != None:
+		parser.current = PARSE_450(parser, ARGUMENT_450.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_450,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_450
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_263)
+
+# execute facing pos
+def enter_264(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute if block
+def enter_265(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_265, current, parser.mark(), None, -1]
+	if START_451 == None or START_451.match(string[current]) != None:
+		parser.current = PARSE_451(parser, ARGUMENT_451.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_451,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_451
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_265)
+
+# execute if blocks
+def enter_266(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_266, current, parser.mark(), None, -1]
+	if START_452 == None or START_452.match(string[current]) != None:
+		parser.current = PARSE_452(parser, ARGUMENT_452.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_452,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_452
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_266)
+
+# execute if data
+def enter_267(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_267, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_453
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_454
+	return parser.no_child_matched(CHILDREN_267)
+
+# execute if entity
+def enter_268(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_268, current, parser.mark(), None, -1]
+	if START_455 == None or START_455.match(string[current]) != None:
+		parser.current = PARSE_455(parser, ARGUMENT_455.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_455,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_455
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_268)
+
+# execute if score
+def enter_269(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_269, current, parser.mark(), None, -1]
+	if START_456 == None or START_456.match(string[current]) != None:
+		parser.current = PARSE_456(parser, ARGUMENT_456.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_456,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_456
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_269)
+
+# execute in dimension
+def enter_270(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute positioned as
+def enter_271(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_271, current, parser.mark(), None, -1]
+	if START_457 == None or START_457.match(string[current]) != None:
+		parser.current = PARSE_457(parser, ARGUMENT_457.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_457,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_457
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_271)
+
+# execute positioned pos
+def enter_272(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute rotated as
+def enter_273(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_273, current, parser.mark(), None, -1]
+	if START_458 == None or START_458.match(string[current]) != None:
+		parser.current = PARSE_458(parser, ARGUMENT_458.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_458,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_458
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_273)
+
+# execute rotated rot
+def enter_274(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result
+def enter_275(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_275, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_459
+	elif token == 'bossbar':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_460
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_461
+	elif token == 'score':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_462
+	return parser.no_child_matched(CHILDREN_275)
+
+# execute store success
+def enter_276(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_276, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_463
+	elif token == 'bossbar':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_464
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_465
+	elif token == 'score':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_466
+	return parser.no_child_matched(CHILDREN_276)
+
+# execute unless block
+def enter_277(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_277, current, parser.mark(), None, -1]
+	if START_467 == None or START_467.match(string[current]) != None:
+		parser.current = PARSE_467(parser, ARGUMENT_467.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_467,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_467
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_277)
+
+# execute unless blocks
+def enter_278(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_278, current, parser.mark(), None, -1]
+	if START_468 == None or START_468.match(string[current]) != None:
+		parser.current = PARSE_468(parser, ARGUMENT_468.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_468,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_468
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_278)
+
+# execute unless data
+def enter_279(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_279, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_469
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_470
+	return parser.no_child_matched(CHILDREN_279)
+
+# execute unless entity
+def enter_280(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_280, current, parser.mark(), None, -1]
+	if START_471 == None or START_471.match(string[current]) != None:
+		parser.current = PARSE_471(parser, ARGUMENT_471.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_471,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_471
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_280)
+
+# execute unless score
+def enter_281(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_281, current, parser.mark(), None, -1]
+	if START_472 == None or START_472.match(string[current]) != None:
+		parser.current = PARSE_472(parser, ARGUMENT_472.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_472,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_472
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_281)
+
+# experience add targets
+def enter_282(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_282, current, parser.mark(), None, -1]
+	if START_473 == None or START_473.match(string[current]) != None:
+		parser.current = PARSE_473(parser, ARGUMENT_473.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_473,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_473
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_282)
+
+# experience query targets
+def enter_283(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_283, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'levels':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_474
+	elif token == 'points':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_475
+	return parser.no_child_matched(CHILDREN_283)
+
+# experience set targets
+def enter_284(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_284, current, parser.mark(), None, -1]
+	if START_476 == None or START_476.match(string[current]) != None:
+		parser.current = PARSE_476(parser, ARGUMENT_476.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_476,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_476
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_284)
+
+# fill from to
+def enter_285(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_285, current, parser.mark(), None, -1]
+	if START_477 == None or START_477.match(string[current]) != None:
+		parser.current = PARSE_477(parser, ARGUMENT_477.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_477,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_477
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_285)
+
+# forceload add from
+def enter_286(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_286, current, parser.mark(), None, -1]
+	if START_478 == None or START_478.match(string[current]) != None:
+		parser.current = PARSE_478(parser, ARGUMENT_478.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_478,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_478
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_286)
+
+# forceload query pos
+def enter_287(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# forceload remove all
+def enter_288(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# forceload remove from
+def enter_289(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_289, current, parser.mark(), None, -1]
+	if START_479 == None or START_479.match(string[current]) != None:
+		parser.current = PARSE_479(parser, ARGUMENT_479.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_479,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_479
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_289)
+
+# gamemode adventure target
+def enter_290(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamemode creative target
+def enter_291(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamemode spectator target
+def enter_292(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamemode survival target
+def enter_293(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule announceAdvancements value
+def enter_294(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule commandBlockOutput value
+def enter_295(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule disableElytraMovementCheck value
+def enter_296(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule doDaylightCycle value
+def enter_297(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule doEntityDrops value
+def enter_298(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule doFireTick value
+def enter_299(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule doLimitedCrafting value
+def enter_300(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule doMobLoot value
+def enter_301(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule doMobSpawning value
+def enter_302(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule doTileDrops value
+def enter_303(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule doWeatherCycle value
+def enter_304(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule keepInventory value
+def enter_305(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule logAdminCommands value
+def enter_306(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule maxCommandChainLength value
+def enter_307(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule maxEntityCramming value
+def enter_308(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule mobGriefing value
+def enter_309(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule naturalRegeneration value
+def enter_310(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule randomTickSpeed value
+def enter_311(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule reducedDebugInfo value
+def enter_312(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule sendCommandFeedback value
+def enter_313(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule showDeathMessages value
+def enter_314(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule spawnRadius value
+def enter_315(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# gamerule spectatorsGenerateChunks value
+def enter_316(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# give targets item
+def enter_317(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_317, current, parser.mark(), None, -1]
+	if START_480 == None or START_480.match(string[current]) != None:
+		parser.current = PARSE_480(parser, ARGUMENT_480.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_480,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_480
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_317)
+
+# kick targets reason
+def enter_318(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give players
+def enter_319(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_319, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'fish':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_481
+	elif token == 'kill':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_482
+	elif token == 'loot':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_483
+	elif token == 'mine':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_484
+	return parser.no_child_matched(CHILDREN_319)
+
+# loot insert targetPos
+def enter_320(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_320, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'fish':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_485
+	elif token == 'kill':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_486
+	elif token == 'loot':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_487
+	elif token == 'mine':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_488
+	return parser.no_child_matched(CHILDREN_320)
+
+# loot replace block
+def enter_321(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_321, current, parser.mark(), None, -1]
+	if START_489 == None or START_489.match(string[current]) != None:
+		parser.current = PARSE_489(parser, ARGUMENT_489.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_489,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_489
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_321)
+
+# loot replace entity
+def enter_322(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_322, current, parser.mark(), None, -1]
+	if START_490 == None or START_490.match(string[current]) != None:
+		parser.current = PARSE_490(parser, ARGUMENT_490.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_490,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_490
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_322)
+
+# loot spawn targetPos
+def enter_323(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_323, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'fish':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_491
+	elif token == 'kill':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_492
+	elif token == 'loot':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_493
+	elif token == 'mine':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_494
+	return parser.no_child_matched(CHILDREN_323)
+
+# msg targets message
+def enter_324(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# particle name pos
+def enter_325(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_325, current, parser.mark(), None, -1]
+	if START_495 == None or START_495.match(string[current]) != None:
+		parser.current = PARSE_495(parser, ARGUMENT_495.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_495,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_495
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_325)
+
+# playsound sound ambient
+def enter_326(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_326, current, parser.mark(), None, -1]
+	if START_496 == None or START_496.match(string[current]) != None:
+		parser.current = PARSE_496(parser, ARGUMENT_496.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_496,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_496
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_326)
+
+# playsound sound block
+def enter_327(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_327, current, parser.mark(), None, -1]
+	if START_497 == None or START_497.match(string[current]) != None:
+		parser.current = PARSE_497(parser, ARGUMENT_497.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_497,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_497
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_327)
+
+# playsound sound hostile
+def enter_328(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_328, current, parser.mark(), None, -1]
+	if START_498 == None or START_498.match(string[current]) != None:
+		parser.current = PARSE_498(parser, ARGUMENT_498.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_498,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_498
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_328)
+
+# playsound sound master
+def enter_329(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_329, current, parser.mark(), None, -1]
+	if START_499 == None or START_499.match(string[current]) != None:
+		parser.current = PARSE_499(parser, ARGUMENT_499.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_499,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_499
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_329)
+
+# playsound sound music
+def enter_330(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_330, current, parser.mark(), None, -1]
+	if START_500 == None or START_500.match(string[current]) != None:
+		parser.current = PARSE_500(parser, ARGUMENT_500.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_500,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_500
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_330)
+
+# playsound sound neutral
+def enter_331(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_331, current, parser.mark(), None, -1]
+	if START_501 == None or START_501.match(string[current]) != None:
+		parser.current = PARSE_501(parser, ARGUMENT_501.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_501,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_501
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_331)
+
+# playsound sound player
+def enter_332(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_332, current, parser.mark(), None, -1]
+	if START_502 == None or START_502.match(string[current]) != None:
+		parser.current = PARSE_502(parser, ARGUMENT_502.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_502,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_502
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_332)
+
+# playsound sound record
+def enter_333(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_333, current, parser.mark(), None, -1]
+	if START_503 == None or START_503.match(string[current]) != None:
+		parser.current = PARSE_503(parser, ARGUMENT_503.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_503,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_503
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_333)
+
+# playsound sound voice
+def enter_334(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_334, current, parser.mark(), None, -1]
+	if START_504 == None or START_504.match(string[current]) != None:
+		parser.current = PARSE_504(parser, ARGUMENT_504.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_504,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_504
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_334)
+
+# playsound sound weather
+def enter_335(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_335, current, parser.mark(), None, -1]
+	if START_505 == None or START_505.match(string[current]) != None:
+		parser.current = PARSE_505(parser, ARGUMENT_505.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_505,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_505
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_335)
+
+# recipe give targets
+def enter_336(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_336, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == '*':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 1)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 1
+		stack.append(frame)
+		return enter_506
+	if START_507 == None or START_507.match(string[current]) != None:
+		parser.current = PARSE_507(parser, ARGUMENT_507.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_507,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_507
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_336)
+
+# recipe take targets
+def enter_337(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_337, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == '*':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 1)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 1
+		stack.append(frame)
+		return enter_508
+	if START_509 == None or START_509.match(string[current]) != None:
+		parser.current = PARSE_509(parser, ARGUMENT_509.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_509,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_509
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_337)
+
+# replaceitem block pos
+def enter_338(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_338, current, parser.mark(), None, -1]
+	if START_510 == None or START_510.match(string[current]) != None:
+		parser.current = PARSE_510(parser, ARGUMENT_510.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_510,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_510
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_338)
+
+# replaceitem entity targets
+def enter_339(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_339, current, parser.mark(), None, -1]
+	if START_511 == None or START_511.match(string[current]) != None:
+		parser.current = PARSE_511(parser, ARGUMENT_511.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_511,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_511
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_339)
+
+# schedule function function
+def enter_340(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_340, current, parser.mark(), None, -1]
+	if START_512 == None or START_512.match(string[current]) != None:
+		parser.current = PARSE_512(parser, ARGUMENT_512.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_512,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_512
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_340)
+
+# scoreboard objectives add
+def enter_341(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_341, current, parser.mark(), None, -1]
+	if START_513 == None or START_513.match(string[current]) != None:
+		parser.current = PARSE_513(parser, ARGUMENT_513.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_513,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_513
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_341)
+
+# scoreboard objectives list
+def enter_342(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard objectives modify
+def enter_343(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_343, current, parser.mark(), None, -1]
+	if START_514 == None or START_514.match(string[current]) != None:
+		parser.current = PARSE_514(parser, ARGUMENT_514.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_514,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_514
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_343)
+
+# scoreboard objectives remove
+def enter_344(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_344, current, parser.mark(), None, -1]
+	if START_515 == None or START_515.match(string[current]) != None:
+		parser.current = PARSE_515(parser, ARGUMENT_515.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_515,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_515
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_344)
+
+# scoreboard objectives setdisplay
+def enter_345(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_345, current, parser.mark(), None, -1]
+	if START_516 == None or START_516.match(string[current]) != None:
+		parser.current = PARSE_516(parser, ARGUMENT_516.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_516,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_516
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_345)
+
+# scoreboard players add
+def enter_346(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_346, current, parser.mark(), None, -1]
+	if START_517 == None or START_517.match(string[current]) != None:
+		parser.current = PARSE_517(parser, ARGUMENT_517.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_517,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_517
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_346)
+
+# scoreboard players enable
+def enter_347(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_347, current, parser.mark(), None, -1]
+	if START_518 == None or START_518.match(string[current]) != None:
+		parser.current = PARSE_518(parser, ARGUMENT_518.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_518,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_518
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_347)
+
+# scoreboard players get
+def enter_348(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_348, current, parser.mark(), None, -1]
+	if START_519 == None or START_519.match(string[current]) != None:
+		parser.current = PARSE_519(parser, ARGUMENT_519.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_519,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_519
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_348)
+
+# scoreboard players list
+def enter_349(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_349, current, parser.mark(), None, -1]
+	if START_520 == None or START_520.match(string[current]) != None:
+		parser.current = PARSE_520(parser, ARGUMENT_520.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_520,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_520
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_349)
+
+# scoreboard players operation
+def enter_350(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_350, current, parser.mark(), None, -1]
+	if START_521 == None or START_521.match(string[current]) != None:
+		parser.current = PARSE_521(parser, ARGUMENT_521.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_521,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_521
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_350)
+
+# scoreboard players remove
+def enter_351(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_351, current, parser.mark(), None, -1]
+	if START_522 == None or START_522.match(string[current]) != None:
+		parser.current = PARSE_522(parser, ARGUMENT_522.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_522,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_522
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_351)
+
+# scoreboard players reset
+def enter_352(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_352, current, parser.mark(), None, -1]
+	if START_523 == None or START_523.match(string[current]) != None:
+		parser.current = PARSE_523(parser, ARGUMENT_523.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_523,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_523
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_352)
+
+# scoreboard players set
+def enter_353(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_353, current, parser.mark(), None, -1]
+	if START_524 == None or START_524.match(string[current]) != None:
+		parser.current = PARSE_524(parser, ARGUMENT_524.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_524,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_524
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_353)
+
+# setblock pos block
+def enter_354(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_354, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'destroy':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_525
+	elif token == 'keep':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_526
+	elif token == 'replace':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_527
+	return parser.no_child_matched(CHILDREN_354)
+
+# spawnpoint targets pos
+def enter_355(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# spreadplayers center spreadDistance
+def enter_356(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_356, current, parser.mark(), None, -1]
+	if START_528 == None or START_528.match(string[current]) != None:
+		parser.current = PARSE_528(parser, ARGUMENT_528.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_528,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_528
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_356)
+
+# stopsound targets *
+def enter_357(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_357, current, parser.mark(), None, -1]
+	if START_529 == None or START_529.match(string[current]) != None:
+		parser.current = PARSE_529(parser, ARGUMENT_529.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_529,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_529
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_357)
+
+# stopsound targets ambient
+def enter_358(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_358, current, parser.mark(), None, -1]
+	if START_530 == None or START_530.match(string[current]) != None:
+		parser.current = PARSE_530(parser, ARGUMENT_530.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_530,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_530
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_358)
+
+# stopsound targets block
+def enter_359(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_359, current, parser.mark(), None, -1]
+	if START_531 == None or START_531.match(string[current]) != None:
+		parser.current = PARSE_531(parser, ARGUMENT_531.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_531,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_531
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_359)
+
+# stopsound targets hostile
+def enter_360(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_360, current, parser.mark(), None, -1]
+	if START_532 == None or START_532.match(string[current]) != None:
+		parser.current = PARSE_532(parser, ARGUMENT_532.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_532,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_532
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_360)
+
+# stopsound targets master
+def enter_361(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_361, current, parser.mark(), None, -1]
+	if START_533 == None or START_533.match(string[current]) != None:
+		parser.current = PARSE_533(parser, ARGUMENT_533.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_533,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_533
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_361)
+
+# stopsound targets music
+def enter_362(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_362, current, parser.mark(), None, -1]
+	if START_534 == None or START_534.match(string[current]) != None:
+		parser.current = PARSE_534(parser, ARGUMENT_534.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_534,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_534
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_362)
+
+# stopsound targets neutral
+def enter_363(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_363, current, parser.mark(), None, -1]
+	if START_535 == None or START_535.match(string[current]) != None:
+		parser.current = PARSE_535(parser, ARGUMENT_535.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_535,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_535
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_363)
+
+# stopsound targets player
+def enter_364(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_364, current, parser.mark(), None, -1]
+	if START_536 == None or START_536.match(string[current]) != None:
+		parser.current = PARSE_536(parser, ARGUMENT_536.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_536,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_536
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_364)
+
+# stopsound targets record
+def enter_365(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_365, current, parser.mark(), None, -1]
+	if START_537 == None or START_537.match(string[current]) != None:
+		parser.current = PARSE_537(parser, ARGUMENT_537.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_537,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_537
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_365)
+
+# stopsound targets voice
+def enter_366(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_366, current, parser.mark(), None, -1]
+	if START_538 == None or START_538.match(string[current]) != None:
+		parser.current = PARSE_538(parser, ARGUMENT_538.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_538,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_538
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_366)
+
+# stopsound targets weather
+def enter_367(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_367, current, parser.mark(), None, -1]
+	if START_539 == None or START_539.match(string[current]) != None:
+		parser.current = PARSE_539(parser, ARGUMENT_539.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_539,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_539
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_367)
+
+# summon entity pos
+def enter_368(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_368, current, parser.mark(), None, -1]
+	if START_540 == None or START_540.match(string[current]) != None:
+		parser.current = PARSE_540(parser, ARGUMENT_540.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_540,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_540
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_368)
+
+# tag targets add
+def enter_369(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_369, current, parser.mark(), None, -1]
+	if START_541 == None or START_541.match(string[current]) != None:
+		parser.current = PARSE_541(parser, ARGUMENT_541.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_541,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_541
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_369)
+
+# tag targets list
+def enter_370(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# tag targets remove
+def enter_371(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_371, current, parser.mark(), None, -1]
+	if START_542 == None or START_542.match(string[current]) != None:
+		parser.current = PARSE_542(parser, ARGUMENT_542.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_542,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_542
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_371)
+
+# team add team
+def enter_372(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_372, current, parser.mark(), None, -1]
+	if START_543 == None or START_543.match(string[current]) != None:
+		parser.current = PARSE_543(parser, ARGUMENT_543.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_543,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_543
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_372)
+
+# team empty team
+def enter_373(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team join team
+def enter_374(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_374, current, parser.mark(), None, -1]
+	if START_544 == None or START_544.match(string[current]) != None:
+		parser.current = PARSE_544(parser, ARGUMENT_544.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_544,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_544
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_374)
+
+# team leave members
+def enter_375(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team list team
+def enter_376(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team
+def enter_377(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_377, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_377.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_377)
+
+# team remove team
+def enter_378(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# teleport targets destination
+def enter_379(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# teleport targets location
+def enter_380(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_380, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'facing':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_554
+	if START_555 == None or START_555.match(string[current]) != None:
+		parser.current = PARSE_555(parser, ARGUMENT_555.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_555,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_555
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_380)
+
+# tellraw targets message
+def enter_381(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# time add time
+def enter_382(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# time query day
+def enter_383(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# time query daytime
+def enter_384(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# time query gametime
+def enter_385(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# time set day
+def enter_386(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# time set midnight
+def enter_387(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# time set night
+def enter_388(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# time set noon
+def enter_389(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# time set time
+def enter_390(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# title targets actionbar
+def enter_391(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_391, current, parser.mark(), None, -1]
+	if START_556 == None or START_556.match(string[current]) != None:
+		parser.current = PARSE_556(parser, ARGUMENT_556.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_556,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_556
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_391)
+
+# title targets clear
+def enter_392(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# title targets reset
+def enter_393(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# title targets subtitle
+def enter_394(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_394, current, parser.mark(), None, -1]
+	if START_557 == None or START_557.match(string[current]) != None:
+		parser.current = PARSE_557(parser, ARGUMENT_557.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_557,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_557
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_394)
+
+# title targets times
+def enter_395(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_395, current, parser.mark(), None, -1]
+	if START_558 == None or START_558.match(string[current]) != None:
+		parser.current = PARSE_558(parser, ARGUMENT_558.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_558,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_558
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_395)
+
+# title targets title
+def enter_396(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_396, current, parser.mark(), None, -1]
+	if START_559 == None or START_559.match(string[current]) != None:
+		parser.current = PARSE_559(parser, ARGUMENT_559.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_559,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_559
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_396)
+
+# trigger objective add
+def enter_397(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_397, current, parser.mark(), None, -1]
+	if START_560 == None or START_560.match(string[current]) != None:
+		parser.current = PARSE_560(parser, ARGUMENT_560.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_560,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_560
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_397)
+
+# trigger objective set
+def enter_398(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_398, current, parser.mark(), None, -1]
+	if START_561 == None or START_561.match(string[current]) != None:
+		parser.current = PARSE_561(parser, ARGUMENT_561.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_561,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_561
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_398)
+
+# weather clear duration
+def enter_399(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# weather rain duration
+def enter_400(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# weather thunder duration
+def enter_401(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# whitelist add targets
+def enter_402(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# whitelist remove targets
+def enter_403(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# worldborder add distance
+def enter_404(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_404, current, parser.mark(), None, -1]
+	if START_562 == None or START_562.match(string[current]) != None:
+		parser.current = PARSE_562(parser, ARGUMENT_562.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_562,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_562
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_404)
+
+# worldborder center pos
+def enter_405(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# worldborder damage amount
+def enter_406(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_406, current, parser.mark(), None, -1]
+	if START_563 == None or START_563.match(string[current]) != None:
+		parser.current = PARSE_563(parser, ARGUMENT_563.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_563,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_563
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_406)
+
+# worldborder damage buffer
+def enter_407(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_407, current, parser.mark(), None, -1]
+	if START_564 == None or START_564.match(string[current]) != None:
+		parser.current = PARSE_564(parser, ARGUMENT_564.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_564,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_564
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_407)
+
+# worldborder set distance
+def enter_408(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_408, current, parser.mark(), None, -1]
+	if START_565 == None or START_565.match(string[current]) != None:
+		parser.current = PARSE_565(parser, ARGUMENT_565.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_565,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_565
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_408)
+
+# worldborder warning distance
+def enter_409(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_409, current, parser.mark(), None, -1]
+	if START_566 == None or START_566.match(string[current]) != None:
+		parser.current = PARSE_566(parser, ARGUMENT_566.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_566,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_566
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_409)
+
+# worldborder warning time
+def enter_410(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_410, current, parser.mark(), None, -1]
+	if START_567 == None or START_567.match(string[current]) != None:
+		parser.current = PARSE_567(parser, ARGUMENT_567.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_567,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_567
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_410)
+
+# advancement grant targets everything
+def enter_411(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# advancement grant targets from
+def enter_412(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_412, current, parser.mark(), None, -1]
+	if START_568 == None or START_568.match(string[current]) != None:
+		parser.current = PARSE_568(parser, ARGUMENT_568.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_568,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_568
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_412)
+
+# advancement grant targets only
+def enter_413(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_413, current, parser.mark(), None, -1]
+	if START_569 == None or START_569.match(string[current]) != None:
+		parser.current = PARSE_569(parser, ARGUMENT_569.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_569,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_569
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_413)
+
+# advancement grant targets through
+def enter_414(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_414, current, parser.mark(), None, -1]
+	if START_570 == None or START_570.match(string[current]) != None:
+		parser.current = PARSE_570(parser, ARGUMENT_570.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_570,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_570
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_414)
+
+# advancement grant targets until
+def enter_415(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_415, current, parser.mark(), None, -1]
+	if START_571 == None or START_571.match(string[current]) != None:
+		parser.current = PARSE_571(parser, ARGUMENT_571.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_571,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_571
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_415)
+
+# advancement revoke targets everything
+def enter_416(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# advancement revoke targets from
+def enter_417(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_417, current, parser.mark(), None, -1]
+	if START_572 == None or START_572.match(string[current]) != None:
+		parser.current = PARSE_572(parser, ARGUMENT_572.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_572,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_572
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_417)
+
+# advancement revoke targets only
+def enter_418(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_418, current, parser.mark(), None, -1]
+	if START_573 == None or START_573.match(string[current]) != None:
+		parser.current = PARSE_573(parser, ARGUMENT_573.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_573,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_573
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_418)
+
+# advancement revoke targets through
+def enter_419(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_419, current, parser.mark(), None, -1]
+	if START_574 == None or START_574.match(string[current]) != None:
+		parser.current = PARSE_574(parser, ARGUMENT_574.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_574,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_574
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_419)
+
+# advancement revoke targets until
+def enter_420(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_420, current, parser.mark(), None, -1]
+	if START_575 == None or START_575.match(string[current]) != None:
+		parser.current = PARSE_575(parser, ARGUMENT_575.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_575,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_575
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_420)
+
+# bossbar add id name
+def enter_421(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar get id max
+def enter_422(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar get id players
+def enter_423(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar get id value
+def enter_424(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar get id visible
+def enter_425(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id color
+def enter_426(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_426, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_426.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_426)
+
+# bossbar set id max
+def enter_427(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_427, current, parser.mark(), None, -1]
+	if START_583 == None or START_583.match(string[current]) != None:
+		parser.current = PARSE_583(parser, ARGUMENT_583.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_583,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_583
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_427)
+
+# bossbar set id name
+def enter_428(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_428, current, parser.mark(), None, -1]
+	if START_584 == None or START_584.match(string[current]) != None:
+		parser.current = PARSE_584(parser, ARGUMENT_584.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_584,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_584
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_428)
+
+# bossbar set id players
+def enter_429(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_429, current, parser.mark(), None, -1]
+	if START_585 == None or START_585.match(string[current]) != None:
+		parser.current = PARSE_585(parser, ARGUMENT_585.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_585,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_585
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_429)
+
+# bossbar set id style
+def enter_430(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_430, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_430.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_430)
+
+# bossbar set id value
+def enter_431(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_431, current, parser.mark(), None, -1]
+	if START_591 == None or START_591.match(string[current]) != None:
+		parser.current = PARSE_591(parser, ARGUMENT_591.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_591,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_591
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_431)
+
+# bossbar set id visible
+def enter_432(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_432, current, parser.mark(), None, -1]
+	if START_592 == None or START_592.match(string[current]) != None:
+		parser.current = PARSE_592(parser, ARGUMENT_592.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_592,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_592
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_432)
+
+# clear targets item maxCount
+def enter_433(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination
+def enter_434(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_434, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'filtered':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_593
+	elif token == 'masked':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_594
+	elif token == 'replace':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_595
+	return parser.no_child_matched(CHILDREN_434)
+
+# data get block targetPos
+def enter_435(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_435, current, parser.mark(), None, -1]
+	if START_596 == None or START_596.match(string[current]) != None:
+		parser.current = PARSE_596(parser, ARGUMENT_596.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_596,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_596
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_435)
+
+# data get entity target
+def enter_436(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_436, current, parser.mark(), None, -1]
+	if START_597 == None or START_597.match(string[current]) != None:
+		parser.current = PARSE_597(parser, ARGUMENT_597.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_597,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_597
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_436)
+
+# data merge block targetPos
+def enter_437(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_437, current, parser.mark(), None, -1]
+	if START_598 == None or START_598.match(string[current]) != None:
+		parser.current = PARSE_598(parser, ARGUMENT_598.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_598,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_598
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_437)
+
+# data merge entity target
+def enter_438(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_438, current, parser.mark(), None, -1]
+	if START_599 == None or START_599.match(string[current]) != None:
+		parser.current = PARSE_599(parser, ARGUMENT_599.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_599,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_599
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_438)
+
+# data modify block targetPos
+def enter_439(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_439, current, parser.mark(), None, -1]
+	if START_600 == None or START_600.match(string[current]) != None:
+		parser.current = PARSE_600(parser, ARGUMENT_600.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_600,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_600
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_439)
+
+# data modify entity target
+def enter_440(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_440, current, parser.mark(), None, -1]
+	if START_601 == None or START_601.match(string[current]) != None:
+		parser.current = PARSE_601(parser, ARGUMENT_601.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_601,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_601
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_440)
+
+# data remove block targetPos
+def enter_441(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_441, current, parser.mark(), None, -1]
+	if START_602 == None or START_602.match(string[current]) != None:
+		parser.current = PARSE_602(parser, ARGUMENT_602.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_602,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_602
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_441)
+
+# data remove entity target
+def enter_442(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_442, current, parser.mark(), None, -1]
+	if START_603 == None or START_603.match(string[current]) != None:
+		parser.current = PARSE_603(parser, ARGUMENT_603.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_603,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_603
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_442)
+
+# datapack enable name after
+def enter_443(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_443, current, parser.mark(), None, -1]
+	if START_604 == None or START_604.match(string[current]) != None:
+		parser.current = PARSE_604(parser, ARGUMENT_604.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_604,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_604
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_443)
+
+# datapack enable name before
+def enter_444(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_444, current, parser.mark(), None, -1]
+	if START_605 == None or START_605.match(string[current]) != None:
+		parser.current = PARSE_605(parser, ARGUMENT_605.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_605,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_605
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_444)
+
+# datapack enable name first
+def enter_445(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# datapack enable name last
+def enter_446(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# effect clear targets effect
+def enter_447(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# effect give targets effect
+def enter_448(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_448, current, parser.mark(), None, -1]
+	if START_606 == None or START_606.match(string[current]) != None:
+		parser.current = PARSE_606(parser, ARGUMENT_606.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_606,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_606
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_448)
+
+# enchant targets enchantment level
+def enter_449(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# execute facing entity targets
+def enter_450(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_450, current, parser.mark(), None, -1]
+	if START_607 == None or START_607.match(string[current]) != None:
+		parser.current = PARSE_607(parser, ARGUMENT_607.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_607,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_607
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_450)
+
+# execute if block pos
+def enter_451(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_451, current, parser.mark(), None, -1]
+	if START_608 == None or START_608.match(string[current]) != None:
+		parser.current = PARSE_608(parser, ARGUMENT_608.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_608,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_608
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_451)
+
+# execute if blocks start
+def enter_452(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_452, current, parser.mark(), None, -1]
+	if START_609 == None or START_609.match(string[current]) != None:
+		parser.current = PARSE_609(parser, ARGUMENT_609.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_609,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_609
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_452)
+
+# execute if data block
+def enter_453(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_453, current, parser.mark(), None, -1]
+	if START_610 == None or START_610.match(string[current]) != None:
+		parser.current = PARSE_610(parser, ARGUMENT_610.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_610,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_610
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_453)
+
+# execute if data entity
+def enter_454(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_454, current, parser.mark(), None, -1]
+	if START_611 == None or START_611.match(string[current]) != None:
+		parser.current = PARSE_611(parser, ARGUMENT_611.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_611,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_611
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_454)
+
+# execute if entity entities
+def enter_455(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if score target
+def enter_456(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_456, current, parser.mark(), None, -1]
+	if START_613 == None or START_613.match(string[current]) != None:
+		parser.current = PARSE_613(parser, ARGUMENT_613.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_613,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_613
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_456)
+
+# execute positioned as targets
+def enter_457(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute rotated as targets
+def enter_458(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result block
+def enter_459(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_459, current, parser.mark(), None, -1]
+	if START_614 == None or START_614.match(string[current]) != None:
+		parser.current = PARSE_614(parser, ARGUMENT_614.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_614,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_614
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_459)
+
+# execute store result bossbar
+def enter_460(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_460, current, parser.mark(), None, -1]
+	if START_615 == None or START_615.match(string[current]) != None:
+		parser.current = PARSE_615(parser, ARGUMENT_615.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_615,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_615
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_460)
+
+# execute store result entity
+def enter_461(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_461, current, parser.mark(), None, -1]
+	if START_616 == None or START_616.match(string[current]) != None:
+		parser.current = PARSE_616(parser, ARGUMENT_616.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_616,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_616
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_461)
+
+# execute store result score
+def enter_462(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_462, current, parser.mark(), None, -1]
+	if START_617 == None or START_617.match(string[current]) != None:
+		parser.current = PARSE_617(parser, ARGUMENT_617.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_617,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_617
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_462)
+
+# execute store success block
+def enter_463(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_463, current, parser.mark(), None, -1]
+	if START_618 == None or START_618.match(string[current]) != None:
+		parser.current = PARSE_618(parser, ARGUMENT_618.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_618,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_618
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_463)
+
+# execute store success bossbar
+def enter_464(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_464, current, parser.mark(), None, -1]
+	if START_619 == None or START_619.match(string[current]) != None:
+		parser.current = PARSE_619(parser, ARGUMENT_619.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_619,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_619
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_464)
+
+# execute store success entity
+def enter_465(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_465, current, parser.mark(), None, -1]
+	if START_620 == None or START_620.match(string[current]) != None:
+		parser.current = PARSE_620(parser, ARGUMENT_620.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_620,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_620
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_465)
+
+# execute store success score
+def enter_466(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_466, current, parser.mark(), None, -1]
+	if START_621 == None or START_621.match(string[current]) != None:
+		parser.current = PARSE_621(parser, ARGUMENT_621.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_621,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_621
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_466)
+
+# execute unless block pos
+def enter_467(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_467, current, parser.mark(), None, -1]
+	if START_622 == None or START_622.match(string[current]) != None:
+		parser.current = PARSE_622(parser, ARGUMENT_622.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_622,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_622
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_467)
+
+# execute unless blocks start
+def enter_468(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_468, current, parser.mark(), None, -1]
+	if START_623 == None or START_623.match(string[current]) != None:
+		parser.current = PARSE_623(parser, ARGUMENT_623.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_623,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_623
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_468)
+
+# execute unless data block
+def enter_469(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_469, current, parser.mark(), None, -1]
+	if START_624 == None or START_624.match(string[current]) != None:
+		parser.current = PARSE_624(parser, ARGUMENT_624.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_624,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_624
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_469)
+
+# execute unless data entity
+def enter_470(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_470, current, parser.mark(), None, -1]
+	if START_625 == None or START_625.match(string[current]) != None:
+		parser.current = PARSE_625(parser, ARGUMENT_625.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_625,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_625
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_470)
+
+# execute unless entity entities
+def enter_471(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless score target
+def enter_472(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_472, current, parser.mark(), None, -1]
+	if START_626 == None or START_626.match(string[current]) != None:
+		parser.current = PARSE_626(parser, ARGUMENT_626.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_626,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_626
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_472)
+
+# experience add targets amount
+def enter_473(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_473, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'levels':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_627
+	elif token == 'points':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_628
+	return parser.no_child_matched(CHILDREN_473)
+
+# experience query targets levels
+def enter_474(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# experience query targets points
+def enter_475(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# experience set targets amount
+def enter_476(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_476, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'levels':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_629
+	elif token == 'points':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_630
+	return parser.no_child_matched(CHILDREN_476)
+
+# fill from to block
+def enter_477(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_477, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_477.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_477)
+
+# forceload add from to
+def enter_478(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# forceload remove from to
+def enter_479(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# give targets item count
+def enter_480(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give players fish
+def enter_481(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_481, current, parser.mark(), None, -1]
+	if START_636 == None or START_636.match(string[current]) != None:
+		parser.current = PARSE_636(parser, ARGUMENT_636.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_636,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_636
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_481)
+
+# loot give players kill
+def enter_482(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_482, current, parser.mark(), None, -1]
+	if START_637 == None or START_637.match(string[current]) != None:
+		parser.current = PARSE_637(parser, ARGUMENT_637.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_637,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_637
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_482)
+
+# loot give players loot
+def enter_483(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_483, current, parser.mark(), None, -1]
+	if START_638 == None or START_638.match(string[current]) != None:
+		parser.current = PARSE_638(parser, ARGUMENT_638.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_638,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_638
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_483)
+
+# loot give players mine
+def enter_484(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_484, current, parser.mark(), None, -1]
+	if START_639 == None or START_639.match(string[current]) != None:
+		parser.current = PARSE_639(parser, ARGUMENT_639.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_639,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_639
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_484)
+
+# loot insert targetPos fish
+def enter_485(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_485, current, parser.mark(), None, -1]
+	if START_640 == None or START_640.match(string[current]) != None:
+		parser.current = PARSE_640(parser, ARGUMENT_640.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_640,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_640
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_485)
+
+# loot insert targetPos kill
+def enter_486(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_486, current, parser.mark(), None, -1]
+	if START_641 == None or START_641.match(string[current]) != None:
+		parser.current = PARSE_641(parser, ARGUMENT_641.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_641,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_641
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_486)
+
+# loot insert targetPos loot
+def enter_487(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_487, current, parser.mark(), None, -1]
+	if START_642 == None or START_642.match(string[current]) != None:
+		parser.current = PARSE_642(parser, ARGUMENT_642.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_642,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_642
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_487)
+
+# loot insert targetPos mine
+def enter_488(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_488, current, parser.mark(), None, -1]
+	if START_643 == None or START_643.match(string[current]) != None:
+		parser.current = PARSE_643(parser, ARGUMENT_643.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_643,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_643
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_488)
+
+# loot replace block targetPos
+def enter_489(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_489, current, parser.mark(), None, -1]
+	if START_644 == None or START_644.match(string[current]) != None:
+		parser.current = PARSE_644(parser, ARGUMENT_644.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_644,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_644
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_489)
+
+# loot replace entity entities
+def enter_490(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_490, current, parser.mark(), None, -1]
+	if START_645 == None or START_645.match(string[current]) != None:
+		parser.current = PARSE_645(parser, ARGUMENT_645.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_645,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_645
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_490)
+
+# loot spawn targetPos fish
+def enter_491(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_491, current, parser.mark(), None, -1]
+	if START_646 == None or START_646.match(string[current]) != None:
+		parser.current = PARSE_646(parser, ARGUMENT_646.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_646,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_646
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_491)
+
+# loot spawn targetPos kill
+def enter_492(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_492, current, parser.mark(), None, -1]
+	if START_647 == None or START_647.match(string[current]) != None:
+		parser.current = PARSE_647(parser, ARGUMENT_647.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_647,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_647
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_492)
+
+# loot spawn targetPos loot
+def enter_493(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_493, current, parser.mark(), None, -1]
+	if START_648 == None or START_648.match(string[current]) != None:
+		parser.current = PARSE_648(parser, ARGUMENT_648.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_648,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_648
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_493)
+
+# loot spawn targetPos mine
+def enter_494(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_494, current, parser.mark(), None, -1]
+	if START_649 == None or START_649.match(string[current]) != None:
+		parser.current = PARSE_649(parser, ARGUMENT_649.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_649,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_649
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_494)
+
+# particle name pos delta
+def enter_495(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_495, current, parser.mark(), None, -1]
+	if START_650 == None or START_650.match(string[current]) != None:
+		parser.current = PARSE_650(parser, ARGUMENT_650.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_650,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_650
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_495)
+
+# playsound sound ambient targets
+def enter_496(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_496, current, parser.mark(), None, -1]
+	if START_651 == None or START_651.match(string[current]) != None:
+		parser.current = PARSE_651(parser, ARGUMENT_651.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_651,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_651
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_496)
+
+# playsound sound block targets
+def enter_497(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_497, current, parser.mark(), None, -1]
+	if START_652 == None or START_652.match(string[current]) != None:
+		parser.current = PARSE_652(parser, ARGUMENT_652.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_652,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_652
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_497)
+
+# playsound sound hostile targets
+def enter_498(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_498, current, parser.mark(), None, -1]
+	if START_653 == None or START_653.match(string[current]) != None:
+		parser.current = PARSE_653(parser, ARGUMENT_653.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_653,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_653
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_498)
+
+# playsound sound master targets
+def enter_499(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_499, current, parser.mark(), None, -1]
+	if START_654 == None or START_654.match(string[current]) != None:
+		parser.current = PARSE_654(parser, ARGUMENT_654.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_654,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_654
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_499)
+
+# playsound sound music targets
+def enter_500(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_500, current, parser.mark(), None, -1]
+	if START_655 == None or START_655.match(string[current]) != None:
+		parser.current = PARSE_655(parser, ARGUMENT_655.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_655,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_655
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_500)
+
+# playsound sound neutral targets
+def enter_501(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_501, current, parser.mark(), None, -1]
+	if START_656 == None or START_656.match(string[current]) != None:
+		parser.current = PARSE_656(parser, ARGUMENT_656.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_656,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_656
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_501)
+
+# playsound sound player targets
+def enter_502(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_502, current, parser.mark(), None, -1]
+	if START_657 == None or START_657.match(string[current]) != None:
+		parser.current = PARSE_657(parser, ARGUMENT_657.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_657,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_657
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_502)
+
+# playsound sound record targets
+def enter_503(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_503, current, parser.mark(), None, -1]
+	if START_658 == None or START_658.match(string[current]) != None:
+		parser.current = PARSE_658(parser, ARGUMENT_658.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_658,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_658
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_503)
+
+# playsound sound voice targets
+def enter_504(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_504, current, parser.mark(), None, -1]
+	if START_659 == None or START_659.match(string[current]) != None:
+		parser.current = PARSE_659(parser, ARGUMENT_659.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_659,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_659
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_504)
+
+# playsound sound weather targets
+def enter_505(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_505, current, parser.mark(), None, -1]
+	if START_660 == None or START_660.match(string[current]) != None:
+		parser.current = PARSE_660(parser, ARGUMENT_660.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_660,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_660
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_505)
+
+# recipe give targets *
+def enter_506(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# recipe give targets recipe
+def enter_507(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# recipe take targets *
+def enter_508(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# recipe take targets recipe
+def enter_509(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# replaceitem block pos slot
+def enter_510(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_510, current, parser.mark(), None, -1]
+	if START_661 == None or START_661.match(string[current]) != None:
+		parser.current = PARSE_661(parser, ARGUMENT_661.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_661,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_661
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_510)
+
+# replaceitem entity targets slot
+def enter_511(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_511, current, parser.mark(), None, -1]
+	if START_662 == None or START_662.match(string[current]) != None:
+		parser.current = PARSE_662(parser, ARGUMENT_662.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_662,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_662
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_511)
+
+# schedule function function time
+def enter_512(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard objectives add objective
+def enter_513(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_513, current, parser.mark(), None, -1]
+	if START_663 == None or START_663.match(string[current]) != None:
+		parser.current = PARSE_663(parser, ARGUMENT_663.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_663,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_663
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_513)
+
+# scoreboard objectives modify objective
+def enter_514(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_514, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'displayname':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 11)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 11
+		stack.append(frame)
+		return enter_664
+	elif token == 'rendertype':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 10)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 10
+		stack.append(frame)
+		return enter_665
+	return parser.no_child_matched(CHILDREN_514)
+
+# scoreboard objectives remove objective
+def enter_515(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard objectives setdisplay slot
+def enter_516(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_516, current, parser.mark(), None, -1]
+	if START_666 == None or START_666.match(string[current]) != None:
+		parser.current = PARSE_666(parser, ARGUMENT_666.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_666,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_666
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_516)
+
+# scoreboard players add targets
+def enter_517(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_517, current, parser.mark(), None, -1]
+	if START_667 == None or START_667.match(string[current]) != None:
+		parser.current = PARSE_667(parser, ARGUMENT_667.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_667,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_667
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_517)
+
+# scoreboard players enable targets
+def enter_518(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_518, current, parser.mark(), None, -1]
+	if START_668 == None or START_668.match(string[current]) != None:
+		parser.current = PARSE_668(parser, ARGUMENT_668.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_668,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_668
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_518)
+
+# scoreboard players get target
+def enter_519(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_519, current, parser.mark(), None, -1]
+	if START_669 == None or START_669.match(string[current]) != None:
+		parser.current = PARSE_669(parser, ARGUMENT_669.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_669,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_669
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_519)
+
+# scoreboard players list target
+def enter_520(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard players operation targets
+def enter_521(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_521, current, parser.mark(), None, -1]
+	if START_670 == None or START_670.match(string[current]) != None:
+		parser.current = PARSE_670(parser, ARGUMENT_670.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_670,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_670
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_521)
+
+# scoreboard players remove targets
+def enter_522(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_522, current, parser.mark(), None, -1]
+	if START_671 == None or START_671.match(string[current]) != None:
+		parser.current = PARSE_671(parser, ARGUMENT_671.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_671,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_671
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_522)
+
+# scoreboard players reset targets
+def enter_523(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_523, current, parser.mark(), None, -1]
+	if START_672 == None or START_672.match(string[current]) != None:
+		parser.current = PARSE_672(parser, ARGUMENT_672.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_672,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_672
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_523)
+
+# scoreboard players set targets
+def enter_524(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_524, current, parser.mark(), None, -1]
+	if START_673 == None or START_673.match(string[current]) != None:
+		parser.current = PARSE_673(parser, ARGUMENT_673.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_673,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_673
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_524)
+
+# setblock pos block destroy
+def enter_525(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# setblock pos block keep
+def enter_526(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# setblock pos block replace
+def enter_527(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# spreadplayers center spreadDistance maxRange
+def enter_528(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_528, current, parser.mark(), None, -1]
+	if START_674 == None or START_674.match(string[current]) != None:
+		parser.current = PARSE_674(parser, ARGUMENT_674.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_674,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_674
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_528)
+
+# stopsound targets * sound
+def enter_529(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets ambient sound
+def enter_530(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets block sound
+def enter_531(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets hostile sound
+def enter_532(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets master sound
+def enter_533(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets music sound
+def enter_534(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets neutral sound
+def enter_535(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets player sound
+def enter_536(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets record sound
+def enter_537(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets voice sound
+def enter_538(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# stopsound targets weather sound
+def enter_539(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# summon entity pos nbt
+def enter_540(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# tag targets add name
+def enter_541(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# tag targets remove name
+def enter_542(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team add team displayName
+def enter_543(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team join team members
+def enter_544(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team collisionRule
+def enter_545(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_545, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'always':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_675
+	elif token == 'never':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_676
+	elif token == 'pushOtherTeams':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 14)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 14
+		stack.append(frame)
+		return enter_677
+	elif token == 'pushOwnTeam':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 11)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 11
+		stack.append(frame)
+		return enter_678
+	return parser.no_child_matched(CHILDREN_545)
+
+# team modify team color
+def enter_546(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_546, current, parser.mark(), None, -1]
+	if START_679 == None or START_679.match(string[current]) != None:
+		parser.current = PARSE_679(parser, ARGUMENT_679.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_679,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_679
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_546)
+
+# team modify team deathMessageVisibility
+def enter_547(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_547, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'always':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_680
+	elif token == 'hideForOtherTeams':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 17)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 17
+		stack.append(frame)
+		return enter_681
+	elif token == 'hideForOwnTeam':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 14)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 14
+		stack.append(frame)
+		return enter_682
+	elif token == 'never':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_683
+	return parser.no_child_matched(CHILDREN_547)
+
+# team modify team displayName
+def enter_548(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_548, current, parser.mark(), None, -1]
+	if START_684 == None or START_684.match(string[current]) != None:
+		parser.current = PARSE_684(parser, ARGUMENT_684.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_684,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_684
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_548)
+
+# team modify team friendlyFire
+def enter_549(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_549, current, parser.mark(), None, -1]
+	if START_685 == None or START_685.match(string[current]) != None:
+		parser.current = PARSE_685(parser, ARGUMENT_685.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_685,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_685
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_549)
+
+# team modify team nametagVisibility
+def enter_550(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_550, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'always':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_686
+	elif token == 'hideForOtherTeams':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 17)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 17
+		stack.append(frame)
+		return enter_687
+	elif token == 'hideForOwnTeam':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 14)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 14
+		stack.append(frame)
+		return enter_688
+	elif token == 'never':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_689
+	return parser.no_child_matched(CHILDREN_550)
+
+# team modify team prefix
+def enter_551(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_551, current, parser.mark(), None, -1]
+	if START_690 == None or START_690.match(string[current]) != None:
+		parser.current = PARSE_690(parser, ARGUMENT_690.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_690,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_690
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_551)
+
+# team modify team seeFriendlyInvisibles
+def enter_552(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_552, current, parser.mark(), None, -1]
+	if START_691 == None or START_691.match(string[current]) != None:
+		parser.current = PARSE_691(parser, ARGUMENT_691.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_691,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_691
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_552)
+
+# team modify team suffix
+def enter_553(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_553, current, parser.mark(), None, -1]
+	if START_692 == None or START_692.match(string[current]) != None:
+		parser.current = PARSE_692(parser, ARGUMENT_692.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_692,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_692
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_553)
+
+# teleport targets location facing
+def enter_554(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_554, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_693
+	if START_694 == None or START_694.match(string[current]) != None:
+		parser.current = PARSE_694(parser, ARGUMENT_694.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_694,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_694
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_554)
+
+# teleport targets location rotation
+def enter_555(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# title targets actionbar title
+def enter_556(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# title targets subtitle title
+def enter_557(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# title targets times fadeIn
+def enter_558(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_558, current, parser.mark(), None, -1]
+	if START_695 == None or START_695.match(string[current]) != None:
+		parser.current = PARSE_695(parser, ARGUMENT_695.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_695,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_695
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_558)
+
+# title targets title title
+def enter_559(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# trigger objective add value
+def enter_560(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# trigger objective set value
+def enter_561(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# worldborder add distance time
+def enter_562(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# worldborder damage amount damagePerBlock
+def enter_563(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# worldborder damage buffer distance
+def enter_564(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# worldborder set distance time
+def enter_565(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# worldborder warning distance distance
+def enter_566(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# worldborder warning time time
+def enter_567(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# advancement grant targets from advancement
+def enter_568(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# advancement grant targets only advancement
+def enter_569(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_569, current, parser.mark(), None, -1]
+	if START_696 == None or START_696.match(string[current]) != None:
+		parser.current = PARSE_696(parser, ARGUMENT_696.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_696,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_696
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_569)
+
+# advancement grant targets through advancement
+def enter_570(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# advancement grant targets until advancement
+def enter_571(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# advancement revoke targets from advancement
+def enter_572(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# advancement revoke targets only advancement
+def enter_573(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_573, current, parser.mark(), None, -1]
+	if START_697 == None or START_697.match(string[current]) != None:
+		parser.current = PARSE_697(parser, ARGUMENT_697.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_697,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_697
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_573)
+
+# advancement revoke targets through advancement
+def enter_574(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# advancement revoke targets until advancement
+def enter_575(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id color blue
+def enter_576(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id color green
+def enter_577(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id color pink
+def enter_578(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id color purple
+def enter_579(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id color red
+def enter_580(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id color white
+def enter_581(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id color yellow
+def enter_582(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id max max
+def enter_583(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id name name
+def enter_584(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id players targets
+def enter_585(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id style notched_10
+def enter_586(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id style notched_12
+def enter_587(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id style notched_20
+def enter_588(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id style notched_6
+def enter_589(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id style progress
+def enter_590(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id value value
+def enter_591(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# bossbar set id visible visible
+def enter_592(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination filtered
+def enter_593(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_593, current, parser.mark(), None, -1]
+	if START_698 == None or START_698.match(string[current]) != None:
+		parser.current = PARSE_698(parser, ARGUMENT_698.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_698,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_698
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_593)
+
+# clone begin end destination masked
+def enter_594(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_594, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'force':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_699
+	elif token == 'move':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_700
+	elif token == 'normal':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_701
+	return parser.no_child_matched(CHILDREN_594)
+
+# clone begin end destination replace
+def enter_595(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_595, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'force':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_702
+	elif token == 'move':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_703
+	elif token == 'normal':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_704
+	return parser.no_child_matched(CHILDREN_595)
+
+# data get block targetPos path
+def enter_596(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_596, current, parser.mark(), None, -1]
+	if START_705 == None or START_705.match(string[current]) != None:
+		parser.current = PARSE_705(parser, ARGUMENT_705.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_705,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_705
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_596)
+
+# data get entity target path
+def enter_597(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_597, current, parser.mark(), None, -1]
+	if START_706 == None or START_706.match(string[current]) != None:
+		parser.current = PARSE_706(parser, ARGUMENT_706.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_706,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_706
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_597)
+
+# data merge block targetPos nbt
+def enter_598(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data merge entity target nbt
+def enter_599(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath
+def enter_600(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_600, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_600.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_600)
+
+# data modify entity target targetPath
+def enter_601(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_601, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_601.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_601)
+
+# data remove block targetPos path
+def enter_602(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data remove entity target path
+def enter_603(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# datapack enable name after existing
+def enter_604(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# datapack enable name before existing
+def enter_605(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# effect give targets effect seconds
+def enter_606(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_606, current, parser.mark(), None, -1]
+	if START_717 == None or START_717.match(string[current]) != None:
+		parser.current = PARSE_717(parser, ARGUMENT_717.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_717,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_717
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_606)
+
+# execute facing entity targets anchor
+def enter_607(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute if block pos block
+def enter_608(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if blocks start end
+def enter_609(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_609, current, parser.mark(), None, -1]
+	if START_718 == None or START_718.match(string[current]) != None:
+		parser.current = PARSE_718(parser, ARGUMENT_718.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_718,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_718
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_609)
+
+# execute if data block sourcePos
+def enter_610(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_610, current, parser.mark(), None, -1]
+	if START_719 == None or START_719.match(string[current]) != None:
+		parser.current = PARSE_719(parser, ARGUMENT_719.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_719,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_719
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_610)
+
+# execute if data entity source
+def enter_611(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_611, current, parser.mark(), None, -1]
+	if START_720 == None or START_720.match(string[current]) != None:
+		parser.current = PARSE_720(parser, ARGUMENT_720.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_720,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_720
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_611)
+
+# execute (executable: True)
+def enter_612(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_612, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_612.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_612)
+
+# execute if score target targetObjective
+def enter_613(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_613, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_613.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_613)
+
+# execute store result block targetPos
+def enter_614(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_614, current, parser.mark(), None, -1]
+	if START_727 == None or START_727.match(string[current]) != None:
+		parser.current = PARSE_727(parser, ARGUMENT_727.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_727,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_727
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_614)
+
+# execute store result bossbar id
+def enter_615(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_615, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'max':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_728
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_729
+	return parser.no_child_matched(CHILDREN_615)
+
+# execute store result entity target
+def enter_616(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_616, current, parser.mark(), None, -1]
+	if START_730 == None or START_730.match(string[current]) != None:
+		parser.current = PARSE_730(parser, ARGUMENT_730.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_730,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_730
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_616)
+
+# execute store result score targets
+def enter_617(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_617, current, parser.mark(), None, -1]
+	if START_731 == None or START_731.match(string[current]) != None:
+		parser.current = PARSE_731(parser, ARGUMENT_731.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_731,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_731
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_617)
+
+# execute store success block targetPos
+def enter_618(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_618, current, parser.mark(), None, -1]
+	if START_732 == None or START_732.match(string[current]) != None:
+		parser.current = PARSE_732(parser, ARGUMENT_732.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_732,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_732
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_618)
+
+# execute store success bossbar id
+def enter_619(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_619, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'max':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_733
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_734
+	return parser.no_child_matched(CHILDREN_619)
+
+# execute store success entity target
+def enter_620(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_620, current, parser.mark(), None, -1]
+	if START_735 == None or START_735.match(string[current]) != None:
+		parser.current = PARSE_735(parser, ARGUMENT_735.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_735,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_735
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_620)
+
+# execute store success score targets
+def enter_621(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_621, current, parser.mark(), None, -1]
+	if START_736 == None or START_736.match(string[current]) != None:
+		parser.current = PARSE_736(parser, ARGUMENT_736.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_736,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_736
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_621)
+
+# execute unless block pos block
+def enter_622(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless blocks start end
+def enter_623(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_623, current, parser.mark(), None, -1]
+	if START_737 == None or START_737.match(string[current]) != None:
+		parser.current = PARSE_737(parser, ARGUMENT_737.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_737,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_737
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_623)
+
+# execute unless data block sourcePos
+def enter_624(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_624, current, parser.mark(), None, -1]
+	if START_738 == None or START_738.match(string[current]) != None:
+		parser.current = PARSE_738(parser, ARGUMENT_738.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_738,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_738
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_624)
+
+# execute unless data entity source
+def enter_625(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_625, current, parser.mark(), None, -1]
+	if START_739 == None or START_739.match(string[current]) != None:
+		parser.current = PARSE_739(parser, ARGUMENT_739.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_739,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_739
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_625)
+
+# execute unless score target targetObjective
+def enter_626(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_626, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_626.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_626)
+
+# experience add targets amount levels
+def enter_627(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# experience add targets amount points
+def enter_628(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# experience set targets amount levels
+def enter_629(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# experience set targets amount points
+def enter_630(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# fill from to block destroy
+def enter_631(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# fill from to block hollow
+def enter_632(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# fill from to block keep
+def enter_633(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# fill from to block outline
+def enter_634(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# fill from to block replace
+def enter_635(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_635, current, parser.mark(), None, -1]
+	if START_746 == None or START_746.match(string[current]) != None:
+		parser.current = PARSE_746(parser, ARGUMENT_746.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_746,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_746
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_635)
+
+# loot give players fish loot_table
+def enter_636(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_636, current, parser.mark(), None, -1]
+	if START_747 == None or START_747.match(string[current]) != None:
+		parser.current = PARSE_747(parser, ARGUMENT_747.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_747,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_747
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_636)
+
+# loot give players kill target
+def enter_637(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give players loot loot_table
+def enter_638(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give players mine pos
+def enter_639(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_639, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_748
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_749
+	if START_750 == None or START_750.match(string[current]) != None:
+		parser.current = PARSE_750(parser, ARGUMENT_750.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_750,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_750
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_639)
+
+# loot insert targetPos fish loot_table
+def enter_640(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_640, current, parser.mark(), None, -1]
+	if START_751 == None or START_751.match(string[current]) != None:
+		parser.current = PARSE_751(parser, ARGUMENT_751.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_751,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_751
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_640)
+
+# loot insert targetPos kill target
+def enter_641(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot insert targetPos loot loot_table
+def enter_642(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot insert targetPos mine pos
+def enter_643(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_643, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_752
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_753
+	if START_754 == None or START_754.match(string[current]) != None:
+		parser.current = PARSE_754(parser, ARGUMENT_754.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_754,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_754
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_643)
+
+# loot replace block targetPos slot
+def enter_644(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_644, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'fish':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_755
+	elif token == 'kill':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_756
+	elif token == 'loot':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_757
+	elif token == 'mine':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_758
+	if START_759 == None or START_759.match(string[current]) != None:
+		parser.current = PARSE_759(parser, ARGUMENT_759.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_759,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_759
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_644)
+
+# loot replace entity entities slot
+def enter_645(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_645, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'fish':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_760
+	elif token == 'kill':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_761
+	elif token == 'loot':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_762
+	elif token == 'mine':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_763
+	if START_764 == None or START_764.match(string[current]) != None:
+		parser.current = PARSE_764(parser, ARGUMENT_764.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_764,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_764
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_645)
+
+# loot spawn targetPos fish loot_table
+def enter_646(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_646, current, parser.mark(), None, -1]
+	if START_765 == None or START_765.match(string[current]) != None:
+		parser.current = PARSE_765(parser, ARGUMENT_765.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_765,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_765
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_646)
+
+# loot spawn targetPos kill target
+def enter_647(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot spawn targetPos loot loot_table
+def enter_648(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot spawn targetPos mine pos
+def enter_649(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_649, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_766
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_767
+	if START_768 == None or START_768.match(string[current]) != None:
+		parser.current = PARSE_768(parser, ARGUMENT_768.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_768,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_768
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_649)
+
+# particle name pos delta speed
+def enter_650(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_650, current, parser.mark(), None, -1]
+	if START_769 == None or START_769.match(string[current]) != None:
+		parser.current = PARSE_769(parser, ARGUMENT_769.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_769,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_769
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_650)
+
+# playsound sound ambient targets pos
+def enter_651(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_651, current, parser.mark(), None, -1]
+	if START_770 == None or START_770.match(string[current]) != None:
+		parser.current = PARSE_770(parser, ARGUMENT_770.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_770,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_770
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_651)
+
+# playsound sound block targets pos
+def enter_652(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_652, current, parser.mark(), None, -1]
+	if START_771 == None or START_771.match(string[current]) != None:
+		parser.current = PARSE_771(parser, ARGUMENT_771.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_771,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_771
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_652)
+
+# playsound sound hostile targets pos
+def enter_653(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_653, current, parser.mark(), None, -1]
+	if START_772 == None or START_772.match(string[current]) != None:
+		parser.current = PARSE_772(parser, ARGUMENT_772.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_772,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_772
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_653)
+
+# playsound sound master targets pos
+def enter_654(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_654, current, parser.mark(), None, -1]
+	if START_773 == None or START_773.match(string[current]) != None:
+		parser.current = PARSE_773(parser, ARGUMENT_773.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_773,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_773
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_654)
+
+# playsound sound music targets pos
+def enter_655(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_655, current, parser.mark(), None, -1]
+	if START_774 == None or START_774.match(string[current]) != None:
+		parser.current = PARSE_774(parser, ARGUMENT_774.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_774,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_774
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_655)
+
+# playsound sound neutral targets pos
+def enter_656(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_656, current, parser.mark(), None, -1]
+	if START_775 == None or START_775.match(string[current]) != None:
+		parser.current = PARSE_775(parser, ARGUMENT_775.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_775,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_775
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_656)
+
+# playsound sound player targets pos
+def enter_657(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_657, current, parser.mark(), None, -1]
+	if START_776 == None or START_776.match(string[current]) != None:
+		parser.current = PARSE_776(parser, ARGUMENT_776.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_776,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_776
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_657)
+
+# playsound sound record targets pos
+def enter_658(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_658, current, parser.mark(), None, -1]
+	if START_777 == None or START_777.match(string[current]) != None:
+		parser.current = PARSE_777(parser, ARGUMENT_777.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_777,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_777
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_658)
+
+# playsound sound voice targets pos
+def enter_659(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_659, current, parser.mark(), None, -1]
+	if START_778 == None or START_778.match(string[current]) != None:
+		parser.current = PARSE_778(parser, ARGUMENT_778.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_778,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_778
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_659)
+
+# playsound sound weather targets pos
+def enter_660(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_660, current, parser.mark(), None, -1]
+	if START_779 == None or START_779.match(string[current]) != None:
+		parser.current = PARSE_779(parser, ARGUMENT_779.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_779,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_779
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_660)
+
+# replaceitem block pos slot item
+def enter_661(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_661, current, parser.mark(), None, -1]
+	if START_780 == None or START_780.match(string[current]) != None:
+		parser.current = PARSE_780(parser, ARGUMENT_780.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_780,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_780
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_661)
+
+# replaceitem entity targets slot item
+def enter_662(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_662, current, parser.mark(), None, -1]
+	if START_781 == None or START_781.match(string[current]) != None:
+		parser.current = PARSE_781(parser, ARGUMENT_781.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_781,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_781
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_662)
+
+# scoreboard objectives add objective criteria
+def enter_663(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_663, current, parser.mark(), None, -1]
+	if START_782 == None or START_782.match(string[current]) != None:
+		parser.current = PARSE_782(parser, ARGUMENT_782.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_782,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_782
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_663)
+
+# scoreboard objectives modify objective displayname
+def enter_664(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_664, current, parser.mark(), None, -1]
+	if START_783 == None or START_783.match(string[current]) != None:
+		parser.current = PARSE_783(parser, ARGUMENT_783.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_783,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_783
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_664)
+
+# scoreboard objectives modify objective rendertype
+def enter_665(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_665, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'hearts':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_784
+	elif token == 'integer':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_785
+	return parser.no_child_matched(CHILDREN_665)
+
+# scoreboard objectives setdisplay slot objective
+def enter_666(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard players add targets objective
+def enter_667(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_667, current, parser.mark(), None, -1]
+	if START_786 == None or START_786.match(string[current]) != None:
+		parser.current = PARSE_786(parser, ARGUMENT_786.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_786,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_786
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_667)
+
+# scoreboard players enable targets objective
+def enter_668(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard players get target objective
+def enter_669(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard players operation targets targetObjective
+def enter_670(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_670, current, parser.mark(), None, -1]
+	if START_787 == None or START_787.match(string[current]) != None:
+		parser.current = PARSE_787(parser, ARGUMENT_787.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_787,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_787
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_670)
+
+# scoreboard players remove targets objective
+def enter_671(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_671, current, parser.mark(), None, -1]
+	if START_788 == None or START_788.match(string[current]) != None:
+		parser.current = PARSE_788(parser, ARGUMENT_788.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_788,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_788
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_671)
+
+# scoreboard players reset targets objective
+def enter_672(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard players set targets objective
+def enter_673(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_673, current, parser.mark(), None, -1]
+	if START_789 == None or START_789.match(string[current]) != None:
+		parser.current = PARSE_789(parser, ARGUMENT_789.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_789,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_789
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_673)
+
+# spreadplayers center spreadDistance maxRange respectTeams
+def enter_674(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_674, current, parser.mark(), None, -1]
+	if START_790 == None or START_790.match(string[current]) != None:
+		parser.current = PARSE_790(parser, ARGUMENT_790.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_790,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_790
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_674)
+
+# team modify team collisionRule always
+def enter_675(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team collisionRule never
+def enter_676(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team collisionRule pushOtherTeams
+def enter_677(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team collisionRule pushOwnTeam
+def enter_678(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team color value
+def enter_679(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team deathMessageVisibility always
+def enter_680(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team deathMessageVisibility hideForOtherTeams
+def enter_681(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team deathMessageVisibility hideForOwnTeam
+def enter_682(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team deathMessageVisibility never
+def enter_683(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team displayName displayName
+def enter_684(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team friendlyFire allowed
+def enter_685(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team nametagVisibility always
+def enter_686(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team nametagVisibility hideForOtherTeams
+def enter_687(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team nametagVisibility hideForOwnTeam
+def enter_688(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team nametagVisibility never
+def enter_689(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team prefix prefix
+def enter_690(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team seeFriendlyInvisibles allowed
+def enter_691(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# team modify team suffix suffix
+def enter_692(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# teleport targets location facing entity
+def enter_693(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_693, current, parser.mark(), None, -1]
+	if START_791 == None or START_791.match(string[current]) != None:
+		parser.current = PARSE_791(parser, ARGUMENT_791.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_791,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_791
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_693)
+
+# teleport targets location facing facingLocation
+def enter_694(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# title targets times fadeIn stay
+def enter_695(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_695, current, parser.mark(), None, -1]
+	if START_792 == None or START_792.match(string[current]) != None:
+		parser.current = PARSE_792(parser, ARGUMENT_792.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_792,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_792
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_695)
+
+# advancement grant targets only advancement criterion
+def enter_696(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# advancement revoke targets only advancement criterion
+def enter_697(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination filtered filter
+def enter_698(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_698, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'force':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_793
+	elif token == 'move':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_794
+	elif token == 'normal':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_795
+	return parser.no_child_matched(CHILDREN_698)
+
+# clone begin end destination masked force
+def enter_699(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination masked move
+def enter_700(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination masked normal
+def enter_701(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination replace force
+def enter_702(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination replace move
+def enter_703(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination replace normal
+def enter_704(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data get block targetPos path scale
+def enter_705(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data get entity target path scale
+def enter_706(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath append
+def enter_707(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_707, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_796
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_797
+	return parser.no_child_matched(CHILDREN_707)
+
+# data modify block targetPos targetPath insert
+def enter_708(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_708, current, parser.mark(), None, -1]
+	if START_798 == None or START_798.match(string[current]) != None:
+		parser.current = PARSE_798(parser, ARGUMENT_798.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_798,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_798
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_708)
+
+# data modify block targetPos targetPath merge
+def enter_709(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_709, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_799
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_800
+	return parser.no_child_matched(CHILDREN_709)
+
+# data modify block targetPos targetPath prepend
+def enter_710(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_710, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_801
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_802
+	return parser.no_child_matched(CHILDREN_710)
+
+# data modify block targetPos targetPath set
+def enter_711(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_711, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_803
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_804
+	return parser.no_child_matched(CHILDREN_711)
+
+# data modify entity target targetPath append
+def enter_712(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_712, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_805
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_806
+	return parser.no_child_matched(CHILDREN_712)
+
+# data modify entity target targetPath insert
+def enter_713(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_713, current, parser.mark(), None, -1]
+	if START_807 == None or START_807.match(string[current]) != None:
+		parser.current = PARSE_807(parser, ARGUMENT_807.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_807,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_807
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_713)
+
+# data modify entity target targetPath merge
+def enter_714(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_714, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_808
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_809
+	return parser.no_child_matched(CHILDREN_714)
+
+# data modify entity target targetPath prepend
+def enter_715(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_715, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_810
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_811
+	return parser.no_child_matched(CHILDREN_715)
+
+# data modify entity target targetPath set
+def enter_716(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_716, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_812
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_813
+	return parser.no_child_matched(CHILDREN_716)
+
+# effect give targets effect seconds amplifier
+def enter_717(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_717, current, parser.mark(), None, -1]
+	if START_814 == None or START_814.match(string[current]) != None:
+		parser.current = PARSE_814(parser, ARGUMENT_814.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_814,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_814
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_717)
+
+# execute if blocks start end destination
+def enter_718(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_718, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'all':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_815
+	elif token == 'masked':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_816
+	return parser.no_child_matched(CHILDREN_718)
+
+# execute if data block sourcePos path
+def enter_719(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if data entity source path
+def enter_720(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if score target targetObjective <
+def enter_721(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_721, current, parser.mark(), None, -1]
+	if START_817 == None or START_817.match(string[current]) != None:
+		parser.current = PARSE_817(parser, ARGUMENT_817.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_817,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_817
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_721)
+
+# execute if score target targetObjective <=
+def enter_722(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_722, current, parser.mark(), None, -1]
+	if START_818 == None or START_818.match(string[current]) != None:
+		parser.current = PARSE_818(parser, ARGUMENT_818.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_818,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_818
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_722)
+
+# execute if score target targetObjective =
+def enter_723(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_723, current, parser.mark(), None, -1]
+	if START_819 == None or START_819.match(string[current]) != None:
+		parser.current = PARSE_819(parser, ARGUMENT_819.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_819,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_819
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_723)
+
+# execute if score target targetObjective >
+def enter_724(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_724, current, parser.mark(), None, -1]
+	if START_820 == None or START_820.match(string[current]) != None:
+		parser.current = PARSE_820(parser, ARGUMENT_820.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_820,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_820
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_724)
+
+# execute if score target targetObjective >=
+def enter_725(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_725, current, parser.mark(), None, -1]
+	if START_821 == None or START_821.match(string[current]) != None:
+		parser.current = PARSE_821(parser, ARGUMENT_821.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_821,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_821
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_725)
+
+# execute if score target targetObjective matches
+def enter_726(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_726, current, parser.mark(), None, -1]
+	if START_822 == None or START_822.match(string[current]) != None:
+		parser.current = PARSE_822(parser, ARGUMENT_822.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_822,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_822
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_726)
+
+# execute store result block targetPos path
+def enter_727(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_727, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_727.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_727)
+
+# execute store result bossbar id max
+def enter_728(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result bossbar id value
+def enter_729(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result entity target path
+def enter_730(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_730, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_730.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_730)
+
+# execute store result score targets objective
+def enter_731(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success block targetPos path
+def enter_732(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_732, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_732.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_732)
+
+# execute store success bossbar id max
+def enter_733(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success bossbar id value
+def enter_734(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success entity target path
+def enter_735(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_735, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	literal = LITERALS_735.get(token)
+	if literal != None:
+		parser.append_region(parser.mccliteral, current, current + len(token))
+		parser.current = current + len(token)
+		stack.append(frame)
+		return literal
+	return parser.no_child_matched(CHILDREN_735)
+
+# execute store success score targets objective
+def enter_736(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute unless blocks start end destination
+def enter_737(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_737, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'all':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 3)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 3
+		stack.append(frame)
+		return enter_847
+	elif token == 'masked':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_848
+	return parser.no_child_matched(CHILDREN_737)
+
+# execute unless data block sourcePos path
+def enter_738(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless data entity source path
+def enter_739(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless score target targetObjective <
+def enter_740(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_740, current, parser.mark(), None, -1]
+	if START_849 == None or START_849.match(string[current]) != None:
+		parser.current = PARSE_849(parser, ARGUMENT_849.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_849,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_849
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_740)
+
+# execute unless score target targetObjective <=
+def enter_741(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_741, current, parser.mark(), None, -1]
+	if START_850 == None or START_850.match(string[current]) != None:
+		parser.current = PARSE_850(parser, ARGUMENT_850.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_850,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_850
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_741)
+
+# execute unless score target targetObjective =
+def enter_742(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_742, current, parser.mark(), None, -1]
+	if START_851 == None or START_851.match(string[current]) != None:
+		parser.current = PARSE_851(parser, ARGUMENT_851.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_851,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_851
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_742)
+
+# execute unless score target targetObjective >
+def enter_743(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_743, current, parser.mark(), None, -1]
+	if START_852 == None or START_852.match(string[current]) != None:
+		parser.current = PARSE_852(parser, ARGUMENT_852.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_852,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_852
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_743)
+
+# execute unless score target targetObjective >=
+def enter_744(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_744, current, parser.mark(), None, -1]
+	if START_853 == None or START_853.match(string[current]) != None:
+		parser.current = PARSE_853(parser, ARGUMENT_853.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_853,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_853
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_744)
+
+# execute unless score target targetObjective matches
+def enter_745(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_745, current, parser.mark(), None, -1]
+	if START_854 == None or START_854.match(string[current]) != None:
+		parser.current = PARSE_854(parser, ARGUMENT_854.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_854,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_854
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_745)
+
+# fill from to block replace filter
+def enter_746(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give players fish loot_table pos
+def enter_747(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_747, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_855
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_856
+	if START_857 == None or START_857.match(string[current]) != None:
+		parser.current = PARSE_857(parser, ARGUMENT_857.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_857,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_857
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_747)
+
+# loot give players mine pos mainhand
+def enter_748(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give players mine pos offhand
+def enter_749(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give players mine pos tool
+def enter_750(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot insert targetPos fish loot_table pos
+def enter_751(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_751, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_858
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_859
+	if START_860 == None or START_860.match(string[current]) != None:
+		parser.current = PARSE_860(parser, ARGUMENT_860.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_860,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_860
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_751)
+
+# loot insert targetPos mine pos mainhand
+def enter_752(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot insert targetPos mine pos offhand
+def enter_753(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot insert targetPos mine pos tool
+def enter_754(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot fish
+def enter_755(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_755, current, parser.mark(), None, -1]
+	if START_861 == None or START_861.match(string[current]) != None:
+		parser.current = PARSE_861(parser, ARGUMENT_861.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_861,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_861
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_755)
+
+# loot replace block targetPos slot kill
+def enter_756(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_756, current, parser.mark(), None, -1]
+	if START_862 == None or START_862.match(string[current]) != None:
+		parser.current = PARSE_862(parser, ARGUMENT_862.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_862,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_862
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_756)
+
+# loot replace block targetPos slot loot
+def enter_757(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_757, current, parser.mark(), None, -1]
+	if START_863 == None or START_863.match(string[current]) != None:
+		parser.current = PARSE_863(parser, ARGUMENT_863.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_863,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_863
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_757)
+
+# loot replace block targetPos slot mine
+def enter_758(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_758, current, parser.mark(), None, -1]
+	if START_864 == None or START_864.match(string[current]) != None:
+		parser.current = PARSE_864(parser, ARGUMENT_864.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_864,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_864
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_758)
+
+# loot replace block targetPos slot count
+def enter_759(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_759, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'fish':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_865
+	elif token == 'kill':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_866
+	elif token == 'loot':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_867
+	elif token == 'mine':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_868
+	return parser.no_child_matched(CHILDREN_759)
+
+# loot replace entity entities slot fish
+def enter_760(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_760, current, parser.mark(), None, -1]
+	if START_869 == None or START_869.match(string[current]) != None:
+		parser.current = PARSE_869(parser, ARGUMENT_869.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_869,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_869
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_760)
+
+# loot replace entity entities slot kill
+def enter_761(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_761, current, parser.mark(), None, -1]
+	if START_870 == None or START_870.match(string[current]) != None:
+		parser.current = PARSE_870(parser, ARGUMENT_870.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_870,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_870
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_761)
+
+# loot replace entity entities slot loot
+def enter_762(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_762, current, parser.mark(), None, -1]
+	if START_871 == None or START_871.match(string[current]) != None:
+		parser.current = PARSE_871(parser, ARGUMENT_871.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_871,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_871
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_762)
+
+# loot replace entity entities slot mine
+def enter_763(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_763, current, parser.mark(), None, -1]
+	if START_872 == None or START_872.match(string[current]) != None:
+		parser.current = PARSE_872(parser, ARGUMENT_872.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_872,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_872
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_763)
+
+# loot replace entity entities slot count
+def enter_764(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_764, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'fish':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_873
+	elif token == 'kill':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_874
+	elif token == 'loot':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_875
+	elif token == 'mine':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_876
+	return parser.no_child_matched(CHILDREN_764)
+
+# loot spawn targetPos fish loot_table pos
+def enter_765(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_765, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_877
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_878
+	if START_879 == None or START_879.match(string[current]) != None:
+		parser.current = PARSE_879(parser, ARGUMENT_879.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_879,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_879
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_765)
+
+# loot spawn targetPos mine pos mainhand
+def enter_766(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot spawn targetPos mine pos offhand
+def enter_767(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot spawn targetPos mine pos tool
+def enter_768(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# particle name pos delta speed count
+def enter_769(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_769, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'force':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_880
+	elif token == 'normal':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_881
+	return parser.no_child_matched(CHILDREN_769)
+
+# playsound sound ambient targets pos volume
+def enter_770(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_770, current, parser.mark(), None, -1]
+	if START_882 == None or START_882.match(string[current]) != None:
+		parser.current = PARSE_882(parser, ARGUMENT_882.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_882,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_882
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_770)
+
+# playsound sound block targets pos volume
+def enter_771(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_771, current, parser.mark(), None, -1]
+	if START_883 == None or START_883.match(string[current]) != None:
+		parser.current = PARSE_883(parser, ARGUMENT_883.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_883,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_883
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_771)
+
+# playsound sound hostile targets pos volume
+def enter_772(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_772, current, parser.mark(), None, -1]
+	if START_884 == None or START_884.match(string[current]) != None:
+		parser.current = PARSE_884(parser, ARGUMENT_884.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_884,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_884
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_772)
+
+# playsound sound master targets pos volume
+def enter_773(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_773, current, parser.mark(), None, -1]
+	if START_885 == None or START_885.match(string[current]) != None:
+		parser.current = PARSE_885(parser, ARGUMENT_885.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_885,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_885
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_773)
+
+# playsound sound music targets pos volume
+def enter_774(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_774, current, parser.mark(), None, -1]
+	if START_886 == None or START_886.match(string[current]) != None:
+		parser.current = PARSE_886(parser, ARGUMENT_886.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_886,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_886
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_774)
+
+# playsound sound neutral targets pos volume
+def enter_775(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_775, current, parser.mark(), None, -1]
+	if START_887 == None or START_887.match(string[current]) != None:
+		parser.current = PARSE_887(parser, ARGUMENT_887.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_887,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_887
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_775)
+
+# playsound sound player targets pos volume
+def enter_776(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_776, current, parser.mark(), None, -1]
+	if START_888 == None or START_888.match(string[current]) != None:
+		parser.current = PARSE_888(parser, ARGUMENT_888.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_888,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_888
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_776)
+
+# playsound sound record targets pos volume
+def enter_777(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_777, current, parser.mark(), None, -1]
+	if START_889 == None or START_889.match(string[current]) != None:
+		parser.current = PARSE_889(parser, ARGUMENT_889.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_889,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_889
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_777)
+
+# playsound sound voice targets pos volume
+def enter_778(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_778, current, parser.mark(), None, -1]
+	if START_890 == None or START_890.match(string[current]) != None:
+		parser.current = PARSE_890(parser, ARGUMENT_890.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_890,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_890
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_778)
+
+# playsound sound weather targets pos volume
+def enter_779(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_779, current, parser.mark(), None, -1]
+	if START_891 == None or START_891.match(string[current]) != None:
+		parser.current = PARSE_891(parser, ARGUMENT_891.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_891,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_891
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_779)
+
+# replaceitem block pos slot item count
+def enter_780(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# replaceitem entity targets slot item count
+def enter_781(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard objectives add objective criteria displayName
+def enter_782(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard objectives modify objective displayname displayName
+def enter_783(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard objectives modify objective rendertype hearts
+def enter_784(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard objectives modify objective rendertype integer
+def enter_785(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard players add targets objective score
+def enter_786(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard players operation targets targetObjective operation
+def enter_787(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_787, current, parser.mark(), None, -1]
+	if START_892 == None or START_892.match(string[current]) != None:
+		parser.current = PARSE_892(parser, ARGUMENT_892.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_892,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_892
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_787)
+
+# scoreboard players remove targets objective score
+def enter_788(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard players set targets objective score
+def enter_789(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# spreadplayers center spreadDistance maxRange respectTeams targets
+def enter_790(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# teleport targets location facing entity facingEntity
+def enter_791(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_791, current, parser.mark(), None, -1]
+	if START_893 == None or START_893.match(string[current]) != None:
+		parser.current = PARSE_893(parser, ARGUMENT_893.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_893,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_893
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_791)
+
+# title targets times fadeIn stay fadeOut
+def enter_792(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination filtered filter force
+def enter_793(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination filtered filter move
+def enter_794(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# clone begin end destination filtered filter normal
+def enter_795(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath append from
+def enter_796(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_796, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_894
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_895
+	return parser.no_child_matched(CHILDREN_796)
+
+# data modify block targetPos targetPath append value
+def enter_797(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_797, current, parser.mark(), None, -1]
+	if START_896 == None or START_896.match(string[current]) != None:
+		parser.current = PARSE_896(parser, ARGUMENT_896.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_896,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_896
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_797)
+
+# data modify block targetPos targetPath insert index
+def enter_798(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_798, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_897
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_898
+	return parser.no_child_matched(CHILDREN_798)
+
+# data modify block targetPos targetPath merge from
+def enter_799(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_799, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_899
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_900
+	return parser.no_child_matched(CHILDREN_799)
+
+# data modify block targetPos targetPath merge value
+def enter_800(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_800, current, parser.mark(), None, -1]
+	if START_901 == None or START_901.match(string[current]) != None:
+		parser.current = PARSE_901(parser, ARGUMENT_901.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_901,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_901
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_800)
+
+# data modify block targetPos targetPath prepend from
+def enter_801(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_801, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_902
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_903
+	return parser.no_child_matched(CHILDREN_801)
+
+# data modify block targetPos targetPath prepend value
+def enter_802(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_802, current, parser.mark(), None, -1]
+	if START_904 == None or START_904.match(string[current]) != None:
+		parser.current = PARSE_904(parser, ARGUMENT_904.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_904,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_904
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_802)
+
+# data modify block targetPos targetPath set from
+def enter_803(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_803, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_905
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_906
+	return parser.no_child_matched(CHILDREN_803)
+
+# data modify block targetPos targetPath set value
+def enter_804(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_804, current, parser.mark(), None, -1]
+	if START_907 == None or START_907.match(string[current]) != None:
+		parser.current = PARSE_907(parser, ARGUMENT_907.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_907,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_907
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_804)
+
+# data modify entity target targetPath append from
+def enter_805(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_805, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_908
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_909
+	return parser.no_child_matched(CHILDREN_805)
+
+# data modify entity target targetPath append value
+def enter_806(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_806, current, parser.mark(), None, -1]
+	if START_910 == None or START_910.match(string[current]) != None:
+		parser.current = PARSE_910(parser, ARGUMENT_910.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_910,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_910
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_806)
+
+# data modify entity target targetPath insert index
+def enter_807(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_807, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'from':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 4)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 4
+		stack.append(frame)
+		return enter_911
+	elif token == 'value':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_912
+	return parser.no_child_matched(CHILDREN_807)
+
+# data modify entity target targetPath merge from
+def enter_808(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_808, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_913
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_914
+	return parser.no_child_matched(CHILDREN_808)
+
+# data modify entity target targetPath merge value
+def enter_809(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_809, current, parser.mark(), None, -1]
+	if START_915 == None or START_915.match(string[current]) != None:
+		parser.current = PARSE_915(parser, ARGUMENT_915.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_915,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_915
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_809)
+
+# data modify entity target targetPath prepend from
+def enter_810(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_810, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_916
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_917
+	return parser.no_child_matched(CHILDREN_810)
+
+# data modify entity target targetPath prepend value
+def enter_811(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_811, current, parser.mark(), None, -1]
+	if START_918 == None or START_918.match(string[current]) != None:
+		parser.current = PARSE_918(parser, ARGUMENT_918.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_918,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_918
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_811)
+
+# data modify entity target targetPath set from
+def enter_812(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_812, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_919
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_920
+	return parser.no_child_matched(CHILDREN_812)
+
+# data modify entity target targetPath set value
+def enter_813(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_813, current, parser.mark(), None, -1]
+	if START_921 == None or START_921.match(string[current]) != None:
+		parser.current = PARSE_921(parser, ARGUMENT_921.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_921,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_921
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_813)
+
+# effect give targets effect seconds amplifier hideParticles
+def enter_814(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# execute if blocks start end destination all
+def enter_815(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if blocks start end destination masked
+def enter_816(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if score target targetObjective < source
+def enter_817(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_817, current, parser.mark(), None, -1]
+	if START_922 == None or START_922.match(string[current]) != None:
+		parser.current = PARSE_922(parser, ARGUMENT_922.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_922,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_922
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_817)
+
+# execute if score target targetObjective <= source
+def enter_818(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_818, current, parser.mark(), None, -1]
+	if START_923 == None or START_923.match(string[current]) != None:
+		parser.current = PARSE_923(parser, ARGUMENT_923.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_923,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_923
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_818)
+
+# execute if score target targetObjective = source
+def enter_819(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_819, current, parser.mark(), None, -1]
+	if START_924 == None or START_924.match(string[current]) != None:
+		parser.current = PARSE_924(parser, ARGUMENT_924.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_924,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_924
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_819)
+
+# execute if score target targetObjective > source
+def enter_820(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_820, current, parser.mark(), None, -1]
+	if START_925 == None or START_925.match(string[current]) != None:
+		parser.current = PARSE_925(parser, ARGUMENT_925.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_925,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_925
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_820)
+
+# execute if score target targetObjective >= source
+def enter_821(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_821, current, parser.mark(), None, -1]
+	if START_926 == None or START_926.match(string[current]) != None:
+		parser.current = PARSE_926(parser, ARGUMENT_926.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_926,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_926
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_821)
+
+# execute if score target targetObjective matches range
+def enter_822(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute store result block targetPos path byte
+def enter_823(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_823, current, parser.mark(), None, -1]
+	if START_927 == None or START_927.match(string[current]) != None:
+		parser.current = PARSE_927(parser, ARGUMENT_927.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_927,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_927
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_823)
+
+# execute store result block targetPos path double
+def enter_824(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_824, current, parser.mark(), None, -1]
+	if START_928 == None or START_928.match(string[current]) != None:
+		parser.current = PARSE_928(parser, ARGUMENT_928.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_928,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_928
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_824)
+
+# execute store result block targetPos path float
+def enter_825(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_825, current, parser.mark(), None, -1]
+	if START_929 == None or START_929.match(string[current]) != None:
+		parser.current = PARSE_929(parser, ARGUMENT_929.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_929,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_929
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_825)
+
+# execute store result block targetPos path int
+def enter_826(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_826, current, parser.mark(), None, -1]
+	if START_930 == None or START_930.match(string[current]) != None:
+		parser.current = PARSE_930(parser, ARGUMENT_930.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_930,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_930
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_826)
+
+# execute store result block targetPos path long
+def enter_827(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_827, current, parser.mark(), None, -1]
+	if START_931 == None or START_931.match(string[current]) != None:
+		parser.current = PARSE_931(parser, ARGUMENT_931.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_931,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_931
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_827)
+
+# execute store result block targetPos path short
+def enter_828(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_828, current, parser.mark(), None, -1]
+	if START_932 == None or START_932.match(string[current]) != None:
+		parser.current = PARSE_932(parser, ARGUMENT_932.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_932,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_932
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_828)
+
+# execute store result entity target path byte
+def enter_829(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_829, current, parser.mark(), None, -1]
+	if START_933 == None or START_933.match(string[current]) != None:
+		parser.current = PARSE_933(parser, ARGUMENT_933.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_933,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_933
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_829)
+
+# execute store result entity target path double
+def enter_830(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_830, current, parser.mark(), None, -1]
+	if START_934 == None or START_934.match(string[current]) != None:
+		parser.current = PARSE_934(parser, ARGUMENT_934.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_934,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_934
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_830)
+
+# execute store result entity target path float
+def enter_831(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_831, current, parser.mark(), None, -1]
+	if START_935 == None or START_935.match(string[current]) != None:
+		parser.current = PARSE_935(parser, ARGUMENT_935.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_935,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_935
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_831)
+
+# execute store result entity target path int
+def enter_832(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_832, current, parser.mark(), None, -1]
+	if START_936 == None or START_936.match(string[current]) != None:
+		parser.current = PARSE_936(parser, ARGUMENT_936.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_936,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_936
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_832)
+
+# execute store result entity target path long
+def enter_833(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_833, current, parser.mark(), None, -1]
+	if START_937 == None or START_937.match(string[current]) != None:
+		parser.current = PARSE_937(parser, ARGUMENT_937.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_937,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_937
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_833)
+
+# execute store result entity target path short
+def enter_834(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_834, current, parser.mark(), None, -1]
+	if START_938 == None or START_938.match(string[current]) != None:
+		parser.current = PARSE_938(parser, ARGUMENT_938.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_938,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_938
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_834)
+
+# execute store success block targetPos path byte
+def enter_835(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_835, current, parser.mark(), None, -1]
+	if START_939 == None or START_939.match(string[current]) != None:
+		parser.current = PARSE_939(parser, ARGUMENT_939.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_939,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_939
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_835)
+
+# execute store success block targetPos path double
+def enter_836(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_836, current, parser.mark(), None, -1]
+	if START_940 == None or START_940.match(string[current]) != None:
+		parser.current = PARSE_940(parser, ARGUMENT_940.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_940,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_940
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_836)
+
+# execute store success block targetPos path float
+def enter_837(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_837, current, parser.mark(), None, -1]
+	if START_941 == None or START_941.match(string[current]) != None:
+		parser.current = PARSE_941(parser, ARGUMENT_941.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_941,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_941
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_837)
+
+# execute store success block targetPos path int
+def enter_838(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_838, current, parser.mark(), None, -1]
+	if START_942 == None or START_942.match(string[current]) != None:
+		parser.current = PARSE_942(parser, ARGUMENT_942.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_942,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_942
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_838)
+
+# execute store success block targetPos path long
+def enter_839(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_839, current, parser.mark(), None, -1]
+	if START_943 == None or START_943.match(string[current]) != None:
+		parser.current = PARSE_943(parser, ARGUMENT_943.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_943,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_943
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_839)
+
+# execute store success block targetPos path short
+def enter_840(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_840, current, parser.mark(), None, -1]
+	if START_944 == None or START_944.match(string[current]) != None:
+		parser.current = PARSE_944(parser, ARGUMENT_944.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_944,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_944
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_840)
+
+# execute store success entity target path byte
+def enter_841(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_841, current, parser.mark(), None, -1]
+	if START_945 == None or START_945.match(string[current]) != None:
+		parser.current = PARSE_945(parser, ARGUMENT_945.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_945,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_945
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_841)
+
+# execute store success entity target path double
+def enter_842(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_842, current, parser.mark(), None, -1]
+	if START_946 == None or START_946.match(string[current]) != None:
+		parser.current = PARSE_946(parser, ARGUMENT_946.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_946,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_946
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_842)
+
+# execute store success entity target path float
+def enter_843(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_843, current, parser.mark(), None, -1]
+	if START_947 == None or START_947.match(string[current]) != None:
+		parser.current = PARSE_947(parser, ARGUMENT_947.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_947,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_947
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_843)
+
+# execute store success entity target path int
+def enter_844(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_844, current, parser.mark(), None, -1]
+	if START_948 == None or START_948.match(string[current]) != None:
+		parser.current = PARSE_948(parser, ARGUMENT_948.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_948,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_948
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_844)
+
+# execute store success entity target path long
+def enter_845(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_845, current, parser.mark(), None, -1]
+	if START_949 == None or START_949.match(string[current]) != None:
+		parser.current = PARSE_949(parser, ARGUMENT_949.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_949,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_949
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_845)
+
+# execute store success entity target path short
+def enter_846(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_846, current, parser.mark(), None, -1]
+	if START_950 == None or START_950.match(string[current]) != None:
+		parser.current = PARSE_950(parser, ARGUMENT_950.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_950,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_950
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_846)
+
+# execute unless blocks start end destination all
+def enter_847(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless blocks start end destination masked
+def enter_848(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless score target targetObjective < source
+def enter_849(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_849, current, parser.mark(), None, -1]
+	if START_951 == None or START_951.match(string[current]) != None:
+		parser.current = PARSE_951(parser, ARGUMENT_951.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_951,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_951
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_849)
+
+# execute unless score target targetObjective <= source
+def enter_850(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_850, current, parser.mark(), None, -1]
+	if START_952 == None or START_952.match(string[current]) != None:
+		parser.current = PARSE_952(parser, ARGUMENT_952.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_952,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_952
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_850)
+
+# execute unless score target targetObjective = source
+def enter_851(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_851, current, parser.mark(), None, -1]
+	if START_953 == None or START_953.match(string[current]) != None:
+		parser.current = PARSE_953(parser, ARGUMENT_953.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_953,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_953
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_851)
+
+# execute unless score target targetObjective > source
+def enter_852(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_852, current, parser.mark(), None, -1]
+	if START_954 == None or START_954.match(string[current]) != None:
+		parser.current = PARSE_954(parser, ARGUMENT_954.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_954,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_954
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_852)
+
+# execute unless score target targetObjective >= source
+def enter_853(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_853, current, parser.mark(), None, -1]
+	if START_955 == None or START_955.match(string[current]) != None:
+		parser.current = PARSE_955(parser, ARGUMENT_955.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_955,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_955
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_853)
+
+# execute unless score target targetObjective matches range
+def enter_854(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# loot give players fish loot_table pos mainhand
+def enter_855(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give players fish loot_table pos offhand
+def enter_856(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot give players fish loot_table pos tool
+def enter_857(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot insert targetPos fish loot_table pos mainhand
+def enter_858(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot insert targetPos fish loot_table pos offhand
+def enter_859(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot insert targetPos fish loot_table pos tool
+def enter_860(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot fish loot_table
+def enter_861(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_861, current, parser.mark(), None, -1]
+	if START_956 == None or START_956.match(string[current]) != None:
+		parser.current = PARSE_956(parser, ARGUMENT_956.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_956,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_956
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_861)
+
+# loot replace block targetPos slot kill target
+def enter_862(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot loot loot_table
+def enter_863(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot mine pos
+def enter_864(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_864, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_957
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_958
+	if START_959 == None or START_959.match(string[current]) != None:
+		parser.current = PARSE_959(parser, ARGUMENT_959.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_959,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_959
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_864)
+
+# loot replace block targetPos slot count fish
+def enter_865(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_865, current, parser.mark(), None, -1]
+	if START_960 == None or START_960.match(string[current]) != None:
+		parser.current = PARSE_960(parser, ARGUMENT_960.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_960,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_960
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_865)
+
+# loot replace block targetPos slot count kill
+def enter_866(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_866, current, parser.mark(), None, -1]
+	if START_961 == None or START_961.match(string[current]) != None:
+		parser.current = PARSE_961(parser, ARGUMENT_961.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_961,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_961
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_866)
+
+# loot replace block targetPos slot count loot
+def enter_867(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_867, current, parser.mark(), None, -1]
+	if START_962 == None or START_962.match(string[current]) != None:
+		parser.current = PARSE_962(parser, ARGUMENT_962.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_962,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_962
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_867)
+
+# loot replace block targetPos slot count mine
+def enter_868(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_868, current, parser.mark(), None, -1]
+	if START_963 == None or START_963.match(string[current]) != None:
+		parser.current = PARSE_963(parser, ARGUMENT_963.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_963,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_963
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_868)
+
+# loot replace entity entities slot fish loot_table
+def enter_869(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_869, current, parser.mark(), None, -1]
+	if START_964 == None or START_964.match(string[current]) != None:
+		parser.current = PARSE_964(parser, ARGUMENT_964.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_964,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_964
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_869)
+
+# loot replace entity entities slot kill target
+def enter_870(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot loot loot_table
+def enter_871(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot mine pos
+def enter_872(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_872, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_965
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_966
+	if START_967 == None or START_967.match(string[current]) != None:
+		parser.current = PARSE_967(parser, ARGUMENT_967.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_967,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_967
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_872)
+
+# loot replace entity entities slot count fish
+def enter_873(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_873, current, parser.mark(), None, -1]
+	if START_968 == None or START_968.match(string[current]) != None:
+		parser.current = PARSE_968(parser, ARGUMENT_968.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_968,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_968
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_873)
+
+# loot replace entity entities slot count kill
+def enter_874(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_874, current, parser.mark(), None, -1]
+	if START_969 == None or START_969.match(string[current]) != None:
+		parser.current = PARSE_969(parser, ARGUMENT_969.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_969,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_969
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_874)
+
+# loot replace entity entities slot count loot
+def enter_875(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_875, current, parser.mark(), None, -1]
+	if START_970 == None or START_970.match(string[current]) != None:
+		parser.current = PARSE_970(parser, ARGUMENT_970.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_970,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_970
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_875)
+
+# loot replace entity entities slot count mine
+def enter_876(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_876, current, parser.mark(), None, -1]
+	if START_971 == None or START_971.match(string[current]) != None:
+		parser.current = PARSE_971(parser, ARGUMENT_971.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_971,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_971
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_876)
+
+# loot spawn targetPos fish loot_table pos mainhand
+def enter_877(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot spawn targetPos fish loot_table pos offhand
+def enter_878(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot spawn targetPos fish loot_table pos tool
+def enter_879(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# particle name pos delta speed count force
+def enter_880(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_880, current, parser.mark(), None, -1]
+	if START_972 == None or START_972.match(string[current]) != None:
+		parser.current = PARSE_972(parser, ARGUMENT_972.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_972,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_972
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_880)
+
+# particle name pos delta speed count normal
+def enter_881(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_881, current, parser.mark(), None, -1]
+	if START_973 == None or START_973.match(string[current]) != None:
+		parser.current = PARSE_973(parser, ARGUMENT_973.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_973,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_973
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_881)
+
+# playsound sound ambient targets pos volume pitch
+def enter_882(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_882, current, parser.mark(), None, -1]
+	if START_974 == None or START_974.match(string[current]) != None:
+		parser.current = PARSE_974(parser, ARGUMENT_974.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_974,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_974
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_882)
+
+# playsound sound block targets pos volume pitch
+def enter_883(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_883, current, parser.mark(), None, -1]
+	if START_975 == None or START_975.match(string[current]) != None:
+		parser.current = PARSE_975(parser, ARGUMENT_975.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_975,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_975
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_883)
+
+# playsound sound hostile targets pos volume pitch
+def enter_884(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_884, current, parser.mark(), None, -1]
+	if START_976 == None or START_976.match(string[current]) != None:
+		parser.current = PARSE_976(parser, ARGUMENT_976.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_976,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_976
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_884)
+
+# playsound sound master targets pos volume pitch
+def enter_885(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_885, current, parser.mark(), None, -1]
+	if START_977 == None or START_977.match(string[current]) != None:
+		parser.current = PARSE_977(parser, ARGUMENT_977.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_977,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_977
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_885)
+
+# playsound sound music targets pos volume pitch
+def enter_886(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_886, current, parser.mark(), None, -1]
+	if START_978 == None or START_978.match(string[current]) != None:
+		parser.current = PARSE_978(parser, ARGUMENT_978.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_978,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_978
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_886)
+
+# playsound sound neutral targets pos volume pitch
+def enter_887(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_887, current, parser.mark(), None, -1]
+	if START_979 == None or START_979.match(string[current]) != None:
+		parser.current = PARSE_979(parser, ARGUMENT_979.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_979,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_979
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_887)
+
+# playsound sound player targets pos volume pitch
+def enter_888(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_888, current, parser.mark(), None, -1]
+	if START_980 == None or START_980.match(string[current]) != None:
+		parser.current = PARSE_980(parser, ARGUMENT_980.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_980,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_980
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_888)
+
+# playsound sound record targets pos volume pitch
+def enter_889(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_889, current, parser.mark(), None, -1]
+	if START_981 == None or START_981.match(string[current]) != None:
+		parser.current = PARSE_981(parser, ARGUMENT_981.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_981,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_981
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_889)
+
+# playsound sound voice targets pos volume pitch
+def enter_890(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_890, current, parser.mark(), None, -1]
+	if START_982 == None or START_982.match(string[current]) != None:
+		parser.current = PARSE_982(parser, ARGUMENT_982.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_982,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_982
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_890)
+
+# playsound sound weather targets pos volume pitch
+def enter_891(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_891, current, parser.mark(), None, -1]
+	if START_983 == None or START_983.match(string[current]) != None:
+		parser.current = PARSE_983(parser, ARGUMENT_983.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_983,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_983
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_891)
+
+# scoreboard players operation targets targetObjective operation source
+def enter_892(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_892, current, parser.mark(), None, -1]
+	if START_984 == None or START_984.match(string[current]) != None:
+		parser.current = PARSE_984(parser, ARGUMENT_984.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_984,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_984
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_892)
+
+# teleport targets location facing entity facingEntity facingAnchor
+def enter_893(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath append from block
+def enter_894(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_894, current, parser.mark(), None, -1]
+	if START_985 == None or START_985.match(string[current]) != None:
+		parser.current = PARSE_985(parser, ARGUMENT_985.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_985,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_985
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_894)
+
+# data modify block targetPos targetPath append from entity
+def enter_895(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_895, current, parser.mark(), None, -1]
+	if START_986 == None or START_986.match(string[current]) != None:
+		parser.current = PARSE_986(parser, ARGUMENT_986.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_986,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_986
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_895)
+
+# data modify block targetPos targetPath append value value
+def enter_896(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath insert index from
+def enter_897(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_897, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_987
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_988
+	return parser.no_child_matched(CHILDREN_897)
+
+# data modify block targetPos targetPath insert index value
+def enter_898(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_898, current, parser.mark(), None, -1]
+	if START_989 == None or START_989.match(string[current]) != None:
+		parser.current = PARSE_989(parser, ARGUMENT_989.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_989,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_989
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_898)
+
+# data modify block targetPos targetPath merge from block
+def enter_899(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_899, current, parser.mark(), None, -1]
+	if START_990 == None or START_990.match(string[current]) != None:
+		parser.current = PARSE_990(parser, ARGUMENT_990.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_990,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_990
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_899)
+
+# data modify block targetPos targetPath merge from entity
+def enter_900(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_900, current, parser.mark(), None, -1]
+	if START_991 == None or START_991.match(string[current]) != None:
+		parser.current = PARSE_991(parser, ARGUMENT_991.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_991,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_991
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_900)
+
+# data modify block targetPos targetPath merge value value
+def enter_901(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath prepend from block
+def enter_902(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_902, current, parser.mark(), None, -1]
+	if START_992 == None or START_992.match(string[current]) != None:
+		parser.current = PARSE_992(parser, ARGUMENT_992.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_992,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_992
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_902)
+
+# data modify block targetPos targetPath prepend from entity
+def enter_903(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_903, current, parser.mark(), None, -1]
+	if START_993 == None or START_993.match(string[current]) != None:
+		parser.current = PARSE_993(parser, ARGUMENT_993.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_993,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_993
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_903)
+
+# data modify block targetPos targetPath prepend value value
+def enter_904(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath set from block
+def enter_905(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_905, current, parser.mark(), None, -1]
+	if START_994 == None or START_994.match(string[current]) != None:
+		parser.current = PARSE_994(parser, ARGUMENT_994.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_994,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_994
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_905)
+
+# data modify block targetPos targetPath set from entity
+def enter_906(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_906, current, parser.mark(), None, -1]
+	if START_995 == None or START_995.match(string[current]) != None:
+		parser.current = PARSE_995(parser, ARGUMENT_995.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_995,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_995
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_906)
+
+# data modify block targetPos targetPath set value value
+def enter_907(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath append from block
+def enter_908(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_908, current, parser.mark(), None, -1]
+	if START_996 == None or START_996.match(string[current]) != None:
+		parser.current = PARSE_996(parser, ARGUMENT_996.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_996,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_996
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_908)
+
+# data modify entity target targetPath append from entity
+def enter_909(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_909, current, parser.mark(), None, -1]
+	if START_997 == None or START_997.match(string[current]) != None:
+		parser.current = PARSE_997(parser, ARGUMENT_997.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_997,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_997
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_909)
+
+# data modify entity target targetPath append value value
+def enter_910(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath insert index from
+def enter_911(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_911, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'block':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 5)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 5
+		stack.append(frame)
+		return enter_998
+	elif token == 'entity':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 6)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 6
+		stack.append(frame)
+		return enter_999
+	return parser.no_child_matched(CHILDREN_911)
+
+# data modify entity target targetPath insert index value
+def enter_912(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_912, current, parser.mark(), None, -1]
+	if START_1000 == None or START_1000.match(string[current]) != None:
+		parser.current = PARSE_1000(parser, ARGUMENT_1000.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1000,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1000
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_912)
+
+# data modify entity target targetPath merge from block
+def enter_913(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_913, current, parser.mark(), None, -1]
+	if START_1001 == None or START_1001.match(string[current]) != None:
+		parser.current = PARSE_1001(parser, ARGUMENT_1001.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1001,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1001
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_913)
+
+# data modify entity target targetPath merge from entity
+def enter_914(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_914, current, parser.mark(), None, -1]
+	if START_1002 == None or START_1002.match(string[current]) != None:
+		parser.current = PARSE_1002(parser, ARGUMENT_1002.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1002,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1002
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_914)
+
+# data modify entity target targetPath merge value value
+def enter_915(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath prepend from block
+def enter_916(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_916, current, parser.mark(), None, -1]
+	if START_1003 == None or START_1003.match(string[current]) != None:
+		parser.current = PARSE_1003(parser, ARGUMENT_1003.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1003,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1003
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_916)
+
+# data modify entity target targetPath prepend from entity
+def enter_917(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_917, current, parser.mark(), None, -1]
+	if START_1004 == None or START_1004.match(string[current]) != None:
+		parser.current = PARSE_1004(parser, ARGUMENT_1004.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1004,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1004
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_917)
+
+# data modify entity target targetPath prepend value value
+def enter_918(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath set from block
+def enter_919(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_919, current, parser.mark(), None, -1]
+	if START_1005 == None or START_1005.match(string[current]) != None:
+		parser.current = PARSE_1005(parser, ARGUMENT_1005.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1005,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1005
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_919)
+
+# data modify entity target targetPath set from entity
+def enter_920(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_920, current, parser.mark(), None, -1]
+	if START_1006 == None or START_1006.match(string[current]) != None:
+		parser.current = PARSE_1006(parser, ARGUMENT_1006.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1006,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1006
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_920)
+
+# data modify entity target targetPath set value value
+def enter_921(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# execute if score target targetObjective < source sourceObjective
+def enter_922(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if score target targetObjective <= source sourceObjective
+def enter_923(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if score target targetObjective = source sourceObjective
+def enter_924(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if score target targetObjective > source sourceObjective
+def enter_925(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute if score target targetObjective >= source sourceObjective
+def enter_926(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute store result block targetPos path byte scale
+def enter_927(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result block targetPos path double scale
+def enter_928(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result block targetPos path float scale
+def enter_929(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result block targetPos path int scale
+def enter_930(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result block targetPos path long scale
+def enter_931(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result block targetPos path short scale
+def enter_932(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result entity target path byte scale
+def enter_933(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result entity target path double scale
+def enter_934(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result entity target path float scale
+def enter_935(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result entity target path int scale
+def enter_936(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result entity target path long scale
+def enter_937(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store result entity target path short scale
+def enter_938(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success block targetPos path byte scale
+def enter_939(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success block targetPos path double scale
+def enter_940(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success block targetPos path float scale
+def enter_941(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success block targetPos path int scale
+def enter_942(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success block targetPos path long scale
+def enter_943(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success block targetPos path short scale
+def enter_944(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success entity target path byte scale
+def enter_945(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success entity target path double scale
+def enter_946(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success entity target path float scale
+def enter_947(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success entity target path int scale
+def enter_948(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success entity target path long scale
+def enter_949(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute store success entity target path short scale
+def enter_950(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_16)
+
+# execute unless score target targetObjective < source sourceObjective
+def enter_951(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless score target targetObjective <= source sourceObjective
+def enter_952(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless score target targetObjective = source sourceObjective
+def enter_953(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless score target targetObjective > source sourceObjective
+def enter_954(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# execute unless score target targetObjective >= source sourceObjective
+def enter_955(parser, stack):
+	parser.check_budget()
+	return parser.follow_redirect(stack, enter_612)
+
+# loot replace block targetPos slot fish loot_table pos
+def enter_956(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_956, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_1007
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_1008
+	if START_1009 == None or START_1009.match(string[current]) != None:
+		parser.current = PARSE_1009(parser, ARGUMENT_1009.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1009,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1009
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_956)
+
+# loot replace block targetPos slot mine pos mainhand
+def enter_957(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot mine pos offhand
+def enter_958(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot mine pos tool
+def enter_959(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot count fish loot_table
+def enter_960(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_960, current, parser.mark(), None, -1]
+	if START_1010 == None or START_1010.match(string[current]) != None:
+		parser.current = PARSE_1010(parser, ARGUMENT_1010.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1010,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1010
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_960)
+
+# loot replace block targetPos slot count kill target
+def enter_961(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot count loot loot_table
+def enter_962(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot count mine pos
+def enter_963(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_963, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_1011
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_1012
+	if START_1013 == None or START_1013.match(string[current]) != None:
+		parser.current = PARSE_1013(parser, ARGUMENT_1013.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1013,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1013
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_963)
+
+# loot replace entity entities slot fish loot_table pos
+def enter_964(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_964, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_1014
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_1015
+	if START_1016 == None or START_1016.match(string[current]) != None:
+		parser.current = PARSE_1016(parser, ARGUMENT_1016.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1016,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1016
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_964)
+
+# loot replace entity entities slot mine pos mainhand
+def enter_965(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot mine pos offhand
+def enter_966(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot mine pos tool
+def enter_967(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot count fish loot_table
+def enter_968(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_968, current, parser.mark(), None, -1]
+	if START_1017 == None or START_1017.match(string[current]) != None:
+		parser.current = PARSE_1017(parser, ARGUMENT_1017.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1017,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1017
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_968)
+
+# loot replace entity entities slot count kill target
+def enter_969(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot count loot loot_table
+def enter_970(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot count mine pos
+def enter_971(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_971, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_1018
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_1019
+	if START_1020 == None or START_1020.match(string[current]) != None:
+		parser.current = PARSE_1020(parser, ARGUMENT_1020.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1020,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1020
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_971)
+
+# particle name pos delta speed count force viewers
+def enter_972(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# particle name pos delta speed count normal viewers
+def enter_973(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound ambient targets pos volume pitch minVolume
+def enter_974(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound block targets pos volume pitch minVolume
+def enter_975(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound hostile targets pos volume pitch minVolume
+def enter_976(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound master targets pos volume pitch minVolume
+def enter_977(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound music targets pos volume pitch minVolume
+def enter_978(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound neutral targets pos volume pitch minVolume
+def enter_979(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound player targets pos volume pitch minVolume
+def enter_980(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound record targets pos volume pitch minVolume
+def enter_981(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound voice targets pos volume pitch minVolume
+def enter_982(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# playsound sound weather targets pos volume pitch minVolume
+def enter_983(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# scoreboard players operation targets targetObjective operation source sourceObjective
+def enter_984(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath append from block sourcePos
+def enter_985(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_985, current, parser.mark(), None, -1]
+	if START_1021 == None or START_1021.match(string[current]) != None:
+		parser.current = PARSE_1021(parser, ARGUMENT_1021.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1021,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1021
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_985)
+
+# data modify block targetPos targetPath append from entity source
+def enter_986(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_986, current, parser.mark(), None, -1]
+	if START_1022 == None or START_1022.match(string[current]) != None:
+		parser.current = PARSE_1022(parser, ARGUMENT_1022.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1022,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1022
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_986)
+
+# data modify block targetPos targetPath insert index from block
+def enter_987(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_987, current, parser.mark(), None, -1]
+	if START_1023 == None or START_1023.match(string[current]) != None:
+		parser.current = PARSE_1023(parser, ARGUMENT_1023.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1023,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1023
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_987)
+
+# data modify block targetPos targetPath insert index from entity
+def enter_988(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_988, current, parser.mark(), None, -1]
+	if START_1024 == None or START_1024.match(string[current]) != None:
+		parser.current = PARSE_1024(parser, ARGUMENT_1024.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1024,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1024
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_988)
+
+# data modify block targetPos targetPath insert index value value
+def enter_989(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath merge from block sourcePos
+def enter_990(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_990, current, parser.mark(), None, -1]
+	if START_1025 == None or START_1025.match(string[current]) != None:
+		parser.current = PARSE_1025(parser, ARGUMENT_1025.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1025,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1025
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_990)
+
+# data modify block targetPos targetPath merge from entity source
+def enter_991(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_991, current, parser.mark(), None, -1]
+	if START_1026 == None or START_1026.match(string[current]) != None:
+		parser.current = PARSE_1026(parser, ARGUMENT_1026.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1026,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1026
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_991)
+
+# data modify block targetPos targetPath prepend from block sourcePos
+def enter_992(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_992, current, parser.mark(), None, -1]
+	if START_1027 == None or START_1027.match(string[current]) != None:
+		parser.current = PARSE_1027(parser, ARGUMENT_1027.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1027,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1027
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_992)
+
+# data modify block targetPos targetPath prepend from entity source
+def enter_993(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_993, current, parser.mark(), None, -1]
+	if START_1028 == None or START_1028.match(string[current]) != None:
+		parser.current = PARSE_1028(parser, ARGUMENT_1028.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1028,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1028
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_993)
+
+# data modify block targetPos targetPath set from block sourcePos
+def enter_994(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_994, current, parser.mark(), None, -1]
+	if START_1029 == None or START_1029.match(string[current]) != None:
+		parser.current = PARSE_1029(parser, ARGUMENT_1029.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1029,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1029
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_994)
+
+# data modify block targetPos targetPath set from entity source
+def enter_995(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_995, current, parser.mark(), None, -1]
+	if START_1030 == None or START_1030.match(string[current]) != None:
+		parser.current = PARSE_1030(parser, ARGUMENT_1030.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1030,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1030
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_995)
+
+# data modify entity target targetPath append from block sourcePos
+def enter_996(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_996, current, parser.mark(), None, -1]
+	if START_1031 == None or START_1031.match(string[current]) != None:
+		parser.current = PARSE_1031(parser, ARGUMENT_1031.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1031,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1031
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_996)
+
+# data modify entity target targetPath append from entity source
+def enter_997(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_997, current, parser.mark(), None, -1]
+	if START_1032 == None or START_1032.match(string[current]) != None:
+		parser.current = PARSE_1032(parser, ARGUMENT_1032.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1032,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1032
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_997)
+
+# data modify entity target targetPath insert index from block
+def enter_998(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_998, current, parser.mark(), None, -1]
+	if START_1033 == None or START_1033.match(string[current]) != None:
+		parser.current = PARSE_1033(parser, ARGUMENT_1033.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1033,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1033
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_998)
+
+# data modify entity target targetPath insert index from entity
+def enter_999(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(None)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return False
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_999, current, parser.mark(), None, -1]
+	if START_1034 == None or START_1034.match(string[current]) != None:
+		parser.current = PARSE_1034(parser, ARGUMENT_1034.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1034,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1034
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_999)
+
+# data modify entity target targetPath insert index value value
+def enter_1000(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath merge from block sourcePos
+def enter_1001(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1001, current, parser.mark(), None, -1]
+	if START_1035 == None or START_1035.match(string[current]) != None:
+		parser.current = PARSE_1035(parser, ARGUMENT_1035.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1035,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1035
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1001)
+
+# data modify entity target targetPath merge from entity source
+def enter_1002(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1002, current, parser.mark(), None, -1]
+	if START_1036 == None or START_1036.match(string[current]) != None:
+		parser.current = PARSE_1036(parser, ARGUMENT_1036.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1036,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1036
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1002)
+
+# data modify entity target targetPath prepend from block sourcePos
+def enter_1003(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1003, current, parser.mark(), None, -1]
+	if START_1037 == None or START_1037.match(string[current]) != None:
+		parser.current = PARSE_1037(parser, ARGUMENT_1037.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1037,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1037
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1003)
+
+# data modify entity target targetPath prepend from entity source
+def enter_1004(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1004, current, parser.mark(), None, -1]
+	if START_1038 == None or START_1038.match(string[current]) != None:
+		parser.current = PARSE_1038(parser, ARGUMENT_1038.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1038,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1038
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1004)
+
+# data modify entity target targetPath set from block sourcePos
+def enter_1005(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1005, current, parser.mark(), None, -1]
+	if START_1039 == None or START_1039.match(string[current]) != None:
+		parser.current = PARSE_1039(parser, ARGUMENT_1039.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1039,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1039
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1005)
+
+# data modify entity target targetPath set from entity source
+def enter_1006(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1006, current, parser.mark(), None, -1]
+	if START_1040 == None or START_1040.match(string[current]) != None:
+		parser.current = PARSE_1040(parser, ARGUMENT_1040.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1040,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1040
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1006)
+
+# loot replace block targetPos slot fish loot_table pos mainhand
+def enter_1007(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot fish loot_table pos offhand
+def enter_1008(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot fish loot_table pos tool
+def enter_1009(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot count fish loot_table pos
+def enter_1010(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1010, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_1041
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_1042
+	if START_1043 == None or START_1043.match(string[current]) != None:
+		parser.current = PARSE_1043(parser, ARGUMENT_1043.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1043,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1043
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1010)
+
+# loot replace block targetPos slot count mine pos mainhand
+def enter_1011(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot count mine pos offhand
+def enter_1012(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot count mine pos tool
+def enter_1013(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot fish loot_table pos mainhand
+def enter_1014(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot fish loot_table pos offhand
+def enter_1015(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot fish loot_table pos tool
+def enter_1016(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot count fish loot_table pos
+def enter_1017(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1017, current, parser.mark(), None, -1]
+	token = TOKEN.match(string, current).group()
+	if token == 'mainhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 8)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 8
+		stack.append(frame)
+		return enter_1044
+	elif token == 'offhand':
+		tokens = parser.tokens
+		tokens.append(parser.region_begin + current)
+		tokens.append(parser.region_begin + current + 7)
+		tokens.append(parser.mccliteral)
+		parser.current = current + 7
+		stack.append(frame)
+		return enter_1045
+	if START_1046 == None or START_1046.match(string[current]) != None:
+		parser.current = PARSE_1046(parser, ARGUMENT_1046.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1046,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1046
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1017)
+
+# loot replace entity entities slot count mine pos mainhand
+def enter_1018(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot count mine pos offhand
+def enter_1019(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot count mine pos tool
+def enter_1020(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath append from block sourcePos sourcePath
+def enter_1021(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath append from entity source sourcePath
+def enter_1022(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath insert index from block sourcePos
+def enter_1023(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1023, current, parser.mark(), None, -1]
+	if START_1047 == None or START_1047.match(string[current]) != None:
+		parser.current = PARSE_1047(parser, ARGUMENT_1047.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1047,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1047
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1023)
+
+# data modify block targetPos targetPath insert index from entity source
+def enter_1024(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1024, current, parser.mark(), None, -1]
+	if START_1048 == None or START_1048.match(string[current]) != None:
+		parser.current = PARSE_1048(parser, ARGUMENT_1048.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1048,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1048
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1024)
+
+# data modify block targetPos targetPath merge from block sourcePos sourcePath
+def enter_1025(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath merge from entity source sourcePath
+def enter_1026(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath prepend from block sourcePos sourcePath
+def enter_1027(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath prepend from entity source sourcePath
+def enter_1028(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath set from block sourcePos sourcePath
+def enter_1029(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath set from entity source sourcePath
+def enter_1030(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath append from block sourcePos sourcePath
+def enter_1031(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath append from entity source sourcePath
+def enter_1032(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath insert index from block sourcePos
+def enter_1033(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1033, current, parser.mark(), None, -1]
+	if START_1049 == None or START_1049.match(string[current]) != None:
+		parser.current = PARSE_1049(parser, ARGUMENT_1049.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1049,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1049
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1033)
+
+# data modify entity target targetPath insert index from entity source
+def enter_1034(parser, stack):
+	parser.check_budget()
+	string = parser.string
+	current = parser.current
+	if current >= len(string):
+		return parser.end_of_command(True)
+
+	start = current
+	while current < len(string) and string[current] in " \t":
+		current += 1
+	parser.current = current
+	if current >= len(string):
+		return True
+	elif current == start:
+		return False
+
+	frame = [CHILDREN_FRAME, CHILDREN_1034, current, parser.mark(), None, -1]
+	if START_1050 == None or START_1050.match(string[current]) != None:
+		parser.current = PARSE_1050(parser, ARGUMENT_1050.properties)
+		if parser.current != current:
+			frame[4] = (ARGUMENT_1050,)
+			frame[5] = 0
+			stack.append(frame)
+			return enter_1050
+		parser.rollback(frame[3])
+	return parser.no_child_matched(CHILDREN_1034)
+
+# data modify entity target targetPath merge from block sourcePos sourcePath
+def enter_1035(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath merge from entity source sourcePath
+def enter_1036(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath prepend from block sourcePos sourcePath
+def enter_1037(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath prepend from entity source sourcePath
+def enter_1038(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath set from block sourcePos sourcePath
+def enter_1039(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath set from entity source sourcePath
+def enter_1040(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot count fish loot_table pos mainhand
+def enter_1041(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot count fish loot_table pos offhand
+def enter_1042(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace block targetPos slot count fish loot_table pos tool
+def enter_1043(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot count fish loot_table pos mainhand
+def enter_1044(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot count fish loot_table pos offhand
+def enter_1045(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# loot replace entity entities slot count fish loot_table pos tool
+def enter_1046(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath insert index from block sourcePos sourcePath
+def enter_1047(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify block targetPos targetPath insert index from entity source sourcePath
+def enter_1048(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath insert index from block sourcePos sourcePath
+def enter_1049(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+# data modify entity target targetPath insert index from entity source sourcePath
+def enter_1050(parser, stack):
+	parser.check_budget()
+	return parser.end_of_command(True)
+
+COMMANDS_0 = {
+	'advancement': enter_1,
+	'ban': enter_2,
+	'ban-ip': enter_3,
+	'banlist': enter_4,
+	'bossbar': enter_5,
+	'clear': enter_6,
+	'clone': enter_7,
+	'data': enter_8,
+	'datapack': enter_9,
+	'debug': enter_10,
+	'defaultgamemode': enter_11,
+	'deop': enter_12,
+	'difficulty': enter_13,
+	'effect': enter_14,
+	'enchant': enter_15,
+	'execute': enter_16,
+	'experience': enter_17,
+	'fill': enter_18,
+	'forceload': enter_19,
+	'function': enter_20,
+	'gamemode': enter_21,
+	'gamerule': enter_22,
+	'give': enter_23,
+	'help': enter_24,
+	'kick': enter_25,
+	'kill': enter_26,
+	'list': enter_27,
+	'locate': enter_28,
+	'loot': enter_29,
+	'me': enter_30,
+	'msg': enter_31,
+	'op': enter_32,
+	'pardon': enter_33,
+	'pardon-ip': enter_34,
+	'particle': enter_35,
+	'playsound': enter_36,
+	'publish': enter_37,
+	'recipe': enter_38,
+	'reload': enter_39,
+	'replaceitem': enter_40,
+	'save-all': enter_41,
+	'save-off': enter_42,
+	'save-on': enter_43,
+	'say': enter_44,
+	'schedule': enter_45,
+	'scoreboard': enter_46,
+	'seed': enter_47,
+	'setblock': enter_48,
+	'setidletimeout': enter_49,
+	'setworldspawn': enter_50,
+	'spawnpoint': enter_51,
+	'spreadplayers': enter_52,
+	'stop': enter_53,
+	'stopsound': enter_54,
+	'summon': enter_55,
+	'tag': enter_56,
+	'team': enter_57,
+	'teammsg': enter_58,
+	'teleport': enter_59,
+	'tell': enter_60,
+	'tellraw': enter_61,
+	'time': enter_62,
+	'title': enter_63,
+	'tm': enter_64,
+	'tp': enter_65,
+	'trigger': enter_66,
+	'w': enter_67,
+	'weather': enter_68,
+	'whitelist': enter_69,
+	'worldborder': enter_70,
+	'xp': enter_71,
+}
+CHILDREN_1 = CompiledChildren(('advancement',), (), None)
+ARGUMENT_74 = CompiledArgument('targets', 'minecraft:game_profile', ArgumentContext.of({}), enter_74)
+PARSE_74 = Parser.parsers[ARGUMENT_74.parser]
+START_74 = start_pattern(ARGUMENT_74)
+CHILDREN_2 = CompiledChildren(('ban',), (ARGUMENT_74, ), True)
+ARGUMENT_75 = CompiledArgument('target', 'brigadier:string', ArgumentContext.of({'type': 'word'}), enter_75)
+PARSE_75 = Parser.parsers[ARGUMENT_75.parser]
+START_75 = start_pattern(ARGUMENT_75)
+CHILDREN_3 = CompiledChildren(('ban-ip',), (ARGUMENT_75, ), True)
+CHILDREN_4 = CompiledChildren(('banlist',), (), True)
+LITERALS_5 = {
+	'add': enter_78,
+	'get': enter_79,
+	'list': enter_80,
+	'remove': enter_81,
+	'set': enter_82,
+}
+CHILDREN_5 = CompiledChildren(('bossbar',), (), None)
+ARGUMENT_83 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_83)
+PARSE_83 = Parser.parsers[ARGUMENT_83.parser]
+START_83 = start_pattern(ARGUMENT_83)
+CHILDREN_6 = CompiledChildren(('clear',), (ARGUMENT_83, ), True)
+ARGUMENT_84 = CompiledArgument('begin', 'minecraft:block_pos', ArgumentContext.of({}), enter_84)
+PARSE_84 = Parser.parsers[ARGUMENT_84.parser]
+START_84 = start_pattern(ARGUMENT_84)
+CHILDREN_7 = CompiledChildren(('clone',), (ARGUMENT_84, ), None)
+CHILDREN_8 = CompiledChildren(('data',), (), None)
+CHILDREN_9 = CompiledChildren(('datapack',), (), True)
+CHILDREN_10 = CompiledChildren(('debug',), (), True)
+CHILDREN_11 = CompiledChildren(('defaultgamemode',), (), True)
+ARGUMENT_98 = CompiledArgument('targets', 'minecraft:game_profile', ArgumentContext.of({}), enter_98)
+PARSE_98 = Parser.parsers[ARGUMENT_98.parser]
+START_98 = start_pattern(ARGUMENT_98)
+CHILDREN_12 = CompiledChildren(('deop',), (ARGUMENT_98, ), True)
+CHILDREN_13 = CompiledChildren(('difficulty',), (), True)
+CHILDREN_14 = CompiledChildren(('effect',), (), None)
+ARGUMENT_105 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_105)
+PARSE_105 = Parser.parsers[ARGUMENT_105.parser]
+START_105 = start_pattern(ARGUMENT_105)
+CHILDREN_15 = CompiledChildren(('enchant',), (ARGUMENT_105, ), None)
+LITERALS_16 = {
+	'align': enter_106,
+	'anchored': enter_107,
+	'as': enter_108,
+	'at': enter_109,
+	'facing': enter_110,
+	'if': enter_111,
+	'in': enter_112,
+	'positioned': enter_113,
+	'rotated': enter_114,
+	'run': enter_115,
+	'store': enter_116,
+	'unless': enter_117,
+}
+CHILDREN_16 = CompiledChildren(('execute',), (), None)
+CHILDREN_17 = CompiledChildren(('experience',), (), None)
+ARGUMENT_121 = CompiledArgument('from', 'minecraft:block_pos', ArgumentContext.of({}), enter_121)
+PARSE_121 = Parser.parsers[ARGUMENT_121.parser]
+START_121 = start_pattern(ARGUMENT_121)
+CHILDREN_18 = CompiledChildren(('fill',), (ARGUMENT_121, ), None)
+CHILDREN_19 = CompiledChildren(('forceload',), (), None)
+ARGUMENT_125 = CompiledArgument('name', 'minecraft:function', ArgumentContext.of({}), enter_125)
+PARSE_125 = Parser.parsers[ARGUMENT_125.parser]
+START_125 = start_pattern(ARGUMENT_125)
+CHILDREN_20 = CompiledChildren(('function',), (ARGUMENT_125, ), True)
+CHILDREN_21 = CompiledChildren(('gamemode',), (), True)
+LITERALS_22 = {
+	'announceAdvancements': enter_130,
+	'commandBlockOutput': enter_131,
+	'disableElytraMovementCheck': enter_132,
+	'doDaylightCycle': enter_133,
+	'doEntityDrops': enter_134,
+	'doFireTick': enter_135,
+	'doLimitedCrafting': enter_136,
+	'doMobLoot': enter_137,
+	'doMobSpawning': enter_138,
+	'doTileDrops': enter_139,
+	'doWeatherCycle': enter_140,
+	'keepInventory': enter_141,
+	'logAdminCommands': enter_142,
+	'maxCommandChainLength': enter_143,
+	'maxEntityCramming': enter_144,
+	'mobGriefing': enter_145,
+	'naturalRegeneration': enter_146,
+	'randomTickSpeed': enter_147,
+	'reducedDebugInfo': enter_148,
+	'sendCommandFeedback': enter_149,
+	'showDeathMessages': enter_150,
+	'spawnRadius': enter_151,
+	'spectatorsGenerateChunks': enter_152,
+}
+CHILDREN_22 = CompiledChildren(('gamerule',), (), True)
+ARGUMENT_153 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_153)
+PARSE_153 = Parser.parsers[ARGUMENT_153.parser]
+START_153 = start_pattern(ARGUMENT_153)
+CHILDREN_23 = CompiledChildren(('give',), (ARGUMENT_153, ), None)
+ARGUMENT_154 = CompiledArgument('command', 'brigadier:string', ArgumentContext.of({'type': 'greedy'}), enter_154)
+PARSE_154 = Parser.parsers[ARGUMENT_154.parser]
+START_154 = start_pattern(ARGUMENT_154)
+CHILDREN_24 = CompiledChildren(('help',), (ARGUMENT_154, ), True)
+ARGUMENT_155 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_155)
+PARSE_155 = Parser.parsers[ARGUMENT_155.parser]
+START_155 = start_pattern(ARGUMENT_155)
+CHILDREN_25 = CompiledChildren(('kick',), (ARGUMENT_155, ), True)
+ARGUMENT_156 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_156)
+PARSE_156 = Parser.parsers[ARGUMENT_156.parser]
+START_156 = start_pattern(ARGUMENT_156)
+CHILDREN_26 = CompiledChildren(('kill',), (ARGUMENT_156, ), True)
+CHILDREN_27 = CompiledChildren(('list',), (), True)
+LITERALS_28 = {
+	'Buried_Treasure': enter_158,
+	'Desert_Pyramid': enter_159,
+	'EndCity': enter_160,
+	'Fortress': enter_161,
+	'Igloo': enter_162,
+	'Jungle_Pyramid': enter_163,
+	'Mansion': enter_164,
+	'Mineshaft': enter_165,
+	'Monument': enter_166,
+	'Ocean_Ruin': enter_167,
+	'Pillager_Outpost': enter_168,
+	'Shipwreck': enter_169,
+	'Stronghold': enter_170,
+	'Swamp_Hut': enter_171,
+	'Village': enter_172,
+}
+CHILDREN_28 = CompiledChildren(('locate',), (), True)
+CHILDREN_29 = CompiledChildren(('loot',), (), None)
+ARGUMENT_177 = CompiledArgument('action', 'brigadier:string', ArgumentContext.of({'type': 'greedy'}), enter_177)
+PARSE_177 = Parser.parsers[ARGUMENT_177.parser]
+START_177 = start_pattern(ARGUMENT_177)
+CHILDREN_30 = CompiledChildren(('me',), (ARGUMENT_177, ), True)
+ARGUMENT_178 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_178)
+PARSE_178 = Parser.parsers[ARGUMENT_178.parser]
+START_178 = start_pattern(ARGUMENT_178)
+CHILDREN_31 = CompiledChildren(('msg',), (ARGUMENT_178, ), None)
+ARGUMENT_179 = CompiledArgument('targets', 'minecraft:game_profile', ArgumentContext.of({}), enter_179)
+PARSE_179 = Parser.parsers[ARGUMENT_179.parser]
+START_179 = start_pattern(ARGUMENT_179)
+CHILDREN_32 = CompiledChildren(('op',), (ARGUMENT_179, ), True)
+ARGUMENT_180 = CompiledArgument('targets', 'minecraft:game_profile', ArgumentContext.of({}), enter_180)
+PARSE_180 = Parser.parsers[ARGUMENT_180.parser]
+START_180 = start_pattern(ARGUMENT_180)
+CHILDREN_33 = CompiledChildren(('pardon',), (ARGUMENT_180, ), True)
+ARGUMENT_181 = CompiledArgument('target', 'brigadier:string', ArgumentContext.of({'type': 'word'}), enter_181)
+PARSE_181 = Parser.parsers[ARGUMENT_181.parser]
+START_181 = start_pattern(ARGUMENT_181)
+CHILDREN_34 = CompiledChildren(('pardon-ip',), (ARGUMENT_181, ), True)
+ARGUMENT_182 = CompiledArgument('name', 'minecraft:particle', ArgumentContext.of({}), enter_182)
+PARSE_182 = Parser.parsers[ARGUMENT_182.parser]
+START_182 = start_pattern(ARGUMENT_182)
+CHILDREN_35 = CompiledChildren(('particle',), (ARGUMENT_182, ), True)
+ARGUMENT_183 = CompiledArgument('sound', 'minecraft:sound', ArgumentContext.of({}), enter_183)
+PARSE_183 = Parser.parsers[ARGUMENT_183.parser]
+START_183 = start_pattern(ARGUMENT_183)
+CHILDREN_36 = CompiledChildren(('playsound',), (ARGUMENT_183, ), None)
+ARGUMENT_184 = CompiledArgument('port', 'brigadier:integer', ArgumentContext.of({'min': 0, 'max': 65535}), enter_184)
+PARSE_184 = Parser.parsers[ARGUMENT_184.parser]
+START_184 = start_pattern(ARGUMENT_184)
+CHILDREN_37 = CompiledChildren(('publish',), (ARGUMENT_184, ), True)
+CHILDREN_38 = CompiledChildren(('recipe',), (), None)
+CHILDREN_40 = CompiledChildren(('replaceitem',), (), None)
+CHILDREN_41 = CompiledChildren(('save-all',), (), True)
+ARGUMENT_190 = CompiledArgument('message', 'minecraft:message', ArgumentContext.of({}), enter_190)
+PARSE_190 = Parser.parsers[ARGUMENT_190.parser]
+START_190 = start_pattern(ARGUMENT_190)
+CHILDREN_44 = CompiledChildren(('say',), (ARGUMENT_190, ), True)
+CHILDREN_45 = CompiledChildren(('schedule',), (), None)
+CHILDREN_46 = CompiledChildren(('scoreboard',), (), None)
+ARGUMENT_194 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_194)
+PARSE_194 = Parser.parsers[ARGUMENT_194.parser]
+START_194 = start_pattern(ARGUMENT_194)
+CHILDREN_48 = CompiledChildren(('setblock',), (ARGUMENT_194, ), None)
+ARGUMENT_195 = CompiledArgument('minutes', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_195)
+PARSE_195 = Parser.parsers[ARGUMENT_195.parser]
+START_195 = start_pattern(ARGUMENT_195)
+CHILDREN_49 = CompiledChildren(('setidletimeout',), (ARGUMENT_195, ), True)
+ARGUMENT_196 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_196)
+PARSE_196 = Parser.parsers[ARGUMENT_196.parser]
+START_196 = start_pattern(ARGUMENT_196)
+CHILDREN_50 = CompiledChildren(('setworldspawn',), (ARGUMENT_196, ), True)
+ARGUMENT_197 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_197)
+PARSE_197 = Parser.parsers[ARGUMENT_197.parser]
+START_197 = start_pattern(ARGUMENT_197)
+CHILDREN_51 = CompiledChildren(('spawnpoint',), (ARGUMENT_197, ), True)
+ARGUMENT_198 = CompiledArgument('center', 'minecraft:vec2', ArgumentContext.of({}), enter_198)
+PARSE_198 = Parser.parsers[ARGUMENT_198.parser]
+START_198 = start_pattern(ARGUMENT_198)
+CHILDREN_52 = CompiledChildren(('spreadplayers',), (ARGUMENT_198, ), None)
+ARGUMENT_199 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_199)
+PARSE_199 = Parser.parsers[ARGUMENT_199.parser]
+START_199 = start_pattern(ARGUMENT_199)
+CHILDREN_54 = CompiledChildren(('stopsound',), (ARGUMENT_199, ), True)
+ARGUMENT_200 = CompiledArgument('entity', 'minecraft:entity_summon', ArgumentContext.of({}), enter_200)
+PARSE_200 = Parser.parsers[ARGUMENT_200.parser]
+START_200 = start_pattern(ARGUMENT_200)
+CHILDREN_55 = CompiledChildren(('summon',), (ARGUMENT_200, ), True)
+ARGUMENT_201 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_201)
+PARSE_201 = Parser.parsers[ARGUMENT_201.parser]
+START_201 = start_pattern(ARGUMENT_201)
+CHILDREN_56 = CompiledChildren(('tag',), (ARGUMENT_201, ), None)
+LITERALS_57 = {
+	'add': enter_202,
+	'empty': enter_203,
+	'join': enter_204,
+	'leave': enter_205,
+	'list': enter_206,
+	'modify': enter_207,
+	'remove': enter_208,
+}
+CHILDREN_57 = CompiledChildren(('team',), (), None)
+ARGUMENT_209 = CompiledArgument('message', 'minecraft:message', ArgumentContext.of({}), enter_209)
+PARSE_209 = Parser.parsers[ARGUMENT_209.parser]
+START_209 = start_pattern(ARGUMENT_209)
+CHILDREN_58 = CompiledChildren(('teammsg',), (ARGUMENT_209, ), True)
+ARGUMENT_210 = CompiledArgument('destination', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_210)
+PARSE_210 = Parser.parsers[ARGUMENT_210.parser]
+START_210 = start_pattern(ARGUMENT_210)
+ARGUMENT_211 = CompiledArgument('location', 'minecraft:vec3', ArgumentContext.of({}), enter_211)
+PARSE_211 = Parser.parsers[ARGUMENT_211.parser]
+START_211 = start_pattern(ARGUMENT_211)
+ARGUMENT_212 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_212)
+PARSE_212 = Parser.parsers[ARGUMENT_212.parser]
+START_212 = start_pattern(ARGUMENT_212)
+CHILDREN_59 = CompiledChildren(('teleport',), (ARGUMENT_210, ARGUMENT_211, ARGUMENT_212, ), None)
+ARGUMENT_213 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_213)
+PARSE_213 = Parser.parsers[ARGUMENT_213.parser]
+START_213 = start_pattern(ARGUMENT_213)
+CHILDREN_61 = CompiledChildren(('tellraw',), (ARGUMENT_213, ), None)
+CHILDREN_62 = CompiledChildren(('time',), (), None)
+ARGUMENT_217 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_217)
+PARSE_217 = Parser.parsers[ARGUMENT_217.parser]
+START_217 = start_pattern(ARGUMENT_217)
+CHILDREN_63 = CompiledChildren(('title',), (ARGUMENT_217, ), None)
+ARGUMENT_218 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_218)
+PARSE_218 = Parser.parsers[ARGUMENT_218.parser]
+START_218 = start_pattern(ARGUMENT_218)
+CHILDREN_66 = CompiledChildren(('trigger',), (ARGUMENT_218, ), True)
+CHILDREN_68 = CompiledChildren(('weather',), (), True)
+LITERALS_69 = {
+	'add': enter_222,
+	'list': enter_223,
+	'off': enter_224,
+	'on': enter_225,
+	'reload': enter_226,
+	'remove': enter_227,
+}
+CHILDREN_69 = CompiledChildren(('whitelist',), (), None)
+LITERALS_70 = {
+	'add': enter_228,
+	'center': enter_229,
+	'damage': enter_230,
+	'get': enter_231,
+	'set': enter_232,
+	'warning': enter_233,
+}
+CHILDREN_70 = CompiledChildren(('worldborder',), (), None)
+ARGUMENT_234 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_234)
+PARSE_234 = Parser.parsers[ARGUMENT_234.parser]
+START_234 = start_pattern(ARGUMENT_234)
+CHILDREN_72 = CompiledChildren(('advancement', 'grant'), (ARGUMENT_234, ), None)
+ARGUMENT_235 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_235)
+PARSE_235 = Parser.parsers[ARGUMENT_235.parser]
+START_235 = start_pattern(ARGUMENT_235)
+CHILDREN_73 = CompiledChildren(('advancement', 'revoke'), (ARGUMENT_235, ), None)
+ARGUMENT_236 = CompiledArgument('reason', 'minecraft:message', ArgumentContext.of({}), enter_236)
+PARSE_236 = Parser.parsers[ARGUMENT_236.parser]
+START_236 = start_pattern(ARGUMENT_236)
+CHILDREN_74 = CompiledChildren(('ban', 'targets'), (ARGUMENT_236, ), True)
+ARGUMENT_237 = CompiledArgument('reason', 'minecraft:message', ArgumentContext.of({}), enter_237)
+PARSE_237 = Parser.parsers[ARGUMENT_237.parser]
+START_237 = start_pattern(ARGUMENT_237)
+CHILDREN_75 = CompiledChildren(('ban-ip', 'target'), (ARGUMENT_237, ), True)
+ARGUMENT_238 = CompiledArgument('id', 'minecraft:resource_location', ArgumentContext.of({}), enter_238)
+PARSE_238 = Parser.parsers[ARGUMENT_238.parser]
+START_238 = start_pattern(ARGUMENT_238)
+CHILDREN_78 = CompiledChildren(('bossbar', 'add'), (ARGUMENT_238, ), None)
+ARGUMENT_239 = CompiledArgument('id', 'minecraft:resource_location', ArgumentContext.of({}), enter_239)
+PARSE_239 = Parser.parsers[ARGUMENT_239.parser]
+START_239 = start_pattern(ARGUMENT_239)
+CHILDREN_79 = CompiledChildren(('bossbar', 'get'), (ARGUMENT_239, ), None)
+ARGUMENT_240 = CompiledArgument('id', 'minecraft:resource_location', ArgumentContext.of({}), enter_240)
+PARSE_240 = Parser.parsers[ARGUMENT_240.parser]
+START_240 = start_pattern(ARGUMENT_240)
+CHILDREN_81 = CompiledChildren(('bossbar', 'remove'), (ARGUMENT_240, ), True)
+ARGUMENT_241 = CompiledArgument('id', 'minecraft:resource_location', ArgumentContext.of({}), enter_241)
+PARSE_241 = Parser.parsers[ARGUMENT_241.parser]
+START_241 = start_pattern(ARGUMENT_241)
+CHILDREN_82 = CompiledChildren(('bossbar', 'set'), (ARGUMENT_241, ), None)
+ARGUMENT_242 = CompiledArgument('item', 'minecraft:item_predicate', ArgumentContext.of({}), enter_242)
+PARSE_242 = Parser.parsers[ARGUMENT_242.parser]
+START_242 = start_pattern(ARGUMENT_242)
+CHILDREN_83 = CompiledChildren(('clear', 'targets'), (ARGUMENT_242, ), True)
+ARGUMENT_243 = CompiledArgument('end', 'minecraft:block_pos', ArgumentContext.of({}), enter_243)
+PARSE_243 = Parser.parsers[ARGUMENT_243.parser]
+START_243 = start_pattern(ARGUMENT_243)
+CHILDREN_84 = CompiledChildren(('clone', 'begin'), (ARGUMENT_243, ), None)
+CHILDREN_85 = CompiledChildren(('data', 'get'), (), None)
+CHILDREN_86 = CompiledChildren(('data', 'merge'), (), None)
+CHILDREN_87 = CompiledChildren(('data', 'modify'), (), None)
+CHILDREN_88 = CompiledChildren(('data', 'remove'), (), None)
+ARGUMENT_252 = CompiledArgument('name', 'brigadier:string', ArgumentContext.of({'type': 'phrase'}), enter_252)
+PARSE_252 = Parser.parsers[ARGUMENT_252.parser]
+START_252 = start_pattern(ARGUMENT_252)
+CHILDREN_89 = CompiledChildren(('datapack', 'disable'), (ARGUMENT_252, ), True)
+ARGUMENT_253 = CompiledArgument('name', 'brigadier:string', ArgumentContext.of({'type': 'phrase'}), enter_253)
+PARSE_253 = Parser.parsers[ARGUMENT_253.parser]
+START_253 = start_pattern(ARGUMENT_253)
+CHILDREN_90 = CompiledChildren(('datapack', 'enable'), (ARGUMENT_253, ), True)
+CHILDREN_91 = CompiledChildren(('datapack', 'list'), (), True)
+ARGUMENT_256 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_256)
+PARSE_256 = Parser.parsers[ARGUMENT_256.parser]
+START_256 = start_pattern(ARGUMENT_256)
+CHILDREN_103 = CompiledChildren(('effect', 'clear'), (ARGUMENT_256, ), True)
+ARGUMENT_257 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_257)
+PARSE_257 = Parser.parsers[ARGUMENT_257.parser]
+START_257 = start_pattern(ARGUMENT_257)
+CHILDREN_104 = CompiledChildren(('effect', 'give'), (ARGUMENT_257, ), None)
+ARGUMENT_258 = CompiledArgument('enchantment', 'minecraft:item_enchantment', ArgumentContext.of({}), enter_258)
+PARSE_258 = Parser.parsers[ARGUMENT_258.parser]
+START_258 = start_pattern(ARGUMENT_258)
+CHILDREN_105 = CompiledChildren(('enchant', 'targets'), (ARGUMENT_258, ), True)
+ARGUMENT_259 = CompiledArgument('axes', 'minecraft:swizzle', ArgumentContext.of({}), enter_259)
+PARSE_259 = Parser.parsers[ARGUMENT_259.parser]
+START_259 = start_pattern(ARGUMENT_259)
+CHILDREN_106 = CompiledChildren(('execute', 'align'), (ARGUMENT_259, ), None)
+ARGUMENT_260 = CompiledArgument('anchor', 'minecraft:entity_anchor', ArgumentContext.of({}), enter_260)
+PARSE_260 = Parser.parsers[ARGUMENT_260.parser]
+START_260 = start_pattern(ARGUMENT_260)
+CHILDREN_107 = CompiledChildren(('execute', 'anchored'), (ARGUMENT_260, ), None)
+ARGUMENT_261 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_261)
+PARSE_261 = Parser.parsers[ARGUMENT_261.parser]
+START_261 = start_pattern(ARGUMENT_261)
+CHILDREN_108 = CompiledChildren(('execute', 'as'), (ARGUMENT_261, ), None)
+ARGUMENT_262 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_262)
+PARSE_262 = Parser.parsers[ARGUMENT_262.parser]
+START_262 = start_pattern(ARGUMENT_262)
+CHILDREN_109 = CompiledChildren(('execute', 'at'), (ARGUMENT_262, ), None)
+ARGUMENT_264 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_264)
+PARSE_264 = Parser.parsers[ARGUMENT_264.parser]
+START_264 = start_pattern(ARGUMENT_264)
+CHILDREN_110 = CompiledChildren(('execute', 'facing'), (ARGUMENT_264, ), None)
+LITERALS_111 = {
+	'block': enter_265,
+	'blocks': enter_266,
+	'data': enter_267,
+	'entity': enter_268,
+	'score': enter_269,
+}
+CHILDREN_111 = CompiledChildren(('execute', 'if'), (), None)
+ARGUMENT_270 = CompiledArgument('dimension', 'minecraft:dimension', ArgumentContext.of({}), enter_270)
+PARSE_270 = Parser.parsers[ARGUMENT_270.parser]
+START_270 = start_pattern(ARGUMENT_270)
+CHILDREN_112 = CompiledChildren(('execute', 'in'), (ARGUMENT_270, ), None)
+ARGUMENT_272 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_272)
+PARSE_272 = Parser.parsers[ARGUMENT_272.parser]
+START_272 = start_pattern(ARGUMENT_272)
+CHILDREN_113 = CompiledChildren(('execute', 'positioned'), (ARGUMENT_272, ), None)
+ARGUMENT_274 = CompiledArgument('rot', 'minecraft:rotation', ArgumentContext.of({}), enter_274)
+PARSE_274 = Parser.parsers[ARGUMENT_274.parser]
+START_274 = start_pattern(ARGUMENT_274)
+CHILDREN_114 = CompiledChildren(('execute', 'rotated'), (ARGUMENT_274, ), None)
+CHILDREN_116 = CompiledChildren(('execute', 'store'), (), None)
+LITERALS_117 = {
+	'block': enter_277,
+	'blocks': enter_278,
+	'data': enter_279,
+	'entity': enter_280,
+	'score': enter_281,
+}
+CHILDREN_117 = CompiledChildren(('execute', 'unless'), (), None)
+ARGUMENT_282 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_282)
+PARSE_282 = Parser.parsers[ARGUMENT_282.parser]
+START_282 = start_pattern(ARGUMENT_282)
+CHILDREN_118 = CompiledChildren(('experience', 'add'), (ARGUMENT_282, ), None)
+ARGUMENT_283 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'players'}), enter_283)
+PARSE_283 = Parser.parsers[ARGUMENT_283.parser]
+START_283 = start_pattern(ARGUMENT_283)
+CHILDREN_119 = CompiledChildren(('experience', 'query'), (ARGUMENT_283, ), None)
+ARGUMENT_284 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_284)
+PARSE_284 = Parser.parsers[ARGUMENT_284.parser]
+START_284 = start_pattern(ARGUMENT_284)
+CHILDREN_120 = CompiledChildren(('experience', 'set'), (ARGUMENT_284, ), None)
+ARGUMENT_285 = CompiledArgument('to', 'minecraft:block_pos', ArgumentContext.of({}), enter_285)
+PARSE_285 = Parser.parsers[ARGUMENT_285.parser]
+START_285 = start_pattern(ARGUMENT_285)
+CHILDREN_121 = CompiledChildren(('fill', 'from'), (ARGUMENT_285, ), None)
+ARGUMENT_286 = CompiledArgument('from', 'minecraft:column_pos', ArgumentContext.of({}), enter_286)
+PARSE_286 = Parser.parsers[ARGUMENT_286.parser]
+START_286 = start_pattern(ARGUMENT_286)
+CHILDREN_122 = CompiledChildren(('forceload', 'add'), (ARGUMENT_286, ), True)
+ARGUMENT_287 = CompiledArgument('pos', 'minecraft:column_pos', ArgumentContext.of({}), enter_287)
+PARSE_287 = Parser.parsers[ARGUMENT_287.parser]
+START_287 = start_pattern(ARGUMENT_287)
+CHILDREN_123 = CompiledChildren(('forceload', 'query'), (ARGUMENT_287, ), True)
+ARGUMENT_289 = CompiledArgument('from', 'minecraft:column_pos', ArgumentContext.of({}), enter_289)
+PARSE_289 = Parser.parsers[ARGUMENT_289.parser]
+START_289 = start_pattern(ARGUMENT_289)
+CHILDREN_124 = CompiledChildren(('forceload', 'remove'), (ARGUMENT_289, ), True)
+ARGUMENT_290 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_290)
+PARSE_290 = Parser.parsers[ARGUMENT_290.parser]
+START_290 = start_pattern(ARGUMENT_290)
+CHILDREN_126 = CompiledChildren(('gamemode', 'adventure'), (ARGUMENT_290, ), True)
+ARGUMENT_291 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_291)
+PARSE_291 = Parser.parsers[ARGUMENT_291.parser]
+START_291 = start_pattern(ARGUMENT_291)
+CHILDREN_127 = CompiledChildren(('gamemode', 'creative'), (ARGUMENT_291, ), True)
+ARGUMENT_292 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_292)
+PARSE_292 = Parser.parsers[ARGUMENT_292.parser]
+START_292 = start_pattern(ARGUMENT_292)
+CHILDREN_128 = CompiledChildren(('gamemode', 'spectator'), (ARGUMENT_292, ), True)
+ARGUMENT_293 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_293)
+PARSE_293 = Parser.parsers[ARGUMENT_293.parser]
+START_293 = start_pattern(ARGUMENT_293)
+CHILDREN_129 = CompiledChildren(('gamemode', 'survival'), (ARGUMENT_293, ), True)
+ARGUMENT_294 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_294)
+PARSE_294 = Parser.parsers[ARGUMENT_294.parser]
+START_294 = start_pattern(ARGUMENT_294)
+CHILDREN_130 = CompiledChildren(('gamerule', 'announceAdvancements'), (ARGUMENT_294, ), True)
+ARGUMENT_295 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_295)
+PARSE_295 = Parser.parsers[ARGUMENT_295.parser]
+START_295 = start_pattern(ARGUMENT_295)
+CHILDREN_131 = CompiledChildren(('gamerule', 'commandBlockOutput'), (ARGUMENT_295, ), True)
+ARGUMENT_296 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_296)
+PARSE_296 = Parser.parsers[ARGUMENT_296.parser]
+START_296 = start_pattern(ARGUMENT_296)
+CHILDREN_132 = CompiledChildren(('gamerule', 'disableElytraMovementCheck'), (ARGUMENT_296, ), True)
+ARGUMENT_297 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_297)
+PARSE_297 = Parser.parsers[ARGUMENT_297.parser]
+START_297 = start_pattern(ARGUMENT_297)
+CHILDREN_133 = CompiledChildren(('gamerule', 'doDaylightCycle'), (ARGUMENT_297, ), True)
+ARGUMENT_298 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_298)
+PARSE_298 = Parser.parsers[ARGUMENT_298.parser]
+START_298 = start_pattern(ARGUMENT_298)
+CHILDREN_134 = CompiledChildren(('gamerule', 'doEntityDrops'), (ARGUMENT_298, ), True)
+ARGUMENT_299 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_299)
+PARSE_299 = Parser.parsers[ARGUMENT_299.parser]
+START_299 = start_pattern(ARGUMENT_299)
+CHILDREN_135 = CompiledChildren(('gamerule', 'doFireTick'), (ARGUMENT_299, ), True)
+ARGUMENT_300 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_300)
+PARSE_300 = Parser.parsers[ARGUMENT_300.parser]
+START_300 = start_pattern(ARGUMENT_300)
+CHILDREN_136 = CompiledChildren(('gamerule', 'doLimitedCrafting'), (ARGUMENT_300, ), True)
+ARGUMENT_301 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_301)
+PARSE_301 = Parser.parsers[ARGUMENT_301.parser]
+START_301 = start_pattern(ARGUMENT_301)
+CHILDREN_137 = CompiledChildren(('gamerule', 'doMobLoot'), (ARGUMENT_301, ), True)
+ARGUMENT_302 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_302)
+PARSE_302 = Parser.parsers[ARGUMENT_302.parser]
+START_302 = start_pattern(ARGUMENT_302)
+CHILDREN_138 = CompiledChildren(('gamerule', 'doMobSpawning'), (ARGUMENT_302, ), True)
+ARGUMENT_303 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_303)
+PARSE_303 = Parser.parsers[ARGUMENT_303.parser]
+START_303 = start_pattern(ARGUMENT_303)
+CHILDREN_139 = CompiledChildren(('gamerule', 'doTileDrops'), (ARGUMENT_303, ), True)
+ARGUMENT_304 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_304)
+PARSE_304 = Parser.parsers[ARGUMENT_304.parser]
+START_304 = start_pattern(ARGUMENT_304)
+CHILDREN_140 = CompiledChildren(('gamerule', 'doWeatherCycle'), (ARGUMENT_304, ), True)
+ARGUMENT_305 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_305)
+PARSE_305 = Parser.parsers[ARGUMENT_305.parser]
+START_305 = start_pattern(ARGUMENT_305)
+CHILDREN_141 = CompiledChildren(('gamerule', 'keepInventory'), (ARGUMENT_305, ), True)
+ARGUMENT_306 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_306)
+PARSE_306 = Parser.parsers[ARGUMENT_306.parser]
+START_306 = start_pattern(ARGUMENT_306)
+CHILDREN_142 = CompiledChildren(('gamerule', 'logAdminCommands'), (ARGUMENT_306, ), True)
+ARGUMENT_307 = CompiledArgument('value', 'brigadier:integer', ArgumentContext.of({}), enter_307)
+PARSE_307 = Parser.parsers[ARGUMENT_307.parser]
+START_307 = start_pattern(ARGUMENT_307)
+CHILDREN_143 = CompiledChildren(('gamerule', 'maxCommandChainLength'), (ARGUMENT_307, ), True)
+ARGUMENT_308 = CompiledArgument('value', 'brigadier:integer', ArgumentContext.of({}), enter_308)
+PARSE_308 = Parser.parsers[ARGUMENT_308.parser]
+START_308 = start_pattern(ARGUMENT_308)
+CHILDREN_144 = CompiledChildren(('gamerule', 'maxEntityCramming'), (ARGUMENT_308, ), True)
+ARGUMENT_309 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_309)
+PARSE_309 = Parser.parsers[ARGUMENT_309.parser]
+START_309 = start_pattern(ARGUMENT_309)
+CHILDREN_145 = CompiledChildren(('gamerule', 'mobGriefing'), (ARGUMENT_309, ), True)
+ARGUMENT_310 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_310)
+PARSE_310 = Parser.parsers[ARGUMENT_310.parser]
+START_310 = start_pattern(ARGUMENT_310)
+CHILDREN_146 = CompiledChildren(('gamerule', 'naturalRegeneration'), (ARGUMENT_310, ), True)
+ARGUMENT_311 = CompiledArgument('value', 'brigadier:integer', ArgumentContext.of({}), enter_311)
+PARSE_311 = Parser.parsers[ARGUMENT_311.parser]
+START_311 = start_pattern(ARGUMENT_311)
+CHILDREN_147 = CompiledChildren(('gamerule', 'randomTickSpeed'), (ARGUMENT_311, ), True)
+ARGUMENT_312 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_312)
+PARSE_312 = Parser.parsers[ARGUMENT_312.parser]
+START_312 = start_pattern(ARGUMENT_312)
+CHILDREN_148 = CompiledChildren(('gamerule', 'reducedDebugInfo'), (ARGUMENT_312, ), True)
+ARGUMENT_313 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_313)
+PARSE_313 = Parser.parsers[ARGUMENT_313.parser]
+START_313 = start_pattern(ARGUMENT_313)
+CHILDREN_149 = CompiledChildren(('gamerule', 'sendCommandFeedback'), (ARGUMENT_313, ), True)
+ARGUMENT_314 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_314)
+PARSE_314 = Parser.parsers[ARGUMENT_314.parser]
+START_314 = start_pattern(ARGUMENT_314)
+CHILDREN_150 = CompiledChildren(('gamerule', 'showDeathMessages'), (ARGUMENT_314, ), True)
+ARGUMENT_315 = CompiledArgument('value', 'brigadier:integer', ArgumentContext.of({}), enter_315)
+PARSE_315 = Parser.parsers[ARGUMENT_315.parser]
+START_315 = start_pattern(ARGUMENT_315)
+CHILDREN_151 = CompiledChildren(('gamerule', 'spawnRadius'), (ARGUMENT_315, ), True)
+ARGUMENT_316 = CompiledArgument('value', 'brigadier:bool', ArgumentContext.of({}), enter_316)
+PARSE_316 = Parser.parsers[ARGUMENT_316.parser]
+START_316 = start_pattern(ARGUMENT_316)
+CHILDREN_152 = CompiledChildren(('gamerule', 'spectatorsGenerateChunks'), (ARGUMENT_316, ), True)
+ARGUMENT_317 = CompiledArgument('item', 'minecraft:item_stack', ArgumentContext.of({}), enter_317)
+PARSE_317 = Parser.parsers[ARGUMENT_317.parser]
+START_317 = start_pattern(ARGUMENT_317)
+CHILDREN_153 = CompiledChildren(('give', 'targets'), (ARGUMENT_317, ), True)
+ARGUMENT_318 = CompiledArgument('reason', 'minecraft:message', ArgumentContext.of({}), enter_318)
+PARSE_318 = Parser.parsers[ARGUMENT_318.parser]
+START_318 = start_pattern(ARGUMENT_318)
+CHILDREN_155 = CompiledChildren(('kick', 'targets'), (ARGUMENT_318, ), True)
+ARGUMENT_319 = CompiledArgument('players', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_319)
+PARSE_319 = Parser.parsers[ARGUMENT_319.parser]
+START_319 = start_pattern(ARGUMENT_319)
+CHILDREN_173 = CompiledChildren(('loot', 'give'), (ARGUMENT_319, ), None)
+ARGUMENT_320 = CompiledArgument('targetPos', 'minecraft:block_pos', ArgumentContext.of({}), enter_320)
+PARSE_320 = Parser.parsers[ARGUMENT_320.parser]
+START_320 = start_pattern(ARGUMENT_320)
+CHILDREN_174 = CompiledChildren(('loot', 'insert'), (ARGUMENT_320, ), None)
+CHILDREN_175 = CompiledChildren(('loot', 'replace'), (), None)
+ARGUMENT_323 = CompiledArgument('targetPos', 'minecraft:vec3', ArgumentContext.of({}), enter_323)
+PARSE_323 = Parser.parsers[ARGUMENT_323.parser]
+START_323 = start_pattern(ARGUMENT_323)
+CHILDREN_176 = CompiledChildren(('loot', 'spawn'), (ARGUMENT_323, ), None)
+ARGUMENT_324 = CompiledArgument('message', 'minecraft:message', ArgumentContext.of({}), enter_324)
+PARSE_324 = Parser.parsers[ARGUMENT_324.parser]
+START_324 = start_pattern(ARGUMENT_324)
+CHILDREN_178 = CompiledChildren(('msg', 'targets'), (ARGUMENT_324, ), True)
+ARGUMENT_325 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_325)
+PARSE_325 = Parser.parsers[ARGUMENT_325.parser]
+START_325 = start_pattern(ARGUMENT_325)
+CHILDREN_182 = CompiledChildren(('particle', 'name'), (ARGUMENT_325, ), True)
+LITERALS_183 = {
+	'ambient': enter_326,
+	'block': enter_327,
+	'hostile': enter_328,
+	'master': enter_329,
+	'music': enter_330,
+	'neutral': enter_331,
+	'player': enter_332,
+	'record': enter_333,
+	'voice': enter_334,
+	'weather': enter_335,
+}
+CHILDREN_183 = CompiledChildren(('playsound', 'sound'), (), None)
+ARGUMENT_336 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_336)
+PARSE_336 = Parser.parsers[ARGUMENT_336.parser]
+START_336 = start_pattern(ARGUMENT_336)
+CHILDREN_185 = CompiledChildren(('recipe', 'give'), (ARGUMENT_336, ), None)
+ARGUMENT_337 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_337)
+PARSE_337 = Parser.parsers[ARGUMENT_337.parser]
+START_337 = start_pattern(ARGUMENT_337)
+CHILDREN_186 = CompiledChildren(('recipe', 'take'), (ARGUMENT_337, ), None)
+ARGUMENT_338 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_338)
+PARSE_338 = Parser.parsers[ARGUMENT_338.parser]
+START_338 = start_pattern(ARGUMENT_338)
+CHILDREN_187 = CompiledChildren(('replaceitem', 'block'), (ARGUMENT_338, ), None)
+ARGUMENT_339 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_339)
+PARSE_339 = Parser.parsers[ARGUMENT_339.parser]
+START_339 = start_pattern(ARGUMENT_339)
+CHILDREN_188 = CompiledChildren(('replaceitem', 'entity'), (ARGUMENT_339, ), None)
+ARGUMENT_340 = CompiledArgument('function', 'minecraft:function', ArgumentContext.of({}), enter_340)
+PARSE_340 = Parser.parsers[ARGUMENT_340.parser]
+START_340 = start_pattern(ARGUMENT_340)
+CHILDREN_191 = CompiledChildren(('schedule', 'function'), (ARGUMENT_340, ), None)
+LITERALS_192 = {
+	'add': enter_341,
+	'list': enter_342,
+	'modify': enter_343,
+	'remove': enter_344,
+	'setdisplay': enter_345,
+}
+CHILDREN_192 = CompiledChildren(('scoreboard', 'objectives'), (), None)
+LITERALS_193 = {
+	'add': enter_346,
+	'enable': enter_347,
+	'get': enter_348,
+	'list': enter_349,
+	'operation': enter_350,
+	'remove': enter_351,
+	'reset': enter_352,
+	'set': enter_353,
+}
+CHILDREN_193 = CompiledChildren(('scoreboard', 'players'), (), None)
+ARGUMENT_354 = CompiledArgument('block', 'minecraft:block_state', ArgumentContext.of({}), enter_354)
+PARSE_354 = Parser.parsers[ARGUMENT_354.parser]
+START_354 = start_pattern(ARGUMENT_354)
+CHILDREN_194 = CompiledChildren(('setblock', 'pos'), (ARGUMENT_354, ), True)
+ARGUMENT_355 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_355)
+PARSE_355 = Parser.parsers[ARGUMENT_355.parser]
+START_355 = start_pattern(ARGUMENT_355)
+CHILDREN_197 = CompiledChildren(('spawnpoint', 'targets'), (ARGUMENT_355, ), True)
+ARGUMENT_356 = CompiledArgument('spreadDistance', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_356)
+PARSE_356 = Parser.parsers[ARGUMENT_356.parser]
+START_356 = start_pattern(ARGUMENT_356)
+CHILDREN_198 = CompiledChildren(('spreadplayers', 'center'), (ARGUMENT_356, ), None)
+LITERALS_199 = {
+	'*': enter_357,
+	'ambient': enter_358,
+	'block': enter_359,
+	'hostile': enter_360,
+	'master': enter_361,
+	'music': enter_362,
+	'neutral': enter_363,
+	'player': enter_364,
+	'record': enter_365,
+	'voice': enter_366,
+	'weather': enter_367,
+}
+CHILDREN_199 = CompiledChildren(('stopsound', 'targets'), (), True)
+ARGUMENT_368 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_368)
+PARSE_368 = Parser.parsers[ARGUMENT_368.parser]
+START_368 = start_pattern(ARGUMENT_368)
+CHILDREN_200 = CompiledChildren(('summon', 'entity'), (ARGUMENT_368, ), True)
+CHILDREN_201 = CompiledChildren(('tag', 'targets'), (), None)
+ARGUMENT_372 = CompiledArgument('team', 'brigadier:string', ArgumentContext.of({'type': 'word'}), enter_372)
+PARSE_372 = Parser.parsers[ARGUMENT_372.parser]
+START_372 = start_pattern(ARGUMENT_372)
+CHILDREN_202 = CompiledChildren(('team', 'add'), (ARGUMENT_372, ), True)
+ARGUMENT_373 = CompiledArgument('team', 'minecraft:team', ArgumentContext.of({}), enter_373)
+PARSE_373 = Parser.parsers[ARGUMENT_373.parser]
+START_373 = start_pattern(ARGUMENT_373)
+CHILDREN_203 = CompiledChildren(('team', 'empty'), (ARGUMENT_373, ), True)
+ARGUMENT_374 = CompiledArgument('team', 'minecraft:team', ArgumentContext.of({}), enter_374)
+PARSE_374 = Parser.parsers[ARGUMENT_374.parser]
+START_374 = start_pattern(ARGUMENT_374)
+CHILDREN_204 = CompiledChildren(('team', 'join'), (ARGUMENT_374, ), True)
+ARGUMENT_375 = CompiledArgument('members', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_375)
+PARSE_375 = Parser.parsers[ARGUMENT_375.parser]
+START_375 = start_pattern(ARGUMENT_375)
+CHILDREN_205 = CompiledChildren(('team', 'leave'), (ARGUMENT_375, ), True)
+ARGUMENT_376 = CompiledArgument('team', 'minecraft:team', ArgumentContext.of({}), enter_376)
+PARSE_376 = Parser.parsers[ARGUMENT_376.parser]
+START_376 = start_pattern(ARGUMENT_376)
+CHILDREN_206 = CompiledChildren(('team', 'list'), (ARGUMENT_376, ), True)
+ARGUMENT_377 = CompiledArgument('team', 'minecraft:team', ArgumentContext.of({}), enter_377)
+PARSE_377 = Parser.parsers[ARGUMENT_377.parser]
+START_377 = start_pattern(ARGUMENT_377)
+CHILDREN_207 = CompiledChildren(('team', 'modify'), (ARGUMENT_377, ), None)
+ARGUMENT_378 = CompiledArgument('team', 'minecraft:team', ArgumentContext.of({}), enter_378)
+PARSE_378 = Parser.parsers[ARGUMENT_378.parser]
+START_378 = start_pattern(ARGUMENT_378)
+CHILDREN_208 = CompiledChildren(('team', 'remove'), (ARGUMENT_378, ), True)
+ARGUMENT_379 = CompiledArgument('destination', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_379)
+PARSE_379 = Parser.parsers[ARGUMENT_379.parser]
+START_379 = start_pattern(ARGUMENT_379)
+ARGUMENT_380 = CompiledArgument('location', 'minecraft:vec3', ArgumentContext.of({}), enter_380)
+PARSE_380 = Parser.parsers[ARGUMENT_380.parser]
+START_380 = start_pattern(ARGUMENT_380)
+CHILDREN_212 = CompiledChildren(('teleport', 'targets'), (ARGUMENT_379, ARGUMENT_380, ), True)
+ARGUMENT_381 = CompiledArgument('message', 'minecraft:component', ArgumentContext.of({}), enter_381)
+PARSE_381 = Parser.parsers[ARGUMENT_381.parser]
+START_381 = start_pattern(ARGUMENT_381)
+CHILDREN_213 = CompiledChildren(('tellraw', 'targets'), (ARGUMENT_381, ), True)
+ARGUMENT_382 = CompiledArgument('time', 'minecraft:time', ArgumentContext.of({}), enter_382)
+PARSE_382 = Parser.parsers[ARGUMENT_382.parser]
+START_382 = start_pattern(ARGUMENT_382)
+CHILDREN_214 = CompiledChildren(('time', 'add'), (ARGUMENT_382, ), True)
+CHILDREN_215 = CompiledChildren(('time', 'query'), (), True)
+ARGUMENT_390 = CompiledArgument('time', 'minecraft:time', ArgumentContext.of({}), enter_390)
+PARSE_390 = Parser.parsers[ARGUMENT_390.parser]
+START_390 = start_pattern(ARGUMENT_390)
+CHILDREN_216 = CompiledChildren(('time', 'set'), (ARGUMENT_390, ), True)
+LITERALS_217 = {
+	'actionbar': enter_391,
+	'clear': enter_392,
+	'reset': enter_393,
+	'subtitle': enter_394,
+	'times': enter_395,
+	'title': enter_396,
+}
+CHILDREN_217 = CompiledChildren(('title', 'targets'), (), None)
+CHILDREN_218 = CompiledChildren(('trigger', 'objective'), (), None)
+ARGUMENT_399 = CompiledArgument('duration', 'brigadier:integer', ArgumentContext.of({'min': 0, 'max': 1000000}), enter_399)
+PARSE_399 = Parser.parsers[ARGUMENT_399.parser]
+START_399 = start_pattern(ARGUMENT_399)
+CHILDREN_219 = CompiledChildren(('weather', 'clear'), (ARGUMENT_399, ), True)
+ARGUMENT_400 = CompiledArgument('duration', 'brigadier:integer', ArgumentContext.of({'min': 0, 'max': 1000000}), enter_400)
+PARSE_400 = Parser.parsers[ARGUMENT_400.parser]
+START_400 = start_pattern(ARGUMENT_400)
+CHILDREN_220 = CompiledChildren(('weather', 'rain'), (ARGUMENT_400, ), True)
+ARGUMENT_401 = CompiledArgument('duration', 'brigadier:integer', ArgumentContext.of({'min': 0, 'max': 1000000}), enter_401)
+PARSE_401 = Parser.parsers[ARGUMENT_401.parser]
+START_401 = start_pattern(ARGUMENT_401)
+CHILDREN_221 = CompiledChildren(('weather', 'thunder'), (ARGUMENT_401, ), True)
+ARGUMENT_402 = CompiledArgument('targets', 'minecraft:game_profile', ArgumentContext.of({}), enter_402)
+PARSE_402 = Parser.parsers[ARGUMENT_402.parser]
+START_402 = start_pattern(ARGUMENT_402)
+CHILDREN_222 = CompiledChildren(('whitelist', 'add'), (ARGUMENT_402, ), True)
+ARGUMENT_403 = CompiledArgument('targets', 'minecraft:game_profile', ArgumentContext.of({}), enter_403)
+PARSE_403 = Parser.parsers[ARGUMENT_403.parser]
+START_403 = start_pattern(ARGUMENT_403)
+CHILDREN_227 = CompiledChildren(('whitelist', 'remove'), (ARGUMENT_403, ), True)
+ARGUMENT_404 = CompiledArgument('distance', 'brigadier:float', ArgumentContext.of({'min': -60000000.0, 'max': 60000000.0}), enter_404)
+PARSE_404 = Parser.parsers[ARGUMENT_404.parser]
+START_404 = start_pattern(ARGUMENT_404)
+CHILDREN_228 = CompiledChildren(('worldborder', 'add'), (ARGUMENT_404, ), True)
+ARGUMENT_405 = CompiledArgument('pos', 'minecraft:vec2', ArgumentContext.of({}), enter_405)
+PARSE_405 = Parser.parsers[ARGUMENT_405.parser]
+START_405 = start_pattern(ARGUMENT_405)
+CHILDREN_229 = CompiledChildren(('worldborder', 'center'), (ARGUMENT_405, ), True)
+CHILDREN_230 = CompiledChildren(('worldborder', 'damage'), (), None)
+ARGUMENT_408 = CompiledArgument('distance', 'brigadier:float', ArgumentContext.of({'min': -60000000.0, 'max': 60000000.0}), enter_408)
+PARSE_408 = Parser.parsers[ARGUMENT_408.parser]
+START_408 = start_pattern(ARGUMENT_408)
+CHILDREN_232 = CompiledChildren(('worldborder', 'set'), (ARGUMENT_408, ), True)
+CHILDREN_233 = CompiledChildren(('worldborder', 'warning'), (), None)
+LITERALS_234 = {
+	'everything': enter_411,
+	'from': enter_412,
+	'only': enter_413,
+	'through': enter_414,
+	'until': enter_415,
+}
+CHILDREN_234 = CompiledChildren(('advancement', 'grant', 'targets'), (), None)
+LITERALS_235 = {
+	'everything': enter_416,
+	'from': enter_417,
+	'only': enter_418,
+	'through': enter_419,
+	'until': enter_420,
+}
+CHILDREN_235 = CompiledChildren(('advancement', 'revoke', 'targets'), (), None)
+ARGUMENT_421 = CompiledArgument('name', 'minecraft:component', ArgumentContext.of({}), enter_421)
+PARSE_421 = Parser.parsers[ARGUMENT_421.parser]
+START_421 = start_pattern(ARGUMENT_421)
+CHILDREN_238 = CompiledChildren(('bossbar', 'add', 'id'), (ARGUMENT_421, ), True)
+CHILDREN_239 = CompiledChildren(('bossbar', 'get', 'id'), (), True)
+LITERALS_241 = {
+	'color': enter_426,
+	'max': enter_427,
+	'name': enter_428,
+	'players': enter_429,
+	'style': enter_430,
+	'value': enter_431,
+	'visible': enter_432,
+}
+CHILDREN_241 = CompiledChildren(('bossbar', 'set', 'id'), (), None)
+ARGUMENT_433 = CompiledArgument('maxCount', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_433)
+PARSE_433 = Parser.parsers[ARGUMENT_433.parser]
+START_433 = start_pattern(ARGUMENT_433)
+CHILDREN_242 = CompiledChildren(('clear', 'targets', 'item'), (ARGUMENT_433, ), True)
+ARGUMENT_434 = CompiledArgument('destination', 'minecraft:block_pos', ArgumentContext.of({}), enter_434)
+PARSE_434 = Parser.parsers[ARGUMENT_434.parser]
+START_434 = start_pattern(ARGUMENT_434)
+CHILDREN_243 = CompiledChildren(('clone', 'begin', 'end'), (ARGUMENT_434, ), True)
+ARGUMENT_435 = CompiledArgument('targetPos', 'minecraft:block_pos', ArgumentContext.of({}), enter_435)
+PARSE_435 = Parser.parsers[ARGUMENT_435.parser]
+START_435 = start_pattern(ARGUMENT_435)
+CHILDREN_244 = CompiledChildren(('data', 'get', 'block'), (ARGUMENT_435, ), True)
+ARGUMENT_436 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_436)
+PARSE_436 = Parser.parsers[ARGUMENT_436.parser]
+START_436 = start_pattern(ARGUMENT_436)
+CHILDREN_245 = CompiledChildren(('data', 'get', 'entity'), (ARGUMENT_436, ), True)
+ARGUMENT_437 = CompiledArgument('targetPos', 'minecraft:block_pos', ArgumentContext.of({}), enter_437)
+PARSE_437 = Parser.parsers[ARGUMENT_437.parser]
+START_437 = start_pattern(ARGUMENT_437)
+CHILDREN_246 = CompiledChildren(('data', 'merge', 'block'), (ARGUMENT_437, ), None)
+ARGUMENT_438 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_438)
+PARSE_438 = Parser.parsers[ARGUMENT_438.parser]
+START_438 = start_pattern(ARGUMENT_438)
+CHILDREN_247 = CompiledChildren(('data', 'merge', 'entity'), (ARGUMENT_438, ), None)
+ARGUMENT_439 = CompiledArgument('targetPos', 'minecraft:block_pos', ArgumentContext.of({}), enter_439)
+PARSE_439 = Parser.parsers[ARGUMENT_439.parser]
+START_439 = start_pattern(ARGUMENT_439)
+CHILDREN_248 = CompiledChildren(('data', 'modify', 'block'), (ARGUMENT_439, ), None)
+ARGUMENT_440 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_440)
+PARSE_440 = Parser.parsers[ARGUMENT_440.parser]
+START_440 = start_pattern(ARGUMENT_440)
+CHILDREN_249 = CompiledChildren(('data', 'modify', 'entity'), (ARGUMENT_440, ), None)
+ARGUMENT_441 = CompiledArgument('targetPos', 'minecraft:block_pos', ArgumentContext.of({}), enter_441)
+PARSE_441 = Parser.parsers[ARGUMENT_441.parser]
+START_441 = start_pattern(ARGUMENT_441)
+CHILDREN_250 = CompiledChildren(('data', 'remove', 'block'), (ARGUMENT_441, ), None)
+ARGUMENT_442 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_442)
+PARSE_442 = Parser.parsers[ARGUMENT_442.parser]
+START_442 = start_pattern(ARGUMENT_442)
+CHILDREN_251 = CompiledChildren(('data', 'remove', 'entity'), (ARGUMENT_442, ), None)
+CHILDREN_253 = CompiledChildren(('datapack', 'enable', 'name'), (), True)
+ARGUMENT_447 = CompiledArgument('effect', 'minecraft:mob_effect', ArgumentContext.of({}), enter_447)
+PARSE_447 = Parser.parsers[ARGUMENT_447.parser]
+START_447 = start_pattern(ARGUMENT_447)
+CHILDREN_256 = CompiledChildren(('effect', 'clear', 'targets'), (ARGUMENT_447, ), True)
+ARGUMENT_448 = CompiledArgument('effect', 'minecraft:mob_effect', ArgumentContext.of({}), enter_448)
+PARSE_448 = Parser.parsers[ARGUMENT_448.parser]
+START_448 = start_pattern(ARGUMENT_448)
+CHILDREN_257 = CompiledChildren(('effect', 'give', 'targets'), (ARGUMENT_448, ), True)
+ARGUMENT_449 = CompiledArgument('level', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_449)
+PARSE_449 = Parser.parsers[ARGUMENT_449.parser]
+START_449 = start_pattern(ARGUMENT_449)
+CHILDREN_258 = CompiledChildren(('enchant', 'targets', 'enchantment'), (ARGUMENT_449, ), True)
+ARGUMENT_450 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_450)
+PARSE_450 = Parser.parsers[ARGUMENT_450.parser]
+START_450 = start_pattern(ARGUMENT_450)
+CHILDREN_263 = CompiledChildren(('execute', 'facing', 'entity'), (ARGUMENT_450, ), None)
+ARGUMENT_451 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_451)
+PARSE_451 = Parser.parsers[ARGUMENT_451.parser]
+START_451 = start_pattern(ARGUMENT_451)
+CHILDREN_265 = CompiledChildren(('execute', 'if', 'block'), (ARGUMENT_451, ), None)
+ARGUMENT_452 = CompiledArgument('start', 'minecraft:block_pos', ArgumentContext.of({}), enter_452)
+PARSE_452 = Parser.parsers[ARGUMENT_452.parser]
+START_452 = start_pattern(ARGUMENT_452)
+CHILDREN_266 = CompiledChildren(('execute', 'if', 'blocks'), (ARGUMENT_452, ), None)
+CHILDREN_267 = CompiledChildren(('execute', 'if', 'data'), (), None)
+ARGUMENT_455 = CompiledArgument('entities', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_455)
+PARSE_455 = Parser.parsers[ARGUMENT_455.parser]
+START_455 = start_pattern(ARGUMENT_455)
+CHILDREN_268 = CompiledChildren(('execute', 'if', 'entity'), (ARGUMENT_455, ), True)
+ARGUMENT_456 = CompiledArgument('target', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_456)
+PARSE_456 = Parser.parsers[ARGUMENT_456.parser]
+START_456 = start_pattern(ARGUMENT_456)
+CHILDREN_269 = CompiledChildren(('execute', 'if', 'score'), (ARGUMENT_456, ), None)
+ARGUMENT_457 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_457)
+PARSE_457 = Parser.parsers[ARGUMENT_457.parser]
+START_457 = start_pattern(ARGUMENT_457)
+CHILDREN_271 = CompiledChildren(('execute', 'positioned', 'as'), (ARGUMENT_457, ), None)
+ARGUMENT_458 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_458)
+PARSE_458 = Parser.parsers[ARGUMENT_458.parser]
+START_458 = start_pattern(ARGUMENT_458)
+CHILDREN_273 = CompiledChildren(('execute', 'rotated', 'as'), (ARGUMENT_458, ), None)
+CHILDREN_275 = CompiledChildren(('execute', 'store', 'result'), (), None)
+CHILDREN_276 = CompiledChildren(('execute', 'store', 'success'), (), None)
+ARGUMENT_467 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_467)
+PARSE_467 = Parser.parsers[ARGUMENT_467.parser]
+START_467 = start_pattern(ARGUMENT_467)
+CHILDREN_277 = CompiledChildren(('execute', 'unless', 'block'), (ARGUMENT_467, ), None)
+ARGUMENT_468 = CompiledArgument('start', 'minecraft:block_pos', ArgumentContext.of({}), enter_468)
+PARSE_468 = Parser.parsers[ARGUMENT_468.parser]
+START_468 = start_pattern(ARGUMENT_468)
+CHILDREN_278 = CompiledChildren(('execute', 'unless', 'blocks'), (ARGUMENT_468, ), None)
+CHILDREN_279 = CompiledChildren(('execute', 'unless', 'data'), (), None)
+ARGUMENT_471 = CompiledArgument('entities', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_471)
+PARSE_471 = Parser.parsers[ARGUMENT_471.parser]
+START_471 = start_pattern(ARGUMENT_471)
+CHILDREN_280 = CompiledChildren(('execute', 'unless', 'entity'), (ARGUMENT_471, ), True)
+ARGUMENT_472 = CompiledArgument('target', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_472)
+PARSE_472 = Parser.parsers[ARGUMENT_472.parser]
+START_472 = start_pattern(ARGUMENT_472)
+CHILDREN_281 = CompiledChildren(('execute', 'unless', 'score'), (ARGUMENT_472, ), None)
+ARGUMENT_473 = CompiledArgument('amount', 'brigadier:integer', ArgumentContext.of({}), enter_473)
+PARSE_473 = Parser.parsers[ARGUMENT_473.parser]
+START_473 = start_pattern(ARGUMENT_473)
+CHILDREN_282 = CompiledChildren(('experience', 'add', 'targets'), (ARGUMENT_473, ), True)
+CHILDREN_283 = CompiledChildren(('experience', 'query', 'targets'), (), True)
+ARGUMENT_476 = CompiledArgument('amount', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_476)
+PARSE_476 = Parser.parsers[ARGUMENT_476.parser]
+START_476 = start_pattern(ARGUMENT_476)
+CHILDREN_284 = CompiledChildren(('experience', 'set', 'targets'), (ARGUMENT_476, ), True)
+ARGUMENT_477 = CompiledArgument('block', 'minecraft:block_state', ArgumentContext.of({}), enter_477)
+PARSE_477 = Parser.parsers[ARGUMENT_477.parser]
+START_477 = start_pattern(ARGUMENT_477)
+CHILDREN_285 = CompiledChildren(('fill', 'from', 'to'), (ARGUMENT_477, ), True)
+ARGUMENT_478 = CompiledArgument('to', 'minecraft:column_pos', ArgumentContext.of({}), enter_478)
+PARSE_478 = Parser.parsers[ARGUMENT_478.parser]
+START_478 = start_pattern(ARGUMENT_478)
+CHILDREN_286 = CompiledChildren(('forceload', 'add', 'from'), (ARGUMENT_478, ), True)
+ARGUMENT_479 = CompiledArgument('to', 'minecraft:column_pos', ArgumentContext.of({}), enter_479)
+PARSE_479 = Parser.parsers[ARGUMENT_479.parser]
+START_479 = start_pattern(ARGUMENT_479)
+CHILDREN_289 = CompiledChildren(('forceload', 'remove', 'from'), (ARGUMENT_479, ), True)
+ARGUMENT_480 = CompiledArgument('count', 'brigadier:integer', ArgumentContext.of({'min': 1}), enter_480)
+PARSE_480 = Parser.parsers[ARGUMENT_480.parser]
+START_480 = start_pattern(ARGUMENT_480)
+CHILDREN_317 = CompiledChildren(('give', 'targets', 'item'), (ARGUMENT_480, ), True)
+CHILDREN_319 = CompiledChildren(('loot', 'give', 'players'), (), None)
+CHILDREN_320 = CompiledChildren(('loot', 'insert', 'targetPos'), (), None)
+ARGUMENT_489 = CompiledArgument('targetPos', 'minecraft:block_pos', ArgumentContext.of({}), enter_489)
+PARSE_489 = Parser.parsers[ARGUMENT_489.parser]
+START_489 = start_pattern(ARGUMENT_489)
+CHILDREN_321 = CompiledChildren(('loot', 'replace', 'block'), (ARGUMENT_489, ), None)
+ARGUMENT_490 = CompiledArgument('entities', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_490)
+PARSE_490 = Parser.parsers[ARGUMENT_490.parser]
+START_490 = start_pattern(ARGUMENT_490)
+CHILDREN_322 = CompiledChildren(('loot', 'replace', 'entity'), (ARGUMENT_490, ), None)
+CHILDREN_323 = CompiledChildren(('loot', 'spawn', 'targetPos'), (), None)
+ARGUMENT_495 = CompiledArgument('delta', 'minecraft:vec3', ArgumentContext.of({}), enter_495)
+PARSE_495 = Parser.parsers[ARGUMENT_495.parser]
+START_495 = start_pattern(ARGUMENT_495)
+CHILDREN_325 = CompiledChildren(('particle', 'name', 'pos'), (ARGUMENT_495, ), None)
+ARGUMENT_496 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_496)
+PARSE_496 = Parser.parsers[ARGUMENT_496.parser]
+START_496 = start_pattern(ARGUMENT_496)
+CHILDREN_326 = CompiledChildren(('playsound', 'sound', 'ambient'), (ARGUMENT_496, ), True)
+ARGUMENT_497 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_497)
+PARSE_497 = Parser.parsers[ARGUMENT_497.parser]
+START_497 = start_pattern(ARGUMENT_497)
+CHILDREN_327 = CompiledChildren(('playsound', 'sound', 'block'), (ARGUMENT_497, ), True)
+ARGUMENT_498 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_498)
+PARSE_498 = Parser.parsers[ARGUMENT_498.parser]
+START_498 = start_pattern(ARGUMENT_498)
+CHILDREN_328 = CompiledChildren(('playsound', 'sound', 'hostile'), (ARGUMENT_498, ), True)
+ARGUMENT_499 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_499)
+PARSE_499 = Parser.parsers[ARGUMENT_499.parser]
+START_499 = start_pattern(ARGUMENT_499)
+CHILDREN_329 = CompiledChildren(('playsound', 'sound', 'master'), (ARGUMENT_499, ), True)
+ARGUMENT_500 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_500)
+PARSE_500 = Parser.parsers[ARGUMENT_500.parser]
+START_500 = start_pattern(ARGUMENT_500)
+CHILDREN_330 = CompiledChildren(('playsound', 'sound', 'music'), (ARGUMENT_500, ), True)
+ARGUMENT_501 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_501)
+PARSE_501 = Parser.parsers[ARGUMENT_501.parser]
+START_501 = start_pattern(ARGUMENT_501)
+CHILDREN_331 = CompiledChildren(('playsound', 'sound', 'neutral'), (ARGUMENT_501, ), True)
+ARGUMENT_502 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_502)
+PARSE_502 = Parser.parsers[ARGUMENT_502.parser]
+START_502 = start_pattern(ARGUMENT_502)
+CHILDREN_332 = CompiledChildren(('playsound', 'sound', 'player'), (ARGUMENT_502, ), True)
+ARGUMENT_503 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_503)
+PARSE_503 = Parser.parsers[ARGUMENT_503.parser]
+START_503 = start_pattern(ARGUMENT_503)
+CHILDREN_333 = CompiledChildren(('playsound', 'sound', 'record'), (ARGUMENT_503, ), True)
+ARGUMENT_504 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_504)
+PARSE_504 = Parser.parsers[ARGUMENT_504.parser]
+START_504 = start_pattern(ARGUMENT_504)
+CHILDREN_334 = CompiledChildren(('playsound', 'sound', 'voice'), (ARGUMENT_504, ), True)
+ARGUMENT_505 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_505)
+PARSE_505 = Parser.parsers[ARGUMENT_505.parser]
+START_505 = start_pattern(ARGUMENT_505)
+CHILDREN_335 = CompiledChildren(('playsound', 'sound', 'weather'), (ARGUMENT_505, ), True)
+ARGUMENT_507 = CompiledArgument('recipe', 'minecraft:resource_location', ArgumentContext.of({}), enter_507)
+PARSE_507 = Parser.parsers[ARGUMENT_507.parser]
+START_507 = start_pattern(ARGUMENT_507)
+CHILDREN_336 = CompiledChildren(('recipe', 'give', 'targets'), (ARGUMENT_507, ), True)
+ARGUMENT_509 = CompiledArgument('recipe', 'minecraft:resource_location', ArgumentContext.of({}), enter_509)
+PARSE_509 = Parser.parsers[ARGUMENT_509.parser]
+START_509 = start_pattern(ARGUMENT_509)
+CHILDREN_337 = CompiledChildren(('recipe', 'take', 'targets'), (ARGUMENT_509, ), True)
+ARGUMENT_510 = CompiledArgument('slot', 'minecraft:item_slot', ArgumentContext.of({}), enter_510)
+PARSE_510 = Parser.parsers[ARGUMENT_510.parser]
+START_510 = start_pattern(ARGUMENT_510)
+CHILDREN_338 = CompiledChildren(('replaceitem', 'block', 'pos'), (ARGUMENT_510, ), None)
+ARGUMENT_511 = CompiledArgument('slot', 'minecraft:item_slot', ArgumentContext.of({}), enter_511)
+PARSE_511 = Parser.parsers[ARGUMENT_511.parser]
+START_511 = start_pattern(ARGUMENT_511)
+CHILDREN_339 = CompiledChildren(('replaceitem', 'entity', 'targets'), (ARGUMENT_511, ), None)
+ARGUMENT_512 = CompiledArgument('time', 'minecraft:time', ArgumentContext.of({}), enter_512)
+PARSE_512 = Parser.parsers[ARGUMENT_512.parser]
+START_512 = start_pattern(ARGUMENT_512)
+CHILDREN_340 = CompiledChildren(('schedule', 'function', 'function'), (ARGUMENT_512, ), True)
+ARGUMENT_513 = CompiledArgument('objective', 'brigadier:string', ArgumentContext.of({'type': 'word'}), enter_513)
+PARSE_513 = Parser.parsers[ARGUMENT_513.parser]
+START_513 = start_pattern(ARGUMENT_513)
+CHILDREN_341 = CompiledChildren(('scoreboard', 'objectives', 'add'), (ARGUMENT_513, ), None)
+ARGUMENT_514 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_514)
+PARSE_514 = Parser.parsers[ARGUMENT_514.parser]
+START_514 = start_pattern(ARGUMENT_514)
+CHILDREN_343 = CompiledChildren(('scoreboard', 'objectives', 'modify'), (ARGUMENT_514, ), None)
+ARGUMENT_515 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_515)
+PARSE_515 = Parser.parsers[ARGUMENT_515.parser]
+START_515 = start_pattern(ARGUMENT_515)
+CHILDREN_344 = CompiledChildren(('scoreboard', 'objectives', 'remove'), (ARGUMENT_515, ), True)
+ARGUMENT_516 = CompiledArgument('slot', 'minecraft:scoreboard_slot', ArgumentContext.of({}), enter_516)
+PARSE_516 = Parser.parsers[ARGUMENT_516.parser]
+START_516 = start_pattern(ARGUMENT_516)
+CHILDREN_345 = CompiledChildren(('scoreboard', 'objectives', 'setdisplay'), (ARGUMENT_516, ), True)
+ARGUMENT_517 = CompiledArgument('targets', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_517)
+PARSE_517 = Parser.parsers[ARGUMENT_517.parser]
+START_517 = start_pattern(ARGUMENT_517)
+CHILDREN_346 = CompiledChildren(('scoreboard', 'players', 'add'), (ARGUMENT_517, ), None)
+ARGUMENT_518 = CompiledArgument('targets', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_518)
+PARSE_518 = Parser.parsers[ARGUMENT_518.parser]
+START_518 = start_pattern(ARGUMENT_518)
+CHILDREN_347 = CompiledChildren(('scoreboard', 'players', 'enable'), (ARGUMENT_518, ), None)
+ARGUMENT_519 = CompiledArgument('target', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_519)
+PARSE_519 = Parser.parsers[ARGUMENT_519.parser]
+START_519 = start_pattern(ARGUMENT_519)
+CHILDREN_348 = CompiledChildren(('scoreboard', 'players', 'get'), (ARGUMENT_519, ), None)
+ARGUMENT_520 = CompiledArgument('target', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_520)
+PARSE_520 = Parser.parsers[ARGUMENT_520.parser]
+START_520 = start_pattern(ARGUMENT_520)
+CHILDREN_349 = CompiledChildren(('scoreboard', 'players', 'list'), (ARGUMENT_520, ), True)
+ARGUMENT_521 = CompiledArgument('targets', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_521)
+PARSE_521 = Parser.parsers[ARGUMENT_521.parser]
+START_521 = start_pattern(ARGUMENT_521)
+CHILDREN_350 = CompiledChildren(('scoreboard', 'players', 'operation'), (ARGUMENT_521, ), None)
+ARGUMENT_522 = CompiledArgument('targets', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_522)
+PARSE_522 = Parser.parsers[ARGUMENT_522.parser]
+START_522 = start_pattern(ARGUMENT_522)
+CHILDREN_351 = CompiledChildren(('scoreboard', 'players', 'remove'), (ARGUMENT_522, ), None)
+ARGUMENT_523 = CompiledArgument('targets', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_523)
+PARSE_523 = Parser.parsers[ARGUMENT_523.parser]
+START_523 = start_pattern(ARGUMENT_523)
+CHILDREN_352 = CompiledChildren(('scoreboard', 'players', 'reset'), (ARGUMENT_523, ), True)
+ARGUMENT_524 = CompiledArgument('targets', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_524)
+PARSE_524 = Parser.parsers[ARGUMENT_524.parser]
+START_524 = start_pattern(ARGUMENT_524)
+CHILDREN_353 = CompiledChildren(('scoreboard', 'players', 'set'), (ARGUMENT_524, ), None)
+CHILDREN_354 = CompiledChildren(('setblock', 'pos', 'block'), (), True)
+ARGUMENT_528 = CompiledArgument('maxRange', 'brigadier:float', ArgumentContext.of({'min': 1.0}), enter_528)
+PARSE_528 = Parser.parsers[ARGUMENT_528.parser]
+START_528 = start_pattern(ARGUMENT_528)
+CHILDREN_356 = CompiledChildren(('spreadplayers', 'center', 'spreadDistance'), (ARGUMENT_528, ), None)
+ARGUMENT_529 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_529)
+PARSE_529 = Parser.parsers[ARGUMENT_529.parser]
+START_529 = start_pattern(ARGUMENT_529)
+CHILDREN_357 = CompiledChildren(('stopsound', 'targets', '*'), (ARGUMENT_529, ), True)
+ARGUMENT_530 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_530)
+PARSE_530 = Parser.parsers[ARGUMENT_530.parser]
+START_530 = start_pattern(ARGUMENT_530)
+CHILDREN_358 = CompiledChildren(('stopsound', 'targets', 'ambient'), (ARGUMENT_530, ), True)
+ARGUMENT_531 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_531)
+PARSE_531 = Parser.parsers[ARGUMENT_531.parser]
+START_531 = start_pattern(ARGUMENT_531)
+CHILDREN_359 = CompiledChildren(('stopsound', 'targets', 'block'), (ARGUMENT_531, ), True)
+ARGUMENT_532 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_532)
+PARSE_532 = Parser.parsers[ARGUMENT_532.parser]
+START_532 = start_pattern(ARGUMENT_532)
+CHILDREN_360 = CompiledChildren(('stopsound', 'targets', 'hostile'), (ARGUMENT_532, ), True)
+ARGUMENT_533 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_533)
+PARSE_533 = Parser.parsers[ARGUMENT_533.parser]
+START_533 = start_pattern(ARGUMENT_533)
+CHILDREN_361 = CompiledChildren(('stopsound', 'targets', 'master'), (ARGUMENT_533, ), True)
+ARGUMENT_534 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_534)
+PARSE_534 = Parser.parsers[ARGUMENT_534.parser]
+START_534 = start_pattern(ARGUMENT_534)
+CHILDREN_362 = CompiledChildren(('stopsound', 'targets', 'music'), (ARGUMENT_534, ), True)
+ARGUMENT_535 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_535)
+PARSE_535 = Parser.parsers[ARGUMENT_535.parser]
+START_535 = start_pattern(ARGUMENT_535)
+CHILDREN_363 = CompiledChildren(('stopsound', 'targets', 'neutral'), (ARGUMENT_535, ), True)
+ARGUMENT_536 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_536)
+PARSE_536 = Parser.parsers[ARGUMENT_536.parser]
+START_536 = start_pattern(ARGUMENT_536)
+CHILDREN_364 = CompiledChildren(('stopsound', 'targets', 'player'), (ARGUMENT_536, ), True)
+ARGUMENT_537 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_537)
+PARSE_537 = Parser.parsers[ARGUMENT_537.parser]
+START_537 = start_pattern(ARGUMENT_537)
+CHILDREN_365 = CompiledChildren(('stopsound', 'targets', 'record'), (ARGUMENT_537, ), True)
+ARGUMENT_538 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_538)
+PARSE_538 = Parser.parsers[ARGUMENT_538.parser]
+START_538 = start_pattern(ARGUMENT_538)
+CHILDREN_366 = CompiledChildren(('stopsound', 'targets', 'voice'), (ARGUMENT_538, ), True)
+ARGUMENT_539 = CompiledArgument('sound', 'minecraft:resource_location', ArgumentContext.of({}), enter_539)
+PARSE_539 = Parser.parsers[ARGUMENT_539.parser]
+START_539 = start_pattern(ARGUMENT_539)
+CHILDREN_367 = CompiledChildren(('stopsound', 'targets', 'weather'), (ARGUMENT_539, ), True)
+ARGUMENT_540 = CompiledArgument('nbt', 'minecraft:nbt_compound_tag', ArgumentContext.of({}), enter_540)
+PARSE_540 = Parser.parsers[ARGUMENT_540.parser]
+START_540 = start_pattern(ARGUMENT_540)
+CHILDREN_368 = CompiledChildren(('summon', 'entity', 'pos'), (ARGUMENT_540, ), True)
+ARGUMENT_541 = CompiledArgument('name', 'brigadier:string', ArgumentContext.of({'type': 'word'}), enter_541)
+PARSE_541 = Parser.parsers[ARGUMENT_541.parser]
+START_541 = start_pattern(ARGUMENT_541)
+CHILDREN_369 = CompiledChildren(('tag', 'targets', 'add'), (ARGUMENT_541, ), True)
+ARGUMENT_542 = CompiledArgument('name', 'brigadier:string', ArgumentContext.of({'type': 'word'}), enter_542)
+PARSE_542 = Parser.parsers[ARGUMENT_542.parser]
+START_542 = start_pattern(ARGUMENT_542)
+CHILDREN_371 = CompiledChildren(('tag', 'targets', 'remove'), (ARGUMENT_542, ), True)
+ARGUMENT_543 = CompiledArgument('displayName', 'minecraft:component', ArgumentContext.of({}), enter_543)
+PARSE_543 = Parser.parsers[ARGUMENT_543.parser]
+START_543 = start_pattern(ARGUMENT_543)
+CHILDREN_372 = CompiledChildren(('team', 'add', 'team'), (ARGUMENT_543, ), True)
+ARGUMENT_544 = CompiledArgument('members', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_544)
+PARSE_544 = Parser.parsers[ARGUMENT_544.parser]
+START_544 = start_pattern(ARGUMENT_544)
+CHILDREN_374 = CompiledChildren(('team', 'join', 'team'), (ARGUMENT_544, ), True)
+LITERALS_377 = {
+	'collisionRule': enter_545,
+	'color': enter_546,
+	'deathMessageVisibility': enter_547,
+	'displayName': enter_548,
+	'friendlyFire': enter_549,
+	'nametagVisibility': enter_550,
+	'prefix': enter_551,
+	'seeFriendlyInvisibles': enter_552,
+	'suffix': enter_553,
+}
+CHILDREN_377 = CompiledChildren(('team', 'modify', 'team'), (), None)
+ARGUMENT_555 = CompiledArgument('rotation', 'minecraft:rotation', ArgumentContext.of({}), enter_555)
+PARSE_555 = Parser.parsers[ARGUMENT_555.parser]
+START_555 = start_pattern(ARGUMENT_555)
+CHILDREN_380 = CompiledChildren(('teleport', 'targets', 'location'), (ARGUMENT_555, ), True)
+ARGUMENT_556 = CompiledArgument('title', 'minecraft:component', ArgumentContext.of({}), enter_556)
+PARSE_556 = Parser.parsers[ARGUMENT_556.parser]
+START_556 = start_pattern(ARGUMENT_556)
+CHILDREN_391 = CompiledChildren(('title', 'targets', 'actionbar'), (ARGUMENT_556, ), True)
+ARGUMENT_557 = CompiledArgument('title', 'minecraft:component', ArgumentContext.of({}), enter_557)
+PARSE_557 = Parser.parsers[ARGUMENT_557.parser]
+START_557 = start_pattern(ARGUMENT_557)
+CHILDREN_394 = CompiledChildren(('title', 'targets', 'subtitle'), (ARGUMENT_557, ), True)
+ARGUMENT_558 = CompiledArgument('fadeIn', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_558)
+PARSE_558 = Parser.parsers[ARGUMENT_558.parser]
+START_558 = start_pattern(ARGUMENT_558)
+CHILDREN_395 = CompiledChildren(('title', 'targets', 'times'), (ARGUMENT_558, ), None)
+ARGUMENT_559 = CompiledArgument('title', 'minecraft:component', ArgumentContext.of({}), enter_559)
+PARSE_559 = Parser.parsers[ARGUMENT_559.parser]
+START_559 = start_pattern(ARGUMENT_559)
+CHILDREN_396 = CompiledChildren(('title', 'targets', 'title'), (ARGUMENT_559, ), True)
+ARGUMENT_560 = CompiledArgument('value', 'brigadier:integer', ArgumentContext.of({}), enter_560)
+PARSE_560 = Parser.parsers[ARGUMENT_560.parser]
+START_560 = start_pattern(ARGUMENT_560)
+CHILDREN_397 = CompiledChildren(('trigger', 'objective', 'add'), (ARGUMENT_560, ), True)
+ARGUMENT_561 = CompiledArgument('value', 'brigadier:integer', ArgumentContext.of({}), enter_561)
+PARSE_561 = Parser.parsers[ARGUMENT_561.parser]
+START_561 = start_pattern(ARGUMENT_561)
+CHILDREN_398 = CompiledChildren(('trigger', 'objective', 'set'), (ARGUMENT_561, ), True)
+ARGUMENT_562 = CompiledArgument('time', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_562)
+PARSE_562 = Parser.parsers[ARGUMENT_562.parser]
+START_562 = start_pattern(ARGUMENT_562)
+CHILDREN_404 = CompiledChildren(('worldborder', 'add', 'distance'), (ARGUMENT_562, ), True)
+ARGUMENT_563 = CompiledArgument('damagePerBlock', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_563)
+PARSE_563 = Parser.parsers[ARGUMENT_563.parser]
+START_563 = start_pattern(ARGUMENT_563)
+CHILDREN_406 = CompiledChildren(('worldborder', 'damage', 'amount'), (ARGUMENT_563, ), True)
+ARGUMENT_564 = CompiledArgument('distance', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_564)
+PARSE_564 = Parser.parsers[ARGUMENT_564.parser]
+START_564 = start_pattern(ARGUMENT_564)
+CHILDREN_407 = CompiledChildren(('worldborder', 'damage', 'buffer'), (ARGUMENT_564, ), True)
+ARGUMENT_565 = CompiledArgument('time', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_565)
+PARSE_565 = Parser.parsers[ARGUMENT_565.parser]
+START_565 = start_pattern(ARGUMENT_565)
+CHILDREN_408 = CompiledChildren(('worldborder', 'set', 'distance'), (ARGUMENT_565, ), True)
+ARGUMENT_566 = CompiledArgument('distance', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_566)
+PARSE_566 = Parser.parsers[ARGUMENT_566.parser]
+START_566 = start_pattern(ARGUMENT_566)
+CHILDREN_409 = CompiledChildren(('worldborder', 'warning', 'distance'), (ARGUMENT_566, ), True)
+ARGUMENT_567 = CompiledArgument('time', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_567)
+PARSE_567 = Parser.parsers[ARGUMENT_567.parser]
+START_567 = start_pattern(ARGUMENT_567)
+CHILDREN_410 = CompiledChildren(('worldborder', 'warning', 'time'), (ARGUMENT_567, ), True)
+ARGUMENT_568 = CompiledArgument('advancement', 'minecraft:resource_location', ArgumentContext.of({}), enter_568)
+PARSE_568 = Parser.parsers[ARGUMENT_568.parser]
+START_568 = start_pattern(ARGUMENT_568)
+CHILDREN_412 = CompiledChildren(('advancement', 'grant', 'targets', 'from'), (ARGUMENT_568, ), True)
+ARGUMENT_569 = CompiledArgument('advancement', 'minecraft:resource_location', ArgumentContext.of({}), enter_569)
+PARSE_569 = Parser.parsers[ARGUMENT_569.parser]
+START_569 = start_pattern(ARGUMENT_569)
+CHILDREN_413 = CompiledChildren(('advancement', 'grant', 'targets', 'only'), (ARGUMENT_569, ), True)
+ARGUMENT_570 = CompiledArgument('advancement', 'minecraft:resource_location', ArgumentContext.of({}), enter_570)
+PARSE_570 = Parser.parsers[ARGUMENT_570.parser]
+START_570 = start_pattern(ARGUMENT_570)
+CHILDREN_414 = CompiledChildren(('advancement', 'grant', 'targets', 'through'), (ARGUMENT_570, ), True)
+ARGUMENT_571 = CompiledArgument('advancement', 'minecraft:resource_location', ArgumentContext.of({}), enter_571)
+PARSE_571 = Parser.parsers[ARGUMENT_571.parser]
+START_571 = start_pattern(ARGUMENT_571)
+CHILDREN_415 = CompiledChildren(('advancement', 'grant', 'targets', 'until'), (ARGUMENT_571, ), True)
+ARGUMENT_572 = CompiledArgument('advancement', 'minecraft:resource_location', ArgumentContext.of({}), enter_572)
+PARSE_572 = Parser.parsers[ARGUMENT_572.parser]
+START_572 = start_pattern(ARGUMENT_572)
+CHILDREN_417 = CompiledChildren(('advancement', 'revoke', 'targets', 'from'), (ARGUMENT_572, ), True)
+ARGUMENT_573 = CompiledArgument('advancement', 'minecraft:resource_location', ArgumentContext.of({}), enter_573)
+PARSE_573 = Parser.parsers[ARGUMENT_573.parser]
+START_573 = start_pattern(ARGUMENT_573)
+CHILDREN_418 = CompiledChildren(('advancement', 'revoke', 'targets', 'only'), (ARGUMENT_573, ), True)
+ARGUMENT_574 = CompiledArgument('advancement', 'minecraft:resource_location', ArgumentContext.of({}), enter_574)
+PARSE_574 = Parser.parsers[ARGUMENT_574.parser]
+START_574 = start_pattern(ARGUMENT_574)
+CHILDREN_419 = CompiledChildren(('advancement', 'revoke', 'targets', 'through'), (ARGUMENT_574, ), True)
+ARGUMENT_575 = CompiledArgument('advancement', 'minecraft:resource_location', ArgumentContext.of({}), enter_575)
+PARSE_575 = Parser.parsers[ARGUMENT_575.parser]
+START_575 = start_pattern(ARGUMENT_575)
+CHILDREN_420 = CompiledChildren(('advancement', 'revoke', 'targets', 'until'), (ARGUMENT_575, ), True)
+LITERALS_426 = {
+	'blue': enter_576,
+	'green': enter_577,
+	'pink': enter_578,
+	'purple': enter_579,
+	'red': enter_580,
+	'white': enter_581,
+	'yellow': enter_582,
+}
+CHILDREN_426 = CompiledChildren(('bossbar', 'set', 'id', 'color'), (), True)
+ARGUMENT_583 = CompiledArgument('max', 'brigadier:integer', ArgumentContext.of({'min': 1}), enter_583)
+PARSE_583 = Parser.parsers[ARGUMENT_583.parser]
+START_583 = start_pattern(ARGUMENT_583)
+CHILDREN_427 = CompiledChildren(('bossbar', 'set', 'id', 'max'), (ARGUMENT_583, ), True)
+ARGUMENT_584 = CompiledArgument('name', 'minecraft:component', ArgumentContext.of({}), enter_584)
+PARSE_584 = Parser.parsers[ARGUMENT_584.parser]
+START_584 = start_pattern(ARGUMENT_584)
+CHILDREN_428 = CompiledChildren(('bossbar', 'set', 'id', 'name'), (ARGUMENT_584, ), True)
+ARGUMENT_585 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_585)
+PARSE_585 = Parser.parsers[ARGUMENT_585.parser]
+START_585 = start_pattern(ARGUMENT_585)
+CHILDREN_429 = CompiledChildren(('bossbar', 'set', 'id', 'players'), (ARGUMENT_585, ), True)
+LITERALS_430 = {
+	'notched_10': enter_586,
+	'notched_12': enter_587,
+	'notched_20': enter_588,
+	'notched_6': enter_589,
+	'progress': enter_590,
+}
+CHILDREN_430 = CompiledChildren(('bossbar', 'set', 'id', 'style'), (), True)
+ARGUMENT_591 = CompiledArgument('value', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_591)
+PARSE_591 = Parser.parsers[ARGUMENT_591.parser]
+START_591 = start_pattern(ARGUMENT_591)
+CHILDREN_431 = CompiledChildren(('bossbar', 'set', 'id', 'value'), (ARGUMENT_591, ), True)
+ARGUMENT_592 = CompiledArgument('visible', 'brigadier:bool', ArgumentContext.of({}), enter_592)
+PARSE_592 = Parser.parsers[ARGUMENT_592.parser]
+START_592 = start_pattern(ARGUMENT_592)
+CHILDREN_432 = CompiledChildren(('bossbar', 'set', 'id', 'visible'), (ARGUMENT_592, ), True)
+CHILDREN_434 = CompiledChildren(('clone', 'begin', 'end', 'destination'), (), True)
+ARGUMENT_596 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_596)
+PARSE_596 = Parser.parsers[ARGUMENT_596.parser]
+START_596 = start_pattern(ARGUMENT_596)
+CHILDREN_435 = CompiledChildren(('data', 'get', 'block', 'targetPos'), (ARGUMENT_596, ), True)
+ARGUMENT_597 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_597)
+PARSE_597 = Parser.parsers[ARGUMENT_597.parser]
+START_597 = start_pattern(ARGUMENT_597)
+CHILDREN_436 = CompiledChildren(('data', 'get', 'entity', 'target'), (ARGUMENT_597, ), True)
+ARGUMENT_598 = CompiledArgument('nbt', 'minecraft:nbt_compound_tag', ArgumentContext.of({}), enter_598)
+PARSE_598 = Parser.parsers[ARGUMENT_598.parser]
+START_598 = start_pattern(ARGUMENT_598)
+CHILDREN_437 = CompiledChildren(('data', 'merge', 'block', 'targetPos'), (ARGUMENT_598, ), True)
+ARGUMENT_599 = CompiledArgument('nbt', 'minecraft:nbt_compound_tag', ArgumentContext.of({}), enter_599)
+PARSE_599 = Parser.parsers[ARGUMENT_599.parser]
+START_599 = start_pattern(ARGUMENT_599)
+CHILDREN_438 = CompiledChildren(('data', 'merge', 'entity', 'target'), (ARGUMENT_599, ), True)
+ARGUMENT_600 = CompiledArgument('targetPath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_600)
+PARSE_600 = Parser.parsers[ARGUMENT_600.parser]
+START_600 = start_pattern(ARGUMENT_600)
+CHILDREN_439 = CompiledChildren(('data', 'modify', 'block', 'targetPos'), (ARGUMENT_600, ), None)
+ARGUMENT_601 = CompiledArgument('targetPath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_601)
+PARSE_601 = Parser.parsers[ARGUMENT_601.parser]
+START_601 = start_pattern(ARGUMENT_601)
+CHILDREN_440 = CompiledChildren(('data', 'modify', 'entity', 'target'), (ARGUMENT_601, ), None)
+ARGUMENT_602 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_602)
+PARSE_602 = Parser.parsers[ARGUMENT_602.parser]
+START_602 = start_pattern(ARGUMENT_602)
+CHILDREN_441 = CompiledChildren(('data', 'remove', 'block', 'targetPos'), (ARGUMENT_602, ), True)
+ARGUMENT_603 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_603)
+PARSE_603 = Parser.parsers[ARGUMENT_603.parser]
+START_603 = start_pattern(ARGUMENT_603)
+CHILDREN_442 = CompiledChildren(('data', 'remove', 'entity', 'target'), (ARGUMENT_603, ), True)
+ARGUMENT_604 = CompiledArgument('existing', 'brigadier:string', ArgumentContext.of({'type': 'phrase'}), enter_604)
+PARSE_604 = Parser.parsers[ARGUMENT_604.parser]
+START_604 = start_pattern(ARGUMENT_604)
+CHILDREN_443 = CompiledChildren(('datapack', 'enable', 'name', 'after'), (ARGUMENT_604, ), True)
+ARGUMENT_605 = CompiledArgument('existing', 'brigadier:string', ArgumentContext.of({'type': 'phrase'}), enter_605)
+PARSE_605 = Parser.parsers[ARGUMENT_605.parser]
+START_605 = start_pattern(ARGUMENT_605)
+CHILDREN_444 = CompiledChildren(('datapack', 'enable', 'name', 'before'), (ARGUMENT_605, ), True)
+ARGUMENT_606 = CompiledArgument('seconds', 'brigadier:integer', ArgumentContext.of({'min': 1, 'max': 1000000}), enter_606)
+PARSE_606 = Parser.parsers[ARGUMENT_606.parser]
+START_606 = start_pattern(ARGUMENT_606)
+CHILDREN_448 = CompiledChildren(('effect', 'give', 'targets', 'effect'), (ARGUMENT_606, ), True)
+ARGUMENT_607 = CompiledArgument('anchor', 'minecraft:entity_anchor', ArgumentContext.of({}), enter_607)
+PARSE_607 = Parser.parsers[ARGUMENT_607.parser]
+START_607 = start_pattern(ARGUMENT_607)
+CHILDREN_450 = CompiledChildren(('execute', 'facing', 'entity', 'targets'), (ARGUMENT_607, ), None)
+ARGUMENT_608 = CompiledArgument('block', 'minecraft:block_predicate', ArgumentContext.of({}), enter_608)
+PARSE_608 = Parser.parsers[ARGUMENT_608.parser]
+START_608 = start_pattern(ARGUMENT_608)
+CHILDREN_451 = CompiledChildren(('execute', 'if', 'block', 'pos'), (ARGUMENT_608, ), True)
+ARGUMENT_609 = CompiledArgument('end', 'minecraft:block_pos', ArgumentContext.of({}), enter_609)
+PARSE_609 = Parser.parsers[ARGUMENT_609.parser]
+START_609 = start_pattern(ARGUMENT_609)
+CHILDREN_452 = CompiledChildren(('execute', 'if', 'blocks', 'start'), (ARGUMENT_609, ), None)
+ARGUMENT_610 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_610)
+PARSE_610 = Parser.parsers[ARGUMENT_610.parser]
+START_610 = start_pattern(ARGUMENT_610)
+CHILDREN_453 = CompiledChildren(('execute', 'if', 'data', 'block'), (ARGUMENT_610, ), None)
+ARGUMENT_611 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_611)
+PARSE_611 = Parser.parsers[ARGUMENT_611.parser]
+START_611 = start_pattern(ARGUMENT_611)
+CHILDREN_454 = CompiledChildren(('execute', 'if', 'data', 'entity'), (ARGUMENT_611, ), None)
+ARGUMENT_613 = CompiledArgument('targetObjective', 'minecraft:objective', ArgumentContext.of({}), enter_613)
+PARSE_613 = Parser.parsers[ARGUMENT_613.parser]
+START_613 = start_pattern(ARGUMENT_613)
+CHILDREN_456 = CompiledChildren(('execute', 'if', 'score', 'target'), (ARGUMENT_613, ), None)
+ARGUMENT_614 = CompiledArgument('targetPos', 'minecraft:block_pos', ArgumentContext.of({}), enter_614)
+PARSE_614 = Parser.parsers[ARGUMENT_614.parser]
+START_614 = start_pattern(ARGUMENT_614)
+CHILDREN_459 = CompiledChildren(('execute', 'store', 'result', 'block'), (ARGUMENT_614, ), None)
+ARGUMENT_615 = CompiledArgument('id', 'minecraft:resource_location', ArgumentContext.of({}), enter_615)
+PARSE_615 = Parser.parsers[ARGUMENT_615.parser]
+START_615 = start_pattern(ARGUMENT_615)
+CHILDREN_460 = CompiledChildren(('execute', 'store', 'result', 'bossbar'), (ARGUMENT_615, ), None)
+ARGUMENT_616 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_616)
+PARSE_616 = Parser.parsers[ARGUMENT_616.parser]
+START_616 = start_pattern(ARGUMENT_616)
+CHILDREN_461 = CompiledChildren(('execute', 'store', 'result', 'entity'), (ARGUMENT_616, ), None)
+ARGUMENT_617 = CompiledArgument('targets', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_617)
+PARSE_617 = Parser.parsers[ARGUMENT_617.parser]
+START_617 = start_pattern(ARGUMENT_617)
+CHILDREN_462 = CompiledChildren(('execute', 'store', 'result', 'score'), (ARGUMENT_617, ), None)
+ARGUMENT_618 = CompiledArgument('targetPos', 'minecraft:block_pos', ArgumentContext.of({}), enter_618)
+PARSE_618 = Parser.parsers[ARGUMENT_618.parser]
+START_618 = start_pattern(ARGUMENT_618)
+CHILDREN_463 = CompiledChildren(('execute', 'store', 'success', 'block'), (ARGUMENT_618, ), None)
+ARGUMENT_619 = CompiledArgument('id', 'minecraft:resource_location', ArgumentContext.of({}), enter_619)
+PARSE_619 = Parser.parsers[ARGUMENT_619.parser]
+START_619 = start_pattern(ARGUMENT_619)
+CHILDREN_464 = CompiledChildren(('execute', 'store', 'success', 'bossbar'), (ARGUMENT_619, ), None)
+ARGUMENT_620 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_620)
+PARSE_620 = Parser.parsers[ARGUMENT_620.parser]
+START_620 = start_pattern(ARGUMENT_620)
+CHILDREN_465 = CompiledChildren(('execute', 'store', 'success', 'entity'), (ARGUMENT_620, ), None)
+ARGUMENT_621 = CompiledArgument('targets', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_621)
+PARSE_621 = Parser.parsers[ARGUMENT_621.parser]
+START_621 = start_pattern(ARGUMENT_621)
+CHILDREN_466 = CompiledChildren(('execute', 'store', 'success', 'score'), (ARGUMENT_621, ), None)
+ARGUMENT_622 = CompiledArgument('block', 'minecraft:block_predicate', ArgumentContext.of({}), enter_622)
+PARSE_622 = Parser.parsers[ARGUMENT_622.parser]
+START_622 = start_pattern(ARGUMENT_622)
+CHILDREN_467 = CompiledChildren(('execute', 'unless', 'block', 'pos'), (ARGUMENT_622, ), True)
+ARGUMENT_623 = CompiledArgument('end', 'minecraft:block_pos', ArgumentContext.of({}), enter_623)
+PARSE_623 = Parser.parsers[ARGUMENT_623.parser]
+START_623 = start_pattern(ARGUMENT_623)
+CHILDREN_468 = CompiledChildren(('execute', 'unless', 'blocks', 'start'), (ARGUMENT_623, ), None)
+ARGUMENT_624 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_624)
+PARSE_624 = Parser.parsers[ARGUMENT_624.parser]
+START_624 = start_pattern(ARGUMENT_624)
+CHILDREN_469 = CompiledChildren(('execute', 'unless', 'data', 'block'), (ARGUMENT_624, ), None)
+ARGUMENT_625 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_625)
+PARSE_625 = Parser.parsers[ARGUMENT_625.parser]
+START_625 = start_pattern(ARGUMENT_625)
+CHILDREN_470 = CompiledChildren(('execute', 'unless', 'data', 'entity'), (ARGUMENT_625, ), None)
+ARGUMENT_626 = CompiledArgument('targetObjective', 'minecraft:objective', ArgumentContext.of({}), enter_626)
+PARSE_626 = Parser.parsers[ARGUMENT_626.parser]
+START_626 = start_pattern(ARGUMENT_626)
+CHILDREN_472 = CompiledChildren(('execute', 'unless', 'score', 'target'), (ARGUMENT_626, ), None)
+CHILDREN_473 = CompiledChildren(('experience', 'add', 'targets', 'amount'), (), True)
+CHILDREN_476 = CompiledChildren(('experience', 'set', 'targets', 'amount'), (), True)
+LITERALS_477 = {
+	'destroy': enter_631,
+	'hollow': enter_632,
+	'keep': enter_633,
+	'outline': enter_634,
+	'replace': enter_635,
+}
+CHILDREN_477 = CompiledChildren(('fill', 'from', 'to', 'block'), (), True)
+ARGUMENT_636 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_636)
+PARSE_636 = Parser.parsers[ARGUMENT_636.parser]
+START_636 = start_pattern(ARGUMENT_636)
+CHILDREN_481 = CompiledChildren(('loot', 'give', 'players', 'fish'), (ARGUMENT_636, ), None)
+ARGUMENT_637 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_637)
+PARSE_637 = Parser.parsers[ARGUMENT_637.parser]
+START_637 = start_pattern(ARGUMENT_637)
+CHILDREN_482 = CompiledChildren(('loot', 'give', 'players', 'kill'), (ARGUMENT_637, ), True)
+ARGUMENT_638 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_638)
+PARSE_638 = Parser.parsers[ARGUMENT_638.parser]
+START_638 = start_pattern(ARGUMENT_638)
+CHILDREN_483 = CompiledChildren(('loot', 'give', 'players', 'loot'), (ARGUMENT_638, ), True)
+ARGUMENT_639 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_639)
+PARSE_639 = Parser.parsers[ARGUMENT_639.parser]
+START_639 = start_pattern(ARGUMENT_639)
+CHILDREN_484 = CompiledChildren(('loot', 'give', 'players', 'mine'), (ARGUMENT_639, ), True)
+ARGUMENT_640 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_640)
+PARSE_640 = Parser.parsers[ARGUMENT_640.parser]
+START_640 = start_pattern(ARGUMENT_640)
+CHILDREN_485 = CompiledChildren(('loot', 'insert', 'targetPos', 'fish'), (ARGUMENT_640, ), None)
+ARGUMENT_641 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_641)
+PARSE_641 = Parser.parsers[ARGUMENT_641.parser]
+START_641 = start_pattern(ARGUMENT_641)
+CHILDREN_486 = CompiledChildren(('loot', 'insert', 'targetPos', 'kill'), (ARGUMENT_641, ), True)
+ARGUMENT_642 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_642)
+PARSE_642 = Parser.parsers[ARGUMENT_642.parser]
+START_642 = start_pattern(ARGUMENT_642)
+CHILDREN_487 = CompiledChildren(('loot', 'insert', 'targetPos', 'loot'), (ARGUMENT_642, ), True)
+ARGUMENT_643 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_643)
+PARSE_643 = Parser.parsers[ARGUMENT_643.parser]
+START_643 = start_pattern(ARGUMENT_643)
+CHILDREN_488 = CompiledChildren(('loot', 'insert', 'targetPos', 'mine'), (ARGUMENT_643, ), True)
+ARGUMENT_644 = CompiledArgument('slot', 'minecraft:item_slot', ArgumentContext.of({}), enter_644)
+PARSE_644 = Parser.parsers[ARGUMENT_644.parser]
+START_644 = start_pattern(ARGUMENT_644)
+CHILDREN_489 = CompiledChildren(('loot', 'replace', 'block', 'targetPos'), (ARGUMENT_644, ), None)
+ARGUMENT_645 = CompiledArgument('slot', 'minecraft:item_slot', ArgumentContext.of({}), enter_645)
+PARSE_645 = Parser.parsers[ARGUMENT_645.parser]
+START_645 = start_pattern(ARGUMENT_645)
+CHILDREN_490 = CompiledChildren(('loot', 'replace', 'entity', 'entities'), (ARGUMENT_645, ), None)
+ARGUMENT_646 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_646)
+PARSE_646 = Parser.parsers[ARGUMENT_646.parser]
+START_646 = start_pattern(ARGUMENT_646)
+CHILDREN_491 = CompiledChildren(('loot', 'spawn', 'targetPos', 'fish'), (ARGUMENT_646, ), None)
+ARGUMENT_647 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_647)
+PARSE_647 = Parser.parsers[ARGUMENT_647.parser]
+START_647 = start_pattern(ARGUMENT_647)
+CHILDREN_492 = CompiledChildren(('loot', 'spawn', 'targetPos', 'kill'), (ARGUMENT_647, ), True)
+ARGUMENT_648 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_648)
+PARSE_648 = Parser.parsers[ARGUMENT_648.parser]
+START_648 = start_pattern(ARGUMENT_648)
+CHILDREN_493 = CompiledChildren(('loot', 'spawn', 'targetPos', 'loot'), (ARGUMENT_648, ), True)
+ARGUMENT_649 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_649)
+PARSE_649 = Parser.parsers[ARGUMENT_649.parser]
+START_649 = start_pattern(ARGUMENT_649)
+CHILDREN_494 = CompiledChildren(('loot', 'spawn', 'targetPos', 'mine'), (ARGUMENT_649, ), True)
+ARGUMENT_650 = CompiledArgument('speed', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_650)
+PARSE_650 = Parser.parsers[ARGUMENT_650.parser]
+START_650 = start_pattern(ARGUMENT_650)
+CHILDREN_495 = CompiledChildren(('particle', 'name', 'pos', 'delta'), (ARGUMENT_650, ), None)
+ARGUMENT_651 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_651)
+PARSE_651 = Parser.parsers[ARGUMENT_651.parser]
+START_651 = start_pattern(ARGUMENT_651)
+CHILDREN_496 = CompiledChildren(('playsound', 'sound', 'ambient', 'targets'), (ARGUMENT_651, ), True)
+ARGUMENT_652 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_652)
+PARSE_652 = Parser.parsers[ARGUMENT_652.parser]
+START_652 = start_pattern(ARGUMENT_652)
+CHILDREN_497 = CompiledChildren(('playsound', 'sound', 'block', 'targets'), (ARGUMENT_652, ), True)
+ARGUMENT_653 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_653)
+PARSE_653 = Parser.parsers[ARGUMENT_653.parser]
+START_653 = start_pattern(ARGUMENT_653)
+CHILDREN_498 = CompiledChildren(('playsound', 'sound', 'hostile', 'targets'), (ARGUMENT_653, ), True)
+ARGUMENT_654 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_654)
+PARSE_654 = Parser.parsers[ARGUMENT_654.parser]
+START_654 = start_pattern(ARGUMENT_654)
+CHILDREN_499 = CompiledChildren(('playsound', 'sound', 'master', 'targets'), (ARGUMENT_654, ), True)
+ARGUMENT_655 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_655)
+PARSE_655 = Parser.parsers[ARGUMENT_655.parser]
+START_655 = start_pattern(ARGUMENT_655)
+CHILDREN_500 = CompiledChildren(('playsound', 'sound', 'music', 'targets'), (ARGUMENT_655, ), True)
+ARGUMENT_656 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_656)
+PARSE_656 = Parser.parsers[ARGUMENT_656.parser]
+START_656 = start_pattern(ARGUMENT_656)
+CHILDREN_501 = CompiledChildren(('playsound', 'sound', 'neutral', 'targets'), (ARGUMENT_656, ), True)
+ARGUMENT_657 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_657)
+PARSE_657 = Parser.parsers[ARGUMENT_657.parser]
+START_657 = start_pattern(ARGUMENT_657)
+CHILDREN_502 = CompiledChildren(('playsound', 'sound', 'player', 'targets'), (ARGUMENT_657, ), True)
+ARGUMENT_658 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_658)
+PARSE_658 = Parser.parsers[ARGUMENT_658.parser]
+START_658 = start_pattern(ARGUMENT_658)
+CHILDREN_503 = CompiledChildren(('playsound', 'sound', 'record', 'targets'), (ARGUMENT_658, ), True)
+ARGUMENT_659 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_659)
+PARSE_659 = Parser.parsers[ARGUMENT_659.parser]
+START_659 = start_pattern(ARGUMENT_659)
+CHILDREN_504 = CompiledChildren(('playsound', 'sound', 'voice', 'targets'), (ARGUMENT_659, ), True)
+ARGUMENT_660 = CompiledArgument('pos', 'minecraft:vec3', ArgumentContext.of({}), enter_660)
+PARSE_660 = Parser.parsers[ARGUMENT_660.parser]
+START_660 = start_pattern(ARGUMENT_660)
+CHILDREN_505 = CompiledChildren(('playsound', 'sound', 'weather', 'targets'), (ARGUMENT_660, ), True)
+ARGUMENT_661 = CompiledArgument('item', 'minecraft:item_stack', ArgumentContext.of({}), enter_661)
+PARSE_661 = Parser.parsers[ARGUMENT_661.parser]
+START_661 = start_pattern(ARGUMENT_661)
+CHILDREN_510 = CompiledChildren(('replaceitem', 'block', 'pos', 'slot'), (ARGUMENT_661, ), True)
+ARGUMENT_662 = CompiledArgument('item', 'minecraft:item_stack', ArgumentContext.of({}), enter_662)
+PARSE_662 = Parser.parsers[ARGUMENT_662.parser]
+START_662 = start_pattern(ARGUMENT_662)
+CHILDREN_511 = CompiledChildren(('replaceitem', 'entity', 'targets', 'slot'), (ARGUMENT_662, ), True)
+ARGUMENT_663 = CompiledArgument('criteria', 'minecraft:objective_criteria', ArgumentContext.of({}), enter_663)
+PARSE_663 = Parser.parsers[ARGUMENT_663.parser]
+START_663 = start_pattern(ARGUMENT_663)
+CHILDREN_513 = CompiledChildren(('scoreboard', 'objectives', 'add', 'objective'), (ARGUMENT_663, ), True)
+CHILDREN_514 = CompiledChildren(('scoreboard', 'objectives', 'modify', 'objective'), (), None)
+ARGUMENT_666 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_666)
+PARSE_666 = Parser.parsers[ARGUMENT_666.parser]
+START_666 = start_pattern(ARGUMENT_666)
+CHILDREN_516 = CompiledChildren(('scoreboard', 'objectives', 'setdisplay', 'slot'), (ARGUMENT_666, ), True)
+ARGUMENT_667 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_667)
+PARSE_667 = Parser.parsers[ARGUMENT_667.parser]
+START_667 = start_pattern(ARGUMENT_667)
+CHILDREN_517 = CompiledChildren(('scoreboard', 'players', 'add', 'targets'), (ARGUMENT_667, ), None)
+ARGUMENT_668 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_668)
+PARSE_668 = Parser.parsers[ARGUMENT_668.parser]
+START_668 = start_pattern(ARGUMENT_668)
+CHILDREN_518 = CompiledChildren(('scoreboard', 'players', 'enable', 'targets'), (ARGUMENT_668, ), True)
+ARGUMENT_669 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_669)
+PARSE_669 = Parser.parsers[ARGUMENT_669.parser]
+START_669 = start_pattern(ARGUMENT_669)
+CHILDREN_519 = CompiledChildren(('scoreboard', 'players', 'get', 'target'), (ARGUMENT_669, ), True)
+ARGUMENT_670 = CompiledArgument('targetObjective', 'minecraft:objective', ArgumentContext.of({}), enter_670)
+PARSE_670 = Parser.parsers[ARGUMENT_670.parser]
+START_670 = start_pattern(ARGUMENT_670)
+CHILDREN_521 = CompiledChildren(('scoreboard', 'players', 'operation', 'targets'), (ARGUMENT_670, ), None)
+ARGUMENT_671 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_671)
+PARSE_671 = Parser.parsers[ARGUMENT_671.parser]
+START_671 = start_pattern(ARGUMENT_671)
+CHILDREN_522 = CompiledChildren(('scoreboard', 'players', 'remove', 'targets'), (ARGUMENT_671, ), None)
+ARGUMENT_672 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_672)
+PARSE_672 = Parser.parsers[ARGUMENT_672.parser]
+START_672 = start_pattern(ARGUMENT_672)
+CHILDREN_523 = CompiledChildren(('scoreboard', 'players', 'reset', 'targets'), (ARGUMENT_672, ), True)
+ARGUMENT_673 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_673)
+PARSE_673 = Parser.parsers[ARGUMENT_673.parser]
+START_673 = start_pattern(ARGUMENT_673)
+CHILDREN_524 = CompiledChildren(('scoreboard', 'players', 'set', 'targets'), (ARGUMENT_673, ), None)
+ARGUMENT_674 = CompiledArgument('respectTeams', 'brigadier:bool', ArgumentContext.of({}), enter_674)
+PARSE_674 = Parser.parsers[ARGUMENT_674.parser]
+START_674 = start_pattern(ARGUMENT_674)
+CHILDREN_528 = CompiledChildren(('spreadplayers', 'center', 'spreadDistance', 'maxRange'), (ARGUMENT_674, ), None)
+CHILDREN_545 = CompiledChildren(('team', 'modify', 'team', 'collisionRule'), (), True)
+ARGUMENT_679 = CompiledArgument('value', 'minecraft:color', ArgumentContext.of({}), enter_679)
+PARSE_679 = Parser.parsers[ARGUMENT_679.parser]
+START_679 = start_pattern(ARGUMENT_679)
+CHILDREN_546 = CompiledChildren(('team', 'modify', 'team', 'color'), (ARGUMENT_679, ), True)
+CHILDREN_547 = CompiledChildren(('team', 'modify', 'team', 'deathMessageVisibility'), (), True)
+ARGUMENT_684 = CompiledArgument('displayName', 'minecraft:component', ArgumentContext.of({}), enter_684)
+PARSE_684 = Parser.parsers[ARGUMENT_684.parser]
+START_684 = start_pattern(ARGUMENT_684)
+CHILDREN_548 = CompiledChildren(('team', 'modify', 'team', 'displayName'), (ARGUMENT_684, ), True)
+ARGUMENT_685 = CompiledArgument('allowed', 'brigadier:bool', ArgumentContext.of({}), enter_685)
+PARSE_685 = Parser.parsers[ARGUMENT_685.parser]
+START_685 = start_pattern(ARGUMENT_685)
+CHILDREN_549 = CompiledChildren(('team', 'modify', 'team', 'friendlyFire'), (ARGUMENT_685, ), True)
+CHILDREN_550 = CompiledChildren(('team', 'modify', 'team', 'nametagVisibility'), (), True)
+ARGUMENT_690 = CompiledArgument('prefix', 'minecraft:component', ArgumentContext.of({}), enter_690)
+PARSE_690 = Parser.parsers[ARGUMENT_690.parser]
+START_690 = start_pattern(ARGUMENT_690)
+CHILDREN_551 = CompiledChildren(('team', 'modify', 'team', 'prefix'), (ARGUMENT_690, ), True)
+ARGUMENT_691 = CompiledArgument('allowed', 'brigadier:bool', ArgumentContext.of({}), enter_691)
+PARSE_691 = Parser.parsers[ARGUMENT_691.parser]
+START_691 = start_pattern(ARGUMENT_691)
+CHILDREN_552 = CompiledChildren(('team', 'modify', 'team', 'seeFriendlyInvisibles'), (ARGUMENT_691, ), True)
+ARGUMENT_692 = CompiledArgument('suffix', 'minecraft:component', ArgumentContext.of({}), enter_692)
+PARSE_692 = Parser.parsers[ARGUMENT_692.parser]
+START_692 = start_pattern(ARGUMENT_692)
+CHILDREN_553 = CompiledChildren(('team', 'modify', 'team', 'suffix'), (ARGUMENT_692, ), True)
+ARGUMENT_694 = CompiledArgument('facingLocation', 'minecraft:vec3', ArgumentContext.of({}), enter_694)
+PARSE_694 = Parser.parsers[ARGUMENT_694.parser]
+START_694 = start_pattern(ARGUMENT_694)
+CHILDREN_554 = CompiledChildren(('teleport', 'targets', 'location', 'facing'), (ARGUMENT_694, ), True)
+ARGUMENT_695 = CompiledArgument('stay', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_695)
+PARSE_695 = Parser.parsers[ARGUMENT_695.parser]
+START_695 = start_pattern(ARGUMENT_695)
+CHILDREN_558 = CompiledChildren(('title', 'targets', 'times', 'fadeIn'), (ARGUMENT_695, ), None)
+ARGUMENT_696 = CompiledArgument('criterion', 'brigadier:string', ArgumentContext.of({'type': 'greedy'}), enter_696)
+PARSE_696 = Parser.parsers[ARGUMENT_696.parser]
+START_696 = start_pattern(ARGUMENT_696)
+CHILDREN_569 = CompiledChildren(('advancement', 'grant', 'targets', 'only', 'advancement'), (ARGUMENT_696, ), True)
+ARGUMENT_697 = CompiledArgument('criterion', 'brigadier:string', ArgumentContext.of({'type': 'greedy'}), enter_697)
+PARSE_697 = Parser.parsers[ARGUMENT_697.parser]
+START_697 = start_pattern(ARGUMENT_697)
+CHILDREN_573 = CompiledChildren(('advancement', 'revoke', 'targets', 'only', 'advancement'), (ARGUMENT_697, ), True)
+ARGUMENT_698 = CompiledArgument('filter', 'minecraft:block_predicate', ArgumentContext.of({}), enter_698)
+PARSE_698 = Parser.parsers[ARGUMENT_698.parser]
+START_698 = start_pattern(ARGUMENT_698)
+CHILDREN_593 = CompiledChildren(('clone', 'begin', 'end', 'destination', 'filtered'), (ARGUMENT_698, ), True)
+CHILDREN_594 = CompiledChildren(('clone', 'begin', 'end', 'destination', 'masked'), (), True)
+CHILDREN_595 = CompiledChildren(('clone', 'begin', 'end', 'destination', 'replace'), (), True)
+ARGUMENT_705 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_705)
+PARSE_705 = Parser.parsers[ARGUMENT_705.parser]
+START_705 = start_pattern(ARGUMENT_705)
+CHILDREN_596 = CompiledChildren(('data', 'get', 'block', 'targetPos', 'path'), (ARGUMENT_705, ), True)
+ARGUMENT_706 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_706)
+PARSE_706 = Parser.parsers[ARGUMENT_706.parser]
+START_706 = start_pattern(ARGUMENT_706)
+CHILDREN_597 = CompiledChildren(('data', 'get', 'entity', 'target', 'path'), (ARGUMENT_706, ), True)
+LITERALS_600 = {
+	'append': enter_707,
+	'insert': enter_708,
+	'merge': enter_709,
+	'prepend': enter_710,
+	'set': enter_711,
+}
+CHILDREN_600 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath'), (), None)
+LITERALS_601 = {
+	'append': enter_712,
+	'insert': enter_713,
+	'merge': enter_714,
+	'prepend': enter_715,
+	'set': enter_716,
+}
+CHILDREN_601 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath'), (), None)
+ARGUMENT_717 = CompiledArgument('amplifier', 'brigadier:integer', ArgumentContext.of({'min': 0, 'max': 255}), enter_717)
+PARSE_717 = Parser.parsers[ARGUMENT_717.parser]
+START_717 = start_pattern(ARGUMENT_717)
+CHILDREN_606 = CompiledChildren(('effect', 'give', 'targets', 'effect', 'seconds'), (ARGUMENT_717, ), True)
+ARGUMENT_718 = CompiledArgument('destination', 'minecraft:block_pos', ArgumentContext.of({}), enter_718)
+PARSE_718 = Parser.parsers[ARGUMENT_718.parser]
+START_718 = start_pattern(ARGUMENT_718)
+CHILDREN_609 = CompiledChildren(('execute', 'if', 'blocks', 'start', 'end'), (ARGUMENT_718, ), None)
+ARGUMENT_719 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_719)
+PARSE_719 = Parser.parsers[ARGUMENT_719.parser]
+START_719 = start_pattern(ARGUMENT_719)
+CHILDREN_610 = CompiledChildren(('execute', 'if', 'data', 'block', 'sourcePos'), (ARGUMENT_719, ), True)
+ARGUMENT_720 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_720)
+PARSE_720 = Parser.parsers[ARGUMENT_720.parser]
+START_720 = start_pattern(ARGUMENT_720)
+CHILDREN_611 = CompiledChildren(('execute', 'if', 'data', 'entity', 'source'), (ARGUMENT_720, ), True)
+LITERALS_612 = {
+	'align': enter_106,
+	'anchored': enter_107,
+	'as': enter_108,
+	'at': enter_109,
+	'facing': enter_110,
+	'if': enter_111,
+	'in': enter_112,
+	'positioned': enter_113,
+	'rotated': enter_114,
+	'run': enter_115,
+	'store': enter_116,
+	'unless': enter_117,
+}
+CHILDREN_612 = CompiledChildren(('execute',), (), None)
+LITERALS_613 = {
+	'<': enter_721,
+	'<=': enter_722,
+	'=': enter_723,
+	'>': enter_724,
+	'>=': enter_725,
+	'matches': enter_726,
+}
+CHILDREN_613 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective'), (), None)
+ARGUMENT_727 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_727)
+PARSE_727 = Parser.parsers[ARGUMENT_727.parser]
+START_727 = start_pattern(ARGUMENT_727)
+CHILDREN_614 = CompiledChildren(('execute', 'store', 'result', 'block', 'targetPos'), (ARGUMENT_727, ), None)
+CHILDREN_615 = CompiledChildren(('execute', 'store', 'result', 'bossbar', 'id'), (), None)
+ARGUMENT_730 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_730)
+PARSE_730 = Parser.parsers[ARGUMENT_730.parser]
+START_730 = start_pattern(ARGUMENT_730)
+CHILDREN_616 = CompiledChildren(('execute', 'store', 'result', 'entity', 'target'), (ARGUMENT_730, ), None)
+ARGUMENT_731 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_731)
+PARSE_731 = Parser.parsers[ARGUMENT_731.parser]
+START_731 = start_pattern(ARGUMENT_731)
+CHILDREN_617 = CompiledChildren(('execute', 'store', 'result', 'score', 'targets'), (ARGUMENT_731, ), None)
+ARGUMENT_732 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_732)
+PARSE_732 = Parser.parsers[ARGUMENT_732.parser]
+START_732 = start_pattern(ARGUMENT_732)
+CHILDREN_618 = CompiledChildren(('execute', 'store', 'success', 'block', 'targetPos'), (ARGUMENT_732, ), None)
+CHILDREN_619 = CompiledChildren(('execute', 'store', 'success', 'bossbar', 'id'), (), None)
+ARGUMENT_735 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_735)
+PARSE_735 = Parser.parsers[ARGUMENT_735.parser]
+START_735 = start_pattern(ARGUMENT_735)
+CHILDREN_620 = CompiledChildren(('execute', 'store', 'success', 'entity', 'target'), (ARGUMENT_735, ), None)
+ARGUMENT_736 = CompiledArgument('objective', 'minecraft:objective', ArgumentContext.of({}), enter_736)
+PARSE_736 = Parser.parsers[ARGUMENT_736.parser]
+START_736 = start_pattern(ARGUMENT_736)
+CHILDREN_621 = CompiledChildren(('execute', 'store', 'success', 'score', 'targets'), (ARGUMENT_736, ), None)
+ARGUMENT_737 = CompiledArgument('destination', 'minecraft:block_pos', ArgumentContext.of({}), enter_737)
+PARSE_737 = Parser.parsers[ARGUMENT_737.parser]
+START_737 = start_pattern(ARGUMENT_737)
+CHILDREN_623 = CompiledChildren(('execute', 'unless', 'blocks', 'start', 'end'), (ARGUMENT_737, ), None)
+ARGUMENT_738 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_738)
+PARSE_738 = Parser.parsers[ARGUMENT_738.parser]
+START_738 = start_pattern(ARGUMENT_738)
+CHILDREN_624 = CompiledChildren(('execute', 'unless', 'data', 'block', 'sourcePos'), (ARGUMENT_738, ), True)
+ARGUMENT_739 = CompiledArgument('path', 'minecraft:nbt_path', ArgumentContext.of({}), enter_739)
+PARSE_739 = Parser.parsers[ARGUMENT_739.parser]
+START_739 = start_pattern(ARGUMENT_739)
+CHILDREN_625 = CompiledChildren(('execute', 'unless', 'data', 'entity', 'source'), (ARGUMENT_739, ), True)
+LITERALS_626 = {
+	'<': enter_740,
+	'<=': enter_741,
+	'=': enter_742,
+	'>': enter_743,
+	'>=': enter_744,
+	'matches': enter_745,
+}
+CHILDREN_626 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective'), (), None)
+ARGUMENT_746 = CompiledArgument('filter', 'minecraft:block_predicate', ArgumentContext.of({}), enter_746)
+PARSE_746 = Parser.parsers[ARGUMENT_746.parser]
+START_746 = start_pattern(ARGUMENT_746)
+CHILDREN_635 = CompiledChildren(('fill', 'from', 'to', 'block', 'replace'), (ARGUMENT_746, ), True)
+ARGUMENT_747 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_747)
+PARSE_747 = Parser.parsers[ARGUMENT_747.parser]
+START_747 = start_pattern(ARGUMENT_747)
+CHILDREN_636 = CompiledChildren(('loot', 'give', 'players', 'fish', 'loot_table'), (ARGUMENT_747, ), True)
+ARGUMENT_750 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_750)
+PARSE_750 = Parser.parsers[ARGUMENT_750.parser]
+START_750 = start_pattern(ARGUMENT_750)
+CHILDREN_639 = CompiledChildren(('loot', 'give', 'players', 'mine', 'pos'), (ARGUMENT_750, ), True)
+ARGUMENT_751 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_751)
+PARSE_751 = Parser.parsers[ARGUMENT_751.parser]
+START_751 = start_pattern(ARGUMENT_751)
+CHILDREN_640 = CompiledChildren(('loot', 'insert', 'targetPos', 'fish', 'loot_table'), (ARGUMENT_751, ), True)
+ARGUMENT_754 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_754)
+PARSE_754 = Parser.parsers[ARGUMENT_754.parser]
+START_754 = start_pattern(ARGUMENT_754)
+CHILDREN_643 = CompiledChildren(('loot', 'insert', 'targetPos', 'mine', 'pos'), (ARGUMENT_754, ), True)
+ARGUMENT_759 = CompiledArgument('count', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_759)
+PARSE_759 = Parser.parsers[ARGUMENT_759.parser]
+START_759 = start_pattern(ARGUMENT_759)
+CHILDREN_644 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot'), (ARGUMENT_759, ), None)
+ARGUMENT_764 = CompiledArgument('count', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_764)
+PARSE_764 = Parser.parsers[ARGUMENT_764.parser]
+START_764 = start_pattern(ARGUMENT_764)
+CHILDREN_645 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot'), (ARGUMENT_764, ), None)
+ARGUMENT_765 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_765)
+PARSE_765 = Parser.parsers[ARGUMENT_765.parser]
+START_765 = start_pattern(ARGUMENT_765)
+CHILDREN_646 = CompiledChildren(('loot', 'spawn', 'targetPos', 'fish', 'loot_table'), (ARGUMENT_765, ), True)
+ARGUMENT_768 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_768)
+PARSE_768 = Parser.parsers[ARGUMENT_768.parser]
+START_768 = start_pattern(ARGUMENT_768)
+CHILDREN_649 = CompiledChildren(('loot', 'spawn', 'targetPos', 'mine', 'pos'), (ARGUMENT_768, ), True)
+ARGUMENT_769 = CompiledArgument('count', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_769)
+PARSE_769 = Parser.parsers[ARGUMENT_769.parser]
+START_769 = start_pattern(ARGUMENT_769)
+CHILDREN_650 = CompiledChildren(('particle', 'name', 'pos', 'delta', 'speed'), (ARGUMENT_769, ), True)
+ARGUMENT_770 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_770)
+PARSE_770 = Parser.parsers[ARGUMENT_770.parser]
+START_770 = start_pattern(ARGUMENT_770)
+CHILDREN_651 = CompiledChildren(('playsound', 'sound', 'ambient', 'targets', 'pos'), (ARGUMENT_770, ), True)
+ARGUMENT_771 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_771)
+PARSE_771 = Parser.parsers[ARGUMENT_771.parser]
+START_771 = start_pattern(ARGUMENT_771)
+CHILDREN_652 = CompiledChildren(('playsound', 'sound', 'block', 'targets', 'pos'), (ARGUMENT_771, ), True)
+ARGUMENT_772 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_772)
+PARSE_772 = Parser.parsers[ARGUMENT_772.parser]
+START_772 = start_pattern(ARGUMENT_772)
+CHILDREN_653 = CompiledChildren(('playsound', 'sound', 'hostile', 'targets', 'pos'), (ARGUMENT_772, ), True)
+ARGUMENT_773 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_773)
+PARSE_773 = Parser.parsers[ARGUMENT_773.parser]
+START_773 = start_pattern(ARGUMENT_773)
+CHILDREN_654 = CompiledChildren(('playsound', 'sound', 'master', 'targets', 'pos'), (ARGUMENT_773, ), True)
+ARGUMENT_774 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_774)
+PARSE_774 = Parser.parsers[ARGUMENT_774.parser]
+START_774 = start_pattern(ARGUMENT_774)
+CHILDREN_655 = CompiledChildren(('playsound', 'sound', 'music', 'targets', 'pos'), (ARGUMENT_774, ), True)
+ARGUMENT_775 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_775)
+PARSE_775 = Parser.parsers[ARGUMENT_775.parser]
+START_775 = start_pattern(ARGUMENT_775)
+CHILDREN_656 = CompiledChildren(('playsound', 'sound', 'neutral', 'targets', 'pos'), (ARGUMENT_775, ), True)
+ARGUMENT_776 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_776)
+PARSE_776 = Parser.parsers[ARGUMENT_776.parser]
+START_776 = start_pattern(ARGUMENT_776)
+CHILDREN_657 = CompiledChildren(('playsound', 'sound', 'player', 'targets', 'pos'), (ARGUMENT_776, ), True)
+ARGUMENT_777 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_777)
+PARSE_777 = Parser.parsers[ARGUMENT_777.parser]
+START_777 = start_pattern(ARGUMENT_777)
+CHILDREN_658 = CompiledChildren(('playsound', 'sound', 'record', 'targets', 'pos'), (ARGUMENT_777, ), True)
+ARGUMENT_778 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_778)
+PARSE_778 = Parser.parsers[ARGUMENT_778.parser]
+START_778 = start_pattern(ARGUMENT_778)
+CHILDREN_659 = CompiledChildren(('playsound', 'sound', 'voice', 'targets', 'pos'), (ARGUMENT_778, ), True)
+ARGUMENT_779 = CompiledArgument('volume', 'brigadier:float', ArgumentContext.of({'min': 0.0}), enter_779)
+PARSE_779 = Parser.parsers[ARGUMENT_779.parser]
+START_779 = start_pattern(ARGUMENT_779)
+CHILDREN_660 = CompiledChildren(('playsound', 'sound', 'weather', 'targets', 'pos'), (ARGUMENT_779, ), True)
+ARGUMENT_780 = CompiledArgument('count', 'brigadier:integer', ArgumentContext.of({'min': 1, 'max': 64}), enter_780)
+PARSE_780 = Parser.parsers[ARGUMENT_780.parser]
+START_780 = start_pattern(ARGUMENT_780)
+CHILDREN_661 = CompiledChildren(('replaceitem', 'block', 'pos', 'slot', 'item'), (ARGUMENT_780, ), True)
+ARGUMENT_781 = CompiledArgument('count', 'brigadier:integer', ArgumentContext.of({'min': 1, 'max': 64}), enter_781)
+PARSE_781 = Parser.parsers[ARGUMENT_781.parser]
+START_781 = start_pattern(ARGUMENT_781)
+CHILDREN_662 = CompiledChildren(('replaceitem', 'entity', 'targets', 'slot', 'item'), (ARGUMENT_781, ), True)
+ARGUMENT_782 = CompiledArgument('displayName', 'minecraft:component', ArgumentContext.of({}), enter_782)
+PARSE_782 = Parser.parsers[ARGUMENT_782.parser]
+START_782 = start_pattern(ARGUMENT_782)
+CHILDREN_663 = CompiledChildren(('scoreboard', 'objectives', 'add', 'objective', 'criteria'), (ARGUMENT_782, ), True)
+ARGUMENT_783 = CompiledArgument('displayName', 'minecraft:component', ArgumentContext.of({}), enter_783)
+PARSE_783 = Parser.parsers[ARGUMENT_783.parser]
+START_783 = start_pattern(ARGUMENT_783)
+CHILDREN_664 = CompiledChildren(('scoreboard', 'objectives', 'modify', 'objective', 'displayname'), (ARGUMENT_783, ), True)
+CHILDREN_665 = CompiledChildren(('scoreboard', 'objectives', 'modify', 'objective', 'rendertype'), (), True)
+ARGUMENT_786 = CompiledArgument('score', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_786)
+PARSE_786 = Parser.parsers[ARGUMENT_786.parser]
+START_786 = start_pattern(ARGUMENT_786)
+CHILDREN_667 = CompiledChildren(('scoreboard', 'players', 'add', 'targets', 'objective'), (ARGUMENT_786, ), True)
+ARGUMENT_787 = CompiledArgument('operation', 'minecraft:operation', ArgumentContext.of({}), enter_787)
+PARSE_787 = Parser.parsers[ARGUMENT_787.parser]
+START_787 = start_pattern(ARGUMENT_787)
+CHILDREN_670 = CompiledChildren(('scoreboard', 'players', 'operation', 'targets', 'targetObjective'), (ARGUMENT_787, ), None)
+ARGUMENT_788 = CompiledArgument('score', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_788)
+PARSE_788 = Parser.parsers[ARGUMENT_788.parser]
+START_788 = start_pattern(ARGUMENT_788)
+CHILDREN_671 = CompiledChildren(('scoreboard', 'players', 'remove', 'targets', 'objective'), (ARGUMENT_788, ), True)
+ARGUMENT_789 = CompiledArgument('score', 'brigadier:integer', ArgumentContext.of({}), enter_789)
+PARSE_789 = Parser.parsers[ARGUMENT_789.parser]
+START_789 = start_pattern(ARGUMENT_789)
+CHILDREN_673 = CompiledChildren(('scoreboard', 'players', 'set', 'targets', 'objective'), (ARGUMENT_789, ), True)
+ARGUMENT_790 = CompiledArgument('targets', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'entities'}), enter_790)
+PARSE_790 = Parser.parsers[ARGUMENT_790.parser]
+START_790 = start_pattern(ARGUMENT_790)
+CHILDREN_674 = CompiledChildren(('spreadplayers', 'center', 'spreadDistance', 'maxRange', 'respectTeams'), (ARGUMENT_790, ), True)
+ARGUMENT_791 = CompiledArgument('facingEntity', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_791)
+PARSE_791 = Parser.parsers[ARGUMENT_791.parser]
+START_791 = start_pattern(ARGUMENT_791)
+CHILDREN_693 = CompiledChildren(('teleport', 'targets', 'location', 'facing', 'entity'), (ARGUMENT_791, ), True)
+ARGUMENT_792 = CompiledArgument('fadeOut', 'brigadier:integer', ArgumentContext.of({'min': 0}), enter_792)
+PARSE_792 = Parser.parsers[ARGUMENT_792.parser]
+START_792 = start_pattern(ARGUMENT_792)
+CHILDREN_695 = CompiledChildren(('title', 'targets', 'times', 'fadeIn', 'stay'), (ARGUMENT_792, ), True)
+CHILDREN_698 = CompiledChildren(('clone', 'begin', 'end', 'destination', 'filtered', 'filter'), (), True)
+CHILDREN_707 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'append'), (), None)
+ARGUMENT_798 = CompiledArgument('index', 'brigadier:integer', ArgumentContext.of({}), enter_798)
+PARSE_798 = Parser.parsers[ARGUMENT_798.parser]
+START_798 = start_pattern(ARGUMENT_798)
+CHILDREN_708 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'insert'), (ARGUMENT_798, ), None)
+CHILDREN_709 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'merge'), (), None)
+CHILDREN_710 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'prepend'), (), None)
+CHILDREN_711 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'set'), (), None)
+CHILDREN_712 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'append'), (), None)
+ARGUMENT_807 = CompiledArgument('index', 'brigadier:integer', ArgumentContext.of({}), enter_807)
+PARSE_807 = Parser.parsers[ARGUMENT_807.parser]
+START_807 = start_pattern(ARGUMENT_807)
+CHILDREN_713 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'insert'), (ARGUMENT_807, ), None)
+CHILDREN_714 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'merge'), (), None)
+CHILDREN_715 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'prepend'), (), None)
+CHILDREN_716 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'set'), (), None)
+ARGUMENT_814 = CompiledArgument('hideParticles', 'brigadier:bool', ArgumentContext.of({}), enter_814)
+PARSE_814 = Parser.parsers[ARGUMENT_814.parser]
+START_814 = start_pattern(ARGUMENT_814)
+CHILDREN_717 = CompiledChildren(('effect', 'give', 'targets', 'effect', 'seconds', 'amplifier'), (ARGUMENT_814, ), True)
+CHILDREN_718 = CompiledChildren(('execute', 'if', 'blocks', 'start', 'end', 'destination'), (), True)
+ARGUMENT_817 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_817)
+PARSE_817 = Parser.parsers[ARGUMENT_817.parser]
+START_817 = start_pattern(ARGUMENT_817)
+CHILDREN_721 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '<'), (ARGUMENT_817, ), None)
+ARGUMENT_818 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_818)
+PARSE_818 = Parser.parsers[ARGUMENT_818.parser]
+START_818 = start_pattern(ARGUMENT_818)
+CHILDREN_722 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '<='), (ARGUMENT_818, ), None)
+ARGUMENT_819 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_819)
+PARSE_819 = Parser.parsers[ARGUMENT_819.parser]
+START_819 = start_pattern(ARGUMENT_819)
+CHILDREN_723 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '='), (ARGUMENT_819, ), None)
+ARGUMENT_820 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_820)
+PARSE_820 = Parser.parsers[ARGUMENT_820.parser]
+START_820 = start_pattern(ARGUMENT_820)
+CHILDREN_724 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '>'), (ARGUMENT_820, ), None)
+ARGUMENT_821 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_821)
+PARSE_821 = Parser.parsers[ARGUMENT_821.parser]
+START_821 = start_pattern(ARGUMENT_821)
+CHILDREN_725 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '>='), (ARGUMENT_821, ), None)
+ARGUMENT_822 = CompiledArgument('range', 'minecraft:int_range', ArgumentContext.of({}), enter_822)
+PARSE_822 = Parser.parsers[ARGUMENT_822.parser]
+START_822 = start_pattern(ARGUMENT_822)
+CHILDREN_726 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', 'matches'), (ARGUMENT_822, ), True)
+LITERALS_727 = {
+	'byte': enter_823,
+	'double': enter_824,
+	'float': enter_825,
+	'int': enter_826,
+	'long': enter_827,
+	'short': enter_828,
+}
+CHILDREN_727 = CompiledChildren(('execute', 'store', 'result', 'block', 'targetPos', 'path'), (), None)
+LITERALS_730 = {
+	'byte': enter_829,
+	'double': enter_830,
+	'float': enter_831,
+	'int': enter_832,
+	'long': enter_833,
+	'short': enter_834,
+}
+CHILDREN_730 = CompiledChildren(('execute', 'store', 'result', 'entity', 'target', 'path'), (), None)
+LITERALS_732 = {
+	'byte': enter_835,
+	'double': enter_836,
+	'float': enter_837,
+	'int': enter_838,
+	'long': enter_839,
+	'short': enter_840,
+}
+CHILDREN_732 = CompiledChildren(('execute', 'store', 'success', 'block', 'targetPos', 'path'), (), None)
+LITERALS_735 = {
+	'byte': enter_841,
+	'double': enter_842,
+	'float': enter_843,
+	'int': enter_844,
+	'long': enter_845,
+	'short': enter_846,
+}
+CHILDREN_735 = CompiledChildren(('execute', 'store', 'success', 'entity', 'target', 'path'), (), None)
+CHILDREN_737 = CompiledChildren(('execute', 'unless', 'blocks', 'start', 'end', 'destination'), (), True)
+ARGUMENT_849 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_849)
+PARSE_849 = Parser.parsers[ARGUMENT_849.parser]
+START_849 = start_pattern(ARGUMENT_849)
+CHILDREN_740 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '<'), (ARGUMENT_849, ), None)
+ARGUMENT_850 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_850)
+PARSE_850 = Parser.parsers[ARGUMENT_850.parser]
+START_850 = start_pattern(ARGUMENT_850)
+CHILDREN_741 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '<='), (ARGUMENT_850, ), None)
+ARGUMENT_851 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_851)
+PARSE_851 = Parser.parsers[ARGUMENT_851.parser]
+START_851 = start_pattern(ARGUMENT_851)
+CHILDREN_742 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '='), (ARGUMENT_851, ), None)
+ARGUMENT_852 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_852)
+PARSE_852 = Parser.parsers[ARGUMENT_852.parser]
+START_852 = start_pattern(ARGUMENT_852)
+CHILDREN_743 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '>'), (ARGUMENT_852, ), None)
+ARGUMENT_853 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'single'}), enter_853)
+PARSE_853 = Parser.parsers[ARGUMENT_853.parser]
+START_853 = start_pattern(ARGUMENT_853)
+CHILDREN_744 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '>='), (ARGUMENT_853, ), None)
+ARGUMENT_854 = CompiledArgument('range', 'minecraft:int_range', ArgumentContext.of({}), enter_854)
+PARSE_854 = Parser.parsers[ARGUMENT_854.parser]
+START_854 = start_pattern(ARGUMENT_854)
+CHILDREN_745 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', 'matches'), (ARGUMENT_854, ), True)
+ARGUMENT_857 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_857)
+PARSE_857 = Parser.parsers[ARGUMENT_857.parser]
+START_857 = start_pattern(ARGUMENT_857)
+CHILDREN_747 = CompiledChildren(('loot', 'give', 'players', 'fish', 'loot_table', 'pos'), (ARGUMENT_857, ), True)
+ARGUMENT_860 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_860)
+PARSE_860 = Parser.parsers[ARGUMENT_860.parser]
+START_860 = start_pattern(ARGUMENT_860)
+CHILDREN_751 = CompiledChildren(('loot', 'insert', 'targetPos', 'fish', 'loot_table', 'pos'), (ARGUMENT_860, ), True)
+ARGUMENT_861 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_861)
+PARSE_861 = Parser.parsers[ARGUMENT_861.parser]
+START_861 = start_pattern(ARGUMENT_861)
+CHILDREN_755 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'fish'), (ARGUMENT_861, ), None)
+ARGUMENT_862 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_862)
+PARSE_862 = Parser.parsers[ARGUMENT_862.parser]
+START_862 = start_pattern(ARGUMENT_862)
+CHILDREN_756 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'kill'), (ARGUMENT_862, ), True)
+ARGUMENT_863 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_863)
+PARSE_863 = Parser.parsers[ARGUMENT_863.parser]
+START_863 = start_pattern(ARGUMENT_863)
+CHILDREN_757 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'loot'), (ARGUMENT_863, ), True)
+ARGUMENT_864 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_864)
+PARSE_864 = Parser.parsers[ARGUMENT_864.parser]
+START_864 = start_pattern(ARGUMENT_864)
+CHILDREN_758 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'mine'), (ARGUMENT_864, ), True)
+CHILDREN_759 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'count'), (), None)
+ARGUMENT_869 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_869)
+PARSE_869 = Parser.parsers[ARGUMENT_869.parser]
+START_869 = start_pattern(ARGUMENT_869)
+CHILDREN_760 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'fish'), (ARGUMENT_869, ), None)
+ARGUMENT_870 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_870)
+PARSE_870 = Parser.parsers[ARGUMENT_870.parser]
+START_870 = start_pattern(ARGUMENT_870)
+CHILDREN_761 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'kill'), (ARGUMENT_870, ), True)
+ARGUMENT_871 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_871)
+PARSE_871 = Parser.parsers[ARGUMENT_871.parser]
+START_871 = start_pattern(ARGUMENT_871)
+CHILDREN_762 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'loot'), (ARGUMENT_871, ), True)
+ARGUMENT_872 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_872)
+PARSE_872 = Parser.parsers[ARGUMENT_872.parser]
+START_872 = start_pattern(ARGUMENT_872)
+CHILDREN_763 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'mine'), (ARGUMENT_872, ), True)
+CHILDREN_764 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'count'), (), None)
+ARGUMENT_879 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_879)
+PARSE_879 = Parser.parsers[ARGUMENT_879.parser]
+START_879 = start_pattern(ARGUMENT_879)
+CHILDREN_765 = CompiledChildren(('loot', 'spawn', 'targetPos', 'fish', 'loot_table', 'pos'), (ARGUMENT_879, ), True)
+CHILDREN_769 = CompiledChildren(('particle', 'name', 'pos', 'delta', 'speed', 'count'), (), True)
+ARGUMENT_882 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_882)
+PARSE_882 = Parser.parsers[ARGUMENT_882.parser]
+START_882 = start_pattern(ARGUMENT_882)
+CHILDREN_770 = CompiledChildren(('playsound', 'sound', 'ambient', 'targets', 'pos', 'volume'), (ARGUMENT_882, ), True)
+ARGUMENT_883 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_883)
+PARSE_883 = Parser.parsers[ARGUMENT_883.parser]
+START_883 = start_pattern(ARGUMENT_883)
+CHILDREN_771 = CompiledChildren(('playsound', 'sound', 'block', 'targets', 'pos', 'volume'), (ARGUMENT_883, ), True)
+ARGUMENT_884 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_884)
+PARSE_884 = Parser.parsers[ARGUMENT_884.parser]
+START_884 = start_pattern(ARGUMENT_884)
+CHILDREN_772 = CompiledChildren(('playsound', 'sound', 'hostile', 'targets', 'pos', 'volume'), (ARGUMENT_884, ), True)
+ARGUMENT_885 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_885)
+PARSE_885 = Parser.parsers[ARGUMENT_885.parser]
+START_885 = start_pattern(ARGUMENT_885)
+CHILDREN_773 = CompiledChildren(('playsound', 'sound', 'master', 'targets', 'pos', 'volume'), (ARGUMENT_885, ), True)
+ARGUMENT_886 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_886)
+PARSE_886 = Parser.parsers[ARGUMENT_886.parser]
+START_886 = start_pattern(ARGUMENT_886)
+CHILDREN_774 = CompiledChildren(('playsound', 'sound', 'music', 'targets', 'pos', 'volume'), (ARGUMENT_886, ), True)
+ARGUMENT_887 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_887)
+PARSE_887 = Parser.parsers[ARGUMENT_887.parser]
+START_887 = start_pattern(ARGUMENT_887)
+CHILDREN_775 = CompiledChildren(('playsound', 'sound', 'neutral', 'targets', 'pos', 'volume'), (ARGUMENT_887, ), True)
+ARGUMENT_888 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_888)
+PARSE_888 = Parser.parsers[ARGUMENT_888.parser]
+START_888 = start_pattern(ARGUMENT_888)
+CHILDREN_776 = CompiledChildren(('playsound', 'sound', 'player', 'targets', 'pos', 'volume'), (ARGUMENT_888, ), True)
+ARGUMENT_889 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_889)
+PARSE_889 = Parser.parsers[ARGUMENT_889.parser]
+START_889 = start_pattern(ARGUMENT_889)
+CHILDREN_777 = CompiledChildren(('playsound', 'sound', 'record', 'targets', 'pos', 'volume'), (ARGUMENT_889, ), True)
+ARGUMENT_890 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_890)
+PARSE_890 = Parser.parsers[ARGUMENT_890.parser]
+START_890 = start_pattern(ARGUMENT_890)
+CHILDREN_778 = CompiledChildren(('playsound', 'sound', 'voice', 'targets', 'pos', 'volume'), (ARGUMENT_890, ), True)
+ARGUMENT_891 = CompiledArgument('pitch', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 2.0}), enter_891)
+PARSE_891 = Parser.parsers[ARGUMENT_891.parser]
+START_891 = start_pattern(ARGUMENT_891)
+CHILDREN_779 = CompiledChildren(('playsound', 'sound', 'weather', 'targets', 'pos', 'volume'), (ARGUMENT_891, ), True)
+ARGUMENT_892 = CompiledArgument('source', 'minecraft:score_holder', ArgumentContext.of({'amount': 'multiple'}), enter_892)
+PARSE_892 = Parser.parsers[ARGUMENT_892.parser]
+START_892 = start_pattern(ARGUMENT_892)
+CHILDREN_787 = CompiledChildren(('scoreboard', 'players', 'operation', 'targets', 'targetObjective', 'operation'), (ARGUMENT_892, ), None)
+ARGUMENT_893 = CompiledArgument('facingAnchor', 'minecraft:entity_anchor', ArgumentContext.of({}), enter_893)
+PARSE_893 = Parser.parsers[ARGUMENT_893.parser]
+START_893 = start_pattern(ARGUMENT_893)
+CHILDREN_791 = CompiledChildren(('teleport', 'targets', 'location', 'facing', 'entity', 'facingEntity'), (ARGUMENT_893, ), True)
+CHILDREN_796 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'append', 'from'), (), None)
+ARGUMENT_896 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_896)
+PARSE_896 = Parser.parsers[ARGUMENT_896.parser]
+START_896 = start_pattern(ARGUMENT_896)
+CHILDREN_797 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'append', 'value'), (ARGUMENT_896, ), True)
+CHILDREN_798 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'insert', 'index'), (), None)
+CHILDREN_799 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'merge', 'from'), (), None)
+ARGUMENT_901 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_901)
+PARSE_901 = Parser.parsers[ARGUMENT_901.parser]
+START_901 = start_pattern(ARGUMENT_901)
+CHILDREN_800 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'merge', 'value'), (ARGUMENT_901, ), True)
+CHILDREN_801 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'prepend', 'from'), (), None)
+ARGUMENT_904 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_904)
+PARSE_904 = Parser.parsers[ARGUMENT_904.parser]
+START_904 = start_pattern(ARGUMENT_904)
+CHILDREN_802 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'prepend', 'value'), (ARGUMENT_904, ), True)
+CHILDREN_803 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'set', 'from'), (), None)
+ARGUMENT_907 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_907)
+PARSE_907 = Parser.parsers[ARGUMENT_907.parser]
+START_907 = start_pattern(ARGUMENT_907)
+CHILDREN_804 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'set', 'value'), (ARGUMENT_907, ), True)
+CHILDREN_805 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'append', 'from'), (), None)
+ARGUMENT_910 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_910)
+PARSE_910 = Parser.parsers[ARGUMENT_910.parser]
+START_910 = start_pattern(ARGUMENT_910)
+CHILDREN_806 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'append', 'value'), (ARGUMENT_910, ), True)
+CHILDREN_807 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'insert', 'index'), (), None)
+CHILDREN_808 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'merge', 'from'), (), None)
+ARGUMENT_915 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_915)
+PARSE_915 = Parser.parsers[ARGUMENT_915.parser]
+START_915 = start_pattern(ARGUMENT_915)
+CHILDREN_809 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'merge', 'value'), (ARGUMENT_915, ), True)
+CHILDREN_810 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'prepend', 'from'), (), None)
+ARGUMENT_918 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_918)
+PARSE_918 = Parser.parsers[ARGUMENT_918.parser]
+START_918 = start_pattern(ARGUMENT_918)
+CHILDREN_811 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'prepend', 'value'), (ARGUMENT_918, ), True)
+CHILDREN_812 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'set', 'from'), (), None)
+ARGUMENT_921 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_921)
+PARSE_921 = Parser.parsers[ARGUMENT_921.parser]
+START_921 = start_pattern(ARGUMENT_921)
+CHILDREN_813 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'set', 'value'), (ARGUMENT_921, ), True)
+ARGUMENT_922 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_922)
+PARSE_922 = Parser.parsers[ARGUMENT_922.parser]
+START_922 = start_pattern(ARGUMENT_922)
+CHILDREN_817 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '<', 'source'), (ARGUMENT_922, ), True)
+ARGUMENT_923 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_923)
+PARSE_923 = Parser.parsers[ARGUMENT_923.parser]
+START_923 = start_pattern(ARGUMENT_923)
+CHILDREN_818 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '<=', 'source'), (ARGUMENT_923, ), True)
+ARGUMENT_924 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_924)
+PARSE_924 = Parser.parsers[ARGUMENT_924.parser]
+START_924 = start_pattern(ARGUMENT_924)
+CHILDREN_819 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '=', 'source'), (ARGUMENT_924, ), True)
+ARGUMENT_925 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_925)
+PARSE_925 = Parser.parsers[ARGUMENT_925.parser]
+START_925 = start_pattern(ARGUMENT_925)
+CHILDREN_820 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '>', 'source'), (ARGUMENT_925, ), True)
+ARGUMENT_926 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_926)
+PARSE_926 = Parser.parsers[ARGUMENT_926.parser]
+START_926 = start_pattern(ARGUMENT_926)
+CHILDREN_821 = CompiledChildren(('execute', 'if', 'score', 'target', 'targetObjective', '>=', 'source'), (ARGUMENT_926, ), True)
+ARGUMENT_927 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_927)
+PARSE_927 = Parser.parsers[ARGUMENT_927.parser]
+START_927 = start_pattern(ARGUMENT_927)
+CHILDREN_823 = CompiledChildren(('execute', 'store', 'result', 'block', 'targetPos', 'path', 'byte'), (ARGUMENT_927, ), None)
+ARGUMENT_928 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_928)
+PARSE_928 = Parser.parsers[ARGUMENT_928.parser]
+START_928 = start_pattern(ARGUMENT_928)
+CHILDREN_824 = CompiledChildren(('execute', 'store', 'result', 'block', 'targetPos', 'path', 'double'), (ARGUMENT_928, ), None)
+ARGUMENT_929 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_929)
+PARSE_929 = Parser.parsers[ARGUMENT_929.parser]
+START_929 = start_pattern(ARGUMENT_929)
+CHILDREN_825 = CompiledChildren(('execute', 'store', 'result', 'block', 'targetPos', 'path', 'float'), (ARGUMENT_929, ), None)
+ARGUMENT_930 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_930)
+PARSE_930 = Parser.parsers[ARGUMENT_930.parser]
+START_930 = start_pattern(ARGUMENT_930)
+CHILDREN_826 = CompiledChildren(('execute', 'store', 'result', 'block', 'targetPos', 'path', 'int'), (ARGUMENT_930, ), None)
+ARGUMENT_931 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_931)
+PARSE_931 = Parser.parsers[ARGUMENT_931.parser]
+START_931 = start_pattern(ARGUMENT_931)
+CHILDREN_827 = CompiledChildren(('execute', 'store', 'result', 'block', 'targetPos', 'path', 'long'), (ARGUMENT_931, ), None)
+ARGUMENT_932 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_932)
+PARSE_932 = Parser.parsers[ARGUMENT_932.parser]
+START_932 = start_pattern(ARGUMENT_932)
+CHILDREN_828 = CompiledChildren(('execute', 'store', 'result', 'block', 'targetPos', 'path', 'short'), (ARGUMENT_932, ), None)
+ARGUMENT_933 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_933)
+PARSE_933 = Parser.parsers[ARGUMENT_933.parser]
+START_933 = start_pattern(ARGUMENT_933)
+CHILDREN_829 = CompiledChildren(('execute', 'store', 'result', 'entity', 'target', 'path', 'byte'), (ARGUMENT_933, ), None)
+ARGUMENT_934 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_934)
+PARSE_934 = Parser.parsers[ARGUMENT_934.parser]
+START_934 = start_pattern(ARGUMENT_934)
+CHILDREN_830 = CompiledChildren(('execute', 'store', 'result', 'entity', 'target', 'path', 'double'), (ARGUMENT_934, ), None)
+ARGUMENT_935 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_935)
+PARSE_935 = Parser.parsers[ARGUMENT_935.parser]
+START_935 = start_pattern(ARGUMENT_935)
+CHILDREN_831 = CompiledChildren(('execute', 'store', 'result', 'entity', 'target', 'path', 'float'), (ARGUMENT_935, ), None)
+ARGUMENT_936 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_936)
+PARSE_936 = Parser.parsers[ARGUMENT_936.parser]
+START_936 = start_pattern(ARGUMENT_936)
+CHILDREN_832 = CompiledChildren(('execute', 'store', 'result', 'entity', 'target', 'path', 'int'), (ARGUMENT_936, ), None)
+ARGUMENT_937 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_937)
+PARSE_937 = Parser.parsers[ARGUMENT_937.parser]
+START_937 = start_pattern(ARGUMENT_937)
+CHILDREN_833 = CompiledChildren(('execute', 'store', 'result', 'entity', 'target', 'path', 'long'), (ARGUMENT_937, ), None)
+ARGUMENT_938 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_938)
+PARSE_938 = Parser.parsers[ARGUMENT_938.parser]
+START_938 = start_pattern(ARGUMENT_938)
+CHILDREN_834 = CompiledChildren(('execute', 'store', 'result', 'entity', 'target', 'path', 'short'), (ARGUMENT_938, ), None)
+ARGUMENT_939 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_939)
+PARSE_939 = Parser.parsers[ARGUMENT_939.parser]
+START_939 = start_pattern(ARGUMENT_939)
+CHILDREN_835 = CompiledChildren(('execute', 'store', 'success', 'block', 'targetPos', 'path', 'byte'), (ARGUMENT_939, ), None)
+ARGUMENT_940 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_940)
+PARSE_940 = Parser.parsers[ARGUMENT_940.parser]
+START_940 = start_pattern(ARGUMENT_940)
+CHILDREN_836 = CompiledChildren(('execute', 'store', 'success', 'block', 'targetPos', 'path', 'double'), (ARGUMENT_940, ), None)
+ARGUMENT_941 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_941)
+PARSE_941 = Parser.parsers[ARGUMENT_941.parser]
+START_941 = start_pattern(ARGUMENT_941)
+CHILDREN_837 = CompiledChildren(('execute', 'store', 'success', 'block', 'targetPos', 'path', 'float'), (ARGUMENT_941, ), None)
+ARGUMENT_942 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_942)
+PARSE_942 = Parser.parsers[ARGUMENT_942.parser]
+START_942 = start_pattern(ARGUMENT_942)
+CHILDREN_838 = CompiledChildren(('execute', 'store', 'success', 'block', 'targetPos', 'path', 'int'), (ARGUMENT_942, ), None)
+ARGUMENT_943 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_943)
+PARSE_943 = Parser.parsers[ARGUMENT_943.parser]
+START_943 = start_pattern(ARGUMENT_943)
+CHILDREN_839 = CompiledChildren(('execute', 'store', 'success', 'block', 'targetPos', 'path', 'long'), (ARGUMENT_943, ), None)
+ARGUMENT_944 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_944)
+PARSE_944 = Parser.parsers[ARGUMENT_944.parser]
+START_944 = start_pattern(ARGUMENT_944)
+CHILDREN_840 = CompiledChildren(('execute', 'store', 'success', 'block', 'targetPos', 'path', 'short'), (ARGUMENT_944, ), None)
+ARGUMENT_945 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_945)
+PARSE_945 = Parser.parsers[ARGUMENT_945.parser]
+START_945 = start_pattern(ARGUMENT_945)
+CHILDREN_841 = CompiledChildren(('execute', 'store', 'success', 'entity', 'target', 'path', 'byte'), (ARGUMENT_945, ), None)
+ARGUMENT_946 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_946)
+PARSE_946 = Parser.parsers[ARGUMENT_946.parser]
+START_946 = start_pattern(ARGUMENT_946)
+CHILDREN_842 = CompiledChildren(('execute', 'store', 'success', 'entity', 'target', 'path', 'double'), (ARGUMENT_946, ), None)
+ARGUMENT_947 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_947)
+PARSE_947 = Parser.parsers[ARGUMENT_947.parser]
+START_947 = start_pattern(ARGUMENT_947)
+CHILDREN_843 = CompiledChildren(('execute', 'store', 'success', 'entity', 'target', 'path', 'float'), (ARGUMENT_947, ), None)
+ARGUMENT_948 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_948)
+PARSE_948 = Parser.parsers[ARGUMENT_948.parser]
+START_948 = start_pattern(ARGUMENT_948)
+CHILDREN_844 = CompiledChildren(('execute', 'store', 'success', 'entity', 'target', 'path', 'int'), (ARGUMENT_948, ), None)
+ARGUMENT_949 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_949)
+PARSE_949 = Parser.parsers[ARGUMENT_949.parser]
+START_949 = start_pattern(ARGUMENT_949)
+CHILDREN_845 = CompiledChildren(('execute', 'store', 'success', 'entity', 'target', 'path', 'long'), (ARGUMENT_949, ), None)
+ARGUMENT_950 = CompiledArgument('scale', 'brigadier:double', ArgumentContext.of({}), enter_950)
+PARSE_950 = Parser.parsers[ARGUMENT_950.parser]
+START_950 = start_pattern(ARGUMENT_950)
+CHILDREN_846 = CompiledChildren(('execute', 'store', 'success', 'entity', 'target', 'path', 'short'), (ARGUMENT_950, ), None)
+ARGUMENT_951 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_951)
+PARSE_951 = Parser.parsers[ARGUMENT_951.parser]
+START_951 = start_pattern(ARGUMENT_951)
+CHILDREN_849 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '<', 'source'), (ARGUMENT_951, ), True)
+ARGUMENT_952 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_952)
+PARSE_952 = Parser.parsers[ARGUMENT_952.parser]
+START_952 = start_pattern(ARGUMENT_952)
+CHILDREN_850 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '<=', 'source'), (ARGUMENT_952, ), True)
+ARGUMENT_953 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_953)
+PARSE_953 = Parser.parsers[ARGUMENT_953.parser]
+START_953 = start_pattern(ARGUMENT_953)
+CHILDREN_851 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '=', 'source'), (ARGUMENT_953, ), True)
+ARGUMENT_954 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_954)
+PARSE_954 = Parser.parsers[ARGUMENT_954.parser]
+START_954 = start_pattern(ARGUMENT_954)
+CHILDREN_852 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '>', 'source'), (ARGUMENT_954, ), True)
+ARGUMENT_955 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_955)
+PARSE_955 = Parser.parsers[ARGUMENT_955.parser]
+START_955 = start_pattern(ARGUMENT_955)
+CHILDREN_853 = CompiledChildren(('execute', 'unless', 'score', 'target', 'targetObjective', '>=', 'source'), (ARGUMENT_955, ), True)
+ARGUMENT_956 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_956)
+PARSE_956 = Parser.parsers[ARGUMENT_956.parser]
+START_956 = start_pattern(ARGUMENT_956)
+CHILDREN_861 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'fish', 'loot_table'), (ARGUMENT_956, ), True)
+ARGUMENT_959 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_959)
+PARSE_959 = Parser.parsers[ARGUMENT_959.parser]
+START_959 = start_pattern(ARGUMENT_959)
+CHILDREN_864 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'mine', 'pos'), (ARGUMENT_959, ), True)
+ARGUMENT_960 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_960)
+PARSE_960 = Parser.parsers[ARGUMENT_960.parser]
+START_960 = start_pattern(ARGUMENT_960)
+CHILDREN_865 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'count', 'fish'), (ARGUMENT_960, ), None)
+ARGUMENT_961 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_961)
+PARSE_961 = Parser.parsers[ARGUMENT_961.parser]
+START_961 = start_pattern(ARGUMENT_961)
+CHILDREN_866 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'count', 'kill'), (ARGUMENT_961, ), True)
+ARGUMENT_962 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_962)
+PARSE_962 = Parser.parsers[ARGUMENT_962.parser]
+START_962 = start_pattern(ARGUMENT_962)
+CHILDREN_867 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'count', 'loot'), (ARGUMENT_962, ), True)
+ARGUMENT_963 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_963)
+PARSE_963 = Parser.parsers[ARGUMENT_963.parser]
+START_963 = start_pattern(ARGUMENT_963)
+CHILDREN_868 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'count', 'mine'), (ARGUMENT_963, ), True)
+ARGUMENT_964 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_964)
+PARSE_964 = Parser.parsers[ARGUMENT_964.parser]
+START_964 = start_pattern(ARGUMENT_964)
+CHILDREN_869 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'fish', 'loot_table'), (ARGUMENT_964, ), True)
+ARGUMENT_967 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_967)
+PARSE_967 = Parser.parsers[ARGUMENT_967.parser]
+START_967 = start_pattern(ARGUMENT_967)
+CHILDREN_872 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'mine', 'pos'), (ARGUMENT_967, ), True)
+ARGUMENT_968 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_968)
+PARSE_968 = Parser.parsers[ARGUMENT_968.parser]
+START_968 = start_pattern(ARGUMENT_968)
+CHILDREN_873 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'count', 'fish'), (ARGUMENT_968, ), None)
+ARGUMENT_969 = CompiledArgument('target', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_969)
+PARSE_969 = Parser.parsers[ARGUMENT_969.parser]
+START_969 = start_pattern(ARGUMENT_969)
+CHILDREN_874 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'count', 'kill'), (ARGUMENT_969, ), True)
+ARGUMENT_970 = CompiledArgument('loot_table', 'minecraft:resource_location', ArgumentContext.of({}), enter_970)
+PARSE_970 = Parser.parsers[ARGUMENT_970.parser]
+START_970 = start_pattern(ARGUMENT_970)
+CHILDREN_875 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'count', 'loot'), (ARGUMENT_970, ), True)
+ARGUMENT_971 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_971)
+PARSE_971 = Parser.parsers[ARGUMENT_971.parser]
+START_971 = start_pattern(ARGUMENT_971)
+CHILDREN_876 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'count', 'mine'), (ARGUMENT_971, ), True)
+ARGUMENT_972 = CompiledArgument('viewers', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_972)
+PARSE_972 = Parser.parsers[ARGUMENT_972.parser]
+START_972 = start_pattern(ARGUMENT_972)
+CHILDREN_880 = CompiledChildren(('particle', 'name', 'pos', 'delta', 'speed', 'count', 'force'), (ARGUMENT_972, ), True)
+ARGUMENT_973 = CompiledArgument('viewers', 'minecraft:entity', ArgumentContext.of({'amount': 'multiple', 'type': 'players'}), enter_973)
+PARSE_973 = Parser.parsers[ARGUMENT_973.parser]
+START_973 = start_pattern(ARGUMENT_973)
+CHILDREN_881 = CompiledChildren(('particle', 'name', 'pos', 'delta', 'speed', 'count', 'normal'), (ARGUMENT_973, ), True)
+ARGUMENT_974 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_974)
+PARSE_974 = Parser.parsers[ARGUMENT_974.parser]
+START_974 = start_pattern(ARGUMENT_974)
+CHILDREN_882 = CompiledChildren(('playsound', 'sound', 'ambient', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_974, ), True)
+ARGUMENT_975 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_975)
+PARSE_975 = Parser.parsers[ARGUMENT_975.parser]
+START_975 = start_pattern(ARGUMENT_975)
+CHILDREN_883 = CompiledChildren(('playsound', 'sound', 'block', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_975, ), True)
+ARGUMENT_976 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_976)
+PARSE_976 = Parser.parsers[ARGUMENT_976.parser]
+START_976 = start_pattern(ARGUMENT_976)
+CHILDREN_884 = CompiledChildren(('playsound', 'sound', 'hostile', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_976, ), True)
+ARGUMENT_977 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_977)
+PARSE_977 = Parser.parsers[ARGUMENT_977.parser]
+START_977 = start_pattern(ARGUMENT_977)
+CHILDREN_885 = CompiledChildren(('playsound', 'sound', 'master', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_977, ), True)
+ARGUMENT_978 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_978)
+PARSE_978 = Parser.parsers[ARGUMENT_978.parser]
+START_978 = start_pattern(ARGUMENT_978)
+CHILDREN_886 = CompiledChildren(('playsound', 'sound', 'music', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_978, ), True)
+ARGUMENT_979 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_979)
+PARSE_979 = Parser.parsers[ARGUMENT_979.parser]
+START_979 = start_pattern(ARGUMENT_979)
+CHILDREN_887 = CompiledChildren(('playsound', 'sound', 'neutral', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_979, ), True)
+ARGUMENT_980 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_980)
+PARSE_980 = Parser.parsers[ARGUMENT_980.parser]
+START_980 = start_pattern(ARGUMENT_980)
+CHILDREN_888 = CompiledChildren(('playsound', 'sound', 'player', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_980, ), True)
+ARGUMENT_981 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_981)
+PARSE_981 = Parser.parsers[ARGUMENT_981.parser]
+START_981 = start_pattern(ARGUMENT_981)
+CHILDREN_889 = CompiledChildren(('playsound', 'sound', 'record', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_981, ), True)
+ARGUMENT_982 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_982)
+PARSE_982 = Parser.parsers[ARGUMENT_982.parser]
+START_982 = start_pattern(ARGUMENT_982)
+CHILDREN_890 = CompiledChildren(('playsound', 'sound', 'voice', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_982, ), True)
+ARGUMENT_983 = CompiledArgument('minVolume', 'brigadier:float', ArgumentContext.of({'min': 0.0, 'max': 1.0}), enter_983)
+PARSE_983 = Parser.parsers[ARGUMENT_983.parser]
+START_983 = start_pattern(ARGUMENT_983)
+CHILDREN_891 = CompiledChildren(('playsound', 'sound', 'weather', 'targets', 'pos', 'volume', 'pitch'), (ARGUMENT_983, ), True)
+ARGUMENT_984 = CompiledArgument('sourceObjective', 'minecraft:objective', ArgumentContext.of({}), enter_984)
+PARSE_984 = Parser.parsers[ARGUMENT_984.parser]
+START_984 = start_pattern(ARGUMENT_984)
+CHILDREN_892 = CompiledChildren(('scoreboard', 'players', 'operation', 'targets', 'targetObjective', 'operation', 'source'), (ARGUMENT_984, ), True)
+ARGUMENT_985 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_985)
+PARSE_985 = Parser.parsers[ARGUMENT_985.parser]
+START_985 = start_pattern(ARGUMENT_985)
+CHILDREN_894 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'append', 'from', 'block'), (ARGUMENT_985, ), True)
+ARGUMENT_986 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_986)
+PARSE_986 = Parser.parsers[ARGUMENT_986.parser]
+START_986 = start_pattern(ARGUMENT_986)
+CHILDREN_895 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'append', 'from', 'entity'), (ARGUMENT_986, ), True)
+CHILDREN_897 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'insert', 'index', 'from'), (), None)
+ARGUMENT_989 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_989)
+PARSE_989 = Parser.parsers[ARGUMENT_989.parser]
+START_989 = start_pattern(ARGUMENT_989)
+CHILDREN_898 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'insert', 'index', 'value'), (ARGUMENT_989, ), True)
+ARGUMENT_990 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_990)
+PARSE_990 = Parser.parsers[ARGUMENT_990.parser]
+START_990 = start_pattern(ARGUMENT_990)
+CHILDREN_899 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'merge', 'from', 'block'), (ARGUMENT_990, ), True)
+ARGUMENT_991 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_991)
+PARSE_991 = Parser.parsers[ARGUMENT_991.parser]
+START_991 = start_pattern(ARGUMENT_991)
+CHILDREN_900 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'merge', 'from', 'entity'), (ARGUMENT_991, ), True)
+ARGUMENT_992 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_992)
+PARSE_992 = Parser.parsers[ARGUMENT_992.parser]
+START_992 = start_pattern(ARGUMENT_992)
+CHILDREN_902 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'prepend', 'from', 'block'), (ARGUMENT_992, ), True)
+ARGUMENT_993 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_993)
+PARSE_993 = Parser.parsers[ARGUMENT_993.parser]
+START_993 = start_pattern(ARGUMENT_993)
+CHILDREN_903 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'prepend', 'from', 'entity'), (ARGUMENT_993, ), True)
+ARGUMENT_994 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_994)
+PARSE_994 = Parser.parsers[ARGUMENT_994.parser]
+START_994 = start_pattern(ARGUMENT_994)
+CHILDREN_905 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'set', 'from', 'block'), (ARGUMENT_994, ), True)
+ARGUMENT_995 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_995)
+PARSE_995 = Parser.parsers[ARGUMENT_995.parser]
+START_995 = start_pattern(ARGUMENT_995)
+CHILDREN_906 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'set', 'from', 'entity'), (ARGUMENT_995, ), True)
+ARGUMENT_996 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_996)
+PARSE_996 = Parser.parsers[ARGUMENT_996.parser]
+START_996 = start_pattern(ARGUMENT_996)
+CHILDREN_908 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'append', 'from', 'block'), (ARGUMENT_996, ), True)
+ARGUMENT_997 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_997)
+PARSE_997 = Parser.parsers[ARGUMENT_997.parser]
+START_997 = start_pattern(ARGUMENT_997)
+CHILDREN_909 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'append', 'from', 'entity'), (ARGUMENT_997, ), True)
+CHILDREN_911 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'insert', 'index', 'from'), (), None)
+ARGUMENT_1000 = CompiledArgument('value', 'minecraft:nbt_tag', ArgumentContext.of({}), enter_1000)
+PARSE_1000 = Parser.parsers[ARGUMENT_1000.parser]
+START_1000 = start_pattern(ARGUMENT_1000)
+CHILDREN_912 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'insert', 'index', 'value'), (ARGUMENT_1000, ), True)
+ARGUMENT_1001 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_1001)
+PARSE_1001 = Parser.parsers[ARGUMENT_1001.parser]
+START_1001 = start_pattern(ARGUMENT_1001)
+CHILDREN_913 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'merge', 'from', 'block'), (ARGUMENT_1001, ), True)
+ARGUMENT_1002 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_1002)
+PARSE_1002 = Parser.parsers[ARGUMENT_1002.parser]
+START_1002 = start_pattern(ARGUMENT_1002)
+CHILDREN_914 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'merge', 'from', 'entity'), (ARGUMENT_1002, ), True)
+ARGUMENT_1003 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_1003)
+PARSE_1003 = Parser.parsers[ARGUMENT_1003.parser]
+START_1003 = start_pattern(ARGUMENT_1003)
+CHILDREN_916 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'prepend', 'from', 'block'), (ARGUMENT_1003, ), True)
+ARGUMENT_1004 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_1004)
+PARSE_1004 = Parser.parsers[ARGUMENT_1004.parser]
+START_1004 = start_pattern(ARGUMENT_1004)
+CHILDREN_917 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'prepend', 'from', 'entity'), (ARGUMENT_1004, ), True)
+ARGUMENT_1005 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_1005)
+PARSE_1005 = Parser.parsers[ARGUMENT_1005.parser]
+START_1005 = start_pattern(ARGUMENT_1005)
+CHILDREN_919 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'set', 'from', 'block'), (ARGUMENT_1005, ), True)
+ARGUMENT_1006 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_1006)
+PARSE_1006 = Parser.parsers[ARGUMENT_1006.parser]
+START_1006 = start_pattern(ARGUMENT_1006)
+CHILDREN_920 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'set', 'from', 'entity'), (ARGUMENT_1006, ), True)
+ARGUMENT_1009 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_1009)
+PARSE_1009 = Parser.parsers[ARGUMENT_1009.parser]
+START_1009 = start_pattern(ARGUMENT_1009)
+CHILDREN_956 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'fish', 'loot_table', 'pos'), (ARGUMENT_1009, ), True)
+ARGUMENT_1010 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_1010)
+PARSE_1010 = Parser.parsers[ARGUMENT_1010.parser]
+START_1010 = start_pattern(ARGUMENT_1010)
+CHILDREN_960 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'count', 'fish', 'loot_table'), (ARGUMENT_1010, ), True)
+ARGUMENT_1013 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_1013)
+PARSE_1013 = Parser.parsers[ARGUMENT_1013.parser]
+START_1013 = start_pattern(ARGUMENT_1013)
+CHILDREN_963 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'count', 'mine', 'pos'), (ARGUMENT_1013, ), True)
+ARGUMENT_1016 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_1016)
+PARSE_1016 = Parser.parsers[ARGUMENT_1016.parser]
+START_1016 = start_pattern(ARGUMENT_1016)
+CHILDREN_964 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'fish', 'loot_table', 'pos'), (ARGUMENT_1016, ), True)
+ARGUMENT_1017 = CompiledArgument('pos', 'minecraft:block_pos', ArgumentContext.of({}), enter_1017)
+PARSE_1017 = Parser.parsers[ARGUMENT_1017.parser]
+START_1017 = start_pattern(ARGUMENT_1017)
+CHILDREN_968 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'count', 'fish', 'loot_table'), (ARGUMENT_1017, ), True)
+ARGUMENT_1020 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_1020)
+PARSE_1020 = Parser.parsers[ARGUMENT_1020.parser]
+START_1020 = start_pattern(ARGUMENT_1020)
+CHILDREN_971 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'count', 'mine', 'pos'), (ARGUMENT_1020, ), True)
+ARGUMENT_1021 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1021)
+PARSE_1021 = Parser.parsers[ARGUMENT_1021.parser]
+START_1021 = start_pattern(ARGUMENT_1021)
+CHILDREN_985 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'append', 'from', 'block', 'sourcePos'), (ARGUMENT_1021, ), True)
+ARGUMENT_1022 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1022)
+PARSE_1022 = Parser.parsers[ARGUMENT_1022.parser]
+START_1022 = start_pattern(ARGUMENT_1022)
+CHILDREN_986 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'append', 'from', 'entity', 'source'), (ARGUMENT_1022, ), True)
+ARGUMENT_1023 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_1023)
+PARSE_1023 = Parser.parsers[ARGUMENT_1023.parser]
+START_1023 = start_pattern(ARGUMENT_1023)
+CHILDREN_987 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'insert', 'index', 'from', 'block'), (ARGUMENT_1023, ), True)
+ARGUMENT_1024 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_1024)
+PARSE_1024 = Parser.parsers[ARGUMENT_1024.parser]
+START_1024 = start_pattern(ARGUMENT_1024)
+CHILDREN_988 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'insert', 'index', 'from', 'entity'), (ARGUMENT_1024, ), True)
+ARGUMENT_1025 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1025)
+PARSE_1025 = Parser.parsers[ARGUMENT_1025.parser]
+START_1025 = start_pattern(ARGUMENT_1025)
+CHILDREN_990 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'merge', 'from', 'block', 'sourcePos'), (ARGUMENT_1025, ), True)
+ARGUMENT_1026 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1026)
+PARSE_1026 = Parser.parsers[ARGUMENT_1026.parser]
+START_1026 = start_pattern(ARGUMENT_1026)
+CHILDREN_991 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'merge', 'from', 'entity', 'source'), (ARGUMENT_1026, ), True)
+ARGUMENT_1027 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1027)
+PARSE_1027 = Parser.parsers[ARGUMENT_1027.parser]
+START_1027 = start_pattern(ARGUMENT_1027)
+CHILDREN_992 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'prepend', 'from', 'block', 'sourcePos'), (ARGUMENT_1027, ), True)
+ARGUMENT_1028 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1028)
+PARSE_1028 = Parser.parsers[ARGUMENT_1028.parser]
+START_1028 = start_pattern(ARGUMENT_1028)
+CHILDREN_993 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'prepend', 'from', 'entity', 'source'), (ARGUMENT_1028, ), True)
+ARGUMENT_1029 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1029)
+PARSE_1029 = Parser.parsers[ARGUMENT_1029.parser]
+START_1029 = start_pattern(ARGUMENT_1029)
+CHILDREN_994 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'set', 'from', 'block', 'sourcePos'), (ARGUMENT_1029, ), True)
+ARGUMENT_1030 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1030)
+PARSE_1030 = Parser.parsers[ARGUMENT_1030.parser]
+START_1030 = start_pattern(ARGUMENT_1030)
+CHILDREN_995 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'set', 'from', 'entity', 'source'), (ARGUMENT_1030, ), True)
+ARGUMENT_1031 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1031)
+PARSE_1031 = Parser.parsers[ARGUMENT_1031.parser]
+START_1031 = start_pattern(ARGUMENT_1031)
+CHILDREN_996 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'append', 'from', 'block', 'sourcePos'), (ARGUMENT_1031, ), True)
+ARGUMENT_1032 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1032)
+PARSE_1032 = Parser.parsers[ARGUMENT_1032.parser]
+START_1032 = start_pattern(ARGUMENT_1032)
+CHILDREN_997 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'append', 'from', 'entity', 'source'), (ARGUMENT_1032, ), True)
+ARGUMENT_1033 = CompiledArgument('sourcePos', 'minecraft:block_pos', ArgumentContext.of({}), enter_1033)
+PARSE_1033 = Parser.parsers[ARGUMENT_1033.parser]
+START_1033 = start_pattern(ARGUMENT_1033)
+CHILDREN_998 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'insert', 'index', 'from', 'block'), (ARGUMENT_1033, ), True)
+ARGUMENT_1034 = CompiledArgument('source', 'minecraft:entity', ArgumentContext.of({'amount': 'single', 'type': 'entities'}), enter_1034)
+PARSE_1034 = Parser.parsers[ARGUMENT_1034.parser]
+START_1034 = start_pattern(ARGUMENT_1034)
+CHILDREN_999 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'insert', 'index', 'from', 'entity'), (ARGUMENT_1034, ), True)
+ARGUMENT_1035 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1035)
+PARSE_1035 = Parser.parsers[ARGUMENT_1035.parser]
+START_1035 = start_pattern(ARGUMENT_1035)
+CHILDREN_1001 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'merge', 'from', 'block', 'sourcePos'), (ARGUMENT_1035, ), True)
+ARGUMENT_1036 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1036)
+PARSE_1036 = Parser.parsers[ARGUMENT_1036.parser]
+START_1036 = start_pattern(ARGUMENT_1036)
+CHILDREN_1002 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'merge', 'from', 'entity', 'source'), (ARGUMENT_1036, ), True)
+ARGUMENT_1037 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1037)
+PARSE_1037 = Parser.parsers[ARGUMENT_1037.parser]
+START_1037 = start_pattern(ARGUMENT_1037)
+CHILDREN_1003 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'prepend', 'from', 'block', 'sourcePos'), (ARGUMENT_1037, ), True)
+ARGUMENT_1038 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1038)
+PARSE_1038 = Parser.parsers[ARGUMENT_1038.parser]
+START_1038 = start_pattern(ARGUMENT_1038)
+CHILDREN_1004 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'prepend', 'from', 'entity', 'source'), (ARGUMENT_1038, ), True)
+ARGUMENT_1039 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1039)
+PARSE_1039 = Parser.parsers[ARGUMENT_1039.parser]
+START_1039 = start_pattern(ARGUMENT_1039)
+CHILDREN_1005 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'set', 'from', 'block', 'sourcePos'), (ARGUMENT_1039, ), True)
+ARGUMENT_1040 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1040)
+PARSE_1040 = Parser.parsers[ARGUMENT_1040.parser]
+START_1040 = start_pattern(ARGUMENT_1040)
+CHILDREN_1006 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'set', 'from', 'entity', 'source'), (ARGUMENT_1040, ), True)
+ARGUMENT_1043 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_1043)
+PARSE_1043 = Parser.parsers[ARGUMENT_1043.parser]
+START_1043 = start_pattern(ARGUMENT_1043)
+CHILDREN_1010 = CompiledChildren(('loot', 'replace', 'block', 'targetPos', 'slot', 'count', 'fish', 'loot_table', 'pos'), (ARGUMENT_1043, ), True)
+ARGUMENT_1046 = CompiledArgument('tool', 'minecraft:item_stack', ArgumentContext.of({}), enter_1046)
+PARSE_1046 = Parser.parsers[ARGUMENT_1046.parser]
+START_1046 = start_pattern(ARGUMENT_1046)
+CHILDREN_1017 = CompiledChildren(('loot', 'replace', 'entity', 'entities', 'slot', 'count', 'fish', 'loot_table', 'pos'), (ARGUMENT_1046, ), True)
+ARGUMENT_1047 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1047)
+PARSE_1047 = Parser.parsers[ARGUMENT_1047.parser]
+START_1047 = start_pattern(ARGUMENT_1047)
+CHILDREN_1023 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'insert', 'index', 'from', 'block', 'sourcePos'), (ARGUMENT_1047, ), True)
+ARGUMENT_1048 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1048)
+PARSE_1048 = Parser.parsers[ARGUMENT_1048.parser]
+START_1048 = start_pattern(ARGUMENT_1048)
+CHILDREN_1024 = CompiledChildren(('data', 'modify', 'block', 'targetPos', 'targetPath', 'insert', 'index', 'from', 'entity', 'source'), (ARGUMENT_1048, ), True)
+ARGUMENT_1049 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1049)
+PARSE_1049 = Parser.parsers[ARGUMENT_1049.parser]
+START_1049 = start_pattern(ARGUMENT_1049)
+CHILDREN_1033 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'insert', 'index', 'from', 'block', 'sourcePos'), (ARGUMENT_1049, ), True)
+ARGUMENT_1050 = CompiledArgument('sourcePath', 'minecraft:nbt_path', ArgumentContext.of({}), enter_1050)
+PARSE_1050 = Parser.parsers[ARGUMENT_1050.parser]
+START_1050 = start_pattern(ARGUMENT_1050)
+CHILDREN_1034 = CompiledChildren(('data', 'modify', 'entity', 'target', 'targetPath', 'insert', 'index', 'from', 'entity', 'source'), (ARGUMENT_1050, ), True)
+ROOT = enter_0
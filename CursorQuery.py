@@ -0,0 +1,279 @@
+import re, time
+from array import array
+from .Parser import Parser, ParseBudgetExceeded, ReorderedCandidates, REDIRECT_FRAME, COMMAND_FRAME, CHILDREN_FRAME
+from .CommandGraph import COMMAND_GRAPH
+
+# Answers which node of the command tree a cursor is in and what it expects there, for
+# completions, signature hints and hover, without highlighting the line into a view.  Only the
+# text before the cursor is parsed.
+#
+# Every answer comes with a checkpoint of the walk, taken at the start of the token the cursor
+# is in.  A later query on a line that still starts with the same text, like the same line
+# with one more character typed, resumes the walk there instead of starting from column 0.
+# A checkpoint is made of lists, strings and numbers only, so it can be kept anywhere, pickled
+# or sent to a worker as JSON
+
+COMMAND_START = re.compile("[\t ]*/?")
+
+# Nodes are kept in checkpoints by their path and whether they're executable, which tells the
+# variant of a node a redirect leads to apart from the node itself
+def node_key(node):
+	return [list(node.path), node.executable]
+
+def index_nodes(root):
+	nodes = {} # (path, executable) -> CommandNode
+	pending = [root]
+	while len(pending) > 0:
+		node = pending.pop()
+		key = (node.path, node.executable)
+		if key in nodes:
+			continue
+		nodes[key] = node
+		if node.redirect_node != None:
+			pending.append(node.redirect_node)
+		pending.extend(node.literals.values())
+		pending.extend(node.arguments)
+	return nodes
+
+NODES = index_nodes(COMMAND_GRAPH)
+
+# Returns the node a key from a checkpoint stands for, or None if the command tree has no such
+# node any more
+def find_node(key):
+	return NODES.get((tuple(key[0]), key[1]))
+
+class CursorInfo:
+
+	def __init__(self, node, start, partial, expected, checkpoint, complete):
+		self.node = node # the CommandNode the token at the cursor is a child of
+		self.start = start # column the token at the cursor starts at
+		self.partial = partial # the token up to the cursor, "" right after whitespace
+		self.expected = expected # the children of node the token can still turn out to be, literals first
+		self.checkpoint = checkpoint # for resuming a query on the same line later, None if there isn't one
+		self.complete = complete # False if the time budget ran out first, then the token is the furthest one found by then
+
+	# The argument parsers the token can be parsed with, in the order they would be tried
+	def expected_parsers(self):
+		return [child.parser for child in self.expected if child.type == "argument"]
+
+# Returns the CursorInfo for column in line, or None if the cursor isn't in a command, like on a
+# comment line.  If the line takes longer than the parser's time budget the answer isn't
+# complete, see CursorInfo.  checkpoint comes from an earlier query and is only used if the
+# line still starts with the text it was taken on
+def query_cursor(line, column, checkpoint=None, *, custom_tags=False):
+	return CursorParser(custom_tags).query(line[:column], checkpoint)
+
+# A parser that keeps track of the token the end of its line is in while walking it.  That's
+# the child of the node entered last, or if a branch that failed got further, the one it got
+# furthest in
+#
+# A line ending in whitespace is past its last token, so the token at its end is an empty one
+# after that.  The first parse that gets there can end in a node without children, like the
+# destination of "tp @s ", when another candidate has children to offer there, like targets.
+# So on such a line a success only ends the walk once a node with children got to the end, and
+# the other candidates are tried until then
+class CursorParser(Parser):
+
+	def __init__(self, allow_custom_tags=False):
+		Parser.__init__(self, allow_custom_tags)
+		self.active = None # (node, start column) of the token furthest along the line
+		self.active_leaf = False # whether the active token comes after a node without children
+		self.entered = None # the node the walk entered last
+		self.saved = None # (prefix length, node, column) of the last checkpoint taken
+		self.saved_walk = None # (stack, depth, token mark) of the last checkpoint until it's kept, see keep_saved_walk
+		self.saved_frames = None
+		self.saved_tokens = None
+		self.clean = True # whether nothing has failed yet, see save_checkpoint
+
+	def query(self, text, checkpoint=None):
+		self.take_tokens()
+		self.memo = {}
+		self.active = None
+		self.active_leaf = False
+		self.entered = None
+		self.saved = None
+		self.saved_walk = None
+		self.clean = True
+		self.region_begin = 0
+		self.deadline = time.perf_counter() + self.time_budget
+		complete = True
+		try:
+			if not self.resume(text, checkpoint):
+				self.highlight(self.root, text, 0, 0)
+		except ParseBudgetExceeded:
+			# Answered with the furthest token found so far, but a walk cut short can't be
+			# resumed from
+			complete = False
+			self.saved = None
+			self.saved_walk = None
+		finally:
+			self.deadline = None
+			self.keep_saved_walk()
+			self.take_tokens()
+
+		if self.active == None:
+			return None
+		node, start = self.active
+		partial = text[start:]
+		return CursorInfo(node, start, partial, self.expected_children(node, partial), self.checkpoint(), complete)
+
+	def expected_children(self, node, partial):
+		expected = [literal_node for name, literal_node in node.literals.items() if name.startswith(partial)]
+		for argument_node in node.arguments:
+			if partial == "" or self.can_start(argument_node, partial[0]):
+				expected.append(argument_node)
+		return tuple(expected)
+
+	def enter_command(self, stack, commands):
+		if not self.regex["comment"].match(self.string, self.current):
+			self.reached(COMMAND_START.match(self.string, self.current).end(), self.root)
+		return self.enter(Parser.enter_command(self, stack, commands))
+
+	def enter_children(self, stack, node):
+		start = self.skip_spaces(self.current)
+		if start > self.current and self.reached(start, node):
+			self.save_checkpoint(stack, node)
+		return self.enter(Parser.enter_children(self, stack, node))
+
+	def follow_redirect(self, stack, target):
+		return self.enter(Parser.follow_redirect(self, stack, target))
+
+	# The node entered last is the one ending here, if there's whitespace between it and the end
+	# of the line the empty token at the end comes after it
+	def end_of_command(self, executable):
+		start = self.skip_spaces(self.current)
+		if start > self.current and start == len(self.string):
+			self.reached(start, self.entered, True)
+		return Parser.end_of_command(self, executable)
+
+	# Returns outcome after remembering it as the node entered last if it's a node
+	def enter(self, outcome):
+		if outcome is not True and outcome is not False and outcome != None:
+			self.entered = outcome
+		return outcome
+
+	def skip_spaces(self, start):
+		while start < len(self.string) and self.string[start] in " \t":
+			start += 1
+		return start
+
+	# Makes the token starting at start the active one if it's further along than the active
+	# one, or as far along and it comes after a node with children where the active one doesn't.
+	# Returns whether it is
+	def reached(self, start, node, leaf=False):
+		if self.active != None and (start < self.active[1] or start == self.active[1] and (leaf or not self.active_leaf)):
+			return False
+		self.active = (node, start)
+		self.active_leaf = leaf
+		return True
+
+	def next_child(self, frame):
+		child = self.enter(Parser.next_child(self, frame))
+		if child == None or frame[5] != 0:
+			self.clean = False
+		return child
+
+	def hand_up(self, stack, success):
+		self.keep_saved_walk()
+		if success and self.string[-1:] in (" ", "\t") and (self.active == None or self.active[1] < len(self.string) or self.active_leaf):
+			success = False
+		if not success:
+			self.clean = False
+		return Parser.hand_up(self, stack, success)
+
+	# How an argument parses can depend on where the line ends.  A particle can take an item
+	# after it, and a selector cut off in the middle ends wherever the line does.  So the
+	# walk up to a token can only be taken as final once the token has started and nothing
+	# has failed yet, since a failed argument might have matched with more of the line there
+	#
+	# A checkpoint is taken at every token while that holds, so only where the walk is gets
+	# noted here, see keep_saved_walk
+	def save_checkpoint(self, stack, node):
+		if not self.clean or self.active[1] >= len(self.string):
+			return
+		self.saved = (self.active[1], node, self.current)
+		self.saved_walk = (stack, len(stack), self.mark())
+
+	# Until something is handed up the walk only pushes frames and adds tokens, so the frames
+	# under the depth of the last checkpoint and the tokens before its mark are still the ones
+	# it was taken on.  They're copied once, before the first hand up or when the walk stops
+	def keep_saved_walk(self):
+		if self.saved_walk == None:
+			return
+		stack, depth, mark = self.saved_walk
+		self.saved_frames = [list(frame) if frame[0] == CHILDREN_FRAME else frame for frame in stack[:depth]]
+		self.saved_tokens = self.tokens[:mark]
+		self.saved_walk = None
+
+	# Returns the last checkpoint taken as plain data
+	def checkpoint(self):
+		if self.saved == None:
+			return None
+		prefix_length, node, column = self.saved
+		return {
+			"prefix": self.string[:prefix_length],
+			"custom_tags": self.custom_tags,
+			"node": node_key(node),
+			"column": column,
+			"stack": [self.encode_frame(frame) for frame in self.saved_frames],
+			"tokens": list(self.saved_tokens)
+		}
+
+	# Picks up the walk on text from checkpoint.  Returns False without doing anything if the
+	# checkpoint isn't for text
+	def resume(self, text, checkpoint):
+		if checkpoint == None or checkpoint["custom_tags"] != self.custom_tags or not text.startswith(checkpoint["prefix"]):
+			return False
+		node = find_node(checkpoint["node"])
+		stack = [self.decode_frame(frame) for frame in checkpoint["stack"]]
+		if node == None or None in stack:
+			return False
+
+		self.string = text
+		self.current = checkpoint["column"]
+		self.tokens = array("i", checkpoint["tokens"])
+		self.walk(stack, node)
+		return True
+
+	def encode_frame(self, frame):
+		if frame[0] == REDIRECT_FRAME:
+			target, column = frame[1]
+			return [REDIRECT_FRAME, node_key(target), column, frame[2]]
+		elif frame[0] == COMMAND_FRAME:
+			return list(frame)
+		candidates = frame[4]
+		tree_order = None
+		if candidates.__class__ is ReorderedCandidates:
+			tree_order = [node_key(candidate) for candidate in candidates.tree_order]
+		if candidates != None:
+			candidates = [node_key(candidate) for candidate in candidates]
+		return [CHILDREN_FRAME, node_key(frame[1]), frame[2], frame[3], candidates, frame[5], tree_order]
+
+	# Returns the frame encode_frame made frame from, or None if one of its nodes is gone
+	def decode_frame(self, frame):
+		if frame[0] == REDIRECT_FRAME:
+			target = find_node(frame[1])
+			if target == None:
+				return None
+			return (REDIRECT_FRAME, (target, frame[2]), frame[3])
+		elif frame[0] == COMMAND_FRAME:
+			return (COMMAND_FRAME, frame[1], frame[2])
+
+		node = find_node(frame[1])
+		candidates = self.decode_candidates(frame[4])
+		tree_order = self.decode_candidates(frame[6])
+		if node == None or candidates == False or tree_order == False:
+			return None
+		if tree_order != None:
+			candidates = ReorderedCandidates(candidates)
+			candidates.tree_order = tree_order
+		return [CHILDREN_FRAME, node, frame[2], frame[3], candidates, frame[5]]
+
+	# Returns the nodes of a list of keys, or False if one of them is gone
+	def decode_candidates(self, keys):
+		if keys == None:
+			return None
+		candidates = tuple(find_node(key) for key in keys)
+		if None in candidates:
+			return False
+		return candidates
@@ -0,0 +1,75 @@
+import sublime
+from .HighlightState import HighlightState
+
+# Runs highlight passes for one view on sublime's async thread.  Bursts of modifications are
+# coalesced into a single pass, and a pass whose buffer changed before it could be applied is
+# thrown away since the modification that changed it has already scheduled a newer one.
+# Only the lines around the visible region are parsed right away, the rest of the file is
+# parsed in time sliced chunks that always start from whatever is currently on screen
+class HighlightScheduler:
+	visible_margin = 50 # lines above and below the visible region highlighted with it
+	chunk_time = 0.02   # seconds spent parsing per chunk before handing control back
+	chunk_delay = 5     # milliseconds between chunks
+
+	def __init__(self, view):
+		self.view = view
+		self.state = HighlightState(view)
+		self.generation = 0
+		self.applied_change_count = None
+		self.scheduled_key = None # (change count, settings generation) of the last scheduled pass
+
+	def schedule(self, allow_custom_tags, delay=0):
+		self.generation += 1
+		generation = self.generation
+		sublime.set_timeout_async(lambda: self.run_pass(generation, allow_custom_tags), delay)
+
+	def run_pass(self, generation, allow_custom_tags):
+		if generation != self.generation or not self.view.is_valid():
+			return
+
+		change_count = self.view.change_count()
+		buffer_text = self.view.substr(sublime.Region(0, self.view.size()))
+		highlight_pass = self.state.plan(buffer_text, allow_custom_tags, self.priority_rows())
+		if highlight_pass != None:
+			sublime.set_timeout(lambda: self.apply_pass(highlight_pass, change_count), 0)
+			return
+
+		# The text is what the last pass left, like after an edit that was undone, but this
+		# pass's generation has stopped the chunks of that one so they're picked back up here
+		self.applied_change_count = change_count
+		self.continue_chunks()
+
+	def run_chunk(self, generation):
+		if generation != self.generation or not self.view.is_valid():
+			return # A newer pass is scheduled and will pick the chunks back up
+
+		change_count = self.view.change_count()
+		if change_count != self.applied_change_count:
+			return
+
+		highlight_pass = self.state.plan_pending(self.priority_rows(), self.chunk_time)
+		if highlight_pass != None:
+			sublime.set_timeout(lambda: self.apply_pass(highlight_pass, change_count), 0)
+
+	def apply_pass(self, highlight_pass, change_count):
+		if not self.view.is_valid() or self.view.change_count() != change_count:
+			return
+
+		if not self.state.apply(highlight_pass):
+			self.schedule(highlight_pass.allow_custom_tags)
+			return
+
+		self.applied_change_count = change_count
+		self.continue_chunks()
+
+	def continue_chunks(self):
+		if self.state.pending_lines > 0:
+			generation = self.generation
+			sublime.set_timeout_async(lambda: self.run_chunk(generation), self.chunk_delay)
+
+	# Returns the (first, last) rows of the visible region plus the margin around it
+	def priority_rows(self):
+		visible_region = self.view.visible_region()
+		first_row = self.view.rowcol(visible_region.begin())[0]
+		last_row = self.view.rowcol(visible_region.end())[0]
+		return (first_row - self.visible_margin, last_row + self.visible_margin)
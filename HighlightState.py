@@ -0,0 +1,192 @@
+import time
+from .Tokenizer import Tokenizer, LINE_PATTERN, COMMAND_LINE
+from .LineCache import LINE_CACHE
+from .RegionManager import RegionManager
+
+# Stands in for the tokens of a line that is waiting to be parsed by a later chunk
+PENDING = object()
+
+class HighlightPass:
+	__slots__ = ("base_lines", "first", "old_end", "lines", "replaced", "dirty_rows", "redraw_rows", "removed", "pending_change", "allow_custom_tags")
+
+	def __init__(self, base_lines, first, old_end, allow_custom_tags):
+		self.base_lines = base_lines
+		self.first = first
+		self.old_end = old_end
+		self.lines = []      # line states replacing base_lines[first:old_end]
+		self.replaced = []   # (row, line state) replacing single lines after the above
+		self.dirty_rows = [] # rows, after replacing, whose regions changed
+		self.redraw_rows = [] # rows, after replacing, whose regions have to be sent again regardless
+		self.removed = []    # line states that no longer exist
+		self.pending_change = 0
+		self.allow_custom_tags = allow_custom_tags
+
+class HighlightState:
+
+	def __init__(self, view):
+		self.view = view
+		self.regions = RegionManager(view)
+		self.tokenizer = Tokenizer()
+		self.lines = [] # (line_id, line_text, line relative token stream or PENDING)
+		self.pending_lines = 0
+		self.allow_custom_tags = None
+		self.next_line_id = 0
+
+	# Parses the lines of buffer_text that differ from the last applied pass without touching
+	# the view, so it can run off the main thread.  Changed lines outside of priority_rows
+	# (first, last) are left PENDING for plan_pending.  Returns None when there is nothing to do
+	def plan(self, buffer_text, allow_custom_tags, priority_rows):
+		new_lines = buffer_text.split("\n")
+		old_lines = self.lines
+
+		# Every line parses differently once the tags setting changes, even the unchanged ones
+		reparse_all = allow_custom_tags != self.allow_custom_tags
+		if reparse_all:
+			first, old_end, new_end = 0, len(old_lines), len(new_lines)
+		else:
+			first, old_end, new_end = self.changed_lines(old_lines, new_lines)
+
+		if first == old_end and first == new_end:
+			return None
+
+		highlight_pass = HighlightPass(old_lines, first, old_end, allow_custom_tags)
+		self.tokenizer.reset(allow_custom_tags)
+
+		# The changed lines are classified in one go, blank and comment lines never need the parser
+		region_start = sum(map(len, new_lines[:first])) + first
+		line_matches = LINE_PATTERN.finditer(buffer_text, region_start)
+
+		# When no lines were added or removed, lines in the changed span that still match
+		# are sitting exactly where they were and can be skipped
+		same_line_count = old_end == new_end
+		reuse_unchanged = same_line_count and not reparse_all
+		first_row, last_row = priority_rows
+		for i, line_match in zip(range(first, new_end), line_matches):
+			line = new_lines[i]
+			if i < old_end:
+				old_line = old_lines[i]
+				if reuse_unchanged and old_line[1] == line:
+					highlight_pass.lines.append(old_line)
+					continue
+				line_id = old_line[0]
+				if old_line[2] is PENDING:
+					highlight_pass.pending_change -= 1
+			else:
+				line_id = self.new_line_id()
+
+			line_kind = line_match.lastindex
+			if line_kind == COMMAND_LINE and (i < first_row or i > last_row):
+				line_state = (line_id, line, PENDING)
+				highlight_pass.pending_change += 1
+			else:
+				line_state = (line_id, line, self.highlight_line(line, i, line_kind, allow_custom_tags))
+
+			highlight_pass.lines.append(line_state)
+			highlight_pass.dirty_rows.append(i)
+
+		for line_state in old_lines[new_end:old_end]:
+			if line_state[2] is PENDING:
+				highlight_pass.pending_change -= 1
+			highlight_pass.removed.append(line_state)
+
+		# Adding or removing a line break right at the edge of a neighbouring line can leave
+		# that line's regions stretched or collapsed, so they get redrawn along with the rest
+		if not same_line_count:
+			if first > 0:
+				highlight_pass.redraw_rows.append(first - 1)
+			if new_end < len(new_lines):
+				highlight_pass.redraw_rows.append(new_end)
+
+		return highlight_pass
+
+	# Parses PENDING lines, starting with the ones in priority_rows and working outwards from
+	# there, until time_budget seconds have passed.  Returns None if no lines are pending
+	def plan_pending(self, priority_rows, time_budget):
+		if self.pending_lines == 0:
+			return None
+
+		lines = self.lines
+		highlight_pass = HighlightPass(lines, 0, 0, self.allow_custom_tags)
+		self.tokenizer.reset(self.allow_custom_tags)
+		start_time = time.perf_counter()
+
+		for i in self.rows_by_priority(len(lines), priority_rows):
+			line_id, line, tokens = lines[i]
+			if tokens is not PENDING:
+				continue
+
+			highlight_pass.replaced.append((i, (line_id, line, self.highlight_line(line, i, COMMAND_LINE, self.allow_custom_tags))))
+			highlight_pass.dirty_rows.append(i)
+			highlight_pass.pending_change -= 1
+
+			if time.perf_counter() - start_time >= time_budget:
+				break
+
+		return highlight_pass
+
+	# Yields every row in [0, line_count), the ones in priority_rows first and then the rest
+	# alternating below and above them so the closest rows come first
+	@staticmethod
+	def rows_by_priority(line_count, priority_rows):
+		first_row = max(0, min(priority_rows[0], line_count))
+		last_row = max(first_row - 1, min(priority_rows[1], line_count - 1))
+		yield from range(first_row, last_row + 1)
+
+		below = last_row + 1
+		above = first_row - 1
+		while below < line_count or above >= 0:
+			if below < line_count:
+				yield below
+				below += 1
+			if above >= 0:
+				yield above
+				above -= 1
+
+	# Pushes a planned pass to the view.  Returns False if another pass was applied after
+	# this one was planned, in which case it has to be planned again
+	def apply(self, highlight_pass):
+		if highlight_pass.base_lines is not self.lines:
+			return False
+
+		lines = list(self.lines)
+		lines[highlight_pass.first:highlight_pass.old_end] = highlight_pass.lines
+		for i, line_state in highlight_pass.replaced:
+			lines[i] = line_state
+		self.lines = lines
+		self.pending_lines += highlight_pass.pending_change
+		self.regions.update(lines, highlight_pass.dirty_rows, highlight_pass.removed, highlight_pass.redraw_rows)
+		self.allow_custom_tags = highlight_pass.allow_custom_tags
+		return True
+
+	# Returns (first, old_end, new_end) where old_lines[first:old_end] were replaced by new_lines[first:new_end]
+	@staticmethod
+	def changed_lines(old_lines, new_lines):
+		limit = min(len(old_lines), len(new_lines))
+		first = 0
+		while first < limit and old_lines[first][1] == new_lines[first]:
+			first += 1
+
+		limit -= first
+		suffix = 0
+		while suffix < limit and old_lines[-1 - suffix][1] == new_lines[-1 - suffix]:
+			suffix += 1
+
+		return first, len(old_lines) - suffix, len(new_lines) - suffix
+
+	def new_line_id(self):
+		self.next_line_id += 1
+		return self.next_line_id
+
+	# Returns the line relative token stream of line, which is shared with the line cache
+	def highlight_line(self, line, row, line_kind, allow_custom_tags):
+		if line_kind != COMMAND_LINE:
+			return self.tokenizer.tokenize(line, line_kind)
+
+		tokens = LINE_CACHE.get(line, allow_custom_tags)
+		if tokens == None:
+			start_time = time.perf_counter()
+			tokens = self.tokenizer.tokenize(line, line_kind)
+			if self.tokenizer.stalled:
+				print("MCC: line {} took {:.0f}ms to highlight, using simple highlighting for it".format(row + 1, (time.perf_counter() - start_time) * 1000))
+			LINE_CACHE.put(line, allow_custom_tags, tokens)
+		return tokens
@@ -0,0 +1,50 @@
+from collections import OrderedDict
+
+# Least recently used cache of line relative token streams keyed on the line's text and whether
+# custom NBT tags were allowed.  Function files repeat the same commands a lot, so most lines
+# can skip the parser entirely
+class LineCache:
+
+	def __init__(self, max_size=10000):
+		self.entries = OrderedDict()
+		self.max_size = max_size
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, line, allow_custom_tags):
+		key = (line, allow_custom_tags)
+		tokens = self.entries.get(key)
+		if tokens == None:
+			self.misses += 1
+			return None
+
+		self.hits += 1
+		self.entries.move_to_end(key)
+		return tokens
+
+	def put(self, line, allow_custom_tags, tokens):
+		self.entries[(line, allow_custom_tags)] = tokens
+		if len(self.entries) > self.max_size:
+			self.entries.popitem(last=False)
+
+	def resize(self, max_size):
+		self.max_size = max(0, max_size)
+		while len(self.entries) > self.max_size:
+			self.entries.popitem(last=False)
+
+	def clear(self):
+		self.entries.clear()
+		self.hits = 0
+		self.misses = 0
+
+	def hit_rate(self):
+		lookups = self.hits + self.misses
+		if lookups == 0:
+			return 0.0
+		return self.hits / lookups
+
+	def stats(self):
+		return "{} of {} lines cached, {} hits, {} misses ({:.1%} hit rate)".format(
+			len(self.entries), self.max_size, self.hits, self.misses, self.hit_rate())
+
+LINE_CACHE = LineCache()
@@ -1,45 +1,69 @@
 import sublime
 import sublime_plugin
-from .CommandTree import COMMAND_TREE
 from .Parser import *
+from .HighlightScheduler import HighlightScheduler
+from .LineCache import LINE_CACHE
 from .ColorSchemeEditor import ColorSchemeEditor
 
+# Preferences used while highlighting, kept up to date through add_on_change instead of being
+# read on every pass.  generation goes up whenever one of them changes
+class HighlightSettings:
+	generation = 0
+	allow_custom_tags = False
+	highlight_delay = 50
+
+	@classmethod
+	def reload(cls):
+		settings = sublime.load_settings("Preferences.sublime-settings")
+		allow_custom_tags = settings.get("mcc_custom_tags", False)
+		if allow_custom_tags != cls.allow_custom_tags:
+			cls.allow_custom_tags = allow_custom_tags
+			cls.generation += 1
+
+		cls.highlight_delay = settings.get("mcc_highlight_delay", 50)
+		Parser.time_budget = settings.get("mcc_line_time_budget", 100) / 1000
+		LINE_CACHE.resize(settings.get("mcc_line_cache_size", 10000))
+
 class MccHighlightCommand(sublime_plugin.EventListener):
 
+	schedulers = {}
+
 	def on_load(self, view):
 		self.run(view)
 
 	def on_modified(self, view):
-		self.run(view)
+		self.run(view, HighlightSettings.highlight_delay)
 
 	def on_activated(self, view):
 		self.run(view)
 
-	def run(self, view):
+	def on_close(self, view):
+		self.schedulers.pop(view.id(), None)
+
+	# Schedules a pass unless the view has already been highlighted, or is about to be,
+	# with the same buffer contents and settings
+	def run(self, view, delay=0):
 		file_name = view.file_name()
 		if file_name == None or not file_name.endswith(".mcfunction"):
 			return
 
-		full_region_string = view.substr(sublime.Region(0, view.size()))
-		file_lines = full_region_string.split("\n")
-		allow_custom_tags = sublime.load_settings("Preferences.sublime-settings").get("mcc_custom_tags", False)
+		if not view.id() in self.schedulers:
+			self.schedulers[view.id()] = HighlightScheduler(view)
+		scheduler = self.schedulers[view.id()]
 
-		PARSER.reset(view, allow_custom_tags)
-		region_start = 0;
-
-		i = 0
-		for line in file_lines:
-			if len(line) > 0:
-				PARSER.highlight(COMMAND_TREE, line, 0, region_start)
-				PARSER.add_regions(line_num=i)
-				i += 1
-			region_start += len(line) + 1
+		pass_key = (view.change_count(), HighlightSettings.generation)
+		if scheduler.scheduled_key == pass_key:
+			return
+		scheduler.scheduled_key = pass_key
+		scheduler.schedule(HighlightSettings.allow_custom_tags, delay)
 
 def plugin_loaded():
 	parser = Parser()
 	settings = sublime.load_settings("Preferences.sublime-settings")
 	settings.add_on_change('color_scheme',ColorSchemeEditor.edit_color_scheme)
 	ColorSchemeEditor.edit_color_scheme()
+	settings.add_on_change('mcc', HighlightSettings.reload)
+	HighlightSettings.reload()
 
 	allowed_autocomplete = settings.get("auto_complete_selector", "")
 	if not "text.plain" in allowed_autocomplete:
@@ -1,17 +1,62 @@
-import sublime, re
+import re, time
+from array import array
 from .Blocks import BLOCKS
 from .Data import *
 from .Registries import *
 from .NbtData import NBT_TAGS
-from .CommandTree import COMMAND_TREE
+from .CommandGraph import COMMAND_GRAPH
+from .ArgumentContext import EMPTY_CONTEXT
+
+# Contexts the parsers call each other with
+WORD_STRING = EMPTY_CONTEXT.derive(type="word")
+PHRASE_STRING = EMPTY_CONTEXT.derive(type="phrase")
+STRICT_STRING = EMPTY_CONTEXT.derive(type="strict")
+LIST_INDEX = EMPTY_CONTEXT.derive(min=0)
+INT_ARRAY = EMPTY_CONTEXT.derive(list_prefix="I;")
+SELECTOR_VALUE = EMPTY_CONTEXT.derive(min=0, type="phrase")
+UNTAGGED_COMPOUND = EMPTY_CONTEXT.derive(tags=False)
+TAGGED_COMPOUND = EMPTY_CONTEXT.derive(tags=True)
+
+# The kinds of frame on the stack of Parser.highlight
+REDIRECT_FRAME = 0
+COMMAND_FRAME = 1
+CHILDREN_FRAME = 2
+
+# Argument candidates the tree profile put in a different order, tree_order is the order of the
+# command tree
+class ReorderedCandidates(tuple):
+	tree_order = ()
+
+# Raised from inside the parser once a line has used up its time budget
+class ParseBudgetExceeded(Exception):
+	pass
 
 class Parser:
-	add_regions_flags = sublime.DRAW_NO_OUTLINE
+	# Scope ids of the tokens in the token stream
+	mcccomment = 0
+	mcccommand = 1
+	mccconstant = 2
+	mccstring = 3
+	mccentity = 4
+	mccliteral = 5
+	invalid = 6
+
+	time_budget = 0.1 # seconds a single line may take before falling back to fallback_highlight
+	stalled_lines = set() # (line, allow_custom_tags) of lines that ran out of time before
+	root = COMMAND_GRAPH # where highlight starts walking every line
+	string_scanners = {} # escape depth -> (quote, escape, scanner), see string_scanner
+
+	# Node path -> {argument name: times picked} from the tree profile, the argument children of
+	# those nodes are tried most picked first.  See TreeProfile.py
+	argument_counts = {}
+
 	regex = {
 		"command" : re.compile('[\t ]*(/?)([a-z]+)'),
 		"comment" :  re.compile('^[\t ]*#.*$'),
 		"entity_tag_advancement_key" : re.compile("([a-z_\-1-9]+:)?([\w\.\-]+)[\t ]*(=)"),
 		"entity_tag_key" : re.compile("(\w+)[\t ]*(=)"),
+		"escape_run" : re.compile(r'\\+"?|"'),
+		"fallback_token" : re.compile(r'(?P<string>"(?:[^"\\]|\\.)*"?)|(?P<entity>@[pears]\b)|(?P<constant>(?<![\w.])(?:[~^]?-?\d*\.?\d+[bsldfBSLDF]?|[~^]|true|false)(?![\w.]))|(?P<literal>[\w.:/#+-]+)'),
 		"float" : re.compile("-?(\d+(\.\d+)?|\.\d+)"),
 		"gamemode" : re.compile("survival|creative|adventure|spectator"),
 		"greedy_string" : re.compile(".*$"),
@@ -32,102 +77,207 @@ class Parser:
 		"objective" : re.compile("[\w\(\)\.\<\>_\-]{1,16}"),
 		"vec4" : re.compile("((?:\d*\.)?\d+)[\t ]+((?:\d*\.)?\d+)[\t ]+((?:\d*\.)?\d+)[\t ]+((?:\d*\.)?\d+)"),
 		"word_string" : re.compile("[\w\(\)\.\<\>_\-]+"),
+		"token" : re.compile("[^ \t]*"),
 		"white_space" : re.compile("^\s+$")
 	}
 
-	def __init__(self):
-		
-		def score_parser(properties):
-			return self.nested_entity_tag_parser(self.int_range_parser, do_nested=False, properties=properties)
-
-		def advancement_parser(properties):
-			return self.nested_entity_tag_parser(self.boolean_parser, do_nested=True)
-
-		# Data for target selector parsing
-		# order for tuple:
-		# (isNegatable, isRange, parser)
-		self.target_selector_value_parsers = [
-			(False, True, self.integer_parser),
-			(False, False, self.integer_parser),
-			(False, True, self.float_parser),
-			(True, False, self.string_parser),
-			(True, False, self.gamemode_parser),
-			(True, False, self.sort_parser),
-			(True, False, self.entity_location_parser),
-			(False, False, score_parser),
-			(False, False, advancement_parser),
-			(True, False, self.nbt_parser)
-		]
-
-	def reset(self, view, allow_custom_tags):
+	# A Parser holds the scan state of a single line being highlighted, so each view (or thread)
+	# uses its own.  Everything describing the grammar lives on the class and is shared
+	def __init__(self, allow_custom_tags=False):
+		self.reset(allow_custom_tags)
 
+	def reset(self, allow_custom_tags):
 		self.current = 0
-		self.view = view
-		self.mcccomment = []
-		self.mcccommand = []
-		self.mccconstant = []
-		self.mccstring = []
-		self.mccentity = []
-		self.mccliteral = []
-		self.invalid = []
+		self.string = ""
+		self.region_begin = 0
+		self.tokens = array("i") # start, end, scope id of every token found, in the order they were found
 		self.custom_tags = allow_custom_tags
+		self.deadline = None
+		self.memo = {} # (command node, column) -> (success, end, tokens found) for the current line
+
+	# Highlights a whole line.  If that takes longer than time_budget the grammar is given up
+	# on, the line is highlighted with fallback_highlight instead and it'll stay that way
+	# whenever it comes up again.  Returns False if the line ran out of time on this call
+	def highlight_line(self, line_string):
+		stall_key = (line_string, self.custom_tags)
+		if stall_key in self.stalled_lines:
+			self.fallback_highlight(line_string)
+			return True
+
+		self.deadline = time.perf_counter() + self.time_budget
+		self.memo = {}
+		try:
+			self.highlight(self.root, line_string, 0, 0)
+			return True
+		except ParseBudgetExceeded:
+			self.take_tokens()
+			self.stalled_lines.add(stall_key)
+			self.fallback_highlight(line_string)
+			return False
+		finally:
+			self.deadline = None
+
+	# Purely lexical highlighting for lines the grammar took too long on
+	def fallback_highlight(self, line_string):
+		self.string = line_string
+		self.region_begin = 0
+		scopes = {
+			"string": self.mccstring,
+			"entity": self.mccentity,
+			"constant": self.mccconstant,
+			"literal": self.mccliteral
+		}
+
+		start = 0
+		command_match = self.regex["command"].match(line_string)
+		if command_match:
+			self.append_region(self.mcccommand, command_match.start(2), command_match.end(2))
+			start = command_match.end()
+
+		for token_match in self.regex["fallback_token"].finditer(line_string, start):
+			self.append_region(scopes[token_match.lastgroup], token_match.start(), token_match.end())
+
+	def check_budget(self):
+		if self.deadline != None and time.perf_counter() > self.deadline:
+			raise ParseBudgetExceeded()
+
+	# Returns the token stream found since the last call and starts a fresh one
+	def take_tokens(self):
+		tokens = self.tokens
+		self.tokens = array("i")
+		return tokens
+
+	# Speculative parses take a mark before they start and roll back to it if they fail, which
+	# throws away every token found since, however deep the failed parse went
+	def mark(self):
+		return len(self.tokens)
+
+	def rollback(self, mark):
+		del self.tokens[mark:]
+
+	# Whether any of the tokens found since mark marks something invalid.  An empty invalid token
+	# is left where a command could have had a slash, so those don't count
+	def found_invalid(self, mark):
+		tokens = self.tokens
+		for i in range(mark, len(tokens), 3):
+			if tokens[i + 2] == self.invalid and tokens[i] < tokens[i + 1]:
+				return True
+		return False
 
-	def add_regions(self, line_num=0):
-		self.view.add_regions("mcccomment" + str(line_num), self.mcccomment, "mcccomment", flags=self.add_regions_flags)
-		self.view.add_regions("mcccommand" + str(line_num), self.mcccommand, "mcccommand", flags=self.add_regions_flags)
-		self.view.add_regions("mccconstant" + str(line_num), self.mccconstant, "mccconstant", flags=self.add_regions_flags)
-		self.view.add_regions("mccstring" + str(line_num), self.mccstring, "mccstring", flags=self.add_regions_flags)
-		self.view.add_regions("mccentity" + str(line_num), self.mccentity, "mccentity", flags=self.add_regions_flags)
-		self.view.add_regions("mccliteral" + str(line_num), self.mccliteral, "mccliteral", flags=self.add_regions_flags)
-		self.view.add_regions("invalid" + str(line_num), self.invalid, "invalid.illegal", flags=self.add_regions_flags)
-
-		self.mcccomment = []
-		self.mcccommand = []
-		self.mccconstant = []
-		self.mccstring = []
-		self.mccentity = []
-		self.mccliteral = []
-		self.invalid = []
-
-	def append_region(self, region_list, start, end):
-		region_list.append(sublime.Region(self.region_begin + start, self.region_begin + end))
-
-	def highlight(self, command_tree, line_string, current, region_start=None):
+	# Returns the argument children of command_node whose parser can start on the current character
+	def argument_candidates(self, command_node):
+		char = self.string[self.current]
+		candidates = command_node.first_char_arguments.get(char)
+		if candidates == None:
+			candidates = tuple(argument_node for argument_node in command_node.arguments if self.can_start(argument_node, char))
+			counts = self.argument_counts.get(" ".join(command_node.path))
+			if counts != None and len(candidates) > 1:
+				# Sorting is stable, so arguments picked equally often stay in tree order
+				reordered = ReorderedCandidates(sorted(candidates, key=lambda argument_node: -counts.get(argument_node.name, 0)))
+				if list(reordered) != list(candidates):
+					reordered.tree_order = candidates
+					candidates = reordered
+			command_node.first_char_arguments[char] = candidates
+		return candidates
+
+	def can_start(self, argument_node, char):
+		if argument_node.parser == "brigadier:string" and argument_node.properties["type"] == "greedy":
+			return True
+		first_chars = self.first_chars.get(argument_node.parser)
+		return first_chars == None or first_chars.match(char) != None
+
+	def append_region(self, scope, start, end):
+		tokens = self.tokens
+		tokens.append(self.region_begin + start)
+		tokens.append(self.region_begin + end)
+		tokens.append(scope)
+
+	# Walks the command graph from command_node with an explicit stack instead of recursing, so
+	# an execute chain costs the same per subcommand however long it gets.  stack holds a frame
+	# for every node waiting on the outcome of a child, innermost last:
+	#   (REDIRECT_FRAME, memo key, mark) for a redirect whose target is being walked
+	#   (COMMAND_FRAME, start, end of the command) for the root while the command's subtree is walked
+	#   [CHILDREN_FRAME, node, start, mark, argument candidates, index] for a node trying its
+	#   children, index is the candidate being walked, -1 while it's the literal.  The
+	#   candidates are only looked up once the literal has failed
+	#
+	# Each step below either enters a child, or gives an outcome that hand_up passes up the stack
+	def highlight(self, command_node, line_string, current, region_start=None):
 		if (region_start != None):
 			self.region_begin = region_start
 		self.string = line_string
 		self.current = current
+		return self.walk([], command_node)
+
+	# Walks on from entering node at the current column, with stack holding the frames of the
+	# nodes above it.  Returns the outcome of the bottom of the stack
+	def walk(self, stack, node):
+		while True:
+			self.check_budget()
+
+			if node.redirect != None:
+				#print("Redirecting to: " + node.redirect_node.name + ", " + str(self.current))
+				success = self.follow_redirect(stack, node.redirect_node)
+				if success is not True and success is not False:
+					node = success
+					continue
+
+			elif not node.has_children or self.current >= len(self.string):
+				success = self.end_of_command(node.executable)
+
+			elif node.type == "root":
+				success = self.enter_command(stack, node.literals)
+				if success is not True and success is not False:
+					node = success
+					continue
 
-		if ("redirect" in command_tree):
-			redirect_command = command_tree["redirect"][0]
-			if redirect_command == "root":
-				new_command_tree = COMMAND_TREE
-			else:
-				new_command_tree = COMMAND_TREE
-				for redirect in command_tree["redirect"]:
-					new_command_tree = new_command_tree["children"][redirect]
-			#print("Redirecting to: " + redirect_command + ", " + str(self.current))
-			if "executable" in command_tree:
-				new_command_tree["executable"] = command_tree["executable"]
-
-			return self.highlight(new_command_tree, line_string, self.current)
-		elif not "children" in command_tree or self.current >= len(line_string):
-			
-			if not "executable" in command_tree or not command_tree["executable"]:
-				self.append_region(self.invalid, 0, len(line_string))
-				self.current = len(line_string)
-				return False
 			else:
-				while (self.current < len(self.string) and self.string[self.current] in " \t"):
-					self.current += 1
+				success = self.enter_children(stack, node)
+				if success is not True and success is not False:
+					node = success
+					continue
+
+			node = self.hand_up(stack, success)
+			if node is True or node is False:
+				return node
+
+	# Redirect targets are the only nodes reachable along more than one path, so they're the
+	# only ones backtracking can try more than once at the same column, like an execute chain
+	# that redirects back to execute.  Each (target, column) attempt that failed is remembered
+	# for the rest of the line and replayed instead of walking the subtree again.  Returns the
+	# outcome if it was replayed, else target after pushing its frame
+	def follow_redirect(self, stack, target):
+		memo_key = (target, self.current)
+		memo_entry = self.memo.get(memo_key)
+		if memo_entry == None:
+			stack.append((REDIRECT_FRAME, memo_key, self.mark()))
+			return target
+
+		success, self.current, tokens = memo_entry
+		self.tokens.extend(tokens)
+		return success
+
+	# The command has ended, either at a node without children or at the end of the line
+	def end_of_command(self, executable):
+		if not executable:
+			self.append_region(self.invalid, 0, len(self.string))
+			self.current = len(self.string)
+			return False
+
+		while (self.current < len(self.string) and self.string[self.current] in " \t"):
+			self.current += 1
 
-				if self.current < len(line_string):
-					self.append_region(self.invalid, self.current, len(line_string))
-					self.current = len(line_string)
-					return False
+		if self.current < len(self.string):
+			self.append_region(self.invalid, self.current, len(self.string))
+			self.current = len(self.string)
+			return False
 
-				return True
+		return True
 
+	# Finds the command at the root of the graph in commands, the root's literal children.
+	# Returns the command's child after pushing the root's frame, or the outcome when the line
+	# has no command
+	def enter_command(self, stack, commands):
 		if self.regex["white_space"].match(self.string):
 			return True
 
@@ -137,88 +287,118 @@ class Parser:
 			self.current = comment_match.end()
 			return True
 
-		elif command_tree["type"] == "root":
-			command_match = self.regex["command"].match(self.string, self.current)
-			if not command_match:
-				self.append_region(self.invalid, 0, len(line_string))
-				return False
-
-			command = command_match.group(2)
-			#print("command: " + command)
-			if command in command_tree["children"]:
-				self.append_region(self.invalid, command_match.start(1), command_match.end(1))
-
-				self.current = command_match.end(2)
-				if self.highlight(command_tree["children"][command], line_string, command_match.end()):
-					self.append_region(self.mcccommand, command_match.start(2), command_match.end(2))
-					return True
-				else:
-					self.append_region(self.invalid, command_match.start(2), command_match.end(2))
-					return False
+		command_match = self.regex["command"].match(self.string, self.current)
+		if command_match and command_match.group(2) in commands:
+			#print("command: " + command_match.group(2))
+			self.append_region(self.invalid, command_match.start(1), command_match.end(1))
+			stack.append((COMMAND_FRAME, command_match.start(2), command_match.end(2)))
+			self.current = command_match.end()
+			return commands[command_match.group(2)]
 
-			else:
-				self.append_region(self.invalid, 0, len(line_string))
-				return False
-		else:
-			was_space = False
-			while (self.current < len(self.string) and self.string[self.current] in " \t"):
-				self.current += 1
-				was_space = True
-
-			if self.current >= len(self.string):
-				if not "executable" in command_tree or not command_tree["executable"]:
-					return False
-				else:
-					return True
+		self.append_region(self.invalid, 0, len(self.string))
+		return False
 
-			elif not was_space:
-				return False	
+	# Finds the child of node the text after the next run of whitespace starts with.  Returns
+	# that child after pushing node's frame, or the outcome of node when none of them match or
+	# the line ends first
+	def enter_children(self, stack, node):
+		was_space = False
+		while (self.current < len(self.string) and self.string[self.current] in " \t"):
+			self.current += 1
+			was_space = True
 
-			start = self.current
-			for key, properties in command_tree["children"].items():
-				if properties["type"] == "literal" and self.string.startswith(key, self.current):
-					self.append_region(self.mccliteral, self.current, self.current + len(key))
-					self.current += len(key)
-					success = self.highlight(properties, line_string, self.current)
-					if success:
-						return True
-					else:
-						self.current = start
-						self.mccliteral.pop()
-
-				elif properties["type"] == "argument":
-					parser_name = properties["parser"]
-					parse_function = self.parsers[parser_name]
-					old_current = self.current
-					if "properties" in properties:
-						#print("using properties for " + parser_name)
-						self.current = parse_function(self, properties["properties"])
-					else:
-						self.current = parse_function(self)
+		if self.current >= len(self.string):
+			return bool(node.executable)
+		elif not was_space:
+			return False
+
+		frame = [CHILDREN_FRAME, node, self.current, self.mark(), None, -1]
+
+		# Literals run up to the next space, so a single lookup on that token finds the only one that can match
+		token_match = self.regex["token"].match(self.string, self.current)
+		literal_node = node.literals.get(token_match.group())
+		if literal_node != None:
+			self.append_region(self.mccliteral, self.current, token_match.end())
+			self.current = token_match.end()
+			stack.append(frame)
+			return literal_node
+
+		child = self.next_child(frame)
+		if child != None:
+			stack.append(frame)
+			return child
+		return self.no_child_matched(node)
+
+	# Hands success up the stack until a node has another child to try.  Returns that child,
+	# after pushing its parent's frame back, or the outcome of the whole walk
+	def hand_up(self, stack, success):
+		while len(stack) > 0:
+			frame = stack.pop()
+			if frame[0] == REDIRECT_FRAME:
+				# Success is handed all the way up, so only failures ever get tried again
+				if not success:
+					self.memo[frame[1]] = (success, self.current, self.tokens[frame[2]:])
+			elif frame[0] == COMMAND_FRAME:
+				if success:
+					self.append_region(self.mcccommand, frame[1], frame[2])
+				else:
+					self.append_region(self.invalid, frame[1], frame[2])
+			elif not success or frame[4].__class__ is ReorderedCandidates and self.against_tree_order(frame):
+				self.current = frame[2]
+				self.rollback(frame[3])
+				child = self.next_child(frame)
+				if child != None:
+					stack.append(frame)
+					return child
+				success = self.no_child_matched(frame[1])
+		return success
+
+	# The tree profile only reorders arguments to find the same match sooner, it mustn't pick a
+	# different one.  So when an argument tried ahead of its turn only matched with invalid
+	# tokens after it, the frame is switched back to tree order and its children are tried
+	# again from the first.  Returns whether it was
+	def against_tree_order(self, frame):
+		candidates = frame[4]
+		if candidates[frame[5]] is candidates.tree_order[0] or not self.found_invalid(frame[3]):
+			return False
+		frame[4] = candidates.tree_order
+		frame[5] = -1
+		return True
+
+	# Parses the argument candidates of a children frame after the one it's on until one of them
+	# matches something.  Returns that argument's node, or None if none of them did
+	def next_child(self, frame):
+		candidates = frame[4]
+		if candidates == None:
+			candidates = frame[4] = self.argument_candidates(frame[1])
+		mark = frame[3]
+		for index in range(frame[5] + 1, len(candidates)):
+			argument_node = candidates[index]
+			parse_function = self.parsers[argument_node.parser]
+			old_current = self.current
+			self.current = parse_function(self, argument_node.properties)
 
-					if old_current != self.current:
-						success = self.highlight(properties, line_string, self.current)
-						if success:
-							return True
-						else:
-							self.invalid.pop()
-							self.current = start
+			if old_current != self.current:
+				frame[5] = index
+				return argument_node
+			self.rollback(mark)
+		return None
+
+	# Marks the rest of the line invalid when none of the children of node matched
+	def no_child_matched(self, node):
+		while (self.current < len(self.string) and self.string[self.current] in " \t"):
+			self.current += 1
 
-			while (self.current < len(self.string) and self.string[self.current] in " \t"):
-				self.current += 1
+		if self.current < len(self.string):
+			self.append_region(self.invalid, self.current, len(self.string))
+			self.current = len(self.string)
 
-			if self.current < len(line_string):
-				self.append_region(self.invalid, self.current, len(line_string))
-				self.current = len(line_string)
+		return bool(node.last_child_executable)
 
-			if not "executable" in properties or not properties["executable"]:
-				return False
-			else:
-				return True
-			
 	# Returns True if the end of the string is reached, else False and will advacne self.current to the next non-whitespace character
 	# this will error highlight the section from err_start until the end of the string
 	def skip_whitespace(self, err_start):
+		self.check_budget()
 		start = self.current
 		if self.current >= len(self.string):
 			return True
@@ -229,7 +409,7 @@ class Parser:
 				return True
 		return False
 
-	def entity_parser(self, properties={}):
+	def entity_parser(self, properties=EMPTY_CONTEXT):
 		start = self.current
 		self.current = self.target_selector_parser(properties)
 		if start != self.current:
@@ -237,7 +417,7 @@ class Parser:
 
 		return self.username_parser(properties)
 
-	def target_selector_parser(self, properties={}):
+	def target_selector_parser(self, properties=EMPTY_CONTEXT):
 		if self.current >= len(self.string):
 			return self.current
 		if self.string[self.current] == "*" and "amount" in properties and properties["amount"] == "multiple":
@@ -266,23 +446,21 @@ class Parser:
 					return self.current
 
 				key = key_match.group(1)
+				key_mark = self.mark()
 				self.append_region(self.mcccommand, key_match.start(2), key_match.end(2))
 				self.append_region(self.mccstring, key_match.start(1), key_match.end(1))
 				self.current = key_match.end(2)
 
 				reached_end = self.skip_whitespace(start_of_key)
 				if reached_end:
-					self.mcccommand.pop()
-					self.mccstring.pop()
+					self.rollback(key_mark)
 					return start_of_key
 
-				new_properties = {}
-				new_properties["min"] = 0
-				new_properties["type"] = "phrase"
 				matched = False
 				for i in range(len(TARGET_KEY_LISTS)):
 					if key in TARGET_KEY_LISTS[i]:
 						isNegatable, isRange, parser = self.target_selector_value_parsers[i]
+						parser = parser.__get__(self)
 						if isNegatable and self.string[self.current] == "!":
 							self.append_region(self.mcccommand, self.current, self.current + 1)
 							self.current += 1
@@ -293,10 +471,10 @@ class Parser:
 
 						old_current = self.current
 						if isRange:
-							self.current = self.range_parser(parser, {})
+							self.current = self.range_parser(parser)
 
 						else:
-							self.current = parser(new_properties)
+							self.current = parser(SELECTOR_VALUE)
 
 						if old_current != self.current:
 							matched = True
@@ -323,10 +501,16 @@ class Parser:
 
 		return self.current
 
-	def int_range_parser(self, properties={}):
+	def score_parser(self, properties=EMPTY_CONTEXT):
+		return self.nested_entity_tag_parser(self.int_range_parser, do_nested=False, properties=properties)
+
+	def advancement_parser(self, properties=EMPTY_CONTEXT):
+		return self.nested_entity_tag_parser(self.boolean_parser, do_nested=True)
+
+	def int_range_parser(self, properties=EMPTY_CONTEXT):
 		return self.range_parser(self.integer_parser, properties)
 
-	def range_parser(self, parse_function, properties={}):
+	def range_parser(self, parse_function, properties=EMPTY_CONTEXT):
 		matched = False
 		start = self.current
 		self.current = parse_function(properties)
@@ -347,14 +531,10 @@ class Parser:
 
 		return self.current
 
-	def nested_entity_tag_parser(self, parser, do_nested=False, properties={}): # scores= and advancements=
+	def nested_entity_tag_parser(self, parser, do_nested=False, properties=EMPTY_CONTEXT): # scores= and advancements=
 		if self.string[self.current] != "{":
 			return self.current
-		elif "min" in properties:
-			old_min = properties["min"]
-			properties.pop("min")
-		else:
-			old_min = None
+		properties = properties.derive(min=None)
 
 		bracket_start = self.current
 		self.current += 1
@@ -363,76 +543,58 @@ class Parser:
 		while continue_parsing:
 			reached_end = self.skip_whitespace(self.current)
 			if reached_end:
-				if old_min != None:
-					properties["min"] = old_min
 				return self.current
 
 			start_of_key = self.current
 			key_match = self.regex["entity_tag_advancement_key"].match(self.string, self.current)
 			if not key_match:
-				if old_min != None:
-					properties["min"] = old_min
 				return self.current
 
 			elif not do_nested and key_match.group(1): # If theres a nested tag where there shouldn't be
 				self.append_region(self.invalid, self.current, key_match.end())
 				self.current = key_match.end()
-				if old_min != None:
-					properties["min"] = old_min
 				return self.current
 
+			key_mark = self.mark()
 			self.append_region(self.mccstring, key_match.start(2), key_match.end(2))
 			self.append_region(self.mcccommand, key_match.start(3), key_match.end(3))
 			self.current = key_match.end()
 
 			reached_end = self.skip_whitespace(start_of_key)
 			if reached_end:
-				if old_min != None:
-					properties["min"] = old_min
 				return self.current
 
 			if key_match.group(1) != None:
 				self.append_region(self.mccliteral, key_match.start(1), key_match.end(1))
 				self.current = self.nested_entity_tag_parser(parser, do_nested=False, properties=properties)
 				if self.string[self.current - 1] != "}": #This tests to see if the parse was successful
-					if old_min != None:
-						properties["min"] = old_min
 					return self.current
 			else:
 				old_current = self.current
 				self.current = parser(properties)
 				if old_current == self.current:
-					self.mccstring.pop()
-					self.mcccommand.pop()
-					if old_min != None:
-						properties["min"] = old_min
+					self.rollback(key_mark)
 					return self.current
 
 			reached_end = self.skip_whitespace(start_of_key)
 			if reached_end:
-				if old_min != None:
-					properties["min"] = old_min
 				return self.current
 
 			if self.string[self.current] == ",":
 				self.current += 1
 			elif self.string[self.current] != "}":
 				self.append_region(self.invalid, self.current, self.current + 1)
-				if old_min != None:
-					properties["min"] = old_min
 				return self.current + 1
 			else:
 				continue_parsing = False
 
 		self.current += 1
-		if old_min != None:
-			properties["min"] = old_min
 		return self.current
 
 	# Word means "up to the next space", phrase is "an unquoted word or 
 	# quoted string", and greedy is "everything from this point to the end of input".
 	# strict means only a regular quote enclosed string will word
-	def string_parser(self, properties={}):
+	def string_parser(self, properties=EMPTY_CONTEXT):
 		if self.current >= len(self.string):
 			return self.current
 
@@ -452,30 +614,23 @@ class Parser:
 			self.current = self.regex_parser(self.regex["greedy_string"], [self.mccstring])
 
 		elif properties["type"] in {"strict", "phrase"}:
-			quote = self.generate_quote(escape_depth)
-			escape = self.generate_quote(escape_depth + 1)[:-1] # Gets the needed backslashes to escape
-
-			string_start = self.current
+			quote, escape, scanner = self.string_scanner(escape_depth)
 			start = self.current
 
 			if not self.string.startswith(quote, self.current):
 				return self.current
 
 			self.current += len(quote)
-			continue_parsing = True
-			while continue_parsing:
-				if self.current >= len(self.string):
-					self.append_region(self.mccstring, start, self.current - 1)
-					self.append_region(self.invalid, self.current - 1, self.current)
-					return self.current
-
-				elif self.string.startswith(quote, self.current):
-					self.append_region(self.mccstring, start, self.current + len(quote))
-					self.current += len(quote)
-					continue_parsing = False
+			while True:
+				scan_match = scanner.match(self.string, self.current)
+				if scan_match.group(1) != None: # The closing quote
+					self.append_region(self.mccstring, start, scan_match.end(1))
+					self.current = scan_match.end(1)
+					break
 
-				elif self.string.startswith(escape, self.current) and self.current + len(escape) < len(self.string):
-					escape_char = self.string[self.current + len(escape)]
+				elif scan_match.group(2) != None: # An escape and the character it escapes
+					self.current = scan_match.start(2)
+					escape_char = scan_match.group(3)
 					if escape_char in "\"\\/bfnrt":
 						if self.current - start > 0:
 							self.append_region(self.mccstring, start, self.current)
@@ -502,21 +657,26 @@ class Parser:
 						self.append_region(self.invalid, self.current, self.current + 1)
 						return self.current + 1
 
-				elif self.string[self.current] in "\"\\":
+				elif scan_match.end() >= len(self.string): # The string never ended
+					self.current = scan_match.end()
+					self.append_region(self.mccstring, start, self.current - 1)
+					self.append_region(self.invalid, self.current - 1, self.current)
+					return self.current
+
+				else: # A quote or backslash that doesn't belong at this depth
+					self.current = scan_match.end()
 					self.append_region(self.mccstring, start, self.current - 1)
 					self.append_region(self.invalid, self.current, self.current + 1)
 					return self.current + 1
-				else:
-					self.current += 1
 
 		return self.current
 
 	# Todo: add entity highlighting
-	def message_parser(self, properties={}):
+	def message_parser(self, properties=EMPTY_CONTEXT):
 		self.append_region(self.mccstring, self.current, len(self.string))
 		return len(self.string)
 
-	def nbt_parser(self, properties={}):
+	def nbt_parser(self, properties=EMPTY_CONTEXT):
 		if not self.string.startswith("{", self.current):
 			return self.current
 
@@ -570,128 +730,12 @@ class Parser:
 				return self.current
 
 			elif allow_custom_tags:
-				possible_types = NBT_TAGS["CUSTOM_TAG"]
+				value_types = NBT_VALUE_TYPES["CUSTOM_TAG"]
 			else:
-				possible_types = NBT_TAGS[key]
-
-			matched = False#self.nbt_values_parser(possible_types, allow_custom_tags, {"escape_depth":escape_depth})
-			for key_type in possible_types:
-				if key_type == "byte": 
-					start = self.current
-					self.current = self.nbt_byte_parser(properties)
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "short":
-					start = self.current
-					self.current = self.nbt_value_parser(self.integer_parser, self.mccconstant, "s")
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "int": 
-					start = self.current
-					self.current = self.integer_parser(properties)
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "long":
-					start = self.current
-					self.current = self.nbt_value_parser(self.integer_parser, self.mccconstant, "L")
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "float":
-					start = self.current
-					self.current = self.nbt_value_parser(self.float_parser, self.mccconstant, "f")
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "double":
-					start = self.current
-					self.current = self.nbt_value_parser(self.float_parser, self.mccconstant, "d")
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "string":
-					start = self.current
-					self.current = self.string_parser({"type":"phrase", "escape_depth":escape_depth})
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "string_list":
-					start = self.current
-					self.current = self.nbt_list_parser(self.string_parser, None, "", {"type":"phrase", "escape_depth":escape_depth})
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "compound":
-					start = self.current
-					self.current = self.nbt_parser({"escape_depth": escape_depth, "tags": allow_custom_tags})
-					if start != self.current:
-						matched = True
-						break
+				value_types = NBT_VALUE_TYPES[key]
 
-				elif key_type == "compound_list":
-					start = self.current
-					self.current = self.nbt_list_parser(self.nbt_parser, None, "", {"escape_depth": escape_depth, "tags": allow_custom_tags})
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "custom_compound":
-					start = self.current
-					self.current = self.nbt_tags_parser({"escape_depth": escape_depth})
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "int_list":
-					start = self.current
-					self.current = self.nbt_list_parser(self.integer_parser, None, "", {"list_prefix": "I;"})
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "double_list":
-					start = self.current
-					self.current = self.nbt_list_parser(self.float_parser, self.mccconstant, "d")
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "float_list":
-					start = self.current
-					self.current = self.nbt_list_parser(self.float_parser, self.mccconstant, "f")
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "json":
-					start = self.current
-					self.current = self.json_in_nbt_parser({"escape_depth":escape_depth})
-					if start != self.current:
-						matched = True
-						break
-
-				elif key_type == "json_list":
-					start = self.current
-					self.current = self.nbt_list_parser(self.json_in_nbt_parser, None, "", {"escape_depth": escape_depth})
-					if start != self.current:
-						matched = True
-						break
-				else:
-					print("unkown type: " + str(key_type))
-
-			if not matched:
-				print("No match for key '" + key + "' within types " + str(possible_types))
+			if not self.nbt_values_parser(value_types, properties, escape_depth, allow_custom_tags):
+				print("No match for key '" + key + "' within types " + str(value_types.names))
 				if self.current < len(self.string):
 					self.append_region(self.invalid, self.current, self.current + 1)
 					return self.current + 1
@@ -721,135 +765,80 @@ class Parser:
 
 
 
-	def nbt_values_parser(self, possible_types, allow_custom_tags, properties={}):
-		escape_depth = 0
-		if "escape_depth" in properties:
-			escape_depth = properties["escape_depth"]
+	# Parses a value of one of value_types, the NbtValueTypes of a key.  Only the types a value
+	# can start with the next character are tried, in the order NBT_TAGS lists them, so most
+	# values are parsed by the first parser tried.  properties, escape_depth and
+	# allow_custom_tags are those of the compound the value is in
+	def nbt_values_parser(self, value_types, properties, escape_depth, allow_custom_tags):
+		if self.current >= len(self.string):
+			return False
 
-		matched = False;
-		for key_type in possible_types:
-			if key_type == "byte": 
-				start = self.current
-				self.current = self.nbt_byte_parser(properties)
-				if start != self.current:
-					matched = True
-					break
+		char = self.string[self.current]
+		value_parsers = value_types.first_char_parsers.get(char)
+		if value_parsers == None:
+			value_parsers = value_types.parsers_starting_with(char)
 
-			elif key_type == "short":
-				start = self.current
-				self.current = self.nbt_value_parser(self.integer_parser, self.mccconstant, "s")
-				if start != self.current:
-					matched = True
-					break
+		for value_parser in value_parsers:
+			start = self.current
+			self.current = value_parser(self, properties, escape_depth, allow_custom_tags)
+			if start != self.current:
+				return True
+		return False
 
-			elif key_type == "int": 
-				start = self.current
-				self.current = self.integer_parser(properties)
-				if start != self.current:
-					matched = True
-					break
+	# The parsers of the NBT value types, see nbt_value_types
+	def nbt_byte_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_byte_parser(properties)
 
-			elif key_type == "long":
-				start = self.current
-				self.current = self.nbt_value_parser(self.integer_parser, self.mccconstant, "L")
-				if start != self.current:
-					matched = True
-					break
+	def nbt_short_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_value_parser(self.integer_parser, self.mccconstant, "s")
 
-			elif key_type == "float":
-				start = self.current
-				self.current = self.nbt_value_parser(self.float_parser, self.mccconstant, "f")
-				if start != self.current:
-					matched = True
-					break
+	def nbt_int_value(self, properties, escape_depth, allow_custom_tags):
+		return self.integer_parser(properties)
 
-			elif key_type == "double":
-				start = self.current
-				self.current = self.nbt_value_parser(self.float_parser, self.mccconstant, "d")
-				if start != self.current:
-					matched = True
-					break
+	def nbt_long_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_value_parser(self.integer_parser, self.mccconstant, "L")
 
-			elif key_type == "string":
-				start = self.current
-				self.current = self.string_parser({"type":"phrase", "escape_depth":escape_depth})
-				if start != self.current:
-					matched = True
-					break
+	def nbt_float_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_value_parser(self.float_parser, self.mccconstant, "f")
 
-			elif key_type == "string_list":
-				start = self.current
-				self.current = self.nbt_list_parser(self.string_parser, None, "", {"type":"phrase", "escape_depth":escape_depth})
-				if start != self.current:
-					matched = True
-					break
+	def nbt_double_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_value_parser(self.float_parser, self.mccconstant, "d")
 
-			elif key_type == "compound":
-				start = self.current
-				self.current = self.nbt_parser({"escape_depth": escape_depth, "tags": allow_custom_tags})
-				if start != self.current:
-					matched = True
-					break
+	def nbt_string_value(self, properties, escape_depth, allow_custom_tags):
+		return self.string_parser(PHRASE_STRING.at_escape_depth(escape_depth))
 
-			elif key_type == "compound_list":
-				start = self.current
-				self.current = self.nbt_list_parser(self.nbt_parser, None, "", {"escape_depth": escape_depth, "tags": allow_custom_tags})
-				if start != self.current:
-					matched = True
-					break
+	def nbt_string_list_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_list_parser(self.string_parser, None, "", PHRASE_STRING.at_escape_depth(escape_depth))
 
-			elif key_type == "custom_compound":
-				start = self.current
-				self.current = self.nbt_tags_parser({"escape_depth": escape_depth})
-				if start != self.current:
-					matched = True
-					break
+	def nbt_compound_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_parser((TAGGED_COMPOUND if allow_custom_tags else UNTAGGED_COMPOUND).at_escape_depth(escape_depth))
 
-			elif key_type == "int_list":
-				start = self.current
-				self.current = self.nbt_list_parser(self.integer_parser, None, "", {"list_prefix": "I;"})
-				if start != self.current:
-					matched = True
-					break
+	def nbt_compound_list_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_list_parser(self.nbt_parser, None, "", (TAGGED_COMPOUND if allow_custom_tags else UNTAGGED_COMPOUND).at_escape_depth(escape_depth))
 
-			elif key_type == "double_list":
-				start = self.current
-				self.current = self.nbt_list_parser(self.float_parser, self.mccconstant, "d")
-				if start != self.current:
-					matched = True
-					break
+	def nbt_custom_compound_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_tags_parser(EMPTY_CONTEXT.at_escape_depth(escape_depth))
 
-			elif key_type == "float_list":
-				start = self.current
-				self.current = self.nbt_list_parser(self.float_parser, self.mccconstant, "f")
-				if start != self.current:
-					matched = True
-					break
+	def nbt_int_list_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_list_parser(self.integer_parser, None, "", INT_ARRAY)
 
-			elif key_type == "json":
-				start = self.current
-				self.current = self.json_in_nbt_parser({"escape_depth":escape_depth})
-				if start != self.current:
-					matched = True
-					break
+	def nbt_double_list_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_list_parser(self.float_parser, self.mccconstant, "d")
 
-			elif key_type == "json_list":
-				start = self.current
-				self.current = self.nbt_list_parser(self.json_in_nbt_parser, None, "", {"escape_depth": escape_depth})
-				if start != self.current:
-					matched = True
-					break
-			else:
-				print("unkown type: " + str(key_type))
-		return matched
+	def nbt_float_list_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_list_parser(self.float_parser, self.mccconstant, "f")
+
+	def nbt_json_value(self, properties, escape_depth, allow_custom_tags):
+		return self.json_in_nbt_parser(EMPTY_CONTEXT.at_escape_depth(escape_depth))
 
-	def nbt_tags_parser(self, properties={}):
-		properties["tags"] = True
-		self.current = self.nbt_parser(properties)
-		properties["tags"] = False
+	def nbt_json_list_value(self, properties, escape_depth, allow_custom_tags):
+		return self.nbt_list_parser(self.json_in_nbt_parser, None, "", EMPTY_CONTEXT.at_escape_depth(escape_depth))
+
+	def nbt_tags_parser(self, properties=EMPTY_CONTEXT):
+		self.current = self.nbt_parser(properties.derive(tags=True))
 		return self.current
 
-	def nbt_list_parser(self, item_parser, suffix_scope, item_suffix, properties={}):
+	def nbt_list_parser(self, item_parser, suffix_scope, item_suffix, properties=EMPTY_CONTEXT):
 		start_delimiter = "["
 		if "list_prefix" in properties:
 			start_delimiter += properties["list_prefix"]
@@ -857,43 +846,48 @@ class Parser:
 		if not self.string.startswith(start_delimiter, self.current):
 			return self.current
 		start_of_list = self.current
+		mark = self.mark()
 		self.current += len(start_delimiter)
 
 		while not self.string.startswith("]", self.current):
 
 			reached_end = self.skip_whitespace(start_of_list)
 			if reached_end:
+				self.rollback(mark)
 				return start_of_list
 			
 			start_of_value = self.current
 			self.current = self.nbt_value_parser(item_parser, suffix_scope, item_suffix, properties)
 
 			if start_of_value == self.current:
+				self.rollback(mark)
 				return start_of_list
 
 			reached_end = self.skip_whitespace(start_of_value)
 			if reached_end:
+				self.rollback(mark)
 				return start_of_list
 
 			if self.string[self.current] == ",":
 				self.current += 1
 			elif self.string[self.current] != "]":
+				self.rollback(mark)
 				return start_of_list
 
 		self.current += 1
 		return self.current
 
-	def nbt_tag_parser(self, properties={}):
+	def nbt_tag_parser(self, properties=EMPTY_CONTEXT):
 		start = self.current
-		possible_types = ["byte", "short", "int", "long", "float", "double", "string", "string_list", "compound", "compound_list", "custom_compound", "int_list", "double_list", "float_list", "json", "json_list"]
-		matched = self.nbt_values_parser(possible_types, self.custom_tags)
+		matched = self.nbt_values_parser(ANY_NBT_VALUE, EMPTY_CONTEXT, 0, self.custom_tags)
 		if not matched:
 			return start
 
 		return self.current
 
-	def nbt_value_parser(self, parser, suffix_scope, suffix, properties={}):
+	def nbt_value_parser(self, parser, suffix_scope, suffix, properties=EMPTY_CONTEXT):
 		start = self.current
+		mark = self.mark()
 		self.current = parser(properties)
 		if start != self.current:
 			if suffix_scope != None and self.string.startswith(suffix, self.current):
@@ -902,20 +896,23 @@ class Parser:
 			elif suffix_scope == None:
 				return self.current
 
+		self.rollback(mark)
 		return start
 
-	def nbt_byte_parser(self, properties={}):
+	def nbt_byte_parser(self, properties=EMPTY_CONTEXT):
 		start = self.current
+		mark = self.mark()
 		self.current = self.integer_parser(properties)
 		if start != self.current:
 			if self.current < len(self.string) and self.string[self.current] == "b":
 				self.append_region(self.mccconstant, self.current, self.current + 1)
 				return self.current + 1
 			else: 
+				self.rollback(mark)
 				return start
 		return self.boolean_parser(properties)
 
-	def integer_parser(self, properties={}):
+	def integer_parser(self, properties=EMPTY_CONTEXT):
 		integer_match = self.regex["integer"].match(self.string, self.current)
 		if integer_match:
 			value = int(integer_match.group())
@@ -926,7 +923,7 @@ class Parser:
 			return integer_match.end()
 		return self.current
 
-	def block_parser(self, properties={}):
+	def block_parser(self, properties=EMPTY_CONTEXT):
 		start = self.current
 		lenient = False
 		if self.string.startswith("#", start):
@@ -938,9 +935,9 @@ class Parser:
 
 			if (block_name in BLOCKS and "properties" in BLOCKS[block_name] and 
 					(block_match.group(1) in [None, "minecraft:"] or lenient)):
-				properties = BLOCKS[block_name]["properties"]
+				block_states = BLOCKS[block_name]["properties"]
 			elif lenient:
-				properties = {}
+				block_states = {}
 			else:
 				return start
 
@@ -978,7 +975,7 @@ class Parser:
 					return self.current + 1
 
 				key = key_match.group(1)
-				if lenient or key in properties:
+				if lenient or key in block_states:
 					self.append_region(self.mccstring, key_match.start(1), key_match.end(1))
 				else:
 					self.append_region(self.invalid, key_match.start(1), key_match.end(1))
@@ -994,7 +991,7 @@ class Parser:
 					self.append_region(self.invalid, self.current, self.current + 1)
 					return self.current + 1
 
-				if lenient or (key in properties and value_match.group() in properties[key]):
+				if lenient or (key in block_states and value_match.group() in block_states[key]):
 					self.append_region(self.mccstring, value_match.start(), value_match.end())
 				else: 
 					self.append_region(self.invalid, value_match.start(), value_match.end())
@@ -1019,17 +1016,17 @@ class Parser:
 
 		return start
 
-	def nbt_path_parser(self, properties={}):
+	def nbt_path_parser(self, properties=EMPTY_CONTEXT):
 		start = self.current
 
 		while self.current < len(self.string):
 			start_of_segment = self.current
 			old_current = self.current
-			self.current = self.string_parser({"type":"word"})
+			self.current = self.string_parser(WORD_STRING)
 			if self.current < len(self.string) and self.string[self.current] == "[":
 				self.current += 1
 				old_current = self.current
-				self.current = self.integer_parser({"min":0})
+				self.current = self.integer_parser(LIST_INDEX)
 				if old_current == self.current or (self.current < len(self.string) and self.string[self.current] != "]"):
 					return start
 				else:
@@ -1046,7 +1043,7 @@ class Parser:
 
 		return start
 
-	def float_parser(self, properties={}):
+	def float_parser(self, properties=EMPTY_CONTEXT):
 		float_match = self.regex["float"].match(self.string, self.current)
 		if float_match:
 			value = float(float_match.group())
@@ -1057,7 +1054,7 @@ class Parser:
 			return float_match.end()
 		return self.current
 
-	def boolean_parser(self, properties={}):
+	def boolean_parser(self, properties=EMPTY_CONTEXT):
 		if self.current + 4 <= len(self.string) and self.string[self.current:self.current+4] == "true":
 			self.append_region(self.mccconstant, self.current, self.current + 4)
 			return self.current + 4
@@ -1068,10 +1065,10 @@ class Parser:
 
 		return self.current
 
-	def axes_parser(self, properties={}):
+	def axes_parser(self, properties=EMPTY_CONTEXT):
 		return self.item_from_set_parser(AXES, self.mccliteral)
 
-	def score_holder_parser(self, properties={}):
+	def score_holder_parser(self, properties=EMPTY_CONTEXT):
 		start = self.current
 		if self.string[self.current] == "#":
 			self.current = self.current + 1
@@ -1084,7 +1081,7 @@ class Parser:
 			return self.current
 		return self.entity_parser(properties)
 
-	def particle_parser(self, properties={}):
+	def particle_parser(self, properties=EMPTY_CONTEXT):
 		particle_match = self.regex["item_block_id"].match(self.string, self.current)
 		if particle_match and particle_match.group(2) in PARTICLES and particle_match.group(1) in [None, "minecraft:"]:
 			self.append_region(self.mccliteral, particle_match.start(1), particle_match.end(1))
@@ -1093,11 +1090,11 @@ class Parser:
 
 			if particle_match.group(2) == "block" or particle_match.group(2) == "falling_dust":
 				self.skip_whitespace(self.current)
-				return self.block_parser(self.current)
+				return self.block_parser()
 
 			elif particle_match.group(2) == "item":
 				self.skip_whitespace(self.current)
-				return self.item_parser(self.current)
+				return self.item_parser()
 
 			elif particle_match.group(2) == "dust":
 				self.skip_whitespace(self.current)
@@ -1106,19 +1103,18 @@ class Parser:
 		return self.current
 
 	# https://www.json.org/
-	def json_parser(self, properties={}):
+	def json_parser(self, properties=EMPTY_CONTEXT):
 		if not "escape_depth" in properties:
-			properties["escape_depth"] = 0
+			properties = properties.at_escape_depth(0)
 
 		if self.string[self.current] == "[":
 			return self.json_array_parser(properties)
 		elif self.string[self.current]  == "{":
 			return self.json_object_parser(properties)
 
-		properties["type"] = "strict"
-		return self.string_parser(properties)
+		return self.string_parser(properties.derive(type="strict"))
 
-	def json_object_parser(self, properties={}):# The '{}' one
+	def json_object_parser(self, properties=EMPTY_CONTEXT):# The '{}' one
 		if self.string[self.current] != "{":
 			return self.current
 		quote = self.generate_quote(properties["escape_depth"])
@@ -1132,7 +1128,8 @@ class Parser:
 				return start_of_object
 
 			start_of_key = self.current
-			self.current = self.string_parser(properties={"type":"strict","escape_depth":properties["escape_depth"]})
+			key_mark = self.mark()
+			self.current = self.string_parser(STRICT_STRING.at_escape_depth(properties["escape_depth"]))
 			if start_of_key == self.current:
 				if self.current < len(self.string):
 					self.append_region(self.invalid, self.current, self.current + 1)
@@ -1154,7 +1151,7 @@ class Parser:
 			matched = False
 			if key in JSON_STRING_KEYS:
 				start_of_value = self.current
-				self.current = self.string_parser(properties={"type":"strict","escape_depth":properties["escape_depth"]})
+				self.current = self.string_parser(STRICT_STRING.at_escape_depth(properties["escape_depth"]))
 				if start_of_value != self.current:
 					matched = True
 
@@ -1206,7 +1203,7 @@ class Parser:
 				matched = True
 
 			if not matched:
-				self.mccstring.pop()
+				self.rollback(key_mark)
 				self.append_region(self.invalid, start_of_key, self.current)
 				return self.current
 
@@ -1229,13 +1226,13 @@ class Parser:
 
 		return self.current + 1
 
-	def json_array_parser(self, properties={}): # The '[]' one
+	def json_array_parser(self, properties=EMPTY_CONTEXT): # The '[]' one
 		if self.string[self.current] != "[":
 			return self.current
 		start_of_list = self.current
 		self.current += 1
 
-		def null_parser(properties={}):
+		def null_parser(properties=EMPTY_CONTEXT):
 			if self.current + 4 < len(self.string) and self.string[self.current : self.current + 4] == "null":
 				self.append_region(self.mccconstant, self.current, self.current + 4)
 				self.current += 4
@@ -1249,17 +1246,12 @@ class Parser:
 			self.boolean_parser
 		]
 
-		old_type = None
-		if "type" in properties:
-			old_type = properties["type"]
-		properties["type"] = "strict"
+		properties = properties.derive(type="strict")
 
 		continue_parsing = True
 		while continue_parsing:
 			reached_end = self.skip_whitespace(self.current)
 			if reached_end:
-				if old_type != None:
-					properties["type"] = old_type
 				return self.current
 
 			start_of_value = self.current
@@ -1270,38 +1262,27 @@ class Parser:
 				if old_current != self.current:
 					break
 
-			if old_type != None:
-				properties["type"] = old_type
-
 			if start_of_value == self.current:
 				if self.current < len(self.string):
 					self.append_region(self.invalid, self.current, self.current + 1)
-				if old_type != None:
-					properties["type"] = old_type
 				return self.current
 
 			reached_end = self.skip_whitespace(start_of_value)
 			if reached_end:
-				if old_type != None:
-					properties["type"] = old_type
 				return self.current
 
 			if self.string[self.current] == ",":
 				self.current += 1
 			elif self.string[self.current] != "]":
-				if old_type != None:
-					properties["type"] = old_type
 				self.append_region(self.invalid, self.current, self.current + 1)
 				return self.current + 1
 			else:
 				continue_parsing = False
 
-		if old_type != None:
-			properties["type"] = old_type
 		self.current += 1
 		return self.current
 
-	def json_event_parser(self, action_set, properties={}):
+	def json_event_parser(self, action_set, properties=EMPTY_CONTEXT):
 		if self.string[self.current] != "{": #Can't be [] since it's an object
 			return self.current
 		self.current += 1
@@ -1312,13 +1293,14 @@ class Parser:
 		quote = self.generate_quote(escape_depth)
 
 		start_of_object = self.current
-		while self.string[self.current] != "}":
+		while self.current < len(self.string) and self.string[self.current] != "}":
 			reached_end = self.skip_whitespace(self.current)
 			if reached_end:
 				return self.current
 
 			start_of_key = self.current
-			self.current = self.string_parser(properties={"type":"strict","escape_depth":escape_depth})
+			key_mark = self.mark()
+			self.current = self.string_parser(STRICT_STRING.at_escape_depth(escape_depth))
 			if start_of_key == self.current:
 				self.append_region(self.invalid, self.current, self.current + 1)
 				return self.current+1
@@ -1340,7 +1322,7 @@ class Parser:
 
 			success = False
 			if key == "action":
-				def action_parser(properties={}):
+				def action_parser(properties=EMPTY_CONTEXT):
 					return self.item_from_set_parser(action_set, self.mccstring)
 
 				start_of_value = self.current
@@ -1350,12 +1332,12 @@ class Parser:
 
 			if key == "value":
 				start_of_value = self.current
-				self.current = self.string_parser(properties={"type":"strict","escape_depth":escape_depth})
+				self.current = self.string_parser(STRICT_STRING.at_escape_depth(escape_depth))
 				if start_of_value != self.current:
 					success = True
 
 			if not success:
-				self.mccstring.pop()
+				self.rollback(key_mark)
 				self.append_region(self.invalid, start_of_key, self.current)
 				return self.current
 
@@ -1369,22 +1351,25 @@ class Parser:
 				self.append_region(self.invalid, self.current, self.current + 1)
 				return self.current + 1
 
+		if self.current >= len(self.string):
+			return self.current
 		return self.current + 1
 
-	def json_score_parser(self, properties={}):
+	def json_score_parser(self, properties=EMPTY_CONTEXT):
 		if self.string[self.current] != "{": #Can't be [] since its an object
 			return self.current
 		self.current += 1
 		quote = self.generate_quote(properties["escape_depth"])
 
 		start_of_object = self.current
-		while self.string[self.current] != "}":
+		while self.current < len(self.string) and self.string[self.current] != "}":
 			reached_end = self.skip_whitespace(start_of_object)
 			if reached_end:
 				return self.current
 
 			start_of_key = self.current
-			self.current = self.string_parser(properties={"type":"strict","escape_depth":properties["escape_depth"]})
+			key_mark = self.mark()
+			self.current = self.string_parser(STRICT_STRING.at_escape_depth(properties["escape_depth"]))
 			if start_of_key == self.current:
 				self.append_region(self.invalid, self.current, self.current + 1)
 				return self.current + 1
@@ -1395,7 +1380,7 @@ class Parser:
 				return self.current
 
 			if self.string[self.current] != ":":
-				self.mccstring.pop()
+				self.rollback(key_mark)
 				self.append_region(self.invalid, start_of_key, self.current)
 				return self.current + 1
 			self.current += 1
@@ -1424,7 +1409,7 @@ class Parser:
 					success = True
 
 			if not success:
-				self.mccstring.pop()
+				self.rollback(key_mark)
 				self.append_region(self.invalid, start_of_key, self.current)
 				return self.current
 
@@ -1438,10 +1423,12 @@ class Parser:
 				self.append_region(self.invalid, self.current, self.current + 1)
 				return self.current + 1
 
+		if self.current >= len(self.string):
+			return self.current
 		self.current += 1
 		return self.current
 
-	def objective_criteria_parser(self, properties={}):
+	def objective_criteria_parser(self, properties=EMPTY_CONTEXT):
 		criteria_match = self.regex["objective_criteria"].match(self.string, self.current)
 		if criteria_match:
 			namespace = criteria_match.group(1)
@@ -1467,7 +1454,7 @@ class Parser:
 
 		return self.current
 
-	def time_parser(self, properties={}):
+	def time_parser(self, properties=EMPTY_CONTEXT):
 		start = self.current
 		self.current = self.integer_parser()
 		if start == self.current:
@@ -1479,65 +1466,65 @@ class Parser:
 
 		return self.current
 
-	def entity_location_parser(self, properties={}):
+	def entity_location_parser(self, properties=EMPTY_CONTEXT):
 		return self.location_from_list_parser(self.regex["item_block_id"], ENTITIES)
 
-	def function_parser(self, properties={}):
+	def function_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["namespace"], [self.mccstring, self.mccliteral, self.invalid])
 
-	def username_parser(self, properties={}):
+	def username_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["username"], [self.mccstring])
 
-	def objective_parser(self, properties={}):
+	def objective_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["objective"], [self.mccstring])
 
-	def vec3d_parser(self, properties={}):
+	def vec3d_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["position-3"], [self.mccconstant, self.mccconstant, self.mccconstant])
 
-	def vec2d_parser(self, properties={}):
+	def vec2d_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["position-2"], [self.mccconstant, self.mccconstant])
 
-	def item_slot_parser(self, properties={}):
+	def item_slot_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["item_slot"], [self.mccstring])
 
-	def scoreboard_slot_parser(self, properties={}):
+	def scoreboard_slot_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["scoreboard_slot"], [self.mccstring])
 
-	def color_parser(self, properties={}):
+	def color_parser(self, properties=EMPTY_CONTEXT):
 		return self.item_from_set_parser(COLORS, self.mccconstant)
 
-	def entity_anchor_parser(self, properties={}):
+	def entity_anchor_parser(self, properties=EMPTY_CONTEXT):
 		return self.item_from_set_parser(ENTITY_ANCHORS, self.mccstring)
 
-	def scoreboard_operation_parser(self, properties={}):
+	def scoreboard_operation_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["operation"], [self.mcccommand])
 
-	def mob_effect_parser(self, proeprties={}):
+	def mob_effect_parser(self, properties=EMPTY_CONTEXT):
 		return self.location_from_list_parser(self.regex["item_block_id"], POTIONS)
 
-	def sound_parser(self, properties={}):
+	def sound_parser(self, properties=EMPTY_CONTEXT):
 		return self.location_from_list_parser(self.regex["resource_location"], SOUNDS)
 
-	def resource_location(self, properties={}):
+	def resource_location(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["resource_location"], [self.mccstring, self.mccliteral])
 
-	def gamemode_parser(self, properties={}):
+	def gamemode_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["gamemode"], [self.mccstring])
 
-	def sort_parser(self, properties={}):
+	def sort_parser(self, properties=EMPTY_CONTEXT):
 		return self.regex_parser(self.regex["sort"], [self.mccliteral])
 
-	def item_parser(self, properties={}):
+	def item_parser(self, properties=EMPTY_CONTEXT):
 		old_current = self.current
 		self.current = self.location_from_list_parser(self.regex["item_block_id"], ITEMS)
 		if self.current != old_current:
 			return self.nbt_parser(properties)
 		return self.current
 
-	def enchantment_parser(self, properties={}):
+	def enchantment_parser(self, properties=EMPTY_CONTEXT):
 		return self.location_from_list_parser(self.regex["resource_location"], ENCHANTMENTS, False)
 
-	def dimension_parser(self, properties={}):
+	def dimension_parser(self, properties=EMPTY_CONTEXT):
 		dimensions = {"overworld", "the_end", "the_nether"}
 		return self.location_from_list_parser(self.regex["resource_location"], dimensions, False)
 
@@ -1568,11 +1555,12 @@ class Parser:
 			return self.current
 
 		if not self.string.startswith("{", self.current + len(quote)):
-			return self.string_parser({"escape_depth": escape_depth, "type":"strict"})
+			return self.string_parser(STRICT_STRING.at_escape_depth(escape_depth))
 
 		self.append_region(self.mccstring, self.current, self.current + len(quote))
 		self.current += len(quote)
-		self.current = self.json_parser({"escape_depth": escape_depth + 1})
+		if not self.unescaped_json_parser(escape_depth + 1):
+			self.current = self.json_parser(EMPTY_CONTEXT.at_escape_depth(escape_depth + 1))
 
 		if not self.string.startswith(quote, self.current):
 			self.append_region(self.invalid, self.current, min(self.current + 1, len(self.string)))
@@ -1582,7 +1570,7 @@ class Parser:
 			self.current += len(quote)
 		return self.current
 
-	def regex_parser(self, pattern, scopes, properties={}):
+	def regex_parser(self, pattern, scopes, properties=EMPTY_CONTEXT):
 		pattern_match = pattern.match(self.string, self.current)
 		if pattern_match:
 			if len(scopes) == 1:
@@ -1607,7 +1595,7 @@ class Parser:
 
 		return self.current
 
-	def quoted_parser(self, parser, properties={}):
+	def quoted_parser(self, parser, properties=EMPTY_CONTEXT):
 		if not "escape_depth" in properties:
 			escape_depth = 0
 		else:
@@ -1617,29 +1605,161 @@ class Parser:
 		if not self.string.startswith(quote, self.current):
 			return self.current
 
+		mark = self.mark()
 		self.append_region(self.mccstring, self.current, self.current + len(quote))
 		self.current += len(quote)
 
 		old_current = self.current
-		self.current = parser(properties)
+		if self.current < len(self.string):
+			self.current = parser(properties)
 		if old_current == self.current:
-			self.mccstring.pop()
+			self.rollback(mark)
 			return self.current
 
 		if not self.string.startswith(quote, self.current):
-			self.mccstring.pop()
+			self.rollback(mark)
 			return start
 		self.append_region(self.mccstring, self.current, self.current + len(quote))
 		return self.current + len(quote)
 
+	# Every level of escaping doubles the backslashes in front of a quote and adds one more
+	# Parses the JSON from the current character to the end of the string it's in, escape_depth
+	# escapes deep, by unescaping it into a buffer and parsing that at escape depth 0.  The
+	# tokens are mapped back to the line's columns afterwards, so however deep the JSON is the
+	# JSON parsers only ever see plain quotes and backslashes.
+	#
+	# Returns False with nothing changed when the JSON can't be unescaped or doesn't parse
+	# cleanly, then it's parsed in place at its escape depth to mark the errors where they are
+	def unescaped_json_parser(self, escape_depth):
+		unescaped = self.unescape(self.current, escape_depth)
+		if unescaped == None:
+			return False
+		buffer, columns = unescaped
+
+		string = self.string
+		current = self.current
+		region_begin = self.region_begin
+		mark = self.mark()
+		self.string = buffer
+		self.current = 0
+		self.region_begin = 0
+		try:
+			end = self.json_parser(EMPTY_CONTEXT)
+		finally:
+			self.string = string
+			self.region_begin = region_begin
+
+		tokens = self.tokens
+		if end != len(buffer) or self.invalid in tokens[mark + 2::3]:
+			self.rollback(mark)
+			self.current = current
+			return False
+
+		for i in range(mark, len(tokens), 3):
+			tokens[i] = region_begin + columns[tokens[i]]
+			tokens[i + 1] = region_begin + columns[tokens[i + 1]]
+		self.current = columns[end]
+		return True
+
+	# Unescapes the string from column start, escape_depth escapes deep, up to the quote that
+	# ends it.  Returns the unescaped text and the column each of its characters starts at in
+	# the line, with the column of the closing quote last, or None if the string doesn't end or
+	# isn't escaped right.
+	#
+	# Only runs of backslashes and quotes change, every level of escaping halves a run's
+	# backslashes and a quote must have an odd number in front of it until the last level,
+	# where an even number means it's the closing quote.  So each run is unescaped in one step
+	# however deep it is
+	def unescape(self, start, escape_depth):
+		string = self.string
+		width = 2 ** escape_depth # columns an unescaped backslash takes up in the line
+		pieces = []
+		columns = array("i")
+		position = start
+		for run in self.regex["escape_run"].finditer(string, start):
+			run_start = run.start()
+			pieces.append(string[position:run_start])
+			columns.extend(range(position, run_start))
+
+			is_quote = string[run.end() - 1] == "\""
+			backslashes = run.end() - run_start - is_quote
+			for level in range(escape_depth):
+				if backslashes % 2 == 0 and is_quote:
+					if level < escape_depth - 1:
+						return None
+					# The closing quote, the backslashes before it are escaped backslashes
+					backslashes //= 2
+					pieces.append("\\" * backslashes)
+					columns.extend(range(run_start, run_start + backslashes * width, width))
+					columns.append(run_start + backslashes * width)
+					return "".join(pieces), columns
+				if backslashes % 2 == 1 and not is_quote:
+					return None
+				backslashes //= 2
+
+			pieces.append("\\" * backslashes)
+			columns.extend(range(run_start, run_start + backslashes * width, width))
+			if is_quote:
+				pieces.append("\"")
+				columns.append(run_start + backslashes * width)
+			position = run.end()
+
+		return None
+
 	def generate_quote(self, escape_depth):
-		quotes = ["\"", "\\\"", "\\\\\\\"", "\\\\\\\\\\\\\\\"", "\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\""]
-		if escape_depth <= 4:
-			return quotes[escape_depth]
-		
-		for i in range(0, escape_depth):
-			quote += "\\"
-		return quote + self.generate_quote(escape_depth - 1)
+		return "\\" * (2 ** escape_depth - 1) + "\""
+
+	# Returns the quote, the escape and the scanner of strings at escape_depth.  Only quotes and
+	# backslashes can end a run of string, so the scanner skips straight to the next one and
+	# tells in the same step whether it's the closing quote (group 1), an escape (group 2) and
+	# the character it escapes (group 3), or neither
+	def string_scanner(self, escape_depth):
+		scanner = self.string_scanners.get(escape_depth)
+		if scanner == None:
+			quote = self.generate_quote(escape_depth)
+			escape = self.generate_quote(escape_depth + 1)[:-1]
+			pattern = re.compile("[^\"\\\\]*(?:(" + re.escape(quote) + ")|(" + re.escape(escape) + ")(.))?", re.DOTALL)
+			scanner = (quote, escape, pattern)
+			self.string_scanners[escape_depth] = scanner
+		return scanner
+
+	# Data for target selector parsing, one entry for each of TARGET_KEY_LISTS
+	# order for tuple:
+	# (isNegatable, isRange, parser)
+	target_selector_value_parsers = (
+		(False, True, integer_parser),
+		(False, False, integer_parser),
+		(False, True, float_parser),
+		(True, False, string_parser),
+		(True, False, gamemode_parser),
+		(True, False, sort_parser),
+		(True, False, entity_location_parser),
+		(False, False, score_parser),
+		(False, False, advancement_parser),
+		(True, False, nbt_parser)
+	)
+
+	# The parser of each NBT value type in NBT_TAGS and the characters a value of that type can
+	# start with.  Each parser fails without finding any tokens on any other character.  This is
+	# only looked up by name, the order types are tried in comes from NbtValueTypes
+	nbt_value_types = {
+		"byte"            : (re.compile("[\-\dtf]"), nbt_byte_value),
+		"short"           : (re.compile("[\-\d]"), nbt_short_value),
+		"int"             : (re.compile("[\-\d]"), nbt_int_value),
+		"long"            : (re.compile("[\-\d]"), nbt_long_value),
+		"float"           : (re.compile("[\-\.\d]"), nbt_float_value),
+		"double"          : (re.compile("[\-\.\d]"), nbt_double_value),
+		"string"          : (re.compile("[\"\w\(\)\.\<\>\-]"), nbt_string_value),
+		"string_list"     : (re.compile("\["), nbt_string_list_value),
+		"compound"        : (re.compile("\{"), nbt_compound_value),
+		"compound_list"   : (re.compile("\["), nbt_compound_list_value),
+		"custom_compound" : (re.compile("\{"), nbt_custom_compound_value),
+		"int_list"        : (re.compile("\["), nbt_int_list_value),
+		"double_list"     : (re.compile("\["), nbt_double_list_value),
+		"float_list"      : (re.compile("\["), nbt_float_list_value),
+		"json"            : (re.compile("[\"\\\\]"), nbt_json_value),
+		"json_list"       : (re.compile("\["), nbt_json_list_value)
+	}
 
 	parsers = { # Master list of what function the parser name in commands.json corresponds to
 		"minecraft:resource_location" : resource_location,
@@ -1685,4 +1805,73 @@ class Parser:
 		"minecraft:time"              : time_parser
 	}
 
-PARSER = Parser()
\ No newline at end of file
+	# The characters each parser in parsers can start on.  Parsers that aren't listed here, and
+	# greedy strings, can start on anything
+	first_chars = {
+		"minecraft:resource_location" : re.compile("[\w\.]"),
+		"minecraft:function"          : re.compile("[#a-z_\-0-9\.]"),
+		"minecraft:entity"            : re.compile("[@\w\(\)\.\<\>\-%\*]"),
+		"brigadier:string"            : re.compile("[\"\w\(\)\.\<\>\-]"),
+		"minecraft:game_profile"      : re.compile("[\w\(\)\.\<\>\-%\*]"),
+		"minecraft:block_pos"         : re.compile("[~\^\-\.\d]"),
+		"minecraft:nbt_compound_tag"  : re.compile("\{"),
+		"minecraft:item_stack"        : re.compile("[#a-z_]"),
+		"minecraft:item_predicate"    : re.compile("[#a-z_]"),
+		"brigadier:integer"           : re.compile("[\-\d]"),
+		"minecraft:block_state"       : re.compile("[#a-z_]"),
+		"minecraft:block_predicate"   : re.compile("[#a-z_]"),
+		"minecraft:nbt_path"          : re.compile("[\w\(\)\.\<\>\-\[]"),
+		"brigadier:float"             : re.compile("[\-\.\d]"),
+		"brigadier:double"            : re.compile("[\-\.\d]"),
+		"brigadier:bool"              : re.compile("[tf]"),
+		"minecraft:swizzle"           : re.compile("[xyz]"),
+		"minecraft:score_holder"      : re.compile("[#@\w\(\)\.\<\>\-%\*]"),
+		"minecraft:objective"         : re.compile("[\w\(\)\.\<\>\-]"),
+		"minecraft:vec3"              : re.compile("[~\^\-\.\d]"),
+		"minecraft:vec2"              : re.compile("[~\-\.\d]"),
+		"minecraft:particle"          : re.compile("[#a-z_]"),
+		"minecraft:item_slot"         : re.compile("[acehivw]"),
+		"minecraft:scoreboard_slot"   : re.compile("[bls]"),
+		"minecraft:team"              : re.compile("[\w\(\)\.\<\>\-%\*]"),
+		"minecraft:color"             : re.compile("[abdglnrwy]"),
+		"minecraft:rotation"          : re.compile("[~\-\.\d]"),
+		"minecraft:component"         : re.compile("[\[\{\"]"),
+		"minecraft:entity_anchor"     : re.compile("[ef]"),
+		"minecraft:operation"         : re.compile("[+\-\*\%\/=<>]"),
+		"minecraft:int_range"         : re.compile("[\-\.\d]"),
+		"minecraft:mob_effect"        : re.compile("[#a-z_]"),
+		"minecraft:sound"             : re.compile("[\w\.]"),
+		"minecraft:objective_criteria": re.compile("[\w\.]"),
+		"minecraft:entity_summon"     : re.compile("[#a-z_]"),
+		"minecraft:item_enchantment"  : re.compile("[\w\.]"),
+		"minecraft:dimension"         : re.compile("[\w\.]"),
+		"minecraft:column_pos"        : re.compile("[~\-\.\d]"),
+		"minecraft:nbt_tag"           : re.compile("[\"\[\{\w\(\)\.\<\>\-]"),
+		"minecraft:time"              : re.compile("[\-\d]")
+	}
+
+# The NBT value types of a key in NBT_TAGS, with the parsers of those types that can start on
+# each character filled in as the characters come up
+class NbtValueTypes:
+	__slots__ = ("names", "types", "first_char_parsers")
+
+	def __init__(self, names):
+		self.names = names
+		self.types = []
+		for name in names:
+			if name in Parser.nbt_value_types:
+				self.types.append(Parser.nbt_value_types[name])
+			else:
+				print("unkown type: " + str(name))
+		self.first_char_parsers = {} # character -> the parsers that can start on it
+
+	def parsers_starting_with(self, char):
+		value_parsers = tuple(value_parser for first_chars, value_parser in self.types if first_chars.match(char))
+		self.first_char_parsers[char] = value_parsers
+		return value_parsers
+
+NBT_VALUE_TYPES = {key: NbtValueTypes(names) for key, names in NBT_TAGS.items()}
+ANY_NBT_VALUE = NbtValueTypes([
+	"byte", "short", "int", "long", "float", "double", "string", "string_list", "compound", "compound_list",
+	"custom_compound", "int_list", "double_list", "float_list", "json", "json_list"
+])
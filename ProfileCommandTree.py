@@ -0,0 +1,43 @@
+import os
+import sublime
+import sublime_plugin
+from .Parser import Parser
+from .TreeProfile import TreeProfile
+
+# Profiling is opt in: nothing is counted until this command is run over a project's function
+# files.  The counts add up over runs and are kept in the User package
+def profile_path():
+	return os.path.join(sublime.packages_path(), "User", "MCC Tree Profile.json")
+
+def plugin_loaded():
+	Parser.argument_counts = TreeProfile.load(profile_path()).argument_counts()
+
+class ProfileCommandTreeCommand(sublime_plugin.WindowCommand):
+	def run(self):
+		folders = self.window.folders()
+		sublime.set_timeout_async(lambda: self.profile(folders), 0)
+
+	def profile(self, folders):
+		settings = sublime.load_settings("Preferences.sublime-settings")
+		allow_custom_tags = settings.get("mcc_custom_tags", False)
+		profile = TreeProfile.load(profile_path())
+
+		file_count = 0
+		for folder in folders:
+			for directory, _, file_names in os.walk(folder):
+				for file_name in file_names:
+					if file_name.endswith(".mcfunction"):
+						with open(os.path.join(directory, file_name), encoding="utf-8", errors="replace") as file:
+							profile.add_lines(file.read().split("\n"), allow_custom_tags)
+						file_count += 1
+
+		profile.save(profile_path())
+		message = "MCC: profiled the command tree over {} function files, it will be used the next time Sublime Text starts".format(file_count)
+		print(message)
+		sublime.status_message(message)
+
+	def is_enabled(self):
+		return len(self.window.folders()) > 0
+
+	def description(self):
+		return "Profile the command tree over this project's function files"
@@ -0,0 +1,143 @@
+import sublime
+from array import array
+from itertools import accumulate
+
+# Draws the regions of a view in blocks of consecutive lines, with one key per scope and block
+# instead of one per scope and line.  A block keeps its lines when lines are added or removed
+# elsewhere, so an edit only ever redraws the blocks it touched.  Keys of blocks that lost all
+# of their lines are erased.  The lines drawn under each key are remembered so keys whose
+# lines and regions didn't change are never sent to the view again, as sublime has already
+# moved their regions along with the text.  Lines come with the token streams of the parser and
+# only the tokens of keys that are sent are turned into regions
+class RegionManager:
+	add_regions_flags = sublime.DRAW_NO_OUTLINE
+	block_size = 128
+	# (key prefix, scope) indexed by the scope ids of the parser's tokens
+	region_scopes = (
+		("mcccomment", "mcccomment"),
+		("mcccommand", "mcccommand"),
+		("mccconstant", "mccconstant"),
+		("mccstring", "mccstring"),
+		("mccentity", "mccentity"),
+		("mccliteral", "mccliteral"),
+		("invalid", "invalid.illegal")
+	)
+
+	def __init__(self, view):
+		self.view = view
+		self.line_blocks = {} # line id -> block id
+		self.block_sizes = {} # block id -> number of lines
+		self.drawn_lines = {} # region key -> [(line_id, line_text, line relative (start, end) pairs)] last drawn
+		self.next_block_id = 0
+
+	# lines are the (line_id, line_text, tokens) states of the whole view, dirty_rows the rows
+	# in lines whose tokens changed and removed_lines the line states that no longer exist.
+	# Every key of the blocks holding redraw_rows is sent again, even if it didn't change
+	def update(self, lines, dirty_rows, removed_lines, redraw_rows=()):
+		dirty_blocks = set()
+		for line_state in removed_lines:
+			block_id = self.line_blocks.pop(line_state[0])
+			self.block_sizes[block_id] -= 1
+			dirty_blocks.add(block_id)
+
+		# New lines join the block of the line above them, which is always assigned
+		# by the time it's reached since rows are handled top to bottom
+		block_rows = {}
+		for row in sorted(set(dirty_rows).union(redraw_rows)):
+			line_id = lines[row][0]
+			block_id = self.line_blocks.get(line_id)
+			if block_id == None:
+				if row > 0:
+					block_id = self.line_blocks[lines[row - 1][0]]
+				else:
+					block_id = self.new_block()
+				self.line_blocks[line_id] = block_id
+				self.block_sizes[block_id] += 1
+			block_rows.setdefault(block_id, row)
+
+		for block_id in dirty_blocks.difference(block_rows):
+			if self.block_sizes[block_id] == 0:
+				self.erase_block(block_id)
+			else:
+				block_rows[block_id] = self.find_block_row(lines, block_id)
+
+		if len(block_rows) == 0:
+			return
+
+		region_starts = [0]
+		region_starts.extend(accumulate(len(line_state[1]) + 1 for line_state in lines))
+
+		redraw_blocks = {self.line_blocks[lines[row][0]] for row in redraw_rows}
+		for block_id, row in block_rows.items():
+			self.draw_block(lines, block_id, row, region_starts, block_id in redraw_blocks)
+
+	def draw_block(self, lines, block_id, row, region_starts, redraw):
+		first = row
+		while first > 0 and self.line_blocks[lines[first - 1][0]] == block_id:
+			first -= 1
+		end = row + 1
+		while end < len(lines) and self.line_blocks[lines[end][0]] == block_id:
+			end += 1
+
+		# Blocks that grew too big are split back into regular sized ones
+		if end - first > 2 * self.block_size:
+			for block_first in range(first, end, self.block_size):
+				if block_first != first:
+					block_id = self.new_block()
+				block_end = min(block_first + self.block_size, end)
+				for line_state in lines[block_first:block_end]:
+					self.line_blocks[line_state[0]] = block_id
+				self.block_sizes[block_id] = block_end - block_first
+				self.add_block_regions(lines, block_id, block_first, block_end, region_starts, redraw)
+		else:
+			self.add_block_regions(lines, block_id, first, end, region_starts, redraw)
+
+	def add_block_regions(self, lines, block_id, first, end, region_starts, redraw):
+		block_key = str(block_id)
+		scope_rows = tuple([] for scope in self.region_scopes)
+		scope_lines = tuple([] for scope in self.region_scopes)
+		for row in range(first, end):
+			line_id, line_text, tokens = lines[row]
+			if isinstance(tokens, array): # Not empty or waiting to be parsed
+				for scope_index, spans in enumerate(self.split_tokens(tokens)):
+					if len(spans) > 0:
+						scope_rows[scope_index].append(row)
+						scope_lines[scope_index].append((line_id, line_text, spans))
+
+		for scope_index, (key, scope) in enumerate(self.region_scopes):
+			region_key = key + block_key
+			drawn_lines = scope_lines[scope_index]
+			if not redraw and self.drawn_lines.get(region_key, []) == drawn_lines:
+				continue
+			self.drawn_lines[region_key] = drawn_lines
+
+			regions = []
+			for row, (line_id, line_text, spans) in zip(scope_rows[scope_index], drawn_lines):
+				region_start = region_starts[row]
+				for i in range(0, len(spans), 2):
+					regions.append(sublime.Region(region_start + spans[i], region_start + spans[i + 1]))
+			self.view.add_regions(region_key, regions, scope, flags=self.add_regions_flags)
+
+	# Splits a token stream of start, end, scope id triples into a tuple of start, end pairs per scope
+	def split_tokens(self, tokens):
+		spans = tuple([] for scope in self.region_scopes)
+		for i in range(0, len(tokens), 3):
+			spans[tokens[i + 2]].extend((tokens[i], tokens[i + 1]))
+		return tuple(map(tuple, spans))
+
+	def find_block_row(self, lines, block_id):
+		for row, line_state in enumerate(lines):
+			if self.line_blocks[line_state[0]] == block_id:
+				return row
+
+	def new_block(self):
+		self.next_block_id += 1
+		self.block_sizes[self.next_block_id] = 0
+		return self.next_block_id
+
+	def erase_block(self, block_id):
+		del self.block_sizes[block_id]
+		block_key = str(block_id)
+		for key, scope in self.region_scopes:
+			self.drawn_lines.pop(key + block_key, None)
+			self.view.erase_regions(key + block_key)
@@ -0,0 +1,15 @@
+import sublime
+import sublime_plugin
+from .LineCache import LINE_CACHE
+
+class ShowLineCacheStatsCommand(sublime_plugin.ApplicationCommand):
+	def run(self):
+		stats = LINE_CACHE.stats()
+		print("MCC line cache: " + stats)
+		sublime.status_message("MCC line cache: " + stats)
+
+	def is_enabled(self):
+		return True
+
+	def description(self):
+		return "Show line cache statistics"
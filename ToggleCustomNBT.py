@@ -1,12 +1,13 @@
 import sublime
 import sublime_plugin
-from .MccHighlighting import MccHighlightCommand
+from .MccHighlighting import MccHighlightCommand, HighlightSettings
 
 class ToggleCustomNbtCommand(sublime_plugin.ApplicationCommand):
 	def run(self):
 		settings = sublime.load_settings("Preferences.sublime-settings")
 		allow_custom = settings.get("mcc_custom_tags", False)
 		allow_custom = settings.set("mcc_custom_tags", not allow_custom)
+		HighlightSettings.reload()
 		view = sublime.active_window().active_view()
 		MccHighlightCommand().run(view)
 		return None
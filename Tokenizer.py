@@ -0,0 +1,58 @@
+import re
+from array import array
+from .Parser import Parser
+from .CompiledParser import load_compiled_parser
+
+# The highlighter without the editor.  Nothing here or in the parser imports sublime, so it can
+# be used from scripts, tests or worker processes just as well as from the plugin.
+#
+# A token stream is an array("i") of start, end, scope id triples, one per token with columns
+# relative to the start of the line.  SCOPES gives the scope name of each scope id
+
+SCOPES = ("mcccomment", "mcccommand", "mccconstant", "mccstring", "mccentity", "mccliteral", "invalid")
+
+# Matches one line at a time, the group that matched tells what kind of line it is
+LINE_PATTERN = re.compile(r"^(?:([^\S\n]*)|([\t ]*#.*)|(.*))$", re.MULTILINE)
+BLANK_LINE = 1
+COMMENT_LINE = 2
+COMMAND_LINE = 3
+
+# The generated CompiledTree.py walks lines in place of the interpreted command tree whenever
+# it's there and up to date
+PARSER_CLASS = load_compiled_parser()
+
+# Returns the token stream of a single line
+def tokenize_line(text, *, custom_tags=False):
+	return Tokenizer(custom_tags).tokenize(text)
+
+# Yields the token stream of each of lines in turn
+def tokenize_lines(lines, *, custom_tags=False):
+	tokenizer = Tokenizer(custom_tags)
+	for line in lines:
+		yield tokenizer.tokenize(line)
+
+# Tokenizes lines one after the other with a single parser, so a Tokenizer should only be used
+# by one thread at a time
+class Tokenizer:
+
+	def __init__(self, custom_tags=False):
+		self.parser = PARSER_CLASS(custom_tags)
+		self.stalled = False # Whether the last line ran out of time and got the fallback tokens
+
+	def reset(self, custom_tags):
+		self.parser.reset(custom_tags)
+		self.stalled = False
+
+	# line_kind is the LINE_PATTERN group line matched, when it's already known
+	def tokenize(self, line, line_kind=None):
+		if line_kind == None:
+			line_kind = LINE_PATTERN.match(line).lastindex
+
+		self.stalled = False
+		if line_kind == BLANK_LINE:
+			return array("i")
+		elif line_kind == COMMENT_LINE:
+			return array("i", (0, len(line), Parser.mcccomment))
+
+		self.stalled = not self.parser.highlight_line(line)
+		return self.parser.take_tokens()
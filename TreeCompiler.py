@@ -0,0 +1,325 @@
+import sys
+import json
+import hashlib
+import importlib
+import importlib.util
+
+# Generates CompiledTree.py, the command tree as a function per node for CompiledParser.py, and
+# checks it against the interpreted tree.  UpdateAll.py runs this outside of Sublime, so it
+# only uses the standard library and imports the rest of the package headless
+
+INLINE_LITERALS = 4 # nodes with more literal children than this look them up in a dict
+
+# The hash of a command tree, the same as CompiledParser.tree_hash.  The keys are sorted so the
+# hash doesn't depend on dict order, which Sublime's Python doesn't keep
+def tree_hash(command_tree):
+	return hashlib.sha1(json.dumps(command_tree, sort_keys=True).encode("utf-8")).hexdigest()
+
+class TreeCompiler:
+
+	def __init__(self, command_tree):
+		self.command_tree = command_tree
+		self.names = {} # (id of the node's data, executable) -> name of the node's function
+		self.pending = [] # (node data, executable, path) of functions still to be written
+		self.functions = []
+		self.tables = []
+		self.written_arguments = set() # names of the argument functions with tables written
+
+	# Returns the source of CompiledTree.py
+	def compile(self):
+		root_name = self.function_name(self.command_tree, self.command_tree.get("executable"), [])
+		while len(self.pending) > 0:
+			node_data, executable, path = self.pending.pop(0)
+			self.write_node(node_data, executable, path)
+
+		source_hash = tree_hash(self.command_tree)
+		return "\n".join([
+			"# File automatically generated by UpdateAll.py",
+			"from .Parser import Parser, CHILDREN_FRAME",
+			"from .ArgumentContext import ArgumentContext",
+			"from .CompiledParser import CompiledArgument, CompiledChildren, start_pattern",
+			"",
+			"SOURCE_HASH = \"" + source_hash + "\"",
+			"TOKEN = Parser.regex[\"token\"]",
+			""
+		] + self.functions + self.tables + [
+			"ROOT = " + root_name,
+			""
+		])
+
+	# Every (node, executable) pair gets a single function, redirects that say whether their
+	# target is executable get a copy of the target's function with that changed
+	def function_name(self, node_data, executable, path):
+		key = (id(node_data), executable)
+		if not key in self.names:
+			self.names[key] = "enter_" + str(len(self.names))
+			self.pending.append((node_data, executable, path))
+		return self.names[key]
+
+	def child_name(self, child_data, path):
+		return self.function_name(child_data, child_data.get("executable"), path)
+
+	def write_node(self, node_data, executable, path):
+		name = self.names[(id(node_data), executable)]
+		description = " ".join(path) if len(path) > 0 else "root"
+		if executable != node_data.get("executable"):
+			description += " (executable: " + str(executable) + ")"
+
+		lines = self.functions
+		lines.append("# " + description)
+		lines.append("def " + name + "(parser, stack):")
+		lines.append("\tparser.check_budget()")
+
+		if "redirect" in node_data:
+			target_data = self.command_tree
+			target_path = []
+			if node_data["redirect"][0] != "root":
+				for target_name in node_data["redirect"]:
+					target_data = target_data["children"][target_name]
+					target_path.append(target_name)
+			target_executable = executable if executable != None else target_data.get("executable")
+			target_name = self.function_name(target_data, target_executable, target_path)
+			lines.append("\treturn parser.follow_redirect(stack, " + target_name + ")")
+
+		elif not "children" in node_data:
+			lines.append("\treturn parser.end_of_command(" + str(executable) + ")")
+
+		elif node_data["type"] == "root":
+			commands_name = "COMMANDS_" + name[6:]
+			lines.append("\tif parser.current >= len(parser.string):")
+			lines.append("\t\treturn parser.end_of_command(" + str(executable) + ")")
+			lines.append("\treturn parser.enter_command(stack, " + commands_name + ")")
+
+			self.tables.append(commands_name + " = {")
+			for child_name, child_data in node_data["children"].items():
+				self.tables.append("\t" + repr(child_name) + ": " + self.child_name(child_data, path + [child_name]) + ",")
+			self.tables.append("}")
+
+		else:
+			self.write_children(node_data, executable, path, name[6:])
+
+		lines.append("")
+
+	# The body of a node with children, Parser.highlight's last branch unrolled for this node
+	def write_children(self, node_data, executable, path, number):
+		children_name = "CHILDREN_" + number
+		literals = []
+		arguments = []
+		last_child_executable = None
+		for child_name, child_data in node_data["children"].items():
+			if child_data["type"] == "literal":
+				literals.append((child_name, self.child_name(child_data, path + [child_name])))
+			else:
+				arguments.append((child_name, child_data, self.child_name(child_data, path + [child_name])))
+			last_child_executable = child_data.get("executable")
+
+		self.functions.extend([
+			"\tstring = parser.string",
+			"\tcurrent = parser.current",
+			"\tif current >= len(string):",
+			"\t\treturn parser.end_of_command(" + str(executable) + ")",
+			"",
+			"\tstart = current",
+			"\twhile current < len(string) and string[current] in \" \\t\":",
+			"\t\tcurrent += 1",
+			"\tparser.current = current",
+			"\tif current >= len(string):",
+			"\t\treturn " + str(bool(executable)),
+			"\telif current == start:",
+			"\t\treturn False",
+			"",
+			"\tframe = [CHILDREN_FRAME, " + children_name + ", current, parser.mark(), None, -1]"
+		])
+
+		if len(literals) > INLINE_LITERALS:
+			literals_name = "LITERALS_" + number
+			self.functions.extend([
+				"\ttoken = TOKEN.match(string, current).group()",
+				"\tliteral = " + literals_name + ".get(token)",
+				"\tif literal != None:",
+				"\t\tparser.append_region(parser.mccliteral, current, current + len(token))",
+				"\t\tparser.current = current + len(token)",
+				"\t\tstack.append(frame)",
+				"\t\treturn literal"
+			])
+			self.tables.append(literals_name + " = {")
+			for literal, literal_name in literals:
+				self.tables.append("\t" + repr(literal) + ": " + literal_name + ",")
+			self.tables.append("}")
+
+		elif len(literals) > 0:
+			self.functions.append("\ttoken = TOKEN.match(string, current).group()")
+			keyword = "if"
+			for literal, literal_name in literals:
+				self.functions.extend([
+					"\t" + keyword + " token == " + repr(literal) + ":",
+					"\t\ttokens = parser.tokens",
+					"\t\ttokens.append(parser.region_begin + current)",
+					"\t\ttokens.append(parser.region_begin + current + " + str(len(literal)) + ")",
+					"\t\ttokens.append(parser.mccliteral)",
+					"\t\tparser.current = current + " + str(len(literal)),
+					"\t\tstack.append(frame)",
+					"\t\treturn " + literal_name
+				])
+				keyword = "elif"
+
+		# A single argument is parsed right here, otherwise the parser picks the candidates
+		if len(arguments) == 1:
+			argument_number = arguments[0][2][6:]
+			self.functions.extend([
+				"\tif START_" + argument_number + " == None or START_" + argument_number + ".match(string[current]) != None:",
+				"\t\tparser.current = PARSE_" + argument_number + "(parser, ARGUMENT_" + argument_number + ".properties)",
+				"\t\tif parser.current != current:",
+				"\t\t\tframe[4] = (ARGUMENT_" + argument_number + ",)",
+				"\t\t\tframe[5] = 0",
+				"\t\t\tstack.append(frame)",
+				"\t\t\treturn " + arguments[0][2],
+				"\t\tparser.rollback(frame[3])"
+			])
+		elif len(arguments) > 1:
+			self.functions.extend([
+				"\targument = parser.next_child(frame)",
+				"\tif argument != None:",
+				"\t\tstack.append(frame)",
+				"\t\treturn argument.enter"
+			])
+		self.functions.append("\treturn parser.no_child_matched(" + children_name + ")")
+
+		argument_names = []
+		for argument_name, child_data, child_name in arguments:
+			argument_number = child_name[6:]
+			argument_names.append("ARGUMENT_" + argument_number + ", ")
+			if child_name in self.written_arguments:
+				continue
+
+			self.written_arguments.add(child_name)
+			properties = "ArgumentContext.of(" + repr(child_data.get("properties", {})) + ")"
+			self.tables.extend([
+				"ARGUMENT_" + argument_number + " = CompiledArgument(" + repr(argument_name) + ", " + repr(child_data["parser"]) + ", " + properties + ", " + child_name + ")",
+				"PARSE_" + argument_number + " = Parser.parsers[ARGUMENT_" + argument_number + ".parser]",
+				"START_" + argument_number + " = start_pattern(ARGUMENT_" + argument_number + ")"
+			])
+		self.tables.append(children_name + " = CompiledChildren(" + repr(tuple(path)) + ", (" + "".join(argument_names) + "), " + str(last_child_executable) + ")")
+
+# Returns the source of CompiledTree.py for command_tree
+def compile_tree(command_tree):
+	return TreeCompiler(command_tree).compile()
+
+# An argument that parses for each parser in commands.json, used to build check lines
+SAMPLE_ARGUMENTS = {
+	"minecraft:resource_location" : "minecraft:stone",
+	"minecraft:function"          : "#minecraft:tick",
+	"minecraft:entity"            : "@e[type=pig,limit=1]",
+	"minecraft:game_profile"      : "Steve",
+	"minecraft:message"           : "hello @a",
+	"minecraft:block_pos"         : "~ ~1 ~",
+	"minecraft:nbt_compound_tag"  : "{a:1b,b:[1,2]}",
+	"minecraft:item_stack"        : "diamond_sword{Damage:1}",
+	"minecraft:item_predicate"    : "#logs",
+	"brigadier:integer"           : "5",
+	"minecraft:block_state"       : "oak_stairs[facing=north]",
+	"minecraft:block_predicate"   : "#logs",
+	"minecraft:nbt_path"          : "a.b[0]",
+	"brigadier:float"             : "0.5",
+	"brigadier:double"            : "1.5",
+	"brigadier:bool"              : "true",
+	"minecraft:swizzle"           : "xz",
+	"minecraft:score_holder"      : "@s",
+	"minecraft:objective"         : "kills",
+	"minecraft:vec3"              : "^ ^ ^1",
+	"minecraft:vec2"              : "~ ~",
+	"minecraft:particle"          : "dust 1 0 0 1",
+	"minecraft:item_slot"         : "weapon.mainhand",
+	"minecraft:scoreboard_slot"   : "sidebar",
+	"minecraft:team"              : "red",
+	"minecraft:color"             : "red",
+	"minecraft:rotation"          : "~ ~",
+	"minecraft:component"         : "{\"text\":\"hi\"}",
+	"minecraft:entity_anchor"     : "eyes",
+	"minecraft:operation"         : "+=",
+	"minecraft:int_range"         : "1..5",
+	"minecraft:mob_effect"        : "speed",
+	"minecraft:sound"             : "entity.pig.ambient",
+	"minecraft:objective_criteria": "dummy",
+	"minecraft:entity_summon"     : "pig",
+	"minecraft:item_enchantment"  : "sharpness",
+	"minecraft:dimension"         : "overworld",
+	"minecraft:column_pos"        : "~ ~",
+	"minecraft:time"              : "1d",
+	"minecraft:nbt_tag"           : "1b"
+}
+
+SAMPLE_STRINGS = {"word": "word", "phrase": "\"a phrase\"", "greedy": "any text"}
+
+# Returns lines that follow every path through command_tree, following redirects once, along
+# with cut off and broken copies of them so the failure paths are checked too
+def sample_lines(command_tree):
+	paths = []
+
+	def walk(node_data, words, redirected):
+		if "redirect" in node_data:
+			paths.append(words)
+			if redirected:
+				return
+			target_data = command_tree
+			if node_data["redirect"][0] != "root":
+				for name in node_data["redirect"]:
+					target_data = target_data["children"][name]
+			walk(target_data, words, True)
+		elif not "children" in node_data:
+			paths.append(words)
+		else:
+			if node_data.get("executable"):
+				paths.append(words)
+			for child_name, child_data in node_data["children"].items():
+				if child_data["type"] == "literal":
+					word = child_name
+				elif child_data["parser"] == "brigadier:string":
+					word = SAMPLE_STRINGS[child_data["properties"]["type"]]
+				else:
+					word = SAMPLE_ARGUMENTS.get(child_data["parser"], "x")
+				walk(child_data, words + [word], redirected)
+
+	walk(command_tree, [], False)
+
+	lines = []
+	for words in paths:
+		line = " ".join(words)
+		lines.append(line)
+		lines.append(line + " ?")
+		if len(words) > 1:
+			lines.append(" ".join(words[:-1]))
+			lines.append(" ".join(words[:-1] + ["!"]))
+			lines.append(" ".join(words[:-1]) + "  " + words[-1])
+	lines.extend(["", "   ", "# comment", "/say hi", "notacommand", "say"])
+	return lines
+
+# Imports module_name from the package in package_dir without running the package's
+# __init__.py, which needs Sublime
+def import_headless(package_dir, module_name):
+	package_name = "mcc_headless"
+	if not package_name in sys.modules:
+		spec = importlib.util.spec_from_loader(package_name, None, is_package=True)
+		package = importlib.util.module_from_spec(spec)
+		package.__path__ = [package_dir]
+		sys.modules[package_name] = package
+	return importlib.import_module(package_name + "." + module_name)
+
+# Runs the interpreted and the compiled tree in package_dir over lines and returns the lines
+# they don't give the same tokens for
+def check_compiled_tree(package_dir, lines):
+	parser_module = import_headless(package_dir, "Parser")
+	compiled_module = import_headless(package_dir, "CompiledParser")
+	if compiled_module.load_compiled_parser() is not compiled_module.CompiledParser:
+		return lines
+
+	parser_module.Parser.time_budget = 60
+	interpreted = parser_module.Parser()
+	compiled = compiled_module.CompiledParser()
+	mismatches = []
+	for line in lines:
+		interpreted.highlight_line(line)
+		compiled.highlight_line(line)
+		if interpreted.take_tokens() != compiled.take_tokens():
+			mismatches.append(line)
+	return mismatches
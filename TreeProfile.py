@@ -0,0 +1,97 @@
+import json
+from .Parser import Parser, CHILDREN_FRAME
+from .Tokenizer import LINE_PATTERN, COMMAND_LINE
+
+# Counts which child each node of the command tree picks on lines that highlight without
+# errors, so the parser can try the arguments real function files use first.  Only argument
+# children are ever reordered from these, literals are found with a single lookup whatever
+# the order.
+#
+# Trying a different argument first can only change how a line highlights when more than one
+# argument of the same node matches it.  Whenever profiling sees that happen the node is
+# marked ambiguous and keeps the order of the tree from then on
+class TreeProfile:
+
+	def __init__(self, counts=None, ambiguous=None):
+		self.counts = counts if counts != None else {} # node path -> {child name: times picked}
+		self.ambiguous = set(ambiguous) if ambiguous != None else set() # paths of the ambiguous nodes
+
+	# Returns the profile saved at path, or an empty one if there isn't one there
+	@classmethod
+	def load(cls, path):
+		try:
+			with open(path, encoding="utf-8") as file:
+				profile_json = json.load(file)
+		except (OSError, ValueError):
+			return cls()
+		return cls(profile_json.get("counts"), profile_json.get("ambiguous"))
+
+	def save(self, path):
+		with open(path, "w", encoding="utf-8") as file:
+			json.dump({"counts": self.counts, "ambiguous": sorted(self.ambiguous)}, file, indent="\t", sort_keys=True)
+
+	def add_lines(self, lines, allow_custom_tags=False):
+		parser = ProfilingParser(self, allow_custom_tags)
+		for line in lines:
+			if LINE_PATTERN.match(line).lastindex == COMMAND_LINE:
+				parser.highlight_line(line)
+				parser.take_tokens()
+
+	def count(self, path, child_name):
+		node_counts = self.counts.setdefault(path, {})
+		node_counts[child_name] = node_counts.get(child_name, 0) + 1
+
+	# Returns the counts for Parser.argument_counts, leaving out the ambiguous nodes
+	def argument_counts(self):
+		return {path: node_counts for path, node_counts in self.counts.items() if not path in self.ambiguous}
+
+# A parser that adds the children picked on every line it highlights to a TreeProfile
+class ProfilingParser(Parser):
+
+	def __init__(self, profile, allow_custom_tags=False):
+		Parser.__init__(self, allow_custom_tags)
+		self.profile = profile
+		self.checking = False # whether an argument is being tried for the ambiguity check
+
+	# Success is handed all the way up, so when it comes in the stack holds exactly the children
+	# that were picked on the way to it.  A node that couldn't match the rest of the line still
+	# succeeds when its last child is executable, so only lines without invalid tokens count
+	def hand_up(self, stack, success):
+		if success and not self.checking and not self.found_invalid(0):
+			for frame in stack:
+				if frame[0] == CHILDREN_FRAME:
+					self.count_pick(frame)
+		return Parser.hand_up(self, stack, success)
+
+	def count_pick(self, frame):
+		node, start, candidates, index = frame[1], frame[2], frame[4], frame[5]
+		path = " ".join(node.path)
+		if index == -1:
+			self.profile.count(path, self.regex["token"].match(self.string, start).group())
+			return
+
+		picked = candidates[index]
+		self.profile.count(path, picked.name)
+		if path in self.profile.ambiguous:
+			return
+
+		for argument_node in candidates:
+			if argument_node is not picked and self.also_matches(argument_node, start):
+				self.profile.ambiguous.add(path)
+				return
+
+	# Whether argument_node and its subtree match the line from start, leaving the parser as it was
+	def also_matches(self, argument_node, start):
+		string = self.string
+		current = self.current
+		mark = self.mark()
+		self.checking = True
+		try:
+			self.current = start
+			end = self.parsers[argument_node.parser](self, argument_node.properties)
+			return end != start and self.highlight(argument_node, string, end)
+		finally:
+			self.checking = False
+			self.rollback(mark)
+			self.string = string
+			self.current = current
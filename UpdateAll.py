@@ -7,6 +7,8 @@ import shutil
 if __name__ != "__main__":
 	exit()
 
+import TreeCompiler
+
 jar_files = []
 with os.scandir() as iterator:
 	for file in iterator:
@@ -153,6 +155,10 @@ commands_py.write("# File automatically generated by UpdateAll.py\n")
 commands_py.write("COMMAND_TREE = " + str(commands))
 commands_py.close()
 
+compiled_py = open("CompiledTree.py", "w")
+compiled_py.write(TreeCompiler.compile_tree(commands))
+compiled_py.close()
+
 commands_json_raw_file = open("commands.json", "w")
 commands_json_raw_file.write(commands_json_raw)
 commands_json_raw_file.close()
@@ -182,6 +188,18 @@ registries_py.write("# File automatically generated by UpdateAll.py\n")
 save_registries(registries_py, registries_json, registry_names)
 registries_py.close()
 
+# The compiled command tree has to give exactly the same tokens as the interpreted one, the
+# plugin falls back on the interpreted one if CompiledTree.py isn't there
+print("Checking the compiled command tree against the interpreted one...")
+mismatches = TreeCompiler.check_compiled_tree(os.getcwd(), TreeCompiler.sample_lines(commands))
+if len(mismatches) > 0:
+	print("The compiled command tree highlights " + str(len(mismatches)) + " lines differently, removing CompiledTree.py. The first few are:")
+	for line in mismatches[:10]:
+		print("\t" + line)
+	os.remove("CompiledTree.py")
+else:
+	print("\tNo differences")
+
 shutil.rmtree("generated")
 shutil.rmtree("logs")
 